@@ -20,6 +20,13 @@ Usage:
     # Force regeneration (ignore cache)
     python scripts/run_corpus.py --corpus backend/corpora/index.jsonl --regen
 
+    # Nightly run through the provider batch API
+    python scripts/run_corpus.py --corpus backend/corpora/index.jsonl --workers 8 --batch --timeout 86400
+
+    # Record live responses once, then profile the pipeline offline
+    LLM_DEFAULT_PROVIDER=replay LLM_REPLAY_MODE=record python scripts/run_corpus.py --corpus backend/corpora/index.jsonl --regen
+    LLM_DEFAULT_PROVIDER=replay LLM_REPLAY_LATENCY=recorded python scripts/run_corpus.py --corpus backend/corpora/index.jsonl --regen
+
 Run from backend directory:
     python scripts/run_corpus.py --help
 """
@@ -125,6 +132,17 @@ def main():
         help="Per-transcript timeout in seconds (default: 600)",
     )
 
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Send LLM calls through provider batch jobs (local backend only; raise --timeout)",
+    )
+    parser.add_argument(
+        "--batch-provider",
+        choices=["openai", "local"],
+        help="Batch provider (default: LLM_BATCH_PROVIDER env var or openai)",
+    )
+
     # Caching
     parser.add_argument(
         "--cache",
@@ -181,6 +199,8 @@ def main():
     print(f"  Content mode: {args.content_mode}")
     print(f"  Output: {args.out}")
     print(f"  Cache: {args.cache}")
+    if args.batch:
+        print(f"  Batch: {args.batch_provider or 'default provider'}")
     if only:
         print(f"  Only: {only}")
     if skip:
@@ -204,6 +224,8 @@ def main():
             timeout_s=args.timeout,
             cache_enabled=args.cache == "drafts",
             force_regen=args.regen,
+            batch_mode=args.batch,
+            batch_provider=args.batch_provider,
         )
     except Exception as e:
         logger.exception("Corpus run failed")
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Standalone worker for queued draft, QA, export and theme jobs.
+
+API nodes started with JOB_QUEUE_ENABLED=true only enqueue jobs. Run one or
+more workers (on any machine that can reach MongoDB) to process them.
+Workers must see the same MongoDB and, for exports, the same EXPORTS_DIR as
+the API nodes.
+
+Usage:
+    # Run every job kind, two at a time
+    JOB_QUEUE_ENABLED=true python scripts/run_worker.py
+
+    # Dedicated draft worker
+    JOB_QUEUE_ENABLED=true python scripts/run_worker.py --kinds draft --concurrency 4
+
+SIGINT/SIGTERM stop claiming new jobs and wait for jobs in flight to finish.
+
+Run from backend directory:
+    python scripts/run_worker.py --help
+"""
+
+import argparse
+import asyncio
+import logging
+import signal
+import sys
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+# Add backend to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+load_dotenv()
+
+from src.db.mongo import close_database
+from src.llm import close_shared_http_clients
+from src.services.job_worker import JOB_WORKER_CONCURRENCY, Worker, default_handlers
+from src.services.work_queue import TaskKind
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+async def run_worker(kinds: list[TaskKind], concurrency: int) -> None:
+    """Run a worker until SIGINT/SIGTERM."""
+    handlers = {kind: handler for kind, handler in default_handlers().items() if kind in kinds}
+    worker = Worker(handlers=handlers, concurrency=concurrency)
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    try:
+        await worker.run(stop)
+    finally:
+        await close_shared_http_clients()
+        await close_database()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Worker for queued background jobs")
+    parser.add_argument(
+        "--kinds",
+        type=str,
+        default=",".join(kind.value for kind in TaskKind),
+        help="Comma-separated job kinds to run (default: all)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=JOB_WORKER_CONCURRENCY,
+        help=f"Jobs run concurrently (default: {JOB_WORKER_CONCURRENCY})",
+    )
+    args = parser.parse_args()
+
+    try:
+        kinds = [TaskKind(kind.strip()) for kind in args.kinds.split(",") if kind.strip()]
+    except ValueError as e:
+        parser.error(str(e))
+
+    asyncio.run(run_worker(kinds, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 """FastAPI application setup."""
 
+import logging
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
@@ -22,12 +23,17 @@ from src.api.exceptions import (
     ValidationError,
 )
 from src.api.response import error_response
-from src.api.routes import ai, coverage, draft, ebook, files, health, projects, qa, themes, visuals
-from src.llm import LLMError
+from src.api.routes import ai, coverage, draft, ebook, files, health, metrics, projects, qa, themes, visuals
+from src.llm import LLMError, close_llm_client, close_shared_http_clients
 from src.db.mongo import close_database
+from src.services.draft_service import resume_interrupted_jobs
+from src.services.pass_pool import shutdown_pass_executor
 from src.services.job_store import get_job_store
 from src.services.export_job_store import get_export_job_store
 from src.services.qa_job_store import get_qa_job_store
+from src.services.job_scheduler import SchedulerFullError
+
+logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
@@ -36,6 +42,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Startup
     job_store = get_job_store()
     await job_store.start_cleanup_task()
+    # Pick up draft jobs interrupted by the last shutdown from their checkpoints
+    try:
+        await resume_interrupted_jobs()
+    except Exception as e:
+        logger.error(f"Recovery sweep for interrupted draft jobs failed: {e}")
     export_job_store = get_export_job_store()
     await export_job_store.start_cleanup_task()
     qa_job_store = get_qa_job_store()
@@ -45,6 +56,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     await job_store.stop_cleanup_task()
     await export_job_store.stop_cleanup_task()
     await qa_job_store.stop_cleanup_task()
+    await close_llm_client()
+    await close_shared_http_clients()
+    shutdown_pass_executor()
     await close_database()
 
 
@@ -167,8 +181,19 @@ async def llm_error_handler(request: Request, exc: LLMError) -> JSONResponse:
     )
 
 
+@app.exception_handler(SchedulerFullError)
+async def scheduler_full_handler(request: Request, exc: SchedulerFullError) -> JSONResponse:
+    """Handle admission control rejections (too many jobs waiting)."""
+    return JSONResponse(
+        status_code=429,
+        content=error_response("QUEUE_FULL", str(exc)),
+        headers={"Retry-After": str(exc.retry_after_seconds)},
+    )
+
+
 # Register routes
 app.include_router(health.router)
+app.include_router(metrics.router)
 app.include_router(projects.router)
 app.include_router(files.router)
 app.include_router(ai.router, prefix="/api")
@@ -1,5 +1,5 @@
 """API routes package."""
 
-from . import ai, coverage, draft, ebook, files, health, projects, qa, visuals
+from . import ai, coverage, draft, ebook, files, health, metrics, projects, qa, visuals
 
-__all__ = ["ai", "coverage", "draft", "ebook", "files", "health", "projects", "qa", "visuals"]
+__all__ = ["ai", "coverage", "draft", "ebook", "files", "health", "metrics", "projects", "qa", "visuals"]
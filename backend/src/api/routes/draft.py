@@ -3,6 +3,7 @@
 Provides async job-based API for ebook draft generation:
 - POST /ai/draft/generate: Start draft generation (returns job_id)
 - GET /ai/draft/status/{job_id}: Poll generation progress
+- GET /ai/draft/stream/{job_id}: Server-sent events with live chapter tokens
 - POST /ai/draft/cancel/{job_id}: Cancel ongoing generation
 - POST /ai/draft/regenerate: Regenerate a single section
 
@@ -11,8 +12,13 @@ All responses use the { data, error } envelope pattern.
 Endpoints will be fully implemented in Phase 3 (US1+US4).
 """
 
+import asyncio
+import json
+import os
+from collections.abc import AsyncIterator
+
 from fastapi import APIRouter
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from src.api.response import success_response, error_response
 from src.models import (
@@ -22,11 +28,24 @@ from src.models import (
     DraftStatusResponse,
     DraftCancelResponse,
     DraftRegenerateResponse,
+    JobStatus,
 )
 from src.services import draft_service
+from src.services.draft_stream import get_draft_stream_hub
+from src.services.job_scheduler import JobKind, get_job_scheduler
 
 router = APIRouter(prefix="/ai/draft", tags=["Draft"])
 
+# Seconds between status events on an idle stream (also acts as keep-alive)
+DRAFT_STREAM_STATUS_INTERVAL = float(os.environ.get("DRAFT_STREAM_STATUS_INTERVAL", "2.0"))
+
+TERMINAL_STATUSES = {JobStatus.completed, JobStatus.cancelled, JobStatus.failed}
+
+
+def _format_sse(event: str, data: dict) -> str:
+    """Format a server-sent event frame."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
 
 @router.post("/generate", response_model=DraftGenerateResponse)
 async def generate_draft(request: DraftGenerateRequest) -> dict:
@@ -39,7 +58,8 @@ async def generate_draft(request: DraftGenerateRequest) -> dict:
         request: Generation request with transcript, outline, style config.
 
     Returns:
-        Job ID and initial status for polling.
+        Job ID and initial status for polling. Requests beyond the waiting
+        queue bound get 429 QUEUE_FULL with a Retry-After header.
     """
     # Validate input
     if len(request.transcript) < 500:
@@ -77,6 +97,7 @@ async def generate_draft(request: DraftGenerateRequest) -> dict:
             "job_id": status_data.job_id,
             "status": status_data.status,
             "progress": status_data.progress.model_dump() if status_data.progress else None,
+            "queue_position": status_data.queue_position,
         })
 
     # Fallback if status not found (should not happen)
@@ -114,12 +135,75 @@ async def get_draft_status(job_id: str) -> dict:
     return success_response(status_data.model_dump())
 
 
+@router.get("/stream/{job_id}")
+async def stream_draft(job_id: str):
+    """Stream live generation events for a job as server-sent events.
+
+    Events:
+    - status: {status, progress} on connect and every few seconds
+    - token: {chapter, delta} LLM text as it is generated
+    - chapter_complete: {chapter, markdown} final text of a finished chapter
+
+    The stream ends after a terminal status (completed/cancelled/failed);
+    fetch /status/{job_id} for the final draft.
+
+    Args:
+        job_id: The job identifier from /generate.
+
+    Returns:
+        text/event-stream response, or 404 if the job does not exist.
+    """
+    status_data = await draft_service.get_job_status(job_id)
+    if not status_data:
+        return JSONResponse(
+            status_code=404,
+            content=error_response("JOB_NOT_FOUND", f"Job {job_id} not found"),
+        )
+
+    hub = get_draft_stream_hub()
+    queue = hub.subscribe(job_id)
+
+    def status_event(data) -> str:
+        return _format_sse("status", {
+            "status": data.status.value,
+            "progress": data.progress.model_dump() if data.progress else None,
+        })
+
+    async def events() -> AsyncIterator[str]:
+        try:
+            yield status_event(status_data)
+            if status_data.status in TERMINAL_STATUSES:
+                return
+            while True:
+                try:
+                    event, data = await asyncio.wait_for(
+                        queue.get(), timeout=DRAFT_STREAM_STATUS_INTERVAL,
+                    )
+                    yield _format_sse(event, data)
+                except TimeoutError:
+                    current = await draft_service.get_job_status(job_id)
+                    if current is None:
+                        return
+                    yield status_event(current)
+                    if current.status in TERMINAL_STATUSES:
+                        return
+        finally:
+            hub.unsubscribe(job_id, queue)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post("/cancel/{job_id}", response_model=DraftCancelResponse)
 async def cancel_draft(job_id: str) -> dict:
     """Cancel an ongoing generation.
 
-    Cancellation is cooperative - the job will stop after the current
-    chapter completes. Partial results are preserved.
+    The job stops immediately, aborting in-flight LLM calls (jobs on a
+    queue worker stop within a second or so). Finished chapters are
+    preserved as a partial draft.
 
     Args:
         job_id: The job identifier to cancel.
@@ -162,11 +246,15 @@ async def regenerate_section(request: DraftRegenerateRequest) -> dict:
             content=error_response("INVALID_DRAFT_PLAN", f"Invalid draft_plan: {e}"),
         )
 
-    result = await draft_service.regenerate_section(
-        section_outline_item_id=request.section_outline_item_id,
-        draft_plan=draft_plan,
-        existing_draft=request.existing_draft,
-        style_config=request.style_config,
+    # A user is waiting: runs ahead of queued background work of its kind
+    result = await get_job_scheduler().run(
+        JobKind.regenerate,
+        lambda: draft_service.regenerate_section(
+            section_outline_item_id=request.section_outline_item_id,
+            draft_plan=draft_plan,
+            existing_draft=request.existing_draft,
+            style_config=request.style_config,
+        ),
     )
 
     if not result:
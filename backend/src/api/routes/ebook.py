@@ -30,6 +30,7 @@ from src.services.epub_generator import (
     start_epub_export,
 )
 from src.services.export_job_store import get_export_job
+from src.services.job_scheduler import SchedulerFullError, get_job_scheduler
 from src.services.pdf_generator import (
     cancel_pdf_export,
     get_pdf_path,
@@ -86,6 +87,7 @@ async def start_export(
         - PROJECT_NOT_FOUND: Project doesn't exist
         - NO_DRAFT_CONTENT: Project has no draft content to export
         - EXPORT_START_FAILED: Failed to start export job
+        - QUEUE_FULL: Too many exports waiting (HTTP 429 with Retry-After)
     """
     # Get project
     project = await get_project(project_id)
@@ -108,6 +110,8 @@ async def start_export(
         export_data = ExportStartData(job_id=job_id)
         return success_response(export_data.model_dump())
 
+    except SchedulerFullError:
+        raise
     except ValueError as e:
         logger.error(f"Failed to start {format.value} export for project {project_id}: {e}")
         return error_response("EXPORT_START_FAILED", str(e))
@@ -146,6 +150,9 @@ async def get_export_status(project_id: str, job_id: str):
         progress=job.progress,
         download_url=download_url,
         error_message=job.error_message,
+        queue_position=(
+            get_job_scheduler().queue_position(job_id) if job.status == ExportJobStatus.pending else None
+        ),
     )
     return success_response(status_data.model_dump())
 
@@ -3,11 +3,15 @@
 from fastapi import APIRouter
 
 from src.api.response import success_response
+from src.llm.circuit_breaker import get_circuit_breakers
 
 router = APIRouter(tags=["System"])
 
 
 @router.get("/health")
 async def health_check() -> dict:
-    """Return system health status."""
-    return success_response({"status": "ok"})
+    """Return system health status and LLM provider circuit breaker states."""
+    return success_response({
+        "status": "ok",
+        "llm_providers": get_circuit_breakers().snapshot(),
+    })
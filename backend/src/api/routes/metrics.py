@@ -0,0 +1,23 @@
+"""Prometheus metrics endpoint."""
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from src.llm.metrics import get_llm_metrics
+from src.llm.rate_limit import get_rate_limiter
+from src.services.job_scheduler import get_job_scheduler
+
+router = APIRouter(tags=["System"])
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics() -> PlainTextResponse:
+    """Return LLM call, rate limiter and job scheduler metrics in Prometheus text format."""
+    return PlainTextResponse(
+        get_llm_metrics().render_prometheus()
+        + get_rate_limiter().render_prometheus()
+        + get_job_scheduler().render_prometheus(),
+        media_type=PROMETHEUS_CONTENT_TYPE,
+    )
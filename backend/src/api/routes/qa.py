@@ -12,7 +12,7 @@ import asyncio
 import logging
 from typing import Optional
 
-from fastapi import APIRouter, BackgroundTasks
+from fastapi import APIRouter
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 
@@ -27,6 +27,8 @@ from src.services.qa_job_store import (
 )
 from src.services.qa_evaluator import evaluate_draft
 from src.services.project_service import get_project, patch_project
+from src.services.job_scheduler import JobKind, SchedulerFullError, get_job_scheduler
+from src.services.work_queue import TaskKind, enqueue_job, job_queue_enabled
 
 logger = logging.getLogger(__name__)
 
@@ -61,6 +63,7 @@ class QAStatusData(BaseModel):
     current_stage: Optional[str] = Field(default=None, description="Current analysis stage")
     report: Optional[QAReport] = Field(default=None, description="QA report when complete")
     error: Optional[str] = Field(default=None, description="Error message if failed")
+    queue_position: Optional[int] = Field(default=None, description="Position among waiting jobs (only when queued)")
 
 
 class QAReportData(BaseModel):
@@ -175,10 +178,7 @@ async def run_qa_analysis(job_id: str, project_id: str) -> None:
 # ============================================================================
 
 @router.post("/analyze")
-async def analyze_draft(
-    request: QAAnalyzeRequest,
-    background_tasks: BackgroundTasks,
-) -> dict:
+async def analyze_draft(request: QAAnalyzeRequest) -> dict:
     """Start async QA analysis.
 
     Creates a background job and returns immediately with job_id.
@@ -186,10 +186,12 @@ async def analyze_draft(
 
     Args:
         request: Analysis request with project_id.
-        background_tasks: FastAPI background tasks.
 
     Returns:
         Job ID and initial status for polling.
+
+    Raises:
+        SchedulerFullError: Too many QA jobs waiting (HTTP 429).
     """
     # Check if project exists
     project = await get_project(request.project_id)
@@ -226,8 +228,17 @@ async def analyze_draft(
     # Create job
     job_id = await create_qa_job(request.project_id)
 
-    # Start background analysis
-    background_tasks.add_task(run_qa_analysis, job_id, request.project_id)
+    # Start background analysis (workers run it when the job queue is enabled)
+    if job_queue_enabled():
+        await enqueue_job(TaskKind.qa, job_id, {"project_id": request.project_id})
+    else:
+        try:
+            get_job_scheduler().submit(
+                JobKind.qa, job_id, lambda: run_qa_analysis(job_id, request.project_id)
+            )
+        except SchedulerFullError:
+            await get_qa_job_store().delete_job(job_id)
+            raise
 
     return success_response({
         "job_id": job_id,
@@ -263,6 +274,9 @@ async def get_qa_status(job_id: str) -> dict:
         "current_stage": job.current_stage,
         "report": job.report.model_dump(mode="json") if job.report else None,
         "error": job.error,
+        "queue_position": (
+            get_job_scheduler().queue_position(job_id) if job.status == QAJobStatus.queued else None
+        ),
     })
 
 
@@ -369,6 +383,7 @@ class RewriteStatusData(BaseModel):
     issues_addressed: Optional[int] = Field(default=None)
     diffs: Optional[list[dict]] = Field(default=None, description="Section diffs when complete")
     error: Optional[str] = Field(default=None)
+    queue_position: Optional[int] = Field(default=None, description="Position among waiting jobs (only when queued)")
 
 
 # Rewrite job store (in-memory for now, similar to QA jobs)
@@ -478,10 +493,7 @@ async def run_rewrite_task(
 
 
 @router.post("/rewrite")
-async def start_rewrite(
-    request: RewriteRequest,
-    background_tasks: BackgroundTasks,
-) -> dict:
+async def start_rewrite(request: RewriteRequest) -> dict:
     """Start a targeted rewrite to fix QA issues.
 
     Creates a background job that rewrites sections flagged by QA
@@ -489,10 +501,12 @@ async def start_rewrite(
 
     Args:
         request: Rewrite request with project_id and options.
-        background_tasks: FastAPI background tasks.
 
     Returns:
         Job ID and status for polling.
+
+    Raises:
+        SchedulerFullError: Too many rewrite jobs waiting (HTTP 429).
     """
     from src.services.rewrite_service import should_allow_rewrite_pass
 
@@ -549,14 +563,21 @@ async def start_rewrite(
         "pass_number": request.pass_number,
     }
 
-    # Start background task
-    background_tasks.add_task(
-        run_rewrite_task,
-        job_id,
-        request.project_id,
-        request.issue_types,
-        request.pass_number,
-    )
+    # Start background task once a rewrite slot is free
+    try:
+        get_job_scheduler().submit(
+            JobKind.rewrite,
+            job_id,
+            lambda: run_rewrite_task(
+                job_id,
+                request.project_id,
+                request.issue_types,
+                request.pass_number,
+            ),
+        )
+    except SchedulerFullError:
+        del _rewrite_jobs[job_id]
+        raise
 
     return success_response({
         "job_id": job_id,
@@ -595,4 +616,7 @@ async def get_rewrite_status(job_id: str) -> dict:
         "diffs": job.get("diffs"),
         "error": job.get("error"),
         "warnings": job.get("warnings"),
+        "queue_position": (
+            get_job_scheduler().queue_position(job_id) if job["status"] == "queued" else None
+        ),
     })
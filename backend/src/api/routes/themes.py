@@ -5,15 +5,17 @@ Endpoints for theme proposal jobs in Ideas Edition.
 
 import logging
 
-from fastapi import APIRouter, BackgroundTasks
+from fastapi import APIRouter
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
 from src.api.response import error_response, success_response
 from src.models.theme_job import ThemeJobStatus
+from src.services.job_scheduler import JobKind, SchedulerFullError, get_job_scheduler
 from src.services.project_service import get_project, ProjectNotFoundError
 from src.services.theme_job_store import get_theme_job_store
 from src.services.theme_proposal_service import propose_themes
+from src.services.work_queue import TaskKind, enqueue_job, job_queue_enabled
 
 logger = logging.getLogger(__name__)
 
@@ -89,10 +91,7 @@ async def run_theme_proposal(job_id: str, project_id: str) -> None:
 
 
 @router.post("/propose")
-async def start_theme_proposal(
-    request: ProposeThemesRequest,
-    background_tasks: BackgroundTasks
-) -> dict:
+async def start_theme_proposal(request: ProposeThemesRequest) -> dict:
     """Start async theme proposal job.
 
     Analyzes transcript and proposes thematic chapters.
@@ -101,8 +100,18 @@ async def start_theme_proposal(
     store = get_theme_job_store()
     job_id = await store.create_job(project_id=request.project_id)
 
-    # Add background task for theme proposal
-    background_tasks.add_task(run_theme_proposal, job_id, request.project_id)
+    # Schedule the theme proposal (workers run it when the job queue is
+    # enabled)
+    if job_queue_enabled():
+        await enqueue_job(TaskKind.themes, job_id, {"project_id": request.project_id})
+    else:
+        try:
+            get_job_scheduler().submit(
+                JobKind.themes, job_id, lambda: run_theme_proposal(job_id, request.project_id)
+            )
+        except SchedulerFullError:
+            await store.delete_job(job_id)
+            raise
 
     return success_response({
         "job_id": job_id,
@@ -129,7 +138,10 @@ async def get_theme_status(job_id: str) -> dict:
         "job_id": job.job_id,
         "status": job.status.value,
         "themes": [t.model_dump() for t in job.themes] if job.themes else [],
-        "error": job.error
+        "error": job.error,
+        "queue_position": (
+            get_job_scheduler().queue_position(job_id) if job.status == ThemeJobStatus.QUEUED else None
+        ),
     })
 
 
@@ -76,6 +76,7 @@ class DraftGenRequest:
             "style_config": self.style_config,
             "candidate_count": self.candidate_count,
             "require_preflight_pass": self.require_preflight_pass,
+            "priority": "batch",
         }
 
     def to_request_json(self) -> dict:
@@ -133,6 +134,8 @@ class DraftGenResult:
     error: Optional[str] = None
     error_code: Optional[str] = None
     meta: Optional[DraftGenMeta] = None
+    # Job timing trace (StageTiming dicts from generation_stats)
+    timings: list[dict] = field(default_factory=list)
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
@@ -247,7 +250,7 @@ class LocalBackend:
         timeout_s: int = 600,
     ) -> DraftGenResult:
         """Generate draft using local draft_service."""
-        from src.models import DraftGenerateRequest
+        from src.models import DraftGenerateRequest, JobPriority
         from src.services import draft_service
 
         start_time = time.time()
@@ -259,6 +262,8 @@ class LocalBackend:
             style_config=request.style_config,
             candidate_count=request.candidate_count,
             require_preflight_pass=request.require_preflight_pass,
+            # Corpus runs yield to interactive users
+            priority=JobPriority.batch,
         )
 
         try:
@@ -320,6 +325,9 @@ class LocalBackend:
                         draft_markdown=status.draft_markdown,
                         draft_plan=status.draft_plan,
                         meta=meta,
+                        timings=[
+                            t.model_dump() for t in status.generation_stats.timings
+                        ] if status.generation_stats else [],
                     )
 
                 elif status.status == "failed":
@@ -450,6 +458,7 @@ class HTTPBackend:
                             draft_markdown=status.get("draft_markdown"),
                             draft_plan=status.get("draft_plan"),
                             meta=meta,
+                            timings=(status.get("generation_stats") or {}).get("timings", []),
                         )
 
                     elif status["status"] == "failed":
@@ -153,6 +153,22 @@ def aggregate_corpus(
 
     gate_passed = len(violations) == 0
 
+    # Timing profile across transcripts that reported one (cached drafts don't)
+    timed_rows = [r for r in gate_rows if r.stage_wall_ms]
+    stage_names = sorted({name for r in timed_rows for name in r.stage_wall_ms})
+    stage_timings = {
+        name: {
+            "mean_wall_ms": round(statistics.mean(r.stage_wall_ms.get(name, 0.0) for r in timed_rows), 3),
+            "max_wall_ms": max(r.stage_wall_ms.get(name, 0.0) for r in timed_rows),
+            "mean_cpu_ms": round(statistics.mean(r.stage_cpu_ms.get(name, 0.0) for r in timed_rows), 3),
+        }
+        for name in stage_names
+    }
+    pass_totals: dict[str, float] = {}
+    for row in timed_rows:
+        for name, cpu_ms in row.pass_cpu_ms.items():
+            pass_totals[name] = pass_totals.get(name, 0.0) + cpu_ms
+
     # Collect failure causes across corpus
     failure_cause_counts: dict[str, int] = {}
     for row in gate_rows:
@@ -183,6 +199,16 @@ def aggregate_corpus(
             key=lambda x: x[1],
             reverse=True,
         )[:10]),
+        "timings": {
+            "transcript_count": len(timed_rows),
+            "stages": stage_timings,
+            "max_chapter_wall_ms": max((r.max_chapter_wall_ms for r in timed_rows), default=0.0),
+            # Mean CPU time per transcript of the most expensive passes
+            "top_passes_cpu_ms": {
+                name: round(total / len(timed_rows), 3)
+                for name, total in sorted(pass_totals.items(), key=lambda x: x[1], reverse=True)[:10]
+            },
+        },
         "gate_rows": [r.to_dict() for r in gate_rows],
     }
 
@@ -268,6 +294,25 @@ def render_summary_md(report: dict) -> str:
             lines.append(f"- {cause}: {count}")
         lines.append("")
 
+    # Timing Profile
+    timings = report.get("timings") or {}
+    if timings.get("stages"):
+        lines.append("## Timing Profile")
+        lines.append("")
+        lines.append("| Stage | Mean Wall (ms) | Max Wall (ms) | Mean CPU (ms) |")
+        lines.append("|-------|----------------|---------------|---------------|")
+        for name, stage in timings["stages"].items():
+            lines.append(
+                f"| {name} | {stage['mean_wall_ms']:.0f} | {stage['max_wall_ms']:.0f} | "
+                f"{stage['mean_cpu_ms']:.0f} |"
+            )
+        lines.append("")
+        if timings.get("top_passes_cpu_ms"):
+            lines.append("**Most expensive passes (mean CPU ms per transcript):**")
+            for name, cpu_ms in timings["top_passes_cpu_ms"].items():
+                lines.append(f"- {name}: {cpu_ms:.1f}")
+            lines.append("")
+
     # Per-Transcript Results
     lines.append("## Per-Transcript Results")
     lines.append("")
@@ -6,6 +6,7 @@ Main entry point for running end-to-end baseline testing across the corpus.
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import json
 import logging
 from dataclasses import dataclass
@@ -310,6 +311,7 @@ async def process_transcript(
         groundedness=groundedness,
         yield_result=yield_result,
         thresholds=config.thresholds,
+        timings=result.timings,
     )
 
     # Write work unit
@@ -350,6 +352,8 @@ async def run_corpus_async(
     cache_enabled: bool = True,
     force_regen: bool = False,
     thresholds: Optional[Thresholds] = None,
+    batch_mode: bool = False,
+    batch_provider: Optional[str] = None,
 ) -> dict:
     """Run corpus evaluation asynchronously.
 
@@ -370,10 +374,17 @@ async def run_corpus_async(
         cache_enabled: Enable draft caching
         force_regen: Force regeneration (ignore cache)
         thresholds: Threshold configuration
+        batch_mode: Send LLM calls through provider batch jobs instead of
+            interactive requests (local backend only; expect batch latency,
+            so raise timeout_s accordingly)
+        batch_provider: Batch provider name (default: LLM_BATCH_PROVIDER)
 
     Returns:
         Corpus report dictionary
     """
+    if batch_mode and backend_type != "local":
+        raise ValueError("Batch mode requires the local backend")
+
     if types is None:
         types = ["Type1"]
 
@@ -414,26 +425,20 @@ async def run_corpus_async(
     # Process transcripts
     gate_rows: list[GateRow] = []
 
-    if workers == 1:
-        # Sequential processing
-        for entry in filtered:
-            gate_row = await process_transcript(
-                entry=entry,
-                backend=backend,
-                corpora_private_dir=corpora_private_dir,
-                output_dir=output_dir,
-                config=config,
-                cache=cache,
-                force_regen=force_regen,
-            )
-            gate_rows.append(gate_row)
-    else:
-        # Parallel processing with semaphore
-        semaphore = asyncio.Semaphore(workers)
-
-        async def process_with_semaphore(entry: dict) -> GateRow:
-            async with semaphore:
-                return await process_transcript(
+    # Batch mode: LLM calls made while processing (including draft jobs the
+    # local backend starts) are collected into provider batch jobs
+    batch_session = None
+    if batch_mode:
+        from src.llm.batch import LLM_BATCH_PROVIDER, BatchSession, create_batch_provider
+
+        batch_session = BatchSession(create_batch_provider(batch_provider or LLM_BATCH_PROVIDER))
+        logger.info(f"Batch mode: LLM calls go through {batch_session.provider.name} batch jobs")
+
+    async with batch_session or contextlib.nullcontext():
+        if workers == 1:
+            # Sequential processing
+            for entry in filtered:
+                gate_row = await process_transcript(
                     entry=entry,
                     backend=backend,
                     corpora_private_dir=corpora_private_dir,
@@ -442,9 +447,28 @@ async def run_corpus_async(
                     cache=cache,
                     force_regen=force_regen,
                 )
-
-        tasks = [process_with_semaphore(entry) for entry in filtered]
-        gate_rows = await asyncio.gather(*tasks)
+                gate_rows.append(gate_row)
+        else:
+            # Parallel processing with semaphore
+            semaphore = asyncio.Semaphore(workers)
+
+            async def process_with_semaphore(entry: dict) -> GateRow:
+                async with semaphore:
+                    return await process_transcript(
+                        entry=entry,
+                        backend=backend,
+                        corpora_private_dir=corpora_private_dir,
+                        output_dir=output_dir,
+                        config=config,
+                        cache=cache,
+                        force_regen=force_regen,
+                    )
+
+            tasks = [process_with_semaphore(entry) for entry in filtered]
+            gate_rows = await asyncio.gather(*tasks)
+
+    if batch_session is not None:
+        logger.info(f"Batch stats: {batch_session.get_stats()}")
 
     # Aggregate results
     git_commit = get_git_commit()
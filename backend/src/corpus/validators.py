@@ -418,6 +418,12 @@ class GateRow:
     # Failure info
     failure_causes: list[str] = field(default_factory=list)
 
+    # Timing profile (empty for cached drafts)
+    stage_wall_ms: dict[str, float] = field(default_factory=dict)
+    stage_cpu_ms: dict[str, float] = field(default_factory=dict)
+    pass_cpu_ms: dict[str, float] = field(default_factory=dict)
+    max_chapter_wall_ms: float = 0.0
+
     # Error (if generation failed)
     error: Optional[str] = None
 
@@ -425,6 +431,30 @@ class GateRow:
         return asdict(self)
 
 
+def apply_timings(row: GateRow, timings: list[dict]) -> None:
+    """Summarize a job's timing trace onto its gate row.
+
+    Stage entries are kept by name, pass CPU time is summed across chapters,
+    and chapters are reduced to the slowest one.
+
+    Args:
+        row: Gate row to update in place
+        timings: StageTiming dicts from generation_stats
+    """
+    for entry in timings:
+        kind = entry.get("kind")
+        name = entry.get("name", "")
+        wall_ms = float(entry.get("wall_ms", 0.0))
+        cpu_ms = float(entry.get("cpu_ms", 0.0))
+        if kind == "stage":
+            row.stage_wall_ms[name] = round(row.stage_wall_ms.get(name, 0.0) + wall_ms, 3)
+            row.stage_cpu_ms[name] = round(row.stage_cpu_ms.get(name, 0.0) + cpu_ms, 3)
+        elif kind == "pass":
+            row.pass_cpu_ms[name] = round(row.pass_cpu_ms.get(name, 0.0) + cpu_ms, 3)
+        elif kind == "chapter":
+            row.max_chapter_wall_ms = max(row.max_chapter_wall_ms, round(wall_ms, 3))
+
+
 def make_gate_row(
     run_id: str,
     transcript_id: str,
@@ -434,6 +464,7 @@ def make_gate_row(
     groundedness: GroundednessResult,
     yield_result: YieldResult,
     thresholds: Thresholds = DEFAULT_THRESHOLDS,
+    timings: Optional[list[dict]] = None,
 ) -> GateRow:
     """Compute gate row with explicit verdict precedence.
 
@@ -452,6 +483,7 @@ def make_gate_row(
         groundedness: Groundedness validation result
         yield_result: Yield metrics result
         thresholds: Threshold configuration
+        timings: Job timing trace (StageTiming dicts), if known
 
     Returns:
         GateRow with verdict and metrics
@@ -468,6 +500,8 @@ def make_gate_row(
         fallback_ratio=yield_result.fallback_ratio,
         p10_prose_words=yield_result.p10_prose_words,
     )
+    if timings:
+        apply_timings(row, timings)
 
     failure_causes = []
 
@@ -4,9 +4,25 @@ This module provides a vendor-neutral interface for interacting with LLM provide
 (OpenAI, Anthropic) with automatic fallback and retry logic.
 """
 
-from .client import LLMClient
+from .batch import (
+    BatchProvider,
+    BatchSession,
+    LocalFileBatchProvider,
+    OpenAIBatchProvider,
+    create_batch_provider,
+    get_active_batch_session,
+)
+from .cache import BaseResponseCache, DiskResponseCache, get_response_cache, set_response_cache
+from .circuit_breaker import (
+    CircuitBreaker,
+    CircuitState,
+    get_circuit_breakers,
+    set_circuit_breakers,
+)
+from .client import LLMClient, close_llm_client, get_llm_client, set_llm_client
 from .errors import (
     AuthenticationError,
+    CircuitOpenError,
     ContentFilterError,
     InvalidRequestError,
     LLMError,
@@ -14,16 +30,30 @@ from .errors import (
     RateLimitError,
     TimeoutError,
 )
-from .models import ChatMessage, LLMRequest, LLMResponse, ResponseFormat, Usage
+from .hedging import HedgingPolicy, get_hedging_policy, set_hedging_policy
+from .metrics import LLMMetrics, LLMUsageRollup, get_llm_metrics, llm_stage, set_llm_metrics
+from .models import ChatMessage, LLMRequest, LLMResponse, ResponseFormat, StreamChunk, Usage
+from .pool import close_shared_http_clients, get_shared_http_client
+from .providers.replay import (
+    ReplayProvider,
+    SyntheticLatency,
+    get_replay_latency,
+    set_replay_latency,
+)
+from .rate_limit import RateLimiter, get_rate_limiter, set_rate_limiter
 from .schemas import get_draft_plan_schema_path, load_draft_plan_schema
 
 __all__ = [
     "LLMClient",
+    "get_llm_client",
+    "set_llm_client",
+    "close_llm_client",
     "LLMRequest",
     "LLMResponse",
     "ChatMessage",
     "ResponseFormat",
     "Usage",
+    "StreamChunk",
     "LLMError",
     "AuthenticationError",
     "RateLimitError",
@@ -31,6 +61,38 @@ __all__ = [
     "InvalidRequestError",
     "ContentFilterError",
     "ProviderError",
+    "CircuitOpenError",
+    "BaseResponseCache",
+    "DiskResponseCache",
+    "get_response_cache",
+    "set_response_cache",
+    "RateLimiter",
+    "get_rate_limiter",
+    "set_rate_limiter",
+    "CircuitBreaker",
+    "CircuitState",
+    "get_circuit_breakers",
+    "set_circuit_breakers",
+    "HedgingPolicy",
+    "get_hedging_policy",
+    "set_hedging_policy",
+    "LLMMetrics",
+    "LLMUsageRollup",
+    "get_llm_metrics",
+    "set_llm_metrics",
+    "llm_stage",
+    "BatchProvider",
+    "BatchSession",
+    "LocalFileBatchProvider",
+    "OpenAIBatchProvider",
+    "create_batch_provider",
+    "get_active_batch_session",
+    "ReplayProvider",
+    "SyntheticLatency",
+    "get_replay_latency",
+    "set_replay_latency",
+    "get_shared_http_client",
+    "close_shared_http_clients",
     "load_draft_plan_schema",
     "get_draft_plan_schema_path",
 ]
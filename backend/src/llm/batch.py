@@ -0,0 +1,446 @@
+"""Offline batch execution for LLM requests.
+
+Corpus runs issue hundreds of independent LLM calls and do not need
+interactive latency. A BatchSession collects the LLMRequests that pipeline
+stages send through LLMClient.generate, submits them as one provider batch
+job, polls until it finishes and hands each result back to the coroutine that
+is waiting for it. Batch jobs run at batch throughput and pricing instead of
+being throttled by interactive rate limits.
+
+Pipeline code does not change: inside `async with BatchSession(...)`, every
+LLMClient.generate call made from that task (or tasks it creates) is routed
+into the session. Streaming calls stay interactive.
+
+Providers:
+- OpenAIBatchProvider: OpenAI Batch API (/v1/chat/completions)
+- LocalFileBatchProvider: file-based stand-in that answers requests with a
+  local responder, for tests and dry runs
+
+Configuration (env vars):
+- LLM_BATCH_PROVIDER: "openai" or "local" (default: "openai")
+- LLM_BATCH_DIR: Working directory for the local provider (default: .cache/llm_batches)
+- LLM_BATCH_MAX_SIZE: Max requests per batch job (default: 500)
+- LLM_BATCH_MAX_WAIT_SECONDS: How long to keep collecting before submitting (default: 5)
+- LLM_BATCH_POLL_SECONDS: Interval between status polls (default: 30)
+"""
+
+import asyncio
+import contextvars
+import json
+import logging
+import os
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+from .errors import LLMError, ProviderError
+from .models import LLMRequest, LLMResponse, Usage
+from .providers.openai import OpenAIProvider
+
+logger = logging.getLogger(__name__)
+
+LLM_BATCH_PROVIDER = os.environ.get("LLM_BATCH_PROVIDER", "openai")
+LLM_BATCH_DIR = os.environ.get("LLM_BATCH_DIR", ".cache/llm_batches")
+LLM_BATCH_MAX_SIZE = int(os.environ.get("LLM_BATCH_MAX_SIZE", "500"))
+LLM_BATCH_MAX_WAIT_SECONDS = float(os.environ.get("LLM_BATCH_MAX_WAIT_SECONDS", "5"))
+LLM_BATCH_POLL_SECONDS = float(os.environ.get("LLM_BATCH_POLL_SECONDS", "30"))
+
+OPENAI_BATCH_ENDPOINT = "/v1/chat/completions"
+
+_active_session: contextvars.ContextVar["BatchSession | None"] = contextvars.ContextVar(
+    "llm_batch_session", default=None
+)
+
+
+class BatchStatus(str, Enum):
+    """Provider batch job status."""
+
+    IN_PROGRESS = "in_progress"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+@dataclass
+class BatchItemResult:
+    """Outcome of one request in a batch job."""
+
+    custom_id: str
+    response: LLMResponse | None = None
+    error: str | None = None
+
+
+@dataclass
+class BatchStats:
+    """Batch session counters."""
+
+    batches_submitted: int = 0
+    requests: int = 0
+    failed_requests: int = 0
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary."""
+        return asdict(self)
+
+
+class BatchProvider(ABC):
+    """Abstract interface for provider batch APIs."""
+
+    name: str
+
+    @abstractmethod
+    async def submit(self, items: dict[str, LLMRequest]) -> str:
+        """Submit requests keyed by custom ID; returns the batch ID."""
+        pass
+
+    @abstractmethod
+    async def poll(self, batch_id: str) -> BatchStatus:
+        """Get the current status of a batch job."""
+        pass
+
+    @abstractmethod
+    async def fetch_results(self, batch_id: str) -> dict[str, BatchItemResult]:
+        """Get per-request results of a completed batch job."""
+        pass
+
+
+def echo_responder(request: LLMRequest) -> LLMResponse:
+    """Default local responder: echo the last user message."""
+    text = next(
+        (str(m.content) for m in reversed(request.messages) if m.role == "user"),
+        "",
+    )
+    return LLMResponse(
+        text=text,
+        finish_reason="stop",
+        usage=Usage(prompt_tokens=0, completion_tokens=0, total_tokens=0),
+        model=request.model,
+        provider="local",
+        latency_ms=0,
+    )
+
+
+class LocalFileBatchProvider(BatchProvider):
+    """File-based batch provider stand-in.
+
+    Batch structure:
+        batch_dir/
+            {batch_id}/
+                input.jsonl   # {"custom_id", "request"}
+                output.jsonl  # {"custom_id", "response" | "error"}
+
+    Requests are answered by a local responder the first time the batch is
+    polled, so the session's submit/poll/fetch cycle is exercised end to end
+    without a network.
+    """
+
+    name = "local"
+
+    def __init__(
+        self,
+        batch_dir: Path | str = LLM_BATCH_DIR,
+        responder: Callable[[LLMRequest], LLMResponse] = echo_responder,
+    ):
+        """Initialize local batch provider.
+
+        Args:
+            batch_dir: Directory for batch input/output files.
+            responder: Function answering a single request.
+        """
+        self.batch_dir = Path(batch_dir)
+        self.responder = responder
+
+    def _path(self, batch_id: str, filename: str) -> Path:
+        return self.batch_dir / batch_id / filename
+
+    async def submit(self, items: dict[str, LLMRequest]) -> str:
+        """Write requests to a new batch input file."""
+        batch_id = f"batch_{uuid.uuid4().hex[:12]}"
+        lines = [
+            json.dumps({"custom_id": custom_id, "request": request.model_dump(mode="json")})
+            for custom_id, request in items.items()
+        ]
+        path = self._path(batch_id, "input.jsonl")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        await asyncio.to_thread(path.write_text, "\n".join(lines) + "\n", "utf-8")
+        return batch_id
+
+    def _process(self, batch_id: str) -> None:
+        """Answer every request in the batch and write the output file."""
+        output = []
+        for line in self._path(batch_id, "input.jsonl").read_text(encoding="utf-8").splitlines():
+            item = json.loads(line)
+            try:
+                response = self.responder(LLMRequest.model_validate(item["request"]))
+                output.append({"custom_id": item["custom_id"], "response": response.model_dump(mode="json")})
+            except Exception as e:
+                output.append({"custom_id": item["custom_id"], "error": str(e)})
+        self._path(batch_id, "output.jsonl").write_text(
+            "\n".join(json.dumps(entry) for entry in output) + "\n", encoding="utf-8",
+        )
+
+    async def poll(self, batch_id: str) -> BatchStatus:
+        """Process the batch on first poll and report completion."""
+        if not self._path(batch_id, "input.jsonl").exists():
+            return BatchStatus.FAILED
+        if not self._path(batch_id, "output.jsonl").exists():
+            await asyncio.to_thread(self._process, batch_id)
+        return BatchStatus.COMPLETED
+
+    async def fetch_results(self, batch_id: str) -> dict[str, BatchItemResult]:
+        """Read results from the batch output file."""
+        text = await asyncio.to_thread(self._path(batch_id, "output.jsonl").read_text, "utf-8")
+        results = {}
+        for line in text.splitlines():
+            entry = json.loads(line)
+            response = entry.get("response")
+            results[entry["custom_id"]] = BatchItemResult(
+                custom_id=entry["custom_id"],
+                response=LLMResponse.model_validate(response) if response else None,
+                error=entry.get("error"),
+            )
+        return results
+
+
+class OpenAIBatchProvider(BatchProvider):
+    """OpenAI Batch API provider.
+
+    Requests are converted with OpenAIProvider's request builder, uploaded as
+    a JSONL file and run against /v1/chat/completions with a 24h completion
+    window. Results are parsed with the same response parser as interactive
+    calls.
+    """
+
+    name = "openai"
+
+    # OpenAI batch states that will never produce output
+    FAILED_STATES = {"failed", "expired", "cancelled", "cancelling"}
+
+    def __init__(self, provider: OpenAIProvider | None = None):
+        """Initialize OpenAI batch provider.
+
+        Args:
+            provider: OpenAI provider supplying the SDK client and request
+                conversion. Defaults to a new OpenAIProvider.
+        """
+        self._provider = provider or OpenAIProvider()
+        self._output_files: dict[str, list[str]] = {}
+
+    async def submit(self, items: dict[str, LLMRequest]) -> str:
+        """Upload the batch input file and create the batch job."""
+        lines = [
+            json.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": OPENAI_BATCH_ENDPOINT,
+                "body": self._provider._build_request(request),
+            })
+            for custom_id, request in items.items()
+        ]
+        client = self._provider.client
+        input_file = await client.files.create(
+            file=("batch.jsonl", ("\n".join(lines) + "\n").encode("utf-8")),
+            purpose="batch",
+        )
+        batch = await client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=OPENAI_BATCH_ENDPOINT,
+            completion_window="24h",
+        )
+        return batch.id
+
+    async def poll(self, batch_id: str) -> BatchStatus:
+        """Retrieve the batch job status."""
+        batch = await self._provider.client.batches.retrieve(batch_id)
+        if batch.status == "completed":
+            self._output_files[batch_id] = [
+                file_id for file_id in (batch.output_file_id, batch.error_file_id) if file_id
+            ]
+            return BatchStatus.COMPLETED
+        if batch.status in self.FAILED_STATES:
+            return BatchStatus.FAILED
+        return BatchStatus.IN_PROGRESS
+
+    def _parse_line(self, entry: dict[str, Any]) -> BatchItemResult:
+        """Convert one output/error file line into a result."""
+        from openai.types.chat import ChatCompletion
+
+        custom_id = entry["custom_id"]
+        response = entry.get("response") or {}
+        if response.get("status_code") == 200:
+            completion = ChatCompletion.model_validate(response["body"])
+            return BatchItemResult(
+                custom_id=custom_id,
+                response=self._provider._parse_response(completion, latency_ms=0),
+            )
+        error = entry.get("error") or response.get("body", {}).get("error") or {}
+        return BatchItemResult(custom_id=custom_id, error=error.get("message", "Batch request failed"))
+
+    async def fetch_results(self, batch_id: str) -> dict[str, BatchItemResult]:
+        """Download and parse the batch output and error files."""
+        results = {}
+        for file_id in self._output_files.pop(batch_id, []):
+            content = await self._provider.client.files.content(file_id)
+            for line in content.text.splitlines():
+                if line.strip():
+                    result = self._parse_line(json.loads(line))
+                    results[result.custom_id] = result
+        return results
+
+
+def create_batch_provider(name: str = LLM_BATCH_PROVIDER) -> BatchProvider:
+    """Create a batch provider by name.
+
+    Args:
+        name: "openai" or "local".
+
+    Returns:
+        BatchProvider instance.
+
+    Raises:
+        ValueError: If the provider name is not recognized.
+    """
+    if name == "openai":
+        return OpenAIBatchProvider()
+    if name == "local":
+        return LocalFileBatchProvider()
+    raise ValueError(f"Unknown batch provider: {name}")
+
+
+class BatchSession:
+    """Collects LLM requests into provider batch jobs.
+
+    Requests are grouped until max_batch_size is reached or max_wait_seconds
+    have passed since the first pending request, then submitted together.
+    Each batch is polled in the background and its results are delivered to
+    the waiting generate() calls; failed items raise ProviderError.
+
+    Usage:
+        async with BatchSession(create_batch_provider()):
+            await run_pipeline()  # LLMClient.generate calls are batched
+    """
+
+    def __init__(
+        self,
+        provider: BatchProvider,
+        max_batch_size: int = LLM_BATCH_MAX_SIZE,
+        max_wait_seconds: float = LLM_BATCH_MAX_WAIT_SECONDS,
+        poll_seconds: float = LLM_BATCH_POLL_SECONDS,
+    ):
+        """Initialize batch session.
+
+        Args:
+            provider: Batch provider to submit jobs to.
+            max_batch_size: Max requests per batch job.
+            max_wait_seconds: Collection window before a partial batch is submitted.
+            poll_seconds: Interval between status polls.
+        """
+        self.provider = provider
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_seconds
+        self.poll_seconds = poll_seconds
+        self.stats = BatchStats()
+        self._pending: dict[str, tuple[LLMRequest, asyncio.Future]] = {}
+        self._flush_timer: asyncio.TimerHandle | None = None
+        self._batch_tasks: set[asyncio.Task] = set()
+        self._token: contextvars.Token | None = None
+
+    async def __aenter__(self) -> "BatchSession":
+        self._token = _active_session.set(self)
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        try:
+            await self.aclose()
+        finally:
+            _active_session.reset(self._token)
+            self._token = None
+
+    async def generate(self, request: LLMRequest) -> LLMResponse:
+        """Queue a request for the next batch and wait for its result.
+
+        Args:
+            request: LLM request to send.
+
+        Returns:
+            LLM response from the batch job.
+
+        Raises:
+            ProviderError: If the batch job or this request failed.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending[uuid.uuid4().hex] = (request, future)
+        self.stats.requests += 1
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_timer is None:
+            self._flush_timer = asyncio.get_running_loop().call_later(
+                self.max_wait_seconds, self._flush,
+            )
+        return await future
+
+    def _flush(self) -> None:
+        """Submit all pending requests as one batch job."""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if not self._pending:
+            return
+        items, self._pending = self._pending, {}
+        task = asyncio.create_task(self._run_batch(items))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(self, items: dict[str, tuple[LLMRequest, asyncio.Future]]) -> None:
+        """Submit a batch, wait for it and resolve its futures."""
+        try:
+            batch_id = await self.provider.submit({cid: request for cid, (request, _) in items.items()})
+            self.stats.batches_submitted += 1
+            logger.info(f"Submitted {self.provider.name} batch {batch_id} with {len(items)} requests")
+
+            while (status := await self.provider.poll(batch_id)) == BatchStatus.IN_PROGRESS:
+                await asyncio.sleep(self.poll_seconds)
+            if status == BatchStatus.FAILED:
+                raise ProviderError(f"Batch {batch_id} failed", provider=self.provider.name)
+
+            results = await self.provider.fetch_results(batch_id)
+            logger.info(f"Batch {batch_id} completed: {len(results)}/{len(items)} results")
+        except Exception as e:
+            error = e if isinstance(e, LLMError) else ProviderError(
+                f"Batch submission failed: {e}", provider=self.provider.name,
+            )
+            for _, future in items.values():
+                if not future.done():
+                    future.set_exception(error)
+            self.stats.failed_requests += len(items)
+            return
+
+        for custom_id, (_, future) in items.items():
+            if future.done():
+                continue
+            result = results.get(custom_id)
+            if result is not None and result.response is not None:
+                future.set_result(result.response)
+            else:
+                self.stats.failed_requests += 1
+                message = result.error if result else "Missing from batch output"
+                future.set_exception(ProviderError(message, provider=self.provider.name))
+
+    async def aclose(self) -> None:
+        """Submit any pending requests and wait for all batches to finish."""
+        self._flush()
+        while self._batch_tasks:
+            await asyncio.gather(*self._batch_tasks, return_exceptions=True)
+
+    def get_stats(self) -> dict:
+        """Get batch session counters."""
+        return self.stats.to_dict()
+
+
+def get_active_batch_session() -> BatchSession | None:
+    """Get the batch session LLM calls in the current context are routed to."""
+    return _active_session.get()
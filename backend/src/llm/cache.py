@@ -0,0 +1,243 @@
+"""Content-addressed LLM response cache.
+
+Identical LLMRequest payloads (same transcript and style config re-run during
+QA iterations or corpus runs) return the stored response instead of calling a
+provider again. Keys are a stable SHA-256 over every request field that can
+change the output.
+
+Configuration (env vars):
+- LLM_CACHE_ENABLED: Enable the response cache (default: false)
+- LLM_CACHE_DIR: Directory for cached responses (default: .cache/llm_responses)
+- LLM_CACHE_MAX_ENTRIES: Max cached responses before LRU eviction (default: 5000)
+- LLM_CACHE_MAX_BYTES: Max total cache size in bytes (default: 500 MB)
+- LLM_CACHE_TTL_SECONDS: Entry lifetime; 0 disables expiry (default: 7 days)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from .models import LLMRequest, LLMResponse
+
+logger = logging.getLogger(__name__)
+
+LLM_CACHE_ENABLED = os.environ.get("LLM_CACHE_ENABLED", "false").lower() == "true"
+LLM_CACHE_DIR = os.environ.get("LLM_CACHE_DIR", ".cache/llm_responses")
+LLM_CACHE_MAX_ENTRIES = int(os.environ.get("LLM_CACHE_MAX_ENTRIES", "5000"))
+LLM_CACHE_MAX_BYTES = int(os.environ.get("LLM_CACHE_MAX_BYTES", str(500 * 1024 * 1024)))
+LLM_CACHE_TTL_SECONDS = float(os.environ.get("LLM_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+
+
+def compute_request_key(request: LLMRequest) -> str:
+    """Compute a stable content hash for an LLM request.
+
+    Covers model, messages, sampling parameters, response format and tools.
+    metadata and the cache flag are excluded since they never reach the
+    provider.
+
+    Args:
+        request: LLM request to hash.
+
+    Returns:
+        Hex SHA-256 digest.
+    """
+    payload = request.model_dump(
+        mode="json",
+        exclude={"metadata", "cache"},
+        exclude_none=True,
+    )
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """Response cache counters."""
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary."""
+        return asdict(self)
+
+
+class BaseResponseCache(ABC):
+    """Abstract base class for LLM response cache backends."""
+
+    def __init__(self) -> None:
+        self.stats = CacheStats()
+
+    @abstractmethod
+    def get(self, key: str) -> LLMResponse | None:
+        """Look up a cached response, or None on a miss."""
+        pass
+
+    @abstractmethod
+    def set(self, key: str, response: LLMResponse) -> None:
+        """Store a response, evicting old entries if needed."""
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        pass
+
+
+class DiskResponseCache(BaseResponseCache):
+    """File-per-entry response cache with TTL and LRU eviction.
+
+    Cache structure:
+        cache_dir/
+            {key[:2]}/
+                {key}.json
+
+    An in-memory LRU index (rebuilt from file mtimes on first use) tracks
+    access order and sizes, so lookups and evictions do not rescan the
+    directory. Least recently used entries are evicted once max_entries or
+    max_bytes is exceeded.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path | str = LLM_CACHE_DIR,
+        max_entries: int = LLM_CACHE_MAX_ENTRIES,
+        max_bytes: int = LLM_CACHE_MAX_BYTES,
+        ttl_seconds: float = LLM_CACHE_TTL_SECONDS,
+    ):
+        """Initialize disk cache.
+
+        Args:
+            cache_dir: Directory for cache storage.
+            max_entries: Maximum number of cached responses.
+            max_bytes: Maximum total size of cached responses.
+            ttl_seconds: Entry lifetime in seconds (0 disables expiry).
+        """
+        super().__init__()
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        # key -> size in bytes, least recently used first
+        self._index: OrderedDict[str, int] | None = None
+        self._total_bytes = 0
+
+    def _path(self, key: str) -> Path:
+        """Get the file path for a cache key."""
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _is_expired(self, stored_at: float) -> bool:
+        """Check whether an entry stored at the given time has expired."""
+        return self.ttl_seconds > 0 and time.time() - stored_at > self.ttl_seconds
+
+    def _load_index(self) -> OrderedDict[str, int]:
+        """Build the LRU index from existing cache files (once)."""
+        if self._index is None:
+            entries = []
+            for path in self.cache_dir.glob("*/*.json"):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, path.stem, stat.st_size))
+            entries.sort()
+            self._index = OrderedDict((key, size) for _, key, size in entries)
+            self._total_bytes = sum(self._index.values())
+        return self._index
+
+    def _remove(self, key: str) -> None:
+        """Delete an entry from disk and the index."""
+        index = self._load_index()
+        self._total_bytes -= index.pop(key, 0)
+        self._path(key).unlink(missing_ok=True)
+
+    def get(self, key: str) -> LLMResponse | None:
+        """Look up a cached response, refreshing its LRU position on a hit."""
+        path = self._path(key)
+        with self._lock:
+            index = self._load_index()
+            try:
+                entry = json.loads(path.read_text(encoding="utf-8"))
+            except FileNotFoundError:
+                self._total_bytes -= index.pop(key, 0)
+                self.stats.misses += 1
+                return None
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"Dropping unreadable LLM cache entry {key[:12]}: {e}")
+                self._remove(key)
+                self.stats.misses += 1
+                return None
+
+            if self._is_expired(entry.get("stored_at", 0)):
+                self._remove(key)
+                self.stats.misses += 1
+                self.stats.evictions += 1
+                return None
+
+            # Refresh LRU position (mtime persists it across restarts)
+            if key in index:
+                index.move_to_end(key)
+            os.utime(path)
+            self.stats.hits += 1
+
+        return LLMResponse.model_validate(entry["response"])
+
+    def set(self, key: str, response: LLMResponse) -> None:
+        """Store a response and evict least recently used entries over the limits."""
+        data = json.dumps({
+            "stored_at": time.time(),
+            "response": response.model_dump(mode="json", exclude={"raw"}),
+        })
+        path = self._path(key)
+        with self._lock:
+            index = self._load_index()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_text(data, encoding="utf-8")
+            tmp_path.replace(path)
+
+            self._total_bytes -= index.pop(key, 0)
+            size = len(data.encode("utf-8"))
+            index[key] = size
+            self._total_bytes += size
+            self.stats.stores += 1
+
+            while len(index) > 1 and (len(index) > self.max_entries or self._total_bytes > self.max_bytes):
+                oldest = next(iter(index))
+                self._remove(oldest)
+                self.stats.evictions += 1
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            for key in list(self._load_index()):
+                self._remove(key)
+
+
+# Module-level singleton
+_default_cache: BaseResponseCache | None = None
+
+
+def get_response_cache() -> BaseResponseCache | None:
+    """Get the default response cache, or None when caching is disabled."""
+    global _default_cache
+    if _default_cache is None and LLM_CACHE_ENABLED:
+        _default_cache = DiskResponseCache()
+        logger.info(f"LLM response cache enabled at {LLM_CACHE_DIR}")
+    return _default_cache
+
+
+def set_response_cache(cache: BaseResponseCache | None) -> None:
+    """Set the response cache instance (for testing)."""
+    global _default_cache
+    _default_cache = cache
@@ -0,0 +1,260 @@
+"""Per-provider circuit breakers for LLM calls.
+
+When a provider is degraded, every LLMClient call would otherwise spend its
+full retry/backoff budget on it before falling back, and every concurrent job
+would repeat the same wait. A breaker watches each provider's recent outcomes
+and, once it trips, LLMClient skips that provider and goes straight to the
+next entry in its fallback order.
+
+States:
+- closed: calls flow normally; outcomes are recorded in a rolling window.
+- open: calls are rejected immediately until the cooldown elapses.
+- half_open: a limited number of probe calls are let through; a success
+  closes the circuit, a failure re-opens it.
+
+The circuit opens when the rolling error rate reaches the threshold (with
+enough calls in the window to be meaningful), or after a run of consecutive
+timeouts, since each timeout already costs a full request timeout.
+
+Only retryable failures (rate limits, timeouts, 5xx) count as errors.
+Non-retryable errors such as invalid requests mean the provider answered, so
+they count as successes.
+
+Configuration (env vars):
+- LLM_BREAKER_ENABLED: Enable circuit breakers (default: true)
+- LLM_BREAKER_WINDOW_SECONDS: Rolling window for the error rate (default: 60)
+- LLM_BREAKER_MIN_CALLS: Calls in the window before the rate applies (default: 5)
+- LLM_BREAKER_ERROR_RATE: Error rate that opens the circuit (default: 0.5)
+- LLM_BREAKER_TIMEOUT_THRESHOLD: Consecutive timeouts that open it (default: 3)
+- LLM_BREAKER_COOLDOWN_SECONDS: Time open before probing again (default: 30)
+- LLM_BREAKER_HALF_OPEN_PROBES: Concurrent probes while half-open (default: 1)
+"""
+
+import logging
+import os
+import time
+from collections import deque
+from enum import Enum
+
+logger = logging.getLogger(__name__)
+
+LLM_BREAKER_ENABLED = os.environ.get("LLM_BREAKER_ENABLED", "true").lower() == "true"
+LLM_BREAKER_WINDOW_SECONDS = float(os.environ.get("LLM_BREAKER_WINDOW_SECONDS", "60"))
+LLM_BREAKER_MIN_CALLS = int(os.environ.get("LLM_BREAKER_MIN_CALLS", "5"))
+LLM_BREAKER_ERROR_RATE = float(os.environ.get("LLM_BREAKER_ERROR_RATE", "0.5"))
+LLM_BREAKER_TIMEOUT_THRESHOLD = int(os.environ.get("LLM_BREAKER_TIMEOUT_THRESHOLD", "3"))
+LLM_BREAKER_COOLDOWN_SECONDS = float(os.environ.get("LLM_BREAKER_COOLDOWN_SECONDS", "30"))
+LLM_BREAKER_HALF_OPEN_PROBES = int(os.environ.get("LLM_BREAKER_HALF_OPEN_PROBES", "1"))
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker state."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Rolling-window circuit breaker for a single provider.
+
+    Callers ask allow_request() before each attempt and report exactly one
+    of record_success(), record_failure() or release() afterwards.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        window_seconds: float = LLM_BREAKER_WINDOW_SECONDS,
+        min_calls: int = LLM_BREAKER_MIN_CALLS,
+        error_rate_threshold: float = LLM_BREAKER_ERROR_RATE,
+        timeout_threshold: int = LLM_BREAKER_TIMEOUT_THRESHOLD,
+        cooldown_seconds: float = LLM_BREAKER_COOLDOWN_SECONDS,
+        half_open_probes: int = LLM_BREAKER_HALF_OPEN_PROBES,
+    ):
+        """Initialize circuit breaker.
+
+        Args:
+            name: Provider name (for logging).
+            window_seconds: Rolling window for the error rate.
+            min_calls: Minimum calls in the window before the rate applies.
+            error_rate_threshold: Error rate (0-1) that opens the circuit.
+            timeout_threshold: Consecutive timeouts that open the circuit.
+            cooldown_seconds: Time spent open before allowing probes.
+            half_open_probes: Concurrent probe calls allowed while half-open.
+        """
+        self.name = name
+        self.window_seconds = window_seconds
+        self.min_calls = min_calls
+        self.error_rate_threshold = error_rate_threshold
+        self.timeout_threshold = timeout_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.half_open_probes = half_open_probes
+
+        self._state = CircuitState.CLOSED
+        # (timestamp, failed) outcomes, oldest first
+        self._outcomes: deque[tuple[float, bool]] = deque()
+        self._consecutive_timeouts = 0
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._times_opened = 0
+        self._rejected = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state, moving from open to half-open once cooled down."""
+        if (
+            self._state == CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self.cooldown_seconds
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._probes_in_flight = 0
+            logger.info(f"Circuit for {self.name} half-open, probing provider")
+        return self._state
+
+    def _prune(self, now: float) -> None:
+        """Drop outcomes that fell out of the rolling window."""
+        cutoff = now - self.window_seconds
+        while self._outcomes and self._outcomes[0][0] < cutoff:
+            self._outcomes.popleft()
+
+    def error_rate(self) -> float:
+        """Error rate over the rolling window (0.0 when empty)."""
+        self._prune(time.monotonic())
+        if not self._outcomes:
+            return 0.0
+        return sum(1 for _, failed in self._outcomes if failed) / len(self._outcomes)
+
+    def allow_request(self) -> bool:
+        """Check whether a call may be sent to the provider now."""
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return True
+        if state == CircuitState.HALF_OPEN and self._probes_in_flight < self.half_open_probes:
+            self._probes_in_flight += 1
+            return True
+        self._rejected += 1
+        return False
+
+    def _finish_probe(self) -> bool:
+        """Release a probe slot; returns True if the call was a probe."""
+        if self._state == CircuitState.HALF_OPEN and self._probes_in_flight > 0:
+            self._probes_in_flight -= 1
+            return True
+        return False
+
+    def _open(self, reason: str) -> None:
+        """Trip the circuit."""
+        self._state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+        self._times_opened += 1
+        logger.warning(
+            f"Circuit for {self.name} opened ({reason}); "
+            f"skipping provider for {self.cooldown_seconds:.0f}s"
+        )
+
+    def record_success(self) -> None:
+        """Record a call the provider answered."""
+        self._consecutive_timeouts = 0
+        if self._finish_probe():
+            self._state = CircuitState.CLOSED
+            self._outcomes.clear()
+            logger.info(f"Circuit for {self.name} closed after successful probe")
+            return
+        now = time.monotonic()
+        self._outcomes.append((now, False))
+        self._prune(now)
+
+    def record_failure(self, timeout: bool = False) -> None:
+        """Record a failed call.
+
+        Args:
+            timeout: Whether the failure was a request timeout.
+        """
+        if self._finish_probe():
+            self._open("probe failed")
+            return
+        if self._state == CircuitState.OPEN:
+            # Late result from a call started before the circuit opened
+            return
+
+        now = time.monotonic()
+        self._outcomes.append((now, True))
+        self._prune(now)
+        self._consecutive_timeouts = self._consecutive_timeouts + 1 if timeout else 0
+
+        if self._consecutive_timeouts >= self.timeout_threshold:
+            self._consecutive_timeouts = 0
+            self._open(f"{self.timeout_threshold} consecutive timeouts")
+            return
+
+        rate = self.error_rate()
+        if len(self._outcomes) >= self.min_calls and rate >= self.error_rate_threshold:
+            self._open(f"error rate {rate:.0%} over {len(self._outcomes)} calls")
+
+    def release(self) -> None:
+        """Release an allowed call that ended without a provider outcome."""
+        self._finish_probe()
+
+    def snapshot(self) -> dict:
+        """Get breaker state for health reporting."""
+        state = self.state
+        retry_in = 0.0
+        if state == CircuitState.OPEN:
+            retry_in = max(0.0, self.cooldown_seconds - (time.monotonic() - self._opened_at))
+        return {
+            "state": state.value,
+            "error_rate": round(self.error_rate(), 3),
+            "calls_in_window": len(self._outcomes),
+            "consecutive_timeouts": self._consecutive_timeouts,
+            "times_opened": self._times_opened,
+            "rejected_calls": self._rejected,
+            "retry_in_seconds": round(retry_in, 1),
+        }
+
+
+class CircuitBreakerRegistry:
+    """Process-wide breakers keyed by provider name."""
+
+    def __init__(self, enabled: bool = LLM_BREAKER_ENABLED, **breaker_kwargs):
+        """Initialize registry.
+
+        Args:
+            enabled: When False, every call is allowed and nothing is tracked.
+            **breaker_kwargs: Overrides passed to each CircuitBreaker.
+        """
+        self.enabled = enabled
+        self._breaker_kwargs = breaker_kwargs
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def get(self, provider: str) -> CircuitBreaker | None:
+        """Get (or create) the breaker for a provider, or None when disabled."""
+        if not self.enabled:
+            return None
+        breaker = self._breakers.get(provider)
+        if breaker is None:
+            breaker = CircuitBreaker(provider, **self._breaker_kwargs)
+            self._breakers[provider] = breaker
+        return breaker
+
+    def snapshot(self) -> dict[str, dict]:
+        """Get state of every breaker that has seen traffic."""
+        return {name: breaker.snapshot() for name, breaker in self._breakers.items()}
+
+
+# Module-level singleton
+_default_registry: CircuitBreakerRegistry | None = None
+
+
+def get_circuit_breakers() -> CircuitBreakerRegistry:
+    """Get the process-wide circuit breaker registry."""
+    global _default_registry
+    if _default_registry is None:
+        _default_registry = CircuitBreakerRegistry()
+    return _default_registry
+
+
+def set_circuit_breakers(registry: CircuitBreakerRegistry | None) -> None:
+    """Set the circuit breaker registry (for testing)."""
+    global _default_registry
+    _default_registry = registry
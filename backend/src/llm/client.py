@@ -8,22 +8,33 @@ import asyncio
 import logging
 import os
 import random
+import time
 import uuid
+from collections.abc import AsyncIterator
 from typing import Any
 
+from .batch import get_active_batch_session
+from .cache import BaseResponseCache, compute_request_key, get_response_cache
+from .circuit_breaker import CircuitBreaker, CircuitBreakerRegistry, get_circuit_breakers
 from .errors import (
     AuthenticationError,
+    CircuitOpenError,
     ContentFilterError,
     InvalidRequestError,
     LLMError,
     ModelNotFoundError,
     RateLimitError,
     RETRYABLE_ERRORS,
+    TimeoutError,
 )
-from .models import LLMRequest, LLMResponse
+from .hedging import HedgingPolicy, get_hedging_policy
+from .metrics import LLMMetrics, get_llm_metrics
+from .models import LLMRequest, LLMResponse, StreamChunk
 from .providers.anthropic import AnthropicProvider
 from .providers.base import LLMProvider
 from .providers.openai import OpenAIProvider
+from .providers.replay import LLM_REPLAY_UPSTREAM, ReplayProvider
+from .rate_limit import RateLimiter, get_rate_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +47,17 @@ class LLMClient:
     - Provider fallback (OpenAI → Anthropic)
     - Correlation ID tracking across attempts
     - Configurable via environment variables
+    - Cheap to construct: all instances share the pooled HTTP transport
+      from llm.pool, so connections are reused across clients
+    - Optional content-addressed response cache (see llm.cache)
+    - Shared per-provider/model RPM/TPM limits (see llm.rate_limit)
+    - Per-provider circuit breakers that skip degraded providers without
+      spending retries on them (see llm.circuit_breaker)
+    - Opt-in hedged requests against tail latency (see llm.hedging)
+    - Offline batch execution inside a BatchSession (see llm.batch)
+    - Per-stage latency/token/retry telemetry (see llm.metrics)
+    - Record/replay provider for offline benchmarking
+      (LLM_DEFAULT_PROVIDER=replay, see llm.providers.replay)
 
     Configuration (env vars):
     - LLM_DEFAULT_PROVIDER: Default provider (default: "openai")
@@ -57,6 +79,11 @@ class LLMClient:
         max_retries: int | None = None,
         openai_api_key: str | None = None,
         anthropic_api_key: str | None = None,
+        cache: BaseResponseCache | None = None,
+        rate_limiter: RateLimiter | None = None,
+        circuit_breakers: CircuitBreakerRegistry | None = None,
+        hedging: HedgingPolicy | None = None,
+        metrics: LLMMetrics | None = None,
     ):
         """Initialize LLM client.
 
@@ -66,6 +93,11 @@ class LLMClient:
             max_retries: Max retries per provider. Defaults to LLM_MAX_RETRIES env var.
             openai_api_key: OpenAI API key. Defaults to OPENAI_API_KEY env var.
             anthropic_api_key: Anthropic API key. Defaults to ANTHROPIC_API_KEY env var.
+            cache: Response cache. Defaults to the shared cache when LLM_CACHE_ENABLED.
+            rate_limiter: Rate limiter. Defaults to the process-wide limiter.
+            circuit_breakers: Breaker registry. Defaults to the process-wide registry.
+            hedging: Hedging policy. Defaults to the process-wide policy.
+            metrics: Call metrics registry. Defaults to the process-wide registry.
         """
         # Load configuration from environment or use provided values
         self._default_provider = (
@@ -88,15 +120,27 @@ class LLMClient:
             "openai": OpenAIProvider(api_key=openai_api_key, timeout=self._timeout),
             "anthropic": AnthropicProvider(api_key=anthropic_api_key, timeout=self._timeout),
         }
+        self._providers["replay"] = ReplayProvider(upstream=self._providers.get(LLM_REPLAY_UPSTREAM))
 
         # Provider fallback order
         self._fallback_order = ["openai", "anthropic"]
+        if self._default_provider == "replay":
+            # Offline runs must never fall through to a live provider
+            self._fallback_order = ["replay"]
+
+        self._cache = cache if cache is not None else get_response_cache()
+        self._rate_limiter = rate_limiter if rate_limiter is not None else get_rate_limiter()
+        self._circuit_breakers = (
+            circuit_breakers if circuit_breakers is not None else get_circuit_breakers()
+        )
+        self._hedging = hedging if hedging is not None else get_hedging_policy()
+        self._metrics = metrics if metrics is not None else get_llm_metrics()
 
     def get_provider(self, name: str) -> LLMProvider:
         """Get a specific provider by name.
 
         Args:
-            name: Provider name ("openai" or "anthropic").
+            name: Provider name ("openai", "anthropic" or "replay").
 
         Returns:
             LLMProvider instance.
@@ -129,6 +173,11 @@ class LLMClient:
             return bool(os.environ.get("OPENAI_API_KEY"))
         if name == "anthropic":
             return bool(os.environ.get("ANTHROPIC_API_KEY"))
+        if name == "replay":
+            replay = self._providers["replay"]
+            if replay.mode == "record":
+                return self.is_provider_available(LLM_REPLAY_UPSTREAM)
+            return True
 
         return False
 
@@ -138,35 +187,91 @@ class LLMClient:
         provider: str | None = None,
         fallback: bool = True,
         correlation_id: str | None = None,
+        hedge: bool | None = None,
     ) -> LLMResponse:
         """Generate a completion with automatic retry and fallback.
 
+        Identical requests are served from the response cache when one is
+        configured, unless request.cache is False. Inside an active
+        BatchSession the request is sent through the session's batch job
+        instead (see llm.batch).
+
         Args:
             request: LLM request to send.
             provider: Specific provider to use. Defaults to default provider.
             fallback: Whether to fallback to other providers on failure.
             correlation_id: Optional ID for tracking across retry attempts.
+            hedge: Send a duplicate request if this one runs past the model's
+                latency percentile. Defaults to LLM_HEDGE_ENABLED.
 
         Returns:
-            LLM response from the successful provider.
+            LLM response from the successful provider (or the cache, with
+            cache_hit=True and latency_ms=0).
 
         Raises:
             LLMError: If all providers fail after retries.
         """
         correlation_id = correlation_id or str(uuid.uuid4())
 
-        # Determine provider order
-        if provider:
-            providers_to_try = [provider]
-            if fallback:
-                # Add other providers as fallbacks
-                providers_to_try.extend(
-                    p for p in self._fallback_order if p != provider
+        cache_key: str | None = None
+        if self._cache is not None and request.cache:
+            cache_key = compute_request_key(request)
+            cached = await asyncio.to_thread(self._cache.get, cache_key)
+            if cached is not None:
+                logger.debug(
+                    "LLM cache hit",
+                    extra={"correlation_id": correlation_id, "cache_key": cache_key[:12]},
                 )
+                self._metrics.record_cache_hit(request.model)
+                return cached.model_copy(update={"latency_ms": 0, "cache_hit": True})
+
+        batch = get_active_batch_session()
+        if batch is not None:
+            # Offline batch mode: no interactive retries, limits or hedging
+            try:
+                response = await batch.generate(request)
+            except LLMError as e:
+                self._metrics.record_error("batch", request.model, e)
+                raise
+            self._metrics.record_response("batch", response)
+        elif hedge if hedge is not None else self._hedging.enabled:
+            response = await self._generate_hedged(request, provider, fallback, correlation_id)
+            self._hedging.record_latency(request.model, response.latency_ms)
         else:
-            providers_to_try = self._fallback_order.copy()
+            response = await self._generate_uncached(request, provider, fallback, correlation_id)
+            self._hedging.record_latency(request.model, response.latency_ms)
+
+        if cache_key is not None:
+            await asyncio.to_thread(self._cache.set, cache_key, response)
+
+        return response
+
+    async def _generate_uncached(
+        self,
+        request: LLMRequest,
+        provider: str | None,
+        fallback: bool,
+        correlation_id: str,
+    ) -> LLMResponse:
+        """Generate via providers with retry and fallback (no cache lookup).
+
+        Args:
+            request: LLM request to send.
+            provider: Specific provider to use. Defaults to default provider.
+            fallback: Whether to fallback to other providers on failure.
+            correlation_id: Tracking ID.
+
+        Returns:
+            LLM response from the successful provider.
+
+        Raises:
+            LLMError: If all providers fail after retries.
+        """
+
+        providers_to_try = self._providers_to_try(provider, fallback)
 
         last_error: LLMError | None = None
+        failed_provider: str | None = None
 
         for provider_name in providers_to_try:
             if not self.is_provider_available(provider_name):
@@ -177,6 +282,9 @@ class LLMClient:
                 )
                 continue
 
+            if failed_provider is not None:
+                self._metrics.record_fallback(failed_provider, request.model)
+
             try:
                 response = await self._generate_with_retry(
                     request=request,
@@ -188,6 +296,7 @@ class LLMClient:
             except RETRYABLE_ERRORS as e:
                 # Retryable error - log and try next provider
                 last_error = e
+                failed_provider = provider_name
                 logger.warning(
                     "Provider %s failed with retryable error: %s. Trying fallback.",
                     provider_name,
@@ -224,6 +333,211 @@ class LLMClient:
             correlation_id=correlation_id,
         )
 
+    async def _generate_hedged(
+        self,
+        request: LLMRequest,
+        provider: str | None,
+        fallback: bool,
+        correlation_id: str,
+    ) -> LLMResponse:
+        """Generate, sending a duplicate if the first call runs long.
+
+        The duplicate goes through the same provider order (so an open
+        circuit breaker sends it to the fallback provider). Whichever call
+        succeeds first wins and the other is cancelled. If one call fails,
+        the other is still awaited.
+
+        Args:
+            request: LLM request to send.
+            provider: Specific provider to use. Defaults to default provider.
+            fallback: Whether to fallback to other providers on failure.
+            correlation_id: Tracking ID.
+
+        Returns:
+            The first successful response.
+
+        Raises:
+            LLMError: If every launched call fails.
+        """
+        self._hedging.start_request()
+        delay = self._hedging.hedge_delay(request.model)
+        if delay is None:
+            return await self._generate_uncached(request, provider, fallback, correlation_id)
+
+        primary = asyncio.create_task(
+            self._generate_uncached(request, provider, fallback, correlation_id)
+        )
+        pending = {primary}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            if primary in done:
+                return primary.result()
+
+            if not self._hedging.try_acquire_hedge():
+                return await primary
+
+            logger.info(
+                "Hedging slow LLM request after %.1fs",
+                delay,
+                extra={"correlation_id": correlation_id, "model": request.model},
+            )
+            hedge = asyncio.create_task(
+                self._generate_uncached(request, provider, fallback, correlation_id)
+            )
+            pending = {primary, hedge}
+            first_error: BaseException | None = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        if task is hedge:
+                            self._hedging.record_hedge_win()
+                        return task.result()
+                    first_error = first_error or error
+            raise first_error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _providers_to_try(self, provider: str | None, fallback: bool) -> list[str]:
+        """Determine provider order for a request.
+
+        Args:
+            provider: Specific provider to use first, if any.
+            fallback: Whether other providers follow as fallbacks.
+
+        Returns:
+            Provider names in the order they should be tried.
+        """
+        if provider:
+            providers_to_try = [provider]
+            if fallback:
+                # Add other providers as fallbacks
+                providers_to_try.extend(
+                    p for p in self._fallback_order if p != provider
+                )
+            return providers_to_try
+        return self._fallback_order.copy()
+
+    async def stream(
+        self,
+        request: LLMRequest,
+        provider: str | None = None,
+        fallback: bool = True,
+        correlation_id: str | None = None,
+    ) -> AsyncIterator[StreamChunk]:
+        """Stream a completion with retry and fallback before the first chunk.
+
+        Retry semantics for streams: a retryable error raised before any
+        chunk has been yielded is retried with backoff and then falls back
+        to the next provider, exactly like generate(). Once a chunk has been
+        yielded the caller has consumed partial output, so a later error is
+        raised as-is rather than silently restarting the stream. Streams
+        bypass the response cache.
+
+        Args:
+            request: LLM request to send.
+            provider: Specific provider to use. Defaults to default provider.
+            fallback: Whether to fallback to other providers on failure.
+            correlation_id: Optional ID for tracking across retry attempts.
+
+        Yields:
+            StreamChunk deltas from the successful provider.
+
+        Raises:
+            LLMError: If all providers fail before streaming, or a stream
+                fails after it has started.
+        """
+        correlation_id = correlation_id or str(uuid.uuid4())
+        last_error: LLMError | None = None
+
+        for provider_name in self._providers_to_try(provider, fallback):
+            if not self.is_provider_available(provider_name):
+                continue
+
+            stream_provider = self.get_provider(provider_name)
+            breaker = self._circuit_breakers.get(provider_name)
+            for attempt in range(self._max_retries + 1):
+                if breaker and not breaker.allow_request():
+                    last_error = last_error or CircuitOpenError(
+                        f"Circuit open for provider {provider_name}",
+                        provider=provider_name,
+                        correlation_id=correlation_id,
+                    )
+                    break
+
+                started = False
+                outcome_recorded = False
+                used_tokens = 0
+                usage = None
+                permit = None
+                try:
+                    permit = await self._rate_limiter.acquire(provider_name, request)
+                    started_at = time.perf_counter()
+                    async for chunk in stream_provider.stream(request):
+                        if not started:
+                            if permit:
+                                # Keep the estimate unless the provider reports usage
+                                used_tokens = permit.estimated_tokens
+                            # The provider is answering; later errors don't trip the breaker
+                            self._record_outcome(breaker, None)
+                            outcome_recorded = True
+                        started = True
+                        if chunk.usage:
+                            usage = chunk.usage
+                            used_tokens = chunk.usage.total_tokens
+                        yield chunk
+                    latency_ms = int((time.perf_counter() - started_at) * 1000)
+                    self._metrics.record_call(provider_name, request.model, latency_ms, usage)
+                    return
+
+                except BaseException as e:
+                    if not outcome_recorded:
+                        self._record_outcome(breaker, e)
+                        outcome_recorded = True
+                    if isinstance(e, LLMError):
+                        self._metrics.record_error(provider_name, request.model, e)
+                    if not isinstance(e, RETRYABLE_ERRORS):
+                        raise
+                    e.correlation_id = correlation_id
+                    if started:
+                        # Partial output already delivered - never replay it
+                        raise
+                    last_error = e
+                    logger.warning(
+                        "Retryable stream error on attempt %d/%d: %s",
+                        attempt + 1,
+                        self._max_retries + 1,
+                        str(e),
+                        extra={
+                            "correlation_id": correlation_id,
+                            "provider": provider_name,
+                            "attempt": attempt + 1,
+                            "error_type": type(e).__name__,
+                        },
+                    )
+                    if attempt < self._max_retries:
+                        self._metrics.record_retry(provider_name, request.model)
+                        await asyncio.sleep(self._calculate_backoff(attempt, e))
+
+                finally:
+                    self._rate_limiter.settle(permit, used_tokens)
+                    if not outcome_recorded:
+                        # Stream finished without yielding anything
+                        self._record_outcome(breaker, None)
+
+            if not fallback:
+                break
+
+        if last_error:
+            raise last_error
+
+        raise LLMError(
+            "No providers available",
+            correlation_id=correlation_id,
+        )
+
     async def _generate_with_retry(
         self,
         request: LLMRequest,
@@ -244,9 +558,20 @@ class LLMClient:
             LLMError: After all retries exhausted.
         """
         provider = self.get_provider(provider_name)
+        breaker = self._circuit_breakers.get(provider_name)
         last_error: Exception | None = None
 
         for attempt in range(self._max_retries + 1):
+            if breaker and not breaker.allow_request():
+                # Stop spending retries on a provider that is known to be down
+                if last_error:
+                    raise last_error
+                raise CircuitOpenError(
+                    f"Circuit open for provider {provider_name}",
+                    provider=provider_name,
+                    correlation_id=correlation_id,
+                )
+
             try:
                 logger.debug(
                     "Attempting request to %s (attempt %d/%d)",
@@ -260,7 +585,19 @@ class LLMClient:
                     },
                 )
 
-                response = await provider.generate(request)
+                permit = None
+                try:
+                    permit = await self._rate_limiter.acquire(provider_name, request)
+                    response = await provider.generate(request)
+                except BaseException as e:
+                    self._rate_limiter.settle(permit, 0)
+                    self._record_outcome(breaker, e)
+                    if isinstance(e, LLMError):
+                        self._metrics.record_error(provider_name, request.model, e)
+                    raise
+                self._rate_limiter.settle(permit, response.usage.total_tokens)
+                self._record_outcome(breaker, None)
+                self._metrics.record_response(provider_name, response)
 
                 # Log successful request
                 logger.info(
@@ -298,6 +635,7 @@ class LLMClient:
 
                 # If more retries left, wait with exponential backoff
                 if attempt < self._max_retries:
+                    self._metrics.record_retry(provider_name, request.model)
                     delay = self._calculate_backoff(attempt, e)
                     logger.debug(
                         "Waiting %.2f seconds before retry",
@@ -320,6 +658,27 @@ class LLMClient:
             correlation_id=correlation_id,
         )
 
+    @staticmethod
+    def _record_outcome(breaker: CircuitBreaker | None, error: BaseException | None) -> None:
+        """Report a provider call's outcome to its circuit breaker.
+
+        Retryable errors count as failures. Non-retryable LLM errors mean the
+        provider answered, so they count as successes. Anything else (e.g.
+        cancellation) releases the call without an outcome.
+
+        Args:
+            breaker: Provider's breaker, or None when breakers are disabled.
+            error: Exception the call raised, or None on success.
+        """
+        if breaker is None:
+            return
+        if error is None or isinstance(error, (AuthenticationError, InvalidRequestError, ContentFilterError, ModelNotFoundError)):
+            breaker.record_success()
+        elif isinstance(error, RETRYABLE_ERRORS):
+            breaker.record_failure(timeout=isinstance(error, TimeoutError))
+        else:
+            breaker.release()
+
     def _calculate_backoff(self, attempt: int, error: Exception) -> float:
         """Calculate backoff delay with exponential growth and jitter.
 
@@ -350,14 +709,40 @@ class LLMClient:
 _default_client: LLMClient | None = None
 
 
-def get_client() -> LLMClient:
-    """Get the default LLM client singleton."""
+def get_llm_client() -> LLMClient:
+    """Get the process-wide LLM client, creating it on first use.
+
+    Services share this client rather than constructing one per call, so
+    providers, pooled connections and the process-wide cache, limiter,
+    breakers, hedging policy and metrics are set up once.
+    """
     global _default_client
     if _default_client is None:
         _default_client = LLMClient()
     return _default_client
 
 
+def set_llm_client(client: LLMClient | None) -> None:
+    """Set the process-wide LLM client (for testing)."""
+    global _default_client
+    _default_client = client
+
+
+async def close_llm_client() -> None:
+    """Drop the process-wide client on shutdown.
+
+    Its providers' connections belong to the shared HTTP pool and are
+    closed by close_shared_http_clients().
+    """
+    global _default_client
+    _default_client = None
+
+
+def get_client() -> LLMClient:
+    """Get the default LLM client singleton (same as get_llm_client)."""
+    return get_llm_client()
+
+
 def get_provider(name: str) -> LLMProvider:
     """Get a specific provider by name."""
     return get_client().get_provider(name)
@@ -93,6 +93,16 @@ class ProviderError(LLMError):
     pass
 
 
+class CircuitOpenError(ProviderError):
+    """Provider skipped because its circuit breaker is open.
+
+    Raised locally without calling the provider. Falls back like any other
+    provider-side failure.
+    """
+
+    pass
+
+
 class ModelNotFoundError(LLMError):
     """Model identifier not recognized.
 
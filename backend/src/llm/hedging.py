@@ -0,0 +1,169 @@
+"""Hedged requests for LLM tail latency.
+
+A few calls take several times the median latency, and the slowest chapter
+sets a job's end-to-end time. With hedging, if a call is still running after
+a high percentile of recently observed latency for its model, LLMClient sends
+a duplicate and takes whichever finishes first, cancelling the other.
+
+Duplicates cost money, so hedges are capped at a fraction of all requests.
+Until a model has enough latency samples, its calls are never hedged.
+
+Configuration (env vars):
+- LLM_HEDGE_ENABLED: Hedge generate() calls by default (default: false)
+- LLM_HEDGE_PERCENTILE: Latency percentile that triggers a hedge (default: 95)
+- LLM_HEDGE_MIN_SAMPLES: Samples per model before hedging (default: 20)
+- LLM_HEDGE_WINDOW: Recent latencies kept per model (default: 200)
+- LLM_HEDGE_MIN_DELAY_SECONDS: Never hedge earlier than this (default: 1.0)
+- LLM_HEDGE_BUDGET_RATIO: Max hedges as a fraction of requests (default: 0.1)
+"""
+
+import logging
+import math
+import os
+from collections import deque
+from dataclasses import asdict, dataclass
+
+logger = logging.getLogger(__name__)
+
+LLM_HEDGE_ENABLED = os.environ.get("LLM_HEDGE_ENABLED", "false").lower() == "true"
+LLM_HEDGE_PERCENTILE = float(os.environ.get("LLM_HEDGE_PERCENTILE", "95"))
+LLM_HEDGE_MIN_SAMPLES = int(os.environ.get("LLM_HEDGE_MIN_SAMPLES", "20"))
+LLM_HEDGE_WINDOW = int(os.environ.get("LLM_HEDGE_WINDOW", "200"))
+LLM_HEDGE_MIN_DELAY_SECONDS = float(os.environ.get("LLM_HEDGE_MIN_DELAY_SECONDS", "1.0"))
+LLM_HEDGE_BUDGET_RATIO = float(os.environ.get("LLM_HEDGE_BUDGET_RATIO", "0.1"))
+
+
+@dataclass
+class HedgeStats:
+    """Hedging counters."""
+
+    requests: int = 0
+    hedges_launched: int = 0
+    hedge_wins: int = 0
+    budget_denied: int = 0
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary."""
+        return asdict(self)
+
+
+class LatencyTracker:
+    """Rolling window of observed latencies per model."""
+
+    def __init__(self, window: int = LLM_HEDGE_WINDOW):
+        """Initialize tracker.
+
+        Args:
+            window: Number of recent latencies kept per model.
+        """
+        self._window = window
+        self._latencies: dict[str, deque[float]] = {}
+
+    def record(self, model: str, latency_ms: float) -> None:
+        """Record a completed call's latency."""
+        samples = self._latencies.get(model)
+        if samples is None:
+            samples = deque(maxlen=self._window)
+            self._latencies[model] = samples
+        samples.append(latency_ms)
+
+    def sample_count(self, model: str) -> int:
+        """Number of latencies recorded for a model."""
+        return len(self._latencies.get(model, ()))
+
+    def percentile(self, model: str, percentile: float) -> float | None:
+        """Get a latency percentile (nearest-rank) in milliseconds.
+
+        Args:
+            model: Model identifier.
+            percentile: Percentile in (0, 100].
+
+        Returns:
+            Latency in milliseconds, or None with no samples.
+        """
+        samples = self._latencies.get(model)
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        rank = max(1, math.ceil(percentile / 100 * len(ordered)))
+        return ordered[min(rank, len(ordered)) - 1]
+
+
+class HedgingPolicy:
+    """Decides when to hedge and enforces the hedge budget."""
+
+    def __init__(
+        self,
+        enabled: bool = LLM_HEDGE_ENABLED,
+        percentile: float = LLM_HEDGE_PERCENTILE,
+        min_samples: int = LLM_HEDGE_MIN_SAMPLES,
+        min_delay_seconds: float = LLM_HEDGE_MIN_DELAY_SECONDS,
+        budget_ratio: float = LLM_HEDGE_BUDGET_RATIO,
+        tracker: LatencyTracker | None = None,
+    ):
+        """Initialize hedging policy.
+
+        Args:
+            enabled: Whether generate() hedges by default.
+            percentile: Latency percentile that triggers a hedge.
+            min_samples: Samples per model required before hedging.
+            min_delay_seconds: Lower bound on the hedge delay.
+            budget_ratio: Max hedges as a fraction of hedge-eligible requests.
+            tracker: Latency tracker. Defaults to a new tracker.
+        """
+        self.enabled = enabled
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.min_delay_seconds = min_delay_seconds
+        self.budget_ratio = budget_ratio
+        self.tracker = tracker or LatencyTracker()
+        self.stats = HedgeStats()
+
+    def record_latency(self, model: str, latency_ms: float) -> None:
+        """Record an observed latency for a model."""
+        self.tracker.record(model, latency_ms)
+
+    def hedge_delay(self, model: str) -> float | None:
+        """Seconds to wait before hedging a call, or None to never hedge it."""
+        if self.tracker.sample_count(model) < self.min_samples:
+            return None
+        latency_ms = self.tracker.percentile(model, self.percentile)
+        return max(self.min_delay_seconds, latency_ms / 1000)
+
+    def start_request(self) -> None:
+        """Count a hedge-eligible request towards the budget."""
+        self.stats.requests += 1
+
+    def try_acquire_hedge(self) -> bool:
+        """Reserve budget for one hedge, if any is left."""
+        if self.stats.hedges_launched + 1 > self.budget_ratio * self.stats.requests:
+            self.stats.budget_denied += 1
+            return False
+        self.stats.hedges_launched += 1
+        return True
+
+    def record_hedge_win(self) -> None:
+        """Count a hedge that finished before the original call."""
+        self.stats.hedge_wins += 1
+
+    def get_stats(self) -> dict:
+        """Get hedging counters."""
+        return self.stats.to_dict()
+
+
+# Module-level singleton
+_default_policy: HedgingPolicy | None = None
+
+
+def get_hedging_policy() -> HedgingPolicy:
+    """Get the process-wide hedging policy."""
+    global _default_policy
+    if _default_policy is None:
+        _default_policy = HedgingPolicy()
+    return _default_policy
+
+
+def set_hedging_policy(policy: HedgingPolicy | None) -> None:
+    """Set the hedging policy instance (for testing)."""
+    global _default_policy
+    _default_policy = policy
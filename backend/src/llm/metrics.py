@@ -0,0 +1,311 @@
+"""LLM call telemetry by pipeline stage, model and provider.
+
+LLMClient reports every provider call here. The report covers latency,
+prompt and completion tokens, retries, fallbacks, errors by type and cache
+hits. Metrics are kept process-wide and exported in Prometheus text format
+(GET /metrics). They are also kept per generation job, so GenerationJob
+stats can show where its time and tokens went.
+
+The pipeline stage is not part of LLMRequest. Services set it around their
+calls with `llm_stage("chapter")`. Calls made outside a stage are labelled
+"unknown". Per-job rollups use `bind_llm_usage()` in the same way. Both are
+ContextVars, so asyncio tasks created inside the block report against the
+same stage and job.
+"""
+
+import math
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import asdict, dataclass, field
+
+from .models import LLMResponse, Usage
+
+UNKNOWN_STAGE = "unknown"
+
+# Histogram bucket upper bounds (Prometheus "le" labels)
+LATENCY_BUCKETS_SECONDS = (0.5, 1, 2.5, 5, 10, 20, 40, 80, 160, 320)
+TOKEN_BUCKETS = (100, 250, 500, 1000, 2500, 5000, 10000, 25000, 50000, 100000)
+
+_current_stage: ContextVar[str] = ContextVar("llm_stage", default=UNKNOWN_STAGE)
+_current_usage: ContextVar["LLMUsageRollup | None"] = ContextVar("llm_usage", default=None)
+
+
+@contextmanager
+def llm_stage(stage: str) -> Iterator[None]:
+    """Label LLM calls made inside the block with a pipeline stage."""
+    token = _current_stage.set(stage)
+    try:
+        yield
+    finally:
+        _current_stage.reset(token)
+
+
+def get_current_stage() -> str:
+    """Get the pipeline stage for calls made in the current context."""
+    return _current_stage.get()
+
+
+def bind_llm_usage(rollup: "LLMUsageRollup") -> Token:
+    """Collect LLM calls made in the current context into a rollup.
+
+    Returns:
+        Token to pass to unbind_llm_usage().
+    """
+    return _current_usage.set(rollup)
+
+
+def unbind_llm_usage(token: Token) -> None:
+    """Stop collecting into the rollup bound by bind_llm_usage()."""
+    _current_usage.reset(token)
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus style."""
+
+    def __init__(self, buckets: tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+
+
+@dataclass
+class LLMCallStats:
+    """Aggregated calls for one (stage, model, provider)."""
+
+    stage: str
+    model: str
+    provider: str
+    calls: int = 0
+    errors: int = 0
+    retries: int = 0
+    fallbacks: int = 0
+    cache_hits: int = 0
+    latency_ms: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary."""
+        return asdict(self)
+
+
+@dataclass
+class _Series:
+    """Metrics for one (stage, model, provider) label set."""
+
+    stats: LLMCallStats
+    latency: Histogram = field(default_factory=lambda: Histogram(LATENCY_BUCKETS_SECONDS))
+    prompt_tokens: Histogram = field(default_factory=lambda: Histogram(TOKEN_BUCKETS))
+    completion_tokens: Histogram = field(default_factory=lambda: Histogram(TOKEN_BUCKETS))
+    errors_by_type: dict[str, int] = field(default_factory=dict)
+
+
+class LLMUsageRollup:
+    """Per-job totals keyed by (stage, model, provider)."""
+
+    def __init__(self) -> None:
+        self._stats: dict[tuple[str, str, str], LLMCallStats] = {}
+
+    def get(self, stage: str, model: str, provider: str) -> LLMCallStats:
+        """Get (or create) the entry for a label set."""
+        key = (stage, model, provider)
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = LLMCallStats(stage=stage, model=model, provider=provider)
+            self._stats[key] = stats
+        return stats
+
+    @property
+    def prompt_tokens(self) -> int:
+        """Prompt tokens across all entries."""
+        return sum(s.prompt_tokens for s in self._stats.values())
+
+    @property
+    def completion_tokens(self) -> int:
+        """Completion tokens across all entries."""
+        return sum(s.completion_tokens for s in self._stats.values())
+
+    def merge(self, entries: list[dict]) -> None:
+        """Add entries saved by to_list() (e.g. from an earlier run of a job)."""
+        for entry in entries:
+            stats = self.get(entry["stage"], entry["model"], entry["provider"])
+            stats.calls += entry.get("calls", 0)
+            stats.errors += entry.get("errors", 0)
+            stats.retries += entry.get("retries", 0)
+            stats.fallbacks += entry.get("fallbacks", 0)
+            stats.cache_hits += entry.get("cache_hits", 0)
+            stats.latency_ms += entry.get("latency_ms", 0)
+            stats.prompt_tokens += entry.get("prompt_tokens", 0)
+            stats.completion_tokens += entry.get("completion_tokens", 0)
+
+    def to_list(self) -> list[dict]:
+        """Entries as dicts, sorted by stage, model and provider."""
+        return [self._stats[key].to_dict() for key in sorted(self._stats)]
+
+
+class LLMMetrics:
+    """Process-wide LLM call metrics with Prometheus text export."""
+
+    def __init__(self) -> None:
+        self._series: dict[tuple[str, str, str], _Series] = {}
+
+    def _series_for(self, model: str, provider: str) -> tuple[_Series, LLMCallStats | None]:
+        """Get the process-wide series and the active job entry for a call."""
+        stage = get_current_stage()
+        key = (stage, model, provider)
+        series = self._series.get(key)
+        if series is None:
+            series = _Series(stats=LLMCallStats(stage=stage, model=model, provider=provider))
+            self._series[key] = series
+        rollup = _current_usage.get()
+        job_stats = rollup.get(stage, model, provider) if rollup is not None else None
+        return series, job_stats
+
+    def record_response(self, provider: str, response: LLMResponse) -> None:
+        """Record a successful provider call."""
+        self.record_call(provider, response.model, response.latency_ms, response.usage)
+
+    def record_call(self, provider: str, model: str, latency_ms: int, usage: Usage | None) -> None:
+        """Record a successful call (usage may be None for streams without it)."""
+        series, job_stats = self._series_for(model, provider)
+        series.latency.observe(latency_ms / 1000)
+        if usage is not None:
+            series.prompt_tokens.observe(usage.prompt_tokens)
+            series.completion_tokens.observe(usage.completion_tokens)
+        for stats in (series.stats, job_stats):
+            if stats is not None:
+                stats.calls += 1
+                stats.latency_ms += latency_ms
+                if usage is not None:
+                    stats.prompt_tokens += usage.prompt_tokens
+                    stats.completion_tokens += usage.completion_tokens
+
+    def record_error(self, provider: str, model: str, error: BaseException) -> None:
+        """Record a failed provider call."""
+        series, job_stats = self._series_for(model, provider)
+        error_type = type(error).__name__
+        series.errors_by_type[error_type] = series.errors_by_type.get(error_type, 0) + 1
+        for stats in (series.stats, job_stats):
+            if stats is not None:
+                stats.errors += 1
+
+    def record_retry(self, provider: str, model: str) -> None:
+        """Record a retry of a failed call on the same provider."""
+        for stats in self._stats_for(model, provider):
+            stats.retries += 1
+
+    def record_fallback(self, provider: str, model: str) -> None:
+        """Record giving up on a provider and moving to the next one."""
+        for stats in self._stats_for(model, provider):
+            stats.fallbacks += 1
+
+    def record_cache_hit(self, model: str) -> None:
+        """Record a response served from the response cache."""
+        for stats in self._stats_for(model, "cache"):
+            stats.cache_hits += 1
+
+    def _stats_for(self, model: str, provider: str) -> list[LLMCallStats]:
+        """Process-wide and (if bound) per-job counters for a call."""
+        series, job_stats = self._series_for(model, provider)
+        return [s for s in (series.stats, job_stats) if s is not None]
+
+    def get_stats(self) -> list[dict]:
+        """Get counters per (stage, model, provider)."""
+        return [self._series[key].stats.to_dict() for key in sorted(self._series)]
+
+    def render_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines: list[str] = []
+        series = [self._series[key] for key in sorted(self._series)]
+
+        counters = (
+            ("llm_requests_total", "Successful LLM provider calls.", "calls"),
+            ("llm_retries_total", "LLM call retries on the same provider.", "retries"),
+            ("llm_fallbacks_total", "LLM calls that moved on to a fallback provider.", "fallbacks"),
+            ("llm_cache_hits_total", "LLM responses served from the response cache.", "cache_hits"),
+        )
+        for name, help_text, attr in counters:
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+            for s in series:
+                value = getattr(s.stats, attr)
+                if value:
+                    lines.append(f"{name}{{{_labels(s.stats)}}} {value}")
+
+        lines += [
+            "# HELP llm_errors_total Failed LLM provider calls by error type.",
+            "# TYPE llm_errors_total counter",
+        ]
+        for s in series:
+            for error_type, count in sorted(s.errors_by_type.items()):
+                lines.append(
+                    f'llm_errors_total{{{_labels(s.stats)},error_type="{error_type}"}} {count}'
+                )
+
+        histograms = (
+            ("llm_request_latency_seconds", "LLM provider call latency.", "latency"),
+            ("llm_prompt_tokens", "Prompt tokens per LLM call.", "prompt_tokens"),
+            ("llm_completion_tokens", "Completion tokens per LLM call.", "completion_tokens"),
+        )
+        for name, help_text, attr in histograms:
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+            for s in series:
+                histogram: Histogram = getattr(s, attr)
+                if not histogram.count:
+                    continue
+                labels = _labels(s.stats)
+                for bound, count in zip(histogram.buckets, histogram.counts, strict=True):
+                    lines.append(f'{name}_bucket{{{labels},le="{_format_number(bound)}"}} {count}')
+                lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+                lines.append(f"{name}_sum{{{labels}}} {_format_number(histogram.sum)}")
+                lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _escape_label(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(stats: LLMCallStats) -> str:
+    """Render the stage/model/provider label set."""
+    return (
+        f'stage="{_escape_label(stats.stage)}",'
+        f'model="{_escape_label(stats.model)}",'
+        f'provider="{_escape_label(stats.provider)}"'
+    )
+
+
+def _format_number(value: float) -> str:
+    """Format a number without a trailing .0 for integral values."""
+    if math.isfinite(value) and value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+# Module-level singleton
+_default_metrics: LLMMetrics | None = None
+
+
+def get_llm_metrics() -> LLMMetrics:
+    """Get the process-wide LLM metrics registry."""
+    global _default_metrics
+    if _default_metrics is None:
+        _default_metrics = LLMMetrics()
+    return _default_metrics
+
+
+def set_llm_metrics(metrics: LLMMetrics | None) -> None:
+    """Set the LLM metrics registry (for testing)."""
+    global _default_metrics
+    _default_metrics = metrics
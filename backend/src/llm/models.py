@@ -17,6 +17,8 @@ class ChatMessage(BaseModel):
     name: str | None = None
     tool_call_id: str | None = None
     tool_calls: list[dict[str, Any]] | None = None
+    # Marks the end of a stable prompt prefix that providers may cache
+    cache_breakpoint: bool = False
 
 
 class ResponseFormat(BaseModel):
@@ -38,6 +40,7 @@ class LLMRequest(BaseModel):
     tool_choice: str | dict[str, Any] | None = None
     stop: list[str] | None = None
     metadata: dict[str, Any] | None = None
+    cache: bool = True  # Set False for sampling calls that need fresh output
 
 
 class Usage(BaseModel):
@@ -46,6 +49,10 @@ class Usage(BaseModel):
     prompt_tokens: int
     completion_tokens: int
     total_tokens: int
+    # Prompt tokens served from / written to the provider's prompt cache
+    # (both are included in prompt_tokens)
+    cached_tokens: int = 0
+    cache_write_tokens: int = 0
 
 
 class LLMResponse(BaseModel):
@@ -57,6 +64,21 @@ class LLMResponse(BaseModel):
     usage: Usage
     model: str
     provider: str
-    latency_ms: int
+    latency_ms: int  # 0 when served from the response cache
     request_id: str | None = None
     raw: dict[str, Any] | None = None
+    cache_hit: bool = False
+
+
+class StreamChunk(BaseModel):
+    """A single incremental piece of a streamed LLM response.
+
+    Text arrives as deltas; the final chunk carries finish_reason and, when
+    the provider reports it, usage.
+    """
+
+    delta: str = ""
+    finish_reason: str | None = None
+    usage: Usage | None = None
+    model: str | None = None
+    provider: str
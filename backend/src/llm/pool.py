@@ -0,0 +1,113 @@
+"""Process-wide pooled HTTP transport for LLM providers.
+
+Every LLMClient builds its own provider objects, and each provider lazily
+creates an AsyncOpenAI/AsyncAnthropic SDK client. Without a shared transport
+each of those SDK clients would open its own connection pool, paying TCP/TLS
+setup again for every chapter. Providers instead pass the shared HTTP client
+from this module to the SDK, so connections are kept alive and reused across
+all LLMClient instances in the process.
+
+Configuration (env vars):
+- LLM_HTTP_MAX_CONNECTIONS: Max open connections per event loop (default: 100)
+- LLM_HTTP_MAX_KEEPALIVE: Max idle keep-alive connections (default: 20)
+- LLM_HTTP_KEEPALIVE_EXPIRY: Seconds an idle connection is kept (default: 30)
+- LLM_HTTP2_ENABLED: Use HTTP/2 when the h2 package is installed (default: true)
+"""
+
+import asyncio
+import importlib.util
+import logging
+import os
+import weakref
+from types import ModuleType
+from typing import Any
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+LLM_HTTP_MAX_CONNECTIONS = int(os.environ.get("LLM_HTTP_MAX_CONNECTIONS", "100"))
+LLM_HTTP_MAX_KEEPALIVE = int(os.environ.get("LLM_HTTP_MAX_KEEPALIVE", "20"))
+LLM_HTTP_KEEPALIVE_EXPIRY = float(os.environ.get("LLM_HTTP_KEEPALIVE_EXPIRY", "30"))
+LLM_HTTP2_ENABLED = os.environ.get("LLM_HTTP2_ENABLED", "true").lower() == "true"
+
+# Connections are bound to the event loop that opened them, so keep one pool
+# per loop (and per SDK HTTP client class). Entries disappear when their loop
+# is garbage collected.
+_shared_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[type, Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def http2_available() -> bool:
+    """Check whether HTTP/2 is enabled and the h2 package is installed."""
+    return LLM_HTTP2_ENABLED and importlib.util.find_spec("h2") is not None
+
+
+def _httpx_module_for(client_cls: type) -> ModuleType:
+    """Find the httpx-compatible package a client class is built on.
+
+    SDK versions differ in whether they ship on httpx or a fork of it, and
+    Limits must come from the same package as the client.
+    """
+    for base in client_cls.__mro__:
+        if base.__name__ == "AsyncClient":
+            return importlib.import_module(base.__module__.split(".")[0])
+    return httpx
+
+
+def _create_http_client(client_cls: type) -> Any:
+    """Create a pooled HTTP client with the configured limits."""
+    httpx_module = _httpx_module_for(client_cls)
+    http2 = http2_available()
+    logger.debug(
+        f"Creating shared LLM HTTP pool ({client_cls.__name__}): "
+        f"max_connections={LLM_HTTP_MAX_CONNECTIONS}, "
+        f"max_keepalive={LLM_HTTP_MAX_KEEPALIVE}, http2={http2}"
+    )
+    return client_cls(
+        http2=http2,
+        limits=httpx_module.Limits(
+            max_connections=LLM_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=LLM_HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=LLM_HTTP_KEEPALIVE_EXPIRY,
+        ),
+        follow_redirects=True,
+    )
+
+
+def get_shared_http_client(client_cls: type = httpx.AsyncClient) -> Any:
+    """Get the pooled HTTP client for the running event loop.
+
+    Args:
+        client_cls: HTTP client class the calling SDK accepts, typically the
+            SDK's DefaultAsyncHttpxClient.
+
+    Returns:
+        Shared client instance, or None when called outside an event loop
+        (the SDK then falls back to its own default client).
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+    loop_clients = _shared_clients.setdefault(loop, {})
+    client = loop_clients.get(client_cls)
+    if client is None or client.is_closed:
+        client = _create_http_client(client_cls)
+        loop_clients[client_cls] = client
+    return client
+
+
+async def close_shared_http_clients() -> None:
+    """Close pooled HTTP clients belonging to the running event loop.
+
+    Clients bound to other loops are dropped without closing, since their
+    connections cannot be awaited from here.
+    """
+    loop = asyncio.get_running_loop()
+    for client in _shared_clients.get(loop, {}).values():
+        if not client.is_closed:
+            await client.aclose()
+    _shared_clients.clear()
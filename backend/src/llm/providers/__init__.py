@@ -6,9 +6,12 @@ This package contains provider-specific implementations of the LLMProvider inter
 from .anthropic import AnthropicProvider
 from .base import LLMProvider
 from .openai import OpenAIProvider
+from .replay import ReplayProvider, SyntheticLatency
 
 __all__ = [
     "LLMProvider",
     "OpenAIProvider",
     "AnthropicProvider",
+    "ReplayProvider",
+    "SyntheticLatency",
 ]
@@ -7,6 +7,7 @@ Supports structured outputs via tool_use pattern (since Anthropic doesn't have n
 import json
 import os
 import time
+from collections.abc import AsyncIterator
 from typing import Any
 
 from anthropic import (
@@ -14,6 +15,7 @@ from anthropic import (
     APIConnectionError,
     APIStatusError,
     APITimeoutError,
+    DefaultAsyncHttpxClient,
 )
 
 from ..errors import (
@@ -26,9 +28,55 @@ from ..errors import (
     RateLimitError,
     TimeoutError,
 )
-from ..models import LLMRequest, LLMResponse, Usage
+from ..models import LLMRequest, LLMResponse, StreamChunk, Usage
+from ..pool import get_shared_http_client
 from .base import LLMProvider
 
+# Map Anthropic stop reasons to our format
+FINISH_REASON_MAP = {
+    "end_turn": "stop",
+    "max_tokens": "length",
+    "stop_sequence": "stop",
+    "tool_use": "tool_calls",
+}
+
+
+# Marks the end of a cacheable prompt prefix
+EPHEMERAL_CACHE_CONTROL = {"type": "ephemeral"}
+
+
+def _token_count(value: Any) -> int:
+    """Read an optional token counter from an SDK usage object."""
+    return value if isinstance(value, int) else 0
+
+
+def _parse_usage(usage: Any, output_tokens: int) -> Usage:
+    """Convert Anthropic usage, folding prompt-cache reads/writes into prompt_tokens.
+
+    Anthropic reports cache reads and writes separately from input_tokens;
+    prompt_tokens keeps meaning "all prompt tokens" across providers.
+    """
+    cached = _token_count(getattr(usage, "cache_read_input_tokens", 0))
+    written = _token_count(getattr(usage, "cache_creation_input_tokens", 0))
+    prompt_tokens = usage.input_tokens + cached + written
+    return Usage(
+        prompt_tokens=prompt_tokens,
+        completion_tokens=output_tokens,
+        total_tokens=prompt_tokens + output_tokens,
+        cached_tokens=cached,
+        cache_write_tokens=written,
+    )
+
+
+def _with_cache_control(content: str | list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Convert message content to blocks with a cache breakpoint on the last one."""
+    if isinstance(content, str):
+        blocks = [{"type": "text", "text": content}]
+    else:
+        blocks = [dict(block) for block in content]
+    blocks[-1]["cache_control"] = EPHEMERAL_CACHE_CONTROL
+    return blocks
+
 
 class AnthropicProvider(LLMProvider):
     """Anthropic Messages API provider.
@@ -38,6 +86,7 @@ class AnthropicProvider(LLMProvider):
     - Function/tool calling
     - Vision (image inputs)
     - Streaming
+    - Prompt caching (cache_breakpoint messages map to cache_control)
 
     Note: Anthropic doesn't have native json_schema mode, but we achieve
     similar results using tool_use with a "respond" tool that has the schema.
@@ -84,7 +133,12 @@ class AnthropicProvider(LLMProvider):
                     "Anthropic API key not configured. Set ANTHROPIC_API_KEY environment variable.",
                     provider=self.name,
                 )
-            self._client = AsyncAnthropic(api_key=self._api_key, timeout=self._timeout)
+            # Reuse the process-wide pooled transport (keep-alive, HTTP/2)
+            self._client = AsyncAnthropic(
+                api_key=self._api_key,
+                timeout=self._timeout,
+                http_client=get_shared_http_client(DefaultAsyncHttpxClient),
+            )
         return self._client
 
     def supports(self, feature: str) -> bool:
@@ -128,10 +182,85 @@ class AnthropicProvider(LLMProvider):
         except APIStatusError as e:
             self._handle_api_error(e)
 
+    async def stream(self, request: LLMRequest) -> AsyncIterator[StreamChunk]:
+        """Stream a completion from Anthropic as text deltas.
+
+        Structured output (json_schema via the respond_with_json tool) streams
+        the tool's partial JSON as text, matching what generate() returns.
+
+        Args:
+            request: Vendor-neutral LLM request.
+
+        Yields:
+            StreamChunk deltas; the final chunk carries finish_reason and usage.
+
+        Raises:
+            Various LLMError subclasses based on the error type.
+        """
+        anthropic_request = self._build_request(request)
+        anthropic_request["stream"] = True
+        structured = bool(request.response_format and request.response_format.type == "json_schema")
+
+        model: str | None = None
+        input_usage: Any = None
+        output_tokens = 0
+        stop_reason: str | None = None
+        try:
+            stream = await self.client.messages.create(**anthropic_request)
+            try:
+                async for event in stream:
+                    if event.type == "message_start":
+                        model = event.message.model
+                        input_usage = event.message.usage
+                    elif event.type == "content_block_delta":
+                        delta = event.delta
+                        if delta.type == "text_delta" and delta.text:
+                            yield StreamChunk(delta=delta.text, model=model, provider=self.name)
+                        elif delta.type == "input_json_delta" and structured and delta.partial_json:
+                            yield StreamChunk(delta=delta.partial_json, model=model, provider=self.name)
+                    elif event.type == "message_delta":
+                        stop_reason = event.delta.stop_reason or stop_reason
+                        output_tokens = event.usage.output_tokens
+            finally:
+                # Abort the HTTP response if the consumer stopped early or was
+                # cancelled, so the provider stops generating tokens
+                await stream.close()
+
+        except APITimeoutError as e:
+            raise TimeoutError(
+                f"Anthropic stream timed out after {self._timeout}s",
+                provider=self.name,
+            ) from e
+
+        except APIConnectionError as e:
+            raise ProviderError(
+                f"Failed to connect to Anthropic: {e}",
+                provider=self.name,
+            ) from e
+
+        except APIStatusError as e:
+            self._handle_api_error(e)
+
+        yield StreamChunk(
+            finish_reason=FINISH_REASON_MAP.get(stop_reason, stop_reason) or "stop",
+            usage=(
+                _parse_usage(input_usage, output_tokens)
+                if input_usage is not None
+                else Usage(prompt_tokens=0, completion_tokens=output_tokens, total_tokens=output_tokens)
+            ),
+            model=model,
+            provider=self.name,
+        )
+
     def _build_request(self, request: LLMRequest) -> dict[str, Any]:
-        """Convert LLMRequest to Anthropic API format."""
+        """Convert LLMRequest to Anthropic API format.
+
+        Messages flagged with cache_breakpoint get an ephemeral cache_control
+        marker on their last content block, so the prompt up to and
+        including them is cached across requests.
+        """
         # Separate system message from conversation messages
-        system_content = None
+        system_content: str | list[dict[str, Any]] | None = None
         messages = []
 
         for msg in request.messages:
@@ -142,6 +271,8 @@ class AnthropicProvider(LLMProvider):
                 else:
                     # Handle list content (shouldn't happen for system, but be safe)
                     system_content = str(msg.content)
+                if msg.cache_breakpoint:
+                    system_content = _with_cache_control(system_content)
             elif msg.role == "tool":
                 # Convert tool response to Anthropic format
                 messages.append({
@@ -156,7 +287,7 @@ class AnthropicProvider(LLMProvider):
                 # user or assistant messages
                 anthropic_msg: dict[str, Any] = {
                     "role": msg.role,
-                    "content": msg.content,
+                    "content": _with_cache_control(msg.content) if msg.cache_breakpoint else msg.content,
                 }
                 messages.append(anthropic_msg)
 
@@ -253,24 +384,13 @@ class AnthropicProvider(LLMProvider):
 
         text = "\n".join(text_parts) if text_parts else None
 
-        # Map Anthropic stop reasons to our format
-        finish_reason_map = {
-            "end_turn": "stop",
-            "max_tokens": "length",
-            "stop_sequence": "stop",
-            "tool_use": "tool_calls",
-        }
-        finish_reason = finish_reason_map.get(response.stop_reason, response.stop_reason)
+        finish_reason = FINISH_REASON_MAP.get(response.stop_reason, response.stop_reason)
 
         return LLMResponse(
             text=text,
             tool_calls=tool_calls if tool_calls else None,
             finish_reason=finish_reason,
-            usage=Usage(
-                prompt_tokens=response.usage.input_tokens,
-                completion_tokens=response.usage.output_tokens,
-                total_tokens=response.usage.input_tokens + response.usage.output_tokens,
-            ),
+            usage=_parse_usage(response.usage, response.usage.output_tokens),
             model=response.model,
             provider=self.name,
             latency_ms=latency_ms,
@@ -5,9 +5,8 @@ Defines the interface that all LLM providers must implement.
 
 from abc import ABC, abstractmethod
 from collections.abc import AsyncIterator
-from typing import Any
 
-from ..models import LLMRequest, LLMResponse
+from ..models import LLMRequest, LLMResponse, StreamChunk
 
 
 class LLMProvider(ABC):
@@ -61,14 +60,18 @@ class LLMProvider(ABC):
         """
         ...
 
-    async def stream(self, request: LLMRequest) -> AsyncIterator[dict[str, Any]]:
+    async def stream(self, request: LLMRequest) -> AsyncIterator[StreamChunk]:
         """Stream response chunks.
 
+        Errors raised before the first chunk use the same LLMError types as
+        generate(); errors after that surface mid-iteration.
+
         Args:
             request: Vendor-neutral LLM request.
 
         Yields:
-            Response chunks as they arrive.
+            StreamChunk text deltas as they arrive; the last chunk carries
+            finish_reason (and usage when available).
 
         Raises:
             NotImplementedError: If streaming is not supported.
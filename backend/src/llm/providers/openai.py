@@ -7,9 +7,16 @@ Supports structured outputs via response_format.json_schema.
 import logging
 import os
 import time
+from collections.abc import AsyncIterator
 from typing import Any
 
-from openai import AsyncOpenAI, APIConnectionError, APIStatusError, APITimeoutError
+from openai import (
+    AsyncOpenAI,
+    APIConnectionError,
+    APIStatusError,
+    APITimeoutError,
+    DefaultAsyncHttpxClient,
+)
 
 from ..errors import (
     AuthenticationError,
@@ -21,12 +28,25 @@ from ..errors import (
     RateLimitError,
     TimeoutError,
 )
-from ..models import ChatMessage, LLMRequest, LLMResponse, Usage
+from ..models import ChatMessage, LLMRequest, LLMResponse, StreamChunk, Usage
+from ..pool import get_shared_http_client
 from .base import LLMProvider
 
 logger = logging.getLogger(__name__)
 
 
+def _parse_usage(usage: Any) -> Usage:
+    """Convert OpenAI usage, including automatic prompt-cache hits."""
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached = getattr(details, "cached_tokens", 0)
+    return Usage(
+        prompt_tokens=usage.prompt_tokens,
+        completion_tokens=usage.completion_tokens,
+        total_tokens=usage.total_tokens,
+        cached_tokens=cached if isinstance(cached, int) else 0,
+    )
+
+
 def _normalize_openai_json_schema(loaded: dict) -> dict:
     """Normalize JSON schema for OpenAI structured output.
 
@@ -126,7 +146,12 @@ class OpenAIProvider(LLMProvider):
                     "OpenAI API key not configured. Set OPENAI_API_KEY environment variable.",
                     provider=self.name,
                 )
-            self._client = AsyncOpenAI(api_key=self._api_key, timeout=self._timeout)
+            # Reuse the process-wide pooled transport (keep-alive, HTTP/2)
+            self._client = AsyncOpenAI(
+                api_key=self._api_key,
+                timeout=self._timeout,
+                http_client=get_shared_http_client(DefaultAsyncHttpxClient),
+            )
         return self._client
 
     def supports(self, feature: str) -> bool:
@@ -170,8 +195,74 @@ class OpenAIProvider(LLMProvider):
         except APIStatusError as e:
             self._handle_api_error(e)
 
+    async def stream(self, request: LLMRequest) -> AsyncIterator[StreamChunk]:
+        """Stream a completion from OpenAI as text deltas.
+
+        Args:
+            request: Vendor-neutral LLM request.
+
+        Yields:
+            StreamChunk deltas; the final chunk carries finish_reason and usage.
+
+        Raises:
+            Various LLMError subclasses based on the error type.
+        """
+        openai_request = self._build_request(request)
+        openai_request["stream"] = True
+        openai_request["stream_options"] = {"include_usage": True}
+
+        finish_reason: str | None = None
+        model: str | None = None
+        try:
+            stream = await self.client.chat.completions.create(**openai_request)
+            try:
+                async for chunk in stream:
+                    model = chunk.model or model
+                    if chunk.choices:
+                        choice = chunk.choices[0]
+                        if choice.finish_reason:
+                            finish_reason = choice.finish_reason
+                        if choice.delta and choice.delta.content:
+                            yield StreamChunk(delta=choice.delta.content, model=model, provider=self.name)
+                    if chunk.usage:
+                        # Usage arrives on a trailing chunk with no choices
+                        yield StreamChunk(
+                            finish_reason=finish_reason or "stop",
+                            usage=_parse_usage(chunk.usage),
+                            model=model,
+                            provider=self.name,
+                        )
+                        return
+            finally:
+                # Abort the HTTP response if the consumer stopped early or was
+                # cancelled, so the provider stops generating tokens
+                await stream.close()
+
+        except APITimeoutError as e:
+            raise TimeoutError(
+                f"OpenAI stream timed out after {self._timeout}s",
+                provider=self.name,
+            ) from e
+
+        except APIConnectionError as e:
+            raise ProviderError(
+                f"Failed to connect to OpenAI: {e}",
+                provider=self.name,
+            ) from e
+
+        except APIStatusError as e:
+            self._handle_api_error(e)
+
+        # Stream ended without a usage chunk
+        yield StreamChunk(finish_reason=finish_reason or "stop", model=model, provider=self.name)
+
     def _build_request(self, request: LLMRequest) -> dict[str, Any]:
-        """Convert LLMRequest to OpenAI API format."""
+        """Convert LLMRequest to OpenAI API format.
+
+        OpenAI caches prompt prefixes automatically, so cache_breakpoint
+        markers need no translation; callers get cache hits by keeping
+        stable content at the start of the message list.
+        """
         # Convert messages
         messages = []
         for msg in request.messages:
@@ -246,11 +337,7 @@ class OpenAIProvider(LLMProvider):
             text=message.content,
             tool_calls=tool_calls,
             finish_reason=choice.finish_reason or "stop",
-            usage=Usage(
-                prompt_tokens=response.usage.prompt_tokens,
-                completion_tokens=response.usage.completion_tokens,
-                total_tokens=response.usage.total_tokens,
-            ),
+            usage=_parse_usage(response.usage),
             model=response.model,
             provider=self.name,
             latency_ms=latency_ms,
@@ -0,0 +1,249 @@
+"""Record/replay provider for offline pipeline benchmarking.
+
+In record mode, requests go to a live upstream provider and each
+request/response pair is saved to a fixture directory. Fixtures are keyed by
+the same content hash as the response cache (llm.cache.compute_request_key).
+In replay mode, the saved responses are served back without network access,
+with an optional synthetic latency. This lets the full draft pipeline be
+profiled deterministically, without live API keys and without provider
+latency noise hiding changes in our own code.
+
+Select it with LLM_DEFAULT_PROVIDER=replay. LLMClient then routes every call
+to this provider and never falls back to a live one.
+
+Configuration (env vars):
+- LLM_REPLAY_MODE: "replay" or "record" (default: replay)
+- LLM_REPLAY_DIR: Fixture directory (default: .cache/llm_replay)
+- LLM_REPLAY_UPSTREAM: Provider recorded from (default: openai)
+- LLM_REPLAY_LATENCY: Synthetic latency for replayed calls (default: none).
+  One of "none", "recorded", "fixed:<ms>", "uniform:<min_ms>:<max_ms>" or
+  "lognormal:<median_ms>:<sigma>".
+- LLM_REPLAY_SEED: Seed for sampled latencies (default: 0)
+"""
+
+import asyncio
+import json
+import logging
+import math
+import os
+import random
+import time
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+from ..cache import compute_request_key
+from ..errors import InvalidRequestError
+from ..models import LLMRequest, LLMResponse, StreamChunk
+from .base import LLMProvider
+
+logger = logging.getLogger(__name__)
+
+LLM_REPLAY_MODE = os.environ.get("LLM_REPLAY_MODE", "replay").lower()
+LLM_REPLAY_DIR = os.environ.get("LLM_REPLAY_DIR", ".cache/llm_replay")
+LLM_REPLAY_UPSTREAM = os.environ.get("LLM_REPLAY_UPSTREAM", "openai")
+LLM_REPLAY_LATENCY = os.environ.get("LLM_REPLAY_LATENCY", "none")
+LLM_REPLAY_SEED = int(os.environ.get("LLM_REPLAY_SEED", "0"))
+
+# Characters per chunk when streaming a replayed response
+REPLAY_STREAM_CHUNK_CHARS = 200
+
+
+class SyntheticLatency:
+    """Latency model applied to replayed responses."""
+
+    KINDS = ("none", "recorded", "fixed", "uniform", "lognormal")
+
+    def __init__(self, kind: str = "none", params: tuple[float, ...] = (), seed: int = LLM_REPLAY_SEED):
+        """Initialize latency model.
+
+        Args:
+            kind: One of KINDS.
+            params: Distribution parameters in milliseconds (sigma for lognormal
+                is unitless).
+            seed: Random seed, so sampled latencies are reproducible.
+        """
+        self.kind = kind
+        self.params = params
+        self._random = random.Random(seed)
+
+    @classmethod
+    def parse(cls, spec: str, seed: int = LLM_REPLAY_SEED) -> "SyntheticLatency":
+        """Parse a latency spec such as "uniform:200:900".
+
+        Raises:
+            ValueError: If the spec is malformed.
+        """
+        kind, *raw_params = spec.strip().lower().split(":")
+        expected = {"none": 0, "recorded": 0, "fixed": 1, "uniform": 2, "lognormal": 2}
+        if kind not in expected:
+            raise ValueError(f"Unknown replay latency {kind!r}. Expected one of {cls.KINDS}")
+        if len(raw_params) != expected[kind]:
+            raise ValueError(f"Replay latency {kind!r} takes {expected[kind]} parameter(s): {spec!r}")
+        params = tuple(float(p) for p in raw_params)
+        if any(p < 0 for p in params):
+            raise ValueError(f"Replay latency parameters must be non-negative: {spec!r}")
+        return cls(kind, params, seed)
+
+    def sample_ms(self, recorded_ms: int) -> float:
+        """Sample a latency in milliseconds for one replayed call."""
+        if self.kind == "recorded":
+            return float(recorded_ms)
+        if self.kind == "fixed":
+            return self.params[0]
+        if self.kind == "uniform":
+            low, high = self.params
+            return self._random.uniform(low, high)
+        if self.kind == "lognormal":
+            median, sigma = self.params
+            return self._random.lognormvariate(math.log(max(median, 1e-3)), sigma)
+        return 0.0
+
+
+def _latency_from_env() -> SyntheticLatency:
+    """Parse LLM_REPLAY_LATENCY, ignoring malformed configuration."""
+    try:
+        return SyntheticLatency.parse(LLM_REPLAY_LATENCY)
+    except ValueError as e:
+        logger.error(f"Ignoring invalid LLM_REPLAY_LATENCY: {e}")
+        return SyntheticLatency()
+
+
+# Shared by every ReplayProvider, so the seeded latency sequence advances
+# across calls even though LLMClient (and its providers) is built per call
+_default_latency: SyntheticLatency | None = None
+
+
+def get_replay_latency() -> SyntheticLatency:
+    """Get the process-wide latency model (from LLM_REPLAY_LATENCY)."""
+    global _default_latency
+    if _default_latency is None:
+        _default_latency = _latency_from_env()
+    return _default_latency
+
+
+def set_replay_latency(latency: SyntheticLatency | None) -> None:
+    """Set the process-wide latency model (for testing)."""
+    global _default_latency
+    _default_latency = latency
+
+
+class ReplayProvider(LLMProvider):
+    """Serves recorded responses, or records them from an upstream provider.
+
+    Fixture structure:
+        fixture_dir/
+            {key[:2]}/
+                {key}.json   # {"request": ..., "response": ...}
+    """
+
+    def __init__(
+        self,
+        upstream: LLMProvider | None = None,
+        fixture_dir: Path | str = LLM_REPLAY_DIR,
+        mode: str = LLM_REPLAY_MODE,
+        latency: SyntheticLatency | None = None,
+    ):
+        """Initialize replay provider.
+
+        Args:
+            upstream: Live provider to record from (required in record mode).
+            fixture_dir: Directory for recorded request/response pairs.
+            mode: "replay" or "record".
+            latency: Synthetic latency for replayed calls. Defaults to the
+                process-wide model from LLM_REPLAY_LATENCY.
+        """
+        if mode not in ("replay", "record"):
+            raise ValueError(f"Unknown replay mode: {mode!r}. Expected 'replay' or 'record'")
+        self.upstream = upstream
+        self.fixture_dir = Path(fixture_dir)
+        self.mode = mode
+        self.latency = latency or get_replay_latency()
+
+    @property
+    def name(self) -> str:
+        """Provider identifier."""
+        return "replay"
+
+    def supports(self, feature: str) -> bool:
+        """Report the recorded provider's capabilities."""
+        if self.upstream is None:
+            return True
+        return self.upstream.supports(feature)
+
+    def _path(self, key: str) -> Path:
+        """Get the fixture path for a request key."""
+        return self.fixture_dir / key[:2] / f"{key}.json"
+
+    def _save(self, key: str, request: LLMRequest, response: LLMResponse) -> None:
+        """Write a request/response pair to its fixture file."""
+        data = json.dumps(
+            {
+                "request": request.model_dump(mode="json", exclude_none=True),
+                "response": response.model_dump(mode="json", exclude={"raw"}),
+            },
+            indent=2,
+            ensure_ascii=False,
+        )
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(data, encoding="utf-8")
+        tmp_path.replace(path)
+
+    def _load(self, key: str) -> LLMResponse | None:
+        """Read a recorded response, or None if no fixture exists."""
+        try:
+            entry = json.loads(self._path(key).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        return LLMResponse.model_validate(entry["response"])
+
+    async def generate(self, request: LLMRequest) -> LLMResponse:
+        """Replay (or record) the response for a request.
+
+        Raises:
+            InvalidRequestError: In replay mode, if the request was never
+                recorded. Retrying cannot help, so this is non-retryable.
+            LLMError: In record mode, whatever the upstream provider raises.
+        """
+        key = compute_request_key(request)
+
+        if self.mode == "record":
+            if self.upstream is None:
+                raise InvalidRequestError("Replay record mode requires an upstream provider", provider=self.name)
+            response = await self.upstream.generate(request)
+            await asyncio.to_thread(self._save, key, request, response)
+            logger.debug(f"Recorded LLM fixture {key[:12]} ({request.model})")
+            return response
+
+        started = time.perf_counter()
+        response = await asyncio.to_thread(self._load, key)
+        if response is None:
+            raise InvalidRequestError(
+                f"No recorded response for request {key[:12]} (model={request.model}) "
+                f"in {self.fixture_dir}. Re-record with LLM_REPLAY_MODE=record.",
+                provider=self.name,
+            )
+
+        delay_ms = self.latency.sample_ms(response.latency_ms)
+        if delay_ms > 0:
+            await asyncio.sleep(delay_ms / 1000)
+        latency_ms = int((time.perf_counter() - started) * 1000)
+        return response.model_copy(update={"latency_ms": latency_ms})
+
+    async def stream(self, request: LLMRequest) -> AsyncIterator[StreamChunk]:
+        """Stream a replayed (or recorded) response in fixed-size chunks."""
+        response = await self.generate(request)
+        text = response.text or ""
+        for start in range(0, len(text), REPLAY_STREAM_CHUNK_CHARS):
+            yield StreamChunk(
+                delta=text[start:start + REPLAY_STREAM_CHUNK_CHARS],
+                model=response.model,
+                provider=response.provider,
+            )
+        yield StreamChunk(
+            finish_reason=response.finish_reason,
+            usage=response.usage,
+            model=response.model,
+            provider=response.provider,
+        )
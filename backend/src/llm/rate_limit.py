@@ -0,0 +1,290 @@
+"""Process-wide RPM/TPM rate limiting for LLM providers.
+
+Every LLMClient shares one RateLimiter, so concurrent jobs draw from the same
+per-provider/model budgets instead of each discovering the provider's limits
+through 429s and backoff. Calls wait in FIFO order until both the request and
+token buckets can cover them; they never fail because of the local limiter.
+
+Token accounting uses an estimate of the prompt before the call and is
+corrected with the provider's reported Usage afterwards.
+
+Configuration (env vars):
+- LLM_RATE_LIMITS: JSON mapping of "provider" or "provider:model" to
+  {"rpm": int, "tpm": int}. Model entries override provider entries.
+  Example: {"openai": {"rpm": 500, "tpm": 200000},
+            "openai:gpt-4o-mini": {"rpm": 5000, "tpm": 2000000}}
+  Unset (default) disables limiting.
+
+Queue waits are exported on /metrics per bucket (see render_prometheus()).
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass, field
+
+from .metrics import Histogram
+from .models import LLMRequest
+
+logger = logging.getLogger(__name__)
+
+# Queue wait histogram bucket upper bounds in seconds
+WAIT_BUCKETS_SECONDS = (0.01, 0.05, 0.1, 0.5, 1, 5, 15, 30, 60, 120)
+
+
+def _load_limits_from_env() -> dict[str, dict[str, int]]:
+    """Parse LLM_RATE_LIMITS, ignoring malformed configuration."""
+    raw = os.environ.get("LLM_RATE_LIMITS", "")
+    if not raw:
+        return {}
+    try:
+        limits = json.loads(raw)
+    except json.JSONDecodeError as e:
+        logger.error(f"Ignoring invalid LLM_RATE_LIMITS: {e}")
+        return {}
+    return {key: dict(value) for key, value in limits.items()}
+
+
+def estimate_prompt_tokens(request: LLMRequest) -> int:
+    """Roughly estimate prompt tokens for a request (~4 chars per token).
+
+    Args:
+        request: LLM request.
+
+    Returns:
+        Estimated prompt token count.
+    """
+    chars = 0
+    for message in request.messages:
+        if isinstance(message.content, str):
+            chars += len(message.content)
+        else:
+            chars += len(json.dumps(message.content))
+    return max(1, chars // 4)
+
+
+@dataclass
+class RateLimitStats:
+    """Queue statistics for one provider/model bucket."""
+
+    requests: int = 0
+    waited_requests: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    queued: int = 0
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary."""
+        return asdict(self)
+
+
+@dataclass
+class RatePermit:
+    """Reservation returned by acquire(), settled with actual usage."""
+
+    key: str
+    estimated_tokens: int
+    wait_seconds: float
+
+
+@dataclass
+class _Bucket:
+    """Continuous-refill request and token buckets for one key."""
+
+    rpm: int | None
+    tpm: int | None
+    requests_available: float = 0.0
+    tokens_available: float = 0.0
+    updated_at: float = field(default_factory=time.monotonic)
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    stats: RateLimitStats = field(default_factory=RateLimitStats)
+    wait_seconds: Histogram = field(default_factory=lambda: Histogram(WAIT_BUCKETS_SECONDS))
+
+    def __post_init__(self) -> None:
+        self.requests_available = float(self.rpm or 0)
+        self.tokens_available = float(self.tpm or 0)
+
+    def refill(self) -> None:
+        """Add capacity accrued since the last refill."""
+        now = time.monotonic()
+        elapsed = now - self.updated_at
+        self.updated_at = now
+        if self.rpm:
+            self.requests_available = min(self.rpm, self.requests_available + elapsed * self.rpm / 60)
+        if self.tpm:
+            self.tokens_available = min(self.tpm, self.tokens_available + elapsed * self.tpm / 60)
+
+    def seconds_until_available(self, tokens: int) -> float:
+        """Time until both buckets can cover one request of the given size."""
+        wait = 0.0
+        if self.rpm and self.requests_available < 1:
+            wait = max(wait, (1 - self.requests_available) * 60 / self.rpm)
+        if self.tpm:
+            # Requests larger than the whole bucket wait for a full bucket
+            needed = min(tokens, self.tpm)
+            if self.tokens_available < needed:
+                wait = max(wait, (needed - self.tokens_available) * 60 / self.tpm)
+        return wait
+
+
+class RateLimiter:
+    """Registry of per-provider/model RPM and TPM buckets."""
+
+    def __init__(self, limits: dict[str, dict[str, int]] | None = None):
+        """Initialize rate limiter.
+
+        Args:
+            limits: Mapping of "provider" or "provider:model" to
+                {"rpm": int, "tpm": int}. Defaults to LLM_RATE_LIMITS.
+        """
+        self._limits = limits if limits is not None else _load_limits_from_env()
+        self._buckets: dict[str, _Bucket] = {}
+
+    def _bucket_for(self, provider: str, model: str) -> tuple[str, _Bucket] | None:
+        """Find (or create) the bucket governing a provider/model pair."""
+        for key in (f"{provider}:{model}", provider):
+            if key in self._limits:
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    limit = self._limits[key]
+                    bucket = _Bucket(rpm=limit.get("rpm"), tpm=limit.get("tpm"))
+                    self._buckets[key] = bucket
+                return key, bucket
+        return None
+
+    async def acquire(self, provider: str, request: LLMRequest) -> RatePermit | None:
+        """Wait until the provider/model budget can cover a request.
+
+        Callers queue in arrival order: the first waiter holds the bucket
+        lock while it sleeps, so later calls cannot overtake it.
+
+        Args:
+            provider: Provider name.
+            request: Request about to be sent.
+
+        Returns:
+            Permit to settle after the call, or None if no limit applies.
+        """
+        found = self._bucket_for(provider, request.model)
+        if found is None:
+            return None
+        key, bucket = found
+        tokens = estimate_prompt_tokens(request)
+
+        started = time.monotonic()
+        bucket.stats.queued += 1
+        try:
+            async with bucket.lock:
+                while True:
+                    bucket.refill()
+                    wait = bucket.seconds_until_available(tokens)
+                    if wait <= 0:
+                        break
+                    await asyncio.sleep(wait)
+                if bucket.rpm:
+                    bucket.requests_available -= 1
+                if bucket.tpm:
+                    bucket.tokens_available -= tokens
+        finally:
+            bucket.stats.queued -= 1
+
+        waited = time.monotonic() - started
+        stats = bucket.stats
+        stats.requests += 1
+        stats.total_wait_seconds += waited
+        stats.max_wait_seconds = max(stats.max_wait_seconds, waited)
+        bucket.wait_seconds.observe(waited)
+        if waited >= 0.001:
+            stats.waited_requests += 1
+            logger.debug(f"Rate limiter {key}: waited {waited:.2f}s for {tokens} estimated tokens")
+
+        return RatePermit(key=key, estimated_tokens=tokens, wait_seconds=waited)
+
+    def settle(self, permit: RatePermit | None, actual_tokens: int) -> None:
+        """Correct the token bucket with the provider's reported usage.
+
+        Under-estimates put the bucket into debt (delaying later calls);
+        over-estimates and failed calls (actual_tokens=0) are refunded.
+
+        Args:
+            permit: Permit from acquire() (None is a no-op).
+            actual_tokens: Tokens actually consumed.
+        """
+        if permit is None:
+            return
+        bucket = self._buckets.get(permit.key)
+        if bucket is None or not bucket.tpm:
+            return
+        bucket.tokens_available = min(
+            bucket.tpm,
+            bucket.tokens_available + permit.estimated_tokens - actual_tokens,
+        )
+
+    def get_stats(self) -> dict[str, dict]:
+        """Get queue statistics per bucket key."""
+        return {key: bucket.stats.to_dict() for key, bucket in self._buckets.items()}
+
+    def render_prometheus(self) -> str:
+        """Render queue metrics per bucket in the Prometheus text exposition format.
+
+        Buckets are labelled by provider and model; provider-wide buckets
+        have model="*".
+        """
+        lines: list[str] = []
+        buckets = [(_bucket_labels(key), self._buckets[key]) for key in sorted(self._buckets)]
+
+        metrics = (
+            ("llm_rate_limit_queued", "gauge", "Calls waiting for rate limit budget.", "queued"),
+            (
+                "llm_rate_limit_waited_requests_total", "counter",
+                "Calls delayed by the local rate limiter.", "waited_requests",
+            ),
+            (
+                "llm_rate_limit_max_wait_seconds", "gauge",
+                "Longest wait for rate limit budget.", "max_wait_seconds",
+            ),
+        )
+        for name, kind, help_text, attr in metrics:
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+            for labels, bucket in buckets:
+                lines.append(f"{name}{{{labels}}} {getattr(bucket.stats, attr):g}")
+
+        name = "llm_rate_limit_wait_seconds"
+        lines += [f"# HELP {name} Time LLM calls waited for rate limit budget.", f"# TYPE {name} histogram"]
+        for labels, bucket in buckets:
+            histogram = bucket.wait_seconds
+            if not histogram.count:
+                continue
+            for bound, count in zip(histogram.buckets, histogram.counts, strict=True):
+                lines.append(f'{name}_bucket{{{labels},le="{bound:g}"}} {count}')
+            lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+            lines.append(f"{name}_sum{{{labels}}} {histogram.sum:g}")
+            lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _bucket_labels(key: str) -> str:
+    """Render provider/model labels for a "provider" or "provider:model" key."""
+    provider, _, model = key.partition(":")
+    return f'provider="{provider}",model="{model or "*"}"'
+
+
+# Module-level singleton
+_default_limiter: RateLimiter | None = None
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Get the process-wide rate limiter singleton."""
+    global _default_limiter
+    if _default_limiter is None:
+        _default_limiter = RateLimiter()
+    return _default_limiter
+
+
+def set_rate_limiter(limiter: RateLimiter | None) -> None:
+    """Set the rate limiter instance (for testing)."""
+    global _default_limiter
+    _default_limiter = limiter
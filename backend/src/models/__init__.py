@@ -72,8 +72,11 @@ from .draft_plan import (
 )
 from .api_responses import (
     JobStatus,
+    JobPriority,
     GenerationProgress,
     TokenUsage,
+    LLMStageUsage,
+    StageTiming,
     GenerationStats,
     ErrorDetail,
     # Request models
@@ -99,7 +102,7 @@ from .api_responses import (
     ExportCancelData,
     ExportCancelResponse,
 )
-from .generation_job import GenerationJob
+from .generation_job import GenerationCheckpoint, GenerationJob
 from .export_job import (
     ExportJob,
     ExportJobStatus,
@@ -220,8 +223,11 @@ __all__ = [
     "draft_plan_json_schema",
     # API responses
     "JobStatus",
+    "JobPriority",
     "GenerationProgress",
     "TokenUsage",
+    "LLMStageUsage",
+    "StageTiming",
     "GenerationStats",
     "ErrorDetail",
     # Request models
@@ -238,6 +244,7 @@ __all__ = [
     "DraftCancelResponse",
     "DraftRegenerateResponse",
     # Generation job
+    "GenerationCheckpoint",
     "GenerationJob",
     # Export job
     "ExportJob",
@@ -34,6 +34,13 @@ class JobStatus(str, Enum):
     failed = "failed"
 
 
+class JobPriority(str, Enum):
+    """Scheduling priority of a background job (see job_scheduler)."""
+    interactive = "interactive"  # A user is waiting on the result
+    normal = "normal"
+    batch = "batch"  # Corpus and other offline runs
+
+
 class GenerationProgress(BaseModel):
     """Progress information during generation."""
     model_config = ConfigDict(extra="forbid")
@@ -58,6 +65,35 @@ class TokenUsage(BaseModel):
     total_tokens: int = Field(ge=0, description="Total tokens used")
 
 
+class LLMStageUsage(BaseModel):
+    """LLM calls for one (stage, model, provider) within a generation."""
+    model_config = ConfigDict(extra="forbid")
+
+    stage: str = Field(description="Pipeline stage (planning, evidence, chapter, polish, ...)")
+    model: str = Field(description="Model identifier")
+    provider: str = Field(description="Provider that served the calls ('cache' for cache hits)")
+    calls: int = Field(ge=0, default=0, description="Successful provider calls")
+    errors: int = Field(ge=0, default=0, description="Failed provider calls")
+    retries: int = Field(ge=0, default=0, description="Retries on the same provider")
+    fallbacks: int = Field(ge=0, default=0, description="Calls that moved on to another provider")
+    cache_hits: int = Field(ge=0, default=0, description="Responses served from the response cache")
+    latency_ms: int = Field(ge=0, default=0, description="Summed latency of successful calls")
+    prompt_tokens: int = Field(ge=0, default=0, description="Input tokens used")
+    completion_tokens: int = Field(ge=0, default=0, description="Output tokens generated")
+
+
+class StageTiming(BaseModel):
+    """Wall and CPU time for one stage, chapter or enforcement pass."""
+    model_config = ConfigDict(extra="forbid")
+
+    name: str = Field(description="Stage name, 'chapter', or the pass function name")
+    kind: str = Field(description="Entry granularity: stage, chapter or pass")
+    chapter: Optional[int] = Field(default=None, description="Chapter number (None for whole-document entries)")
+    wall_ms: float = Field(ge=0, default=0, description="Summed wall-clock time")
+    cpu_ms: float = Field(ge=0, default=0, description="Summed CPU time of the event loop thread")
+    count: int = Field(ge=0, default=0, description="Number of timed runs")
+
+
 class GenerationStats(BaseModel):
     """Statistics about the completed generation."""
     model_config = ConfigDict(extra="forbid")
@@ -66,6 +102,14 @@ class GenerationStats(BaseModel):
     total_words: int = Field(ge=0, description="Total word count of draft")
     generation_time_ms: int = Field(ge=0, description="Total generation time in milliseconds")
     tokens_used: TokenUsage = Field(description="Token usage breakdown")
+    llm_usage: List[LLMStageUsage] = Field(
+        default_factory=list,
+        description="LLM calls, latency and tokens per stage, model and provider"
+    )
+    timings: List[StageTiming] = Field(
+        default_factory=list,
+        description="Wall and CPU time per stage, chapter and enforcement pass"
+    )
 
 
 # ============================================================================
@@ -90,6 +134,13 @@ class DraftGenerateRequest(BaseModel):
         le=5,
         description="Number of candidates for best-of-N selection (1=disabled, 2-3 recommended)"
     )
+    candidate_score_threshold: Optional[float] = Field(
+        default=None,
+        description=(
+            "Optional 'good enough' score for best-of-N selection. When a candidate "
+            "reaches it, remaining in-flight candidates are cancelled."
+        )
+    )
     require_preflight_pass: bool = Field(
         default=False,
         description=(
@@ -97,6 +148,10 @@ class DraftGenerateRequest(BaseModel):
             "insufficient evidence. When False (default), generation proceeds with warnings."
         )
     )
+    priority: JobPriority = Field(
+        default=JobPriority.normal,
+        description="Scheduling priority when generation jobs are queued"
+    )
 
 
 class DraftRegenerateRequest(BaseModel):
@@ -127,6 +182,10 @@ class DraftGenerateData(BaseModel):
         default=None,
         description="Progress info (if generating)"
     )
+    queue_position: Optional[int] = Field(
+        default=None,
+        description="1-based position among jobs waiting to start (only when queued)"
+    )
 
     # Only present when status == completed
     draft_markdown: Optional[str] = Field(
@@ -160,6 +219,10 @@ class DraftStatusData(BaseModel):
         default=None,
         description="Progress info (if generating)"
     )
+    queue_position: Optional[int] = Field(
+        default=None,
+        description="1-based position among jobs waiting to start (only when queued)"
+    )
 
     # Only present when status == completed
     draft_markdown: Optional[str] = Field(
@@ -339,6 +402,10 @@ class ExportStatusData(BaseModel):
         default=None,
         description="Error message when status is 'failed', null otherwise"
     )
+    queue_position: Optional[int] = Field(
+        default=None,
+        description="1-based position among waiting exports when status is 'pending', null otherwise"
+    )
 
 
 class ExportStatusResponse(BaseModel):
@@ -10,7 +10,7 @@ from datetime import datetime
 from enum import Enum
 from typing import List, Optional
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, PrivateAttr
 
 from .style_config import ContentMode
 
@@ -109,6 +109,30 @@ class ChapterEvidence(BaseModel):
     )
     transcript_range: Optional[TranscriptRange] = None
 
+    # Not serialized: only the run that hit the failure knows about it
+    _extraction_failed: bool = PrivateAttr(default=False)
+
+    @classmethod
+    def failed_extraction(
+        cls,
+        chapter_index: int,
+        chapter_title: str,
+        outline_item_id: Optional[str] = None,
+    ) -> ChapterEvidence:
+        """Empty evidence standing in for a chapter whose extraction failed."""
+        evidence = cls(
+            chapter_index=chapter_index,
+            chapter_title=chapter_title,
+            outline_item_id=outline_item_id,
+        )
+        evidence._extraction_failed = True
+        return evidence
+
+    @property
+    def extraction_failed(self) -> bool:
+        """Whether this is a placeholder for a failed extraction."""
+        return self._extraction_failed
+
 
 class EvidenceMap(BaseModel):
     """Per-chapter grounding data for source-faithful generation."""
@@ -123,3 +147,8 @@ class EvidenceMap(BaseModel):
     transcript_hash: str = Field(description="Hash for cache invalidation")
     chapters: List[ChapterEvidence] = Field(default_factory=list)
     global_context: Optional[GlobalContext] = Field(default=None)
+
+    @property
+    def has_failed_extractions(self) -> bool:
+        """Whether any chapter's evidence is a failed-extraction placeholder."""
+        return any(chapter.extraction_failed for chapter in self.chapters)
@@ -9,6 +9,7 @@ Pydantic v2. Extra fields are forbidden to prevent drift.
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from enum import Enum
 from typing import Optional, List
 
 from pydantic import BaseModel, Field, ConfigDict
@@ -27,12 +28,19 @@ def _ensure_tz_aware(dt: Optional[datetime]) -> Optional[datetime]:
         return dt.replace(tzinfo=timezone.utc)
     return dt
 
-from .api_responses import JobStatus, GenerationProgress, GenerationStats, TokenUsage
+from .api_responses import JobStatus, GenerationProgress, GenerationStats, LLMStageUsage, StageTiming, TokenUsage
 from .draft_plan import DraftPlan
 from .visuals import VisualPlan
 from .style_config import ContentMode
 
 
+class GenerationCheckpoint(str, Enum):
+    """Last completed stage of a generation job (resume point)."""
+    plan = "plan"                  # DraftPlan stored
+    evidence_map = "evidence_map"  # Evidence Map stored
+    chapters = "chapters"          # Every chapter generated; only post-processing remains
+
+
 class GenerationJob(BaseModel):
     """In-memory state for a draft generation job.
 
@@ -73,6 +81,10 @@ class GenerationJob(BaseModel):
         default_factory=list,
         description="Markdown content for each completed chapter"
     )
+    completed_chapter_numbers: List[int] = Field(
+        default_factory=list,
+        description="Chapter number of each entry in chapters_completed (same order)"
+    )
 
     # Results
     draft_plan: Optional[DraftPlan] = Field(
@@ -115,7 +127,22 @@ class GenerationJob(BaseModel):
     # Control
     cancel_requested: bool = Field(
         default=False,
-        description="Set to True to request cancellation after current chapter"
+        description="Set to True when cancellation is requested"
+    )
+
+    # Checkpointing (resume after restart)
+    request: Optional[dict] = Field(
+        default=None,
+        description="DraftGenerateRequest as JSON, kept so the job can be resumed"
+    )
+    checkpoint: Optional[GenerationCheckpoint] = Field(
+        default=None,
+        description="Last completed stage; resumed jobs skip everything up to it"
+    )
+    resume_count: int = Field(
+        default=0,
+        ge=0,
+        description="Times the job was resumed after an interruption"
     )
 
     # Statistics tracking
@@ -137,6 +164,14 @@ class GenerationJob(BaseModel):
         ge=0,
         description="Accumulated completion tokens used"
     )
+    llm_usage: List[dict] = Field(
+        default_factory=list,
+        description="Per-stage LLM call rollup (LLMStageUsage dicts)"
+    )
+    timings: List[dict] = Field(
+        default_factory=list,
+        description="Timing trace per stage, chapter and pass (StageTiming dicts)"
+    )
 
     def get_progress(self) -> GenerationProgress:
         """Get current progress as GenerationProgress model."""
@@ -171,6 +206,8 @@ class GenerationJob(BaseModel):
                 completion_tokens=self.total_completion_tokens,
                 total_tokens=self.total_prompt_tokens + self.total_completion_tokens,
             ),
+            llm_usage=[LLMStageUsage.model_validate(entry) for entry in self.llm_usage],
+            timings=[StageTiming.model_validate(entry) for entry in self.timings],
         )
 
     def _get_current_chapter_title(self) -> Optional[str]:
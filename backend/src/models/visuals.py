@@ -17,7 +17,7 @@ from datetime import datetime
 from enum import Enum
 from typing import List, Optional, Literal
 
-from pydantic import BaseModel, Field, ConfigDict, model_validator
+from pydantic import BaseModel, Field, ConfigDict, PrivateAttr, model_validator
 
 from .style_config import VisualType, VisualSourcePolicy
 
@@ -132,3 +132,18 @@ class VisualPlan(BaseModel):
     opportunities: List[VisualOpportunity] = Field(default_factory=list)
     assets: List[VisualAsset] = Field(default_factory=list)
     assignments: List[VisualAssignment] = Field(default_factory=list)
+
+    # Not serialized: only the run that hit the failure knows about it
+    _fallback: bool = PrivateAttr(default=False)
+
+    @classmethod
+    def fallback(cls) -> VisualPlan:
+        """Empty plan standing in for a failed visual opportunity generation."""
+        plan = cls()
+        plan._fallback = True
+        return plan
+
+    @property
+    def is_fallback(self) -> bool:
+        """Whether this plan is the empty fallback after a failure."""
+        return self._fallback
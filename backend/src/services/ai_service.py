@@ -10,7 +10,7 @@ import json
 
 from pydantic import BaseModel
 
-from src.llm import ChatMessage, LLMClient, LLMRequest, ResponseFormat
+from src.llm import ChatMessage, LLMRequest, ResponseFormat, get_llm_client, llm_stage
 
 # Maximum transcript length (enforced at API level too)
 MAX_TRANSCRIPT_LENGTH = 50_000
@@ -114,7 +114,7 @@ async def clean_transcript(transcript: str) -> str:
     Raises:
         LLMError: If the AI request fails after retries and fallback.
     """
-    client = LLMClient()
+    client = get_llm_client()
 
     request = LLMRequest(
         messages=[
@@ -126,7 +126,8 @@ async def clean_transcript(transcript: str) -> str:
         max_tokens=16000,  # Allow long output for full transcript
     )
 
-    response = await client.generate(request)
+    with llm_stage("clean_transcript"):
+        response = await client.generate(request)
 
     # Return the cleaned text (or empty string if no text)
     return response.text or ""
@@ -144,7 +145,7 @@ async def suggest_outline(transcript: str) -> list[SuggestedOutlineItem]:
     Raises:
         LLMError: If the AI request fails after retries and fallback.
     """
-    client = LLMClient()
+    client = get_llm_client()
 
     request = LLMRequest(
         messages=[
@@ -160,7 +161,8 @@ async def suggest_outline(transcript: str) -> list[SuggestedOutlineItem]:
         ),
     )
 
-    response = await client.generate(request)
+    with llm_stage("suggest_outline"):
+        response = await client.generate(request)
 
     # Parse the JSON response
     if not response.text:
@@ -191,7 +193,7 @@ async def suggest_resources(transcript: str) -> list[SuggestedResource]:
     Raises:
         LLMError: If the AI request fails after retries and fallback.
     """
-    client = LLMClient()
+    client = get_llm_client()
 
     request = LLMRequest(
         messages=[
@@ -207,7 +209,8 @@ async def suggest_resources(transcript: str) -> list[SuggestedResource]:
         ),
     )
 
-    response = await client.generate(request)
+    with llm_stage("suggest_resources"):
+        response = await client.generate(request)
 
     # Parse the JSON response
     if not response.text:
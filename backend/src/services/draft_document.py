@@ -0,0 +1,283 @@
+"""Parsed draft document shared by the enforcement passes.
+
+Post-processing runs dozens of passes over the assembled draft. Each string
+pass re-splits the whole draft into paragraphs and re-tracks which section
+it is in. The chapter-scoped steps also rebuilt the full string once per
+chapter. A DraftDocument is parsed once and handed from pass to pass. It is
+serialized back to markdown when a string-only pass needs it, or when
+post-processing ends.
+
+Structure:
+- Paragraphs are the draft split on blank lines (`text.split("\\n\\n")`),
+  so `DraftDocument.parse(text).to_markdown() == text`.
+- Each paragraph is classified the way the prose passes always have:
+  section headings (`## `, `### `, or a Key Excerpts / Core Claims marker),
+  Key Excerpts content, Core Claims content, blockquotes and prose.
+- Chapters are runs of paragraphs starting at a `## Chapter N` heading.
+  Paragraphs before the first chapter are the preamble (book title).
+- Sentences are split on demand with SENTENCE_BOUNDARY.
+
+Offsets are character offsets into `to_markdown()` at the time they were
+computed. Any edit bumps `version`, and classification and offsets are
+recomputed lazily on the next read.
+
+Passes that accept a DraftDocument also accept a string (see DraftText).
+They edit a document in place and return it. Given a string, they return
+a string, so existing callers are unaffected.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from enum import Enum
+from typing import Optional, Union
+
+PARAGRAPH_SEPARATOR = "\n\n"
+
+# Conservative sentence boundary used by the prose passes
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+(?=[A-Z])')
+
+CHAPTER_HEADING = re.compile(r'^## Chapter (\d+)')
+# A chapter heading that is not preceded by a blank line
+_INLINE_CHAPTER_HEADING = re.compile(r'(?<=[^\n])\n(?=## Chapter \d+)')
+
+
+class BlockKind(str, Enum):
+    """How the prose passes treat a paragraph."""
+    heading = "heading"
+    key_excerpts = "key_excerpts"
+    core_claims = "core_claims"
+    blockquote = "blockquote"
+    prose = "prose"
+
+
+@dataclass
+class Sentence:
+    """One sentence of a paragraph."""
+
+    text: str
+    start: int  # Offset into the serialized document
+
+
+@dataclass
+class Block:
+    """A classified paragraph."""
+
+    index: int
+    text: str
+    kind: BlockKind
+    chapter: Optional[int]  # Chapter number, None in the preamble
+    start: int  # Offset into the serialized document
+
+    @property
+    def end(self) -> int:
+        """Offset just past the paragraph."""
+        return self.start + len(self.text)
+
+    def sentences(self) -> list[Sentence]:
+        """Split the paragraph into sentences (SENTENCE_BOUNDARY)."""
+        sentences = []
+        position = 0
+        for part in SENTENCE_BOUNDARY.split(self.text):
+            position = self.text.index(part, position)
+            sentences.append(Sentence(text=part, start=self.start + position))
+            position += len(part)
+        return sentences
+
+
+@dataclass
+class Chapter:
+    """A chapter: paragraphs [first, end) of the document."""
+
+    number: int
+    first: int
+    end: int
+    start: int  # Offset of the heading paragraph in the serialized document
+
+
+class DraftDocument:
+    """Draft markdown parsed into paragraphs, chapters and sentences."""
+
+    def __init__(self, paragraphs: list[str]):
+        """Initialize from paragraphs (use DraftDocument.parse())."""
+        self._paragraphs = paragraphs
+        self.version = 0
+        self._blocks: Optional[list[Block]] = None
+        self._chapters: Optional[list[Chapter]] = None
+
+    @classmethod
+    def parse(cls, text: str, chapter_breaks: bool = False) -> DraftDocument:
+        """Parse draft markdown.
+
+        Args:
+            text: Draft markdown.
+            chapter_breaks: Insert a blank line before `## Chapter N` lines
+                that do not start a paragraph, so every chapter is a run of
+                whole paragraphs. Without it, parsing is lossless.
+
+        Returns:
+            Parsed document.
+        """
+        if chapter_breaks:
+            text = _INLINE_CHAPTER_HEADING.sub(PARAGRAPH_SEPARATOR, text)
+        return cls(text.split(PARAGRAPH_SEPARATOR))
+
+    def to_markdown(self) -> str:
+        """Serialize back to markdown."""
+        return PARAGRAPH_SEPARATOR.join(self._paragraphs)
+
+    @property
+    def paragraphs(self) -> list[str]:
+        """Raw paragraphs (read-only view; edit with set_paragraphs())."""
+        return list(self._paragraphs)
+
+    def set_paragraphs(self, paragraphs: list[str]) -> None:
+        """Replace every paragraph in one step."""
+        self._paragraphs = list(paragraphs)
+        self.version += 1
+        self._blocks = None
+        self._chapters = None
+
+    def blocks(self) -> list[Block]:
+        """Paragraphs with their kind, chapter and offset."""
+        if self._blocks is None:
+            self._blocks = _classify(self._paragraphs)
+        return self._blocks
+
+    def prose(self) -> Iterator[Block]:
+        """Narrative prose paragraphs (outside Key Excerpts and Core Claims)."""
+        return (block for block in self.blocks() if block.kind == BlockKind.prose)
+
+    def chapters(self) -> list[Chapter]:
+        """Chapters in document order."""
+        if self._chapters is None:
+            blocks = self.blocks()
+            starts = [
+                (block.index, number, block.start)
+                for block in blocks
+                if (number := _chapter_number(block.text)) is not None
+            ]
+            self._chapters = [
+                Chapter(
+                    number=number,
+                    first=first,
+                    end=starts[i + 1][0] if i + 1 < len(starts) else len(blocks),
+                    start=start,
+                )
+                for i, (first, number, start) in enumerate(starts)
+            ]
+        return self._chapters
+
+    def chapter_text(self, chapter: Chapter) -> str:
+        """A chapter's markdown, including the blank line before the next chapter.
+
+        This matches slicing the serialized draft from one chapter heading
+        to the next.
+        """
+        text = PARAGRAPH_SEPARATOR.join(self._paragraphs[chapter.first:chapter.end])
+        if chapter.end < len(self._paragraphs):
+            text += PARAGRAPH_SEPARATOR
+        return text
+
+    def map_chapters(self, fn: Callable[[Chapter, str], str]) -> None:
+        """Rewrite every chapter's markdown in a single rebuild.
+
+        Args:
+            fn: Called with each chapter and its chapter_text(); returns the
+                new chapter markdown. Nothing is changed if fn raises.
+        """
+        chapters = self.chapters()
+        if not chapters:
+            return
+        paragraphs = self._paragraphs[:chapters[0].first]
+        for chapter in chapters:
+            new_text = fn(chapter, self.chapter_text(chapter))
+            parts = new_text.split(PARAGRAPH_SEPARATOR)
+            if chapter.end < len(self._paragraphs) and len(parts) > 1 and parts[-1] == "":
+                # The separator before the next chapter is added back on join
+                parts.pop()
+            paragraphs.extend(parts)
+        self.set_paragraphs(paragraphs)
+
+    def rewrite_prose(self, fn: Callable[[str], Optional[str]]) -> None:
+        """Rewrite narrative prose paragraphs; other paragraphs are kept as is.
+
+        Args:
+            fn: Called with each prose paragraph; returns its replacement,
+                or None to drop it. Nothing is changed if fn raises, and
+                `version` is only bumped if a paragraph changed.
+        """
+        paragraphs = []
+        for block in self.blocks():
+            if block.kind != BlockKind.prose:
+                paragraphs.append(block.text)
+                continue
+            rewritten = fn(block.text)
+            if rewritten is not None:
+                paragraphs.append(rewritten)
+        if paragraphs != self._paragraphs:
+            self.set_paragraphs(paragraphs)
+
+
+DraftText = Union[str, DraftDocument]
+
+
+def as_document(text: DraftText) -> DraftDocument:
+    """Parse a string, or pass a document through."""
+    return text if isinstance(text, DraftDocument) else DraftDocument.parse(text)
+
+
+def like_input(text: DraftText, doc: DraftDocument) -> DraftText:
+    """Return the document, or its markdown if the pass was given a string."""
+    return doc if isinstance(text, DraftDocument) else doc.to_markdown()
+
+
+def split_sentences(paragraph: str) -> list[str]:
+    """Split a paragraph on SENTENCE_BOUNDARY."""
+    return SENTENCE_BOUNDARY.split(paragraph)
+
+
+def _chapter_number(paragraph: str) -> Optional[int]:
+    """Chapter number if the paragraph opens with a chapter heading."""
+    match = CHAPTER_HEADING.match(paragraph.lstrip("\n"))
+    return int(match.group(1)) if match else None
+
+
+def _classify(paragraphs: list[str]) -> list[Block]:
+    """Classify paragraphs, tracking Key Excerpts / Core Claims sections."""
+    blocks = []
+    in_key_excerpts = False
+    in_core_claims = False
+    chapter: Optional[int] = None
+    offset = 0
+
+    for index, para in enumerate(paragraphs):
+        stripped = para.strip()
+        if '### Key Excerpts' in stripped:
+            in_key_excerpts, in_core_claims = True, False
+            kind = BlockKind.heading
+        elif '### Core Claims' in stripped:
+            in_key_excerpts, in_core_claims = False, True
+            kind = BlockKind.heading
+        elif stripped.startswith('## ') or stripped.startswith('### '):
+            in_key_excerpts = in_core_claims = False
+            kind = BlockKind.heading
+        elif in_key_excerpts:
+            kind = BlockKind.key_excerpts
+        elif in_core_claims:
+            kind = BlockKind.core_claims
+        elif stripped.startswith('>'):
+            kind = BlockKind.blockquote
+        else:
+            kind = BlockKind.prose
+
+        number = _chapter_number(para)
+        if number is not None:
+            chapter = number
+
+        blocks.append(Block(index=index, text=para, kind=kind, chapter=chapter, start=offset))
+        offset += len(para) + len(PARAGRAPH_SEPARATOR)
+
+    return blocks
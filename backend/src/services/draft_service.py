@@ -3,7 +3,9 @@
 Orchestrates the async generation workflow:
 1. Create job and start background task
 2. Generate DraftPlan (structure + mappings)
-3. Generate chapters sequentially with context
+3. Generate chapters sequentially with context (or in parallel, bounded by
+   CHAPTER_GENERATION_CONCURRENCY, with continuity taken from the DraftPlan;
+   parallel essay drafts pipeline each chapter straight from its evidence)
 4. Assemble final draft
 
 Uses in-memory job store for state management.
@@ -16,15 +18,27 @@ import logging
 import os
 import re
 import uuid
+from collections.abc import Callable
 from datetime import datetime
+from functools import partial
 from typing import Optional
 
-from src.llm import LLMClient, LLMRequest, ChatMessage, ResponseFormat, load_draft_plan_schema
+from src.llm import (
+    LLMClient,
+    LLMRequest,
+    ChatMessage,
+    ResponseFormat,
+    get_llm_client,
+    llm_stage,
+    load_draft_plan_schema,
+)
+from src.llm.metrics import LLMUsageRollup, bind_llm_usage, unbind_llm_usage
 from src.llm.schemas import load_visual_opportunities_schema
 from src.models import (
     DraftPlan,
     ChapterPlan,
     VisualPlan,
+    GenerationCheckpoint,
     GenerationJob,
     JobStatus,
     DraftGenerateRequest,
@@ -44,6 +58,23 @@ from src.models.evidence_map import EvidenceMap, ChapterEvidence
 from src.models.edition import WhitelistQuote, TranscriptPair, CoverageLevel
 
 from .job_store import get_job_store, get_job, update_job
+from .draft_stream import get_draft_stream_hub
+from .job_scheduler import JobKind, SchedulerFullError, get_job_scheduler
+from .work_queue import TaskKind, enqueue_job, job_queue_enabled
+from .stage_cache import CachedStage, compute_stage_key, content_hash, get_stage_cache, prompt_version
+from .draft_document import DraftText, as_document, like_input, split_sentences
+from .pass_engine import PassEngine, PassReportSink, PassScope, PassSpec
+from .pass_pool import get_pass_executor
+from .stage_timing import (
+    TimingKind,
+    TimingTrace,
+    bind_timing_trace,
+    start_timing,
+    timed,
+    timed_pass,
+    unbind_timing_trace,
+)
+from .token_budget import PromptBudget, estimate_claim_tokens, fit_claims, fit_tail, fit_text
 from .whitelist_service import (
     build_quote_whitelist,
     canonicalize_transcript,
@@ -71,11 +102,14 @@ from .entity_allowlist import (
 )
 from .prompts import (
     DRAFT_PLAN_SYSTEM_PROMPT,
+    EVIDENCE_EXTRACTION_SYSTEM_PROMPT,
     build_draft_plan_user_prompt,
     build_chapter_system_prompt,
     build_chapter_user_prompt,
+    build_prefix_cached_messages,
     extract_transcript_segment,
     get_previous_chapter_ending,
+    get_previous_chapter_plan_ending,
     get_next_chapter_preview,
     parse_outline_to_chapters,
     VISUAL_OPPORTUNITY_SYSTEM_PROMPT,
@@ -87,11 +121,14 @@ from .prompts import (
     build_grounded_chapter_system_prompt,
     build_grounded_chapter_user_prompt,
     get_content_mode_prompt,
+    GROUNDED_TRANSCRIPT_REFERENCE_CHARS,
     # P0: Interview grounded single-pass generation
     build_interview_grounded_system_prompt,
     build_interview_grounded_user_prompt,
 )
 from .evidence_service import (
+    EVIDENCE_EXTRACTION_MODEL,
+    EVIDENCE_PROMPT_RESERVED_TOKENS,
     generate_evidence_map,
     get_evidence_for_chapter,
     check_interview_constraints,
@@ -112,16 +149,50 @@ PLANNING_MODEL = "gpt-4o-mini"  # Faster, cheaper for structured planning
 CHAPTER_MODEL = "gpt-4o-mini"   # Could use gpt-4o for higher quality
 POLISH_MODEL = "gpt-4o"         # Stronger model for prose polish pass
 
+# Chapter prompt tokens reserved for the system prompt, goals and instructions;
+# the rest of the model's input budget goes to evidence, transcript and context
+CHAPTER_PROMPT_RESERVED_TOKENS = 4000
+
 # Best-of-N candidate selection for interview mode
 # When enabled, generates multiple candidates and picks the best based on scoring
 # Env var sets the MAX allowed; request param sets actual count (capped by env var)
 INTERVIEW_CANDIDATE_COUNT_MAX = int(os.environ.get("INTERVIEW_CANDIDATE_COUNT_MAX", "5"))  # Server-side cap
+# Candidates are generated concurrently; this bounds how many are in flight at once
+INTERVIEW_CANDIDATE_CONCURRENCY = int(os.environ.get("INTERVIEW_CANDIDATE_CONCURRENCY", "3"))
+
+# Parallel chapter generation for chapter-by-chapter mode
+# 1 = sequential (each chapter sees the previous chapter's text)
+# >1 = up to N chapters in flight, continuity context taken from the DraftPlan
+CHAPTER_GENERATION_CONCURRENCY = int(os.environ.get("CHAPTER_GENERATION_CONCURRENCY", "1"))
+
+# Pipelined chapter mode: when chapters run in parallel, start each chapter as
+# soon as its own evidence is extracted instead of waiting for the whole map.
+# Only applies to essay-format drafts without a required preflight gate.
+# Enforcement (including the chapter-scoped passes) still runs after the last
+# chapter lands, since it matches quotes against the whole-map whitelist.
+DRAFT_PIPELINE_ENABLED = os.environ.get("DRAFT_PIPELINE_ENABLED", "true").lower() == "true"
+
+# Resume interrupted jobs on startup from their last checkpoint (plan, Evidence
+# Map, finished chapters) instead of losing the LLM work already done.
+# A job interrupted more than DRAFT_RESUME_MAX_ATTEMPTS times is failed.
+DRAFT_RESUME_ENABLED = os.environ.get("DRAFT_RESUME_ENABLED", "true").lower() == "true"
+DRAFT_RESUME_MAX_ATTEMPTS = int(os.environ.get("DRAFT_RESUME_MAX_ATTEMPTS", "3"))
+
+# Cancelling a job cancels its running task, which aborts in-flight LLM calls.
+# Queue workers run jobs in another process, so they poll for cancel requests.
+DRAFT_CANCEL_POLL_SECONDS = float(os.environ.get("DRAFT_CANCEL_POLL_SECONDS", "1"))
+# How long cancel_job waits for the task to stop before returning
+DRAFT_CANCEL_WAIT_SECONDS = 2.0
 
 # Dynamic name policy feature flag (Ideas Edition)
 # When enabled, uses dynamic person blacklist from speakers + entity allowlist from transcript
 # When disabled, falls back to hardcoded physicist names (legacy behavior)
 DYNAMIC_NAME_POLICY_ENABLED = os.environ.get("DYNAMIC_NAME_POLICY_ENABLED", "false").lower() == "true"
 
+# Check the draft for known corruption patterns (_DEBUG_CORRUPTION_PATTERNS) after
+# every post-processing pass that changes it, to find the pass that introduced them
+DRAFT_PASS_CORRUPTION_CHECK = os.environ.get("DRAFT_PASS_CORRUPTION_CHECK", "false").lower() == "true"
+
 # Generic titles that should be replaced
 GENERIC_TITLES = {
     "interview", "interview transcript", "untitled", "untitled ebook", "draft", ""
@@ -212,6 +283,7 @@ BANNED_PHRASES = [
 BANNED_PHRASE_REGEXES = [re.compile(re.escape(p), re.IGNORECASE) for p in BANNED_PHRASES]
 
 
+@timed_pass
 def strip_banned_sections(text: str, book_format: str = "essay") -> tuple[str, list[str]]:
     """Strip banned sections from generated text.
 
@@ -261,6 +333,7 @@ def count_banned_phrases(text: str) -> dict[str, int]:
     return counts
 
 
+@timed_pass
 def enforce_prose_quality(
     text: str,
     book_format: str = "essay",
@@ -314,6 +387,7 @@ KEY_EXCERPTS_EMPTY_PATTERN = re.compile(
 )
 
 
+@timed_pass
 def inject_excerpts_into_empty_sections(
     markdown: str,
     whitelist: list[WhitelistQuote],
@@ -445,6 +519,7 @@ def compile_key_excerpts_section(
 # ==============================================================================
 
 
+@timed_pass
 def strip_empty_section_headers(markdown: str) -> tuple[str, list[dict]]:
     """Remove section headers that have no content.
 
@@ -779,6 +854,7 @@ def remove_invalid_quotes(
     return result, converted_quotes
 
 
+@timed_pass
 def enforce_quote_grounding(
     text: str,
     transcript: str,
@@ -823,6 +899,7 @@ def enforce_quote_grounding(
 
     return result, report
 
+@timed_pass
 def validate_core_claims_structure(text: str) -> tuple[str, dict]:
     """Validate Core Claims have proper quote structure.
 
@@ -910,6 +987,7 @@ def validate_core_claims_structure(text: str) -> tuple[str, dict]:
     }
 
 
+@timed_pass
 def drop_claims_with_invalid_quotes(
     text: str,
     transcript: str,
@@ -1013,6 +1091,7 @@ def drop_claims_with_invalid_quotes(
     }
 
 
+@timed_pass
 def ensure_required_sections_exist(text: str) -> tuple[str, dict]:
     """Ensure every chapter has both Key Excerpts and Core Claims sections.
 
@@ -1107,6 +1186,7 @@ def ensure_required_sections_exist(text: str) -> tuple[str, dict]:
     }
 
 
+@timed_pass
 def drop_excerpts_with_invalid_quotes(
     text: str,
     transcript: str,
@@ -1327,6 +1407,7 @@ def remove_ellipsis_sentences(text: str, ellipses: list[dict]) -> tuple[str, lis
     return result.strip(), removed_sentences
 
 
+@timed_pass
 def enforce_ellipsis_ban(text: str, remove_sentences: bool = True) -> tuple[str, dict]:
     """Enforce global ellipsis ban: find and optionally remove ellipsis-containing sentences.
 
@@ -1965,6 +2046,7 @@ def _stitch_sentences(sentences: list[str]) -> str:
     return ' '.join(result)
 
 
+@timed_pass
 def enforce_verbatim_leak_gate(
     text: str,
     whitelist_quotes: list[str],
@@ -2085,7 +2167,8 @@ def enforce_verbatim_leak_gate(
     }
 
 
-def enforce_dangling_attribution_gate(text: str) -> tuple[str, dict]:
+@timed_pass
+def enforce_dangling_attribution_gate(text: DraftText) -> tuple[DraftText, dict]:
     """Rewrite dangling attribution patterns to indirect speech, DROP unrewritable ones.
 
     Detects patterns like:
@@ -2113,7 +2196,7 @@ def enforce_dangling_attribution_gate(text: str) -> tuple[str, dict]:
     Rewriting to indirect speech creates awkward prose; dropping is safer.
 
     Args:
-        text: The draft markdown text.
+        text: The draft markdown text, or a DraftDocument (edited in place).
 
     Returns:
         Tuple of (cleaned_text, report_dict).
@@ -2261,10 +2344,11 @@ def enforce_dangling_attribution_gate(text: str) -> tuple[str, dict]:
         # Check the left context for "as " pattern preceding the subject
         match_start = match.start()
         # Get text before the match (up to 20 chars for context)
-        left_context = text[max(0, match_start - 20):match_start].lower()
+        left_context = match.string[max(0, match_start - 20):match_start].lower()
         # Check if this is an "as X argues" interpolation
-        # Pattern: ", as " or " as " immediately before the match
-        if re.search(r',?\s+as\s*$', left_context):
+        # Pattern: ", as " or " as " immediately before the match, but not a
+        # sentence-start "As " (those introducers are rewritten, see above)
+        if re.search(r'[^.!?\s]\s+as\s*$', left_context):
             # This is an interpolation like ", as Deutsch argues, is"
             # Don't rewrite - return original
             return match.group(0)
@@ -2355,47 +2439,8 @@ def enforce_dangling_attribution_gate(text: str) -> tuple[str, dict]:
         # period_space already contains the period, so just use it directly
         return f"{period_space}{first_letter}"
 
-    # Split into paragraphs to track sections
-    paragraphs = text.split('\n\n')
-    result_paragraphs = []
-
-    in_key_excerpts = False
-    in_core_claims = False
-
-    for para in paragraphs:
-        stripped = para.strip()
-
-        # Track section boundaries
-        if '### Key Excerpts' in stripped:
-            in_key_excerpts = True
-            in_core_claims = False
-            result_paragraphs.append(para)
-            continue
-        elif '### Core Claims' in stripped:
-            in_key_excerpts = False
-            in_core_claims = True
-            result_paragraphs.append(para)
-            continue
-        elif stripped.startswith('## '):
-            in_key_excerpts = False
-            in_core_claims = False
-            result_paragraphs.append(para)
-            continue
-        elif stripped.startswith('### '):
-            in_key_excerpts = False
-            in_core_claims = False
-            result_paragraphs.append(para)
-            continue
-
-        # Don't modify Key Excerpts or Core Claims content
-        if in_key_excerpts or in_core_claims:
-            result_paragraphs.append(para)
-            continue
-
-        # Skip blockquotes
-        if stripped.startswith('>'):
-            result_paragraphs.append(para)
-            continue
+    def rewrite_paragraph(para: str) -> Optional[str]:
+        nonlocal sentences_dropped
 
         # STEP 1: Drop sentences containing problematic patterns (unrewritable leaks)
         # These are P0 drops - patterns that indicate quote-introducer or speaker framing leaks
@@ -2409,8 +2454,7 @@ def enforce_dangling_attribution_gate(text: str) -> tuple[str, dict]:
         if has_recall_verb or has_as_verb_that:
             # Split into sentences and filter out bad ones
             # Use conservative sentence splitting
-            sentence_pattern = re.compile(r'(?<=[.!?])\s+(?=[A-Z])')
-            sentences = sentence_pattern.split(modified)
+            sentences = split_sentences(modified)
             kept_sentences = []
 
             for sentence in sentences:
@@ -2436,7 +2480,7 @@ def enforce_dangling_attribution_gate(text: str) -> tuple[str, dict]:
                 modified = ' '.join(kept_sentences)
             else:
                 # All sentences dropped - skip this paragraph entirely
-                continue
+                return None
 
         # STEP 2: Apply rewrites to narrative prose
         modified = rewrite_pattern.sub(rewrite_to_indirect, modified)
@@ -2447,9 +2491,11 @@ def enforce_dangling_attribution_gate(text: str) -> tuple[str, dict]:
         # Fix any "that This/That/These..." capitalization issues
         modified = fix_that_capitalization(modified)
 
-        result_paragraphs.append(modified)
+        return modified
 
-    result = '\n\n'.join(result_paragraphs)
+    doc = as_document(text)
+    doc.rewrite_prose(rewrite_paragraph)
+    result = like_input(text, doc)
 
     if rewrite_count > 0:
         logger.info(f"Dangling attribution gate: rewrote {rewrite_count} patterns to indirect speech")
@@ -2464,7 +2510,8 @@ def enforce_dangling_attribution_gate(text: str) -> tuple[str, dict]:
     }
 
 
-def sanitize_speaker_framing(text: str) -> tuple[str, dict]:
+@timed_pass
+def sanitize_speaker_framing(text: DraftText) -> tuple[DraftText, dict]:
     """Drop sentences with attribution-wrapper patterns from narrative prose.
 
     VERB-AGNOSTIC approach: instead of matching specific verbs, match the
@@ -2483,7 +2530,7 @@ def sanitize_speaker_framing(text: str) -> tuple[str, dict]:
     The final style invariant: no attribution framing at all in timeless prose.
 
     Args:
-        text: The draft markdown text.
+        text: The draft markdown text, or a DraftDocument (edited in place).
 
     Returns:
         Tuple of (sanitized_text, report_dict).
@@ -2569,51 +2616,11 @@ def sanitize_speaker_framing(text: str) -> tuple[str, dict]:
             return True, "as_generic_speaker"
         return False, ""
 
-    # Process paragraph by paragraph
-    paragraphs = text.split('\n\n')
-    result_paragraphs = []
-
-    in_key_excerpts = False
-    in_core_claims = False
-
-    for para in paragraphs:
-        stripped = para.strip()
-
-        # Track section boundaries
-        if '### Key Excerpts' in stripped:
-            in_key_excerpts = True
-            in_core_claims = False
-            result_paragraphs.append(para)
-            continue
-        elif '### Core Claims' in stripped:
-            in_key_excerpts = False
-            in_core_claims = True
-            result_paragraphs.append(para)
-            continue
-        elif stripped.startswith('## '):
-            in_key_excerpts = False
-            in_core_claims = False
-            result_paragraphs.append(para)
-            continue
-        elif stripped.startswith('### '):
-            in_key_excerpts = False
-            in_core_claims = False
-            result_paragraphs.append(para)
-            continue
-
-        # Don't modify Key Excerpts or Core Claims content
-        if in_key_excerpts or in_core_claims:
-            result_paragraphs.append(para)
-            continue
-
-        # Skip blockquotes
-        if stripped.startswith('>'):
-            result_paragraphs.append(para)
-            continue
+    def rewrite_paragraph(para: str) -> Optional[str]:
+        nonlocal sentences_dropped
 
         # Split into sentences and filter out bad ones
-        sentence_pattern = re.compile(r'(?<=[.!?])\s+(?=[A-Z])')
-        sentences = sentence_pattern.split(para)
+        sentences = split_sentences(para)
         kept_sentences = []
 
         # Orphan pronoun pattern - these need antecedent from previous sentence
@@ -2640,10 +2647,13 @@ def sanitize_speaker_framing(text: str) -> tuple[str, dict]:
 
         # Rejoin remaining sentences
         if kept_sentences:
-            result_paragraphs.append(' '.join(kept_sentences))
+            return ' '.join(kept_sentences)
         # If all sentences dropped, skip this paragraph entirely
+        return None
 
-    result = '\n\n'.join(result_paragraphs)
+    doc = as_document(text)
+    doc.rewrite_prose(rewrite_paragraph)
+    result = like_input(text, doc)
 
     if sentences_dropped > 0:
         logger.info(f"Speaker-framing sanitizer: dropped {sentences_dropped} sentences")
@@ -2654,8 +2664,9 @@ def sanitize_speaker_framing(text: str) -> tuple[str, dict]:
     }
 
 
+@timed_pass
 def enforce_no_names_in_prose(
-    text: str,
+    text: DraftText,
     person_blacklist: "PersonBlacklist | None" = None,
     entity_allowlist: "EntityAllowlist | None" = None,
 ) -> tuple[str, dict]:
@@ -2672,7 +2683,7 @@ def enforce_no_names_in_prose(
     - Falls back to hardcoded physicist names for backwards compatibility
 
     Args:
-        text: The draft markdown text.
+        text: The draft markdown text, or a DraftDocument (edited in place).
         person_blacklist: Optional dynamic blacklist from speakers.
         entity_allowlist: Optional allowlist for org/product names.
 
@@ -2705,47 +2716,8 @@ def enforce_no_names_in_prose(
         r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b'
     )
 
-    # Process paragraph by paragraph
-    paragraphs = text.split('\n\n')
-    result_paragraphs = []
-
-    in_key_excerpts = False
-    in_core_claims = False
-
-    for para in paragraphs:
-        stripped = para.strip()
-
-        # Track section boundaries
-        if '### Key Excerpts' in stripped:
-            in_key_excerpts = True
-            in_core_claims = False
-            result_paragraphs.append(para)
-            continue
-        elif '### Core Claims' in stripped:
-            in_key_excerpts = False
-            in_core_claims = True
-            result_paragraphs.append(para)
-            continue
-        elif stripped.startswith('## '):
-            in_key_excerpts = False
-            in_core_claims = False
-            result_paragraphs.append(para)
-            continue
-        elif stripped.startswith('### '):
-            in_key_excerpts = False
-            in_core_claims = False
-            result_paragraphs.append(para)
-            continue
-
-        # Don't modify Key Excerpts or Core Claims content
-        if in_key_excerpts or in_core_claims:
-            result_paragraphs.append(para)
-            continue
-
-        # Skip blockquotes
-        if stripped.startswith('>'):
-            result_paragraphs.append(para)
-            continue
+    def rewrite_paragraph(para: str) -> Optional[str]:
+        nonlocal sentences_dropped
 
         # Helper function to check if sentence should be dropped
         def should_drop_sentence(sentence: str) -> tuple[bool, str, str | None]:
@@ -2787,8 +2759,7 @@ def enforce_no_names_in_prose(
 
         if might_have_names:
             # Split into sentences and filter out bad ones
-            sentence_pattern = re.compile(r'(?<=[.!?])\s+(?=[A-Z])')
-            sentences = sentence_pattern.split(para)
+            sentences = split_sentences(para)
             kept_sentences = []
 
             for sentence in sentences:
@@ -2806,12 +2777,14 @@ def enforce_no_names_in_prose(
 
             # Rejoin remaining sentences
             if kept_sentences:
-                result_paragraphs.append(' '.join(kept_sentences))
+                return ' '.join(kept_sentences)
             # If all sentences dropped, skip this paragraph entirely
-        else:
-            result_paragraphs.append(para)
+            return None
+        return para
 
-    result = '\n\n'.join(result_paragraphs)
+    doc = as_document(text)
+    doc.rewrite_prose(rewrite_paragraph)
+    result = like_input(text, doc)
 
     if sentences_dropped > 0:
         logger.info(f"No-names-in-prose invariant: dropped {sentences_dropped} sentences")
@@ -2837,7 +2810,8 @@ def enforce_speaker_framing_invariant(text: str) -> tuple[str, dict]:
     }
 
 
-def sanitize_meta_discourse(text: str) -> tuple[str, dict]:
+@timed_pass
+def sanitize_meta_discourse(text: DraftText) -> tuple[DraftText, dict]:
     """Drop sentences that describe the document itself from narrative prose.
 
     Meta-discourse is template/prompt text that leaked into the output.
@@ -2853,7 +2827,7 @@ def sanitize_meta_discourse(text: str) -> tuple[str, dict]:
     - "in summary" - meta-commentary
 
     Args:
-        text: The draft markdown text.
+        text: The draft markdown text, or a DraftDocument (edited in place).
 
     Returns:
         Tuple of (sanitized_text, report_dict).
@@ -2891,53 +2865,13 @@ def sanitize_meta_discourse(text: str) -> tuple[str, dict]:
         re.IGNORECASE
     )
 
-    # Process paragraph by paragraph
-    paragraphs = text.split('\n\n')
-    result_paragraphs = []
-
-    in_key_excerpts = False
-    in_core_claims = False
-
-    for para in paragraphs:
-        stripped = para.strip()
-
-        # Track section boundaries
-        if '### Key Excerpts' in stripped:
-            in_key_excerpts = True
-            in_core_claims = False
-            result_paragraphs.append(para)
-            continue
-        elif '### Core Claims' in stripped:
-            in_key_excerpts = False
-            in_core_claims = True
-            result_paragraphs.append(para)
-            continue
-        elif stripped.startswith('## '):
-            in_key_excerpts = False
-            in_core_claims = False
-            result_paragraphs.append(para)
-            continue
-        elif stripped.startswith('### '):
-            in_key_excerpts = False
-            in_core_claims = False
-            result_paragraphs.append(para)
-            continue
-
-        # Don't modify Key Excerpts or Core Claims content
-        if in_key_excerpts or in_core_claims:
-            result_paragraphs.append(para)
-            continue
-
-        # Skip blockquotes
-        if stripped.startswith('>'):
-            result_paragraphs.append(para)
-            continue
+    def rewrite_paragraph(para: str) -> Optional[str]:
+        nonlocal sentences_dropped
 
         # Check if paragraph contains any meta-discourse patterns
         if META_DISCOURSE_PATTERNS.search(para):
             # Split into sentences and filter out bad ones
-            sentence_pattern = re.compile(r'(?<=[.!?])\s+(?=[A-Z])')
-            sentences = sentence_pattern.split(para)
+            sentences = split_sentences(para)
             kept_sentences = []
 
             for sentence in sentences:
@@ -2952,12 +2886,14 @@ def sanitize_meta_discourse(text: str) -> tuple[str, dict]:
 
             # Rejoin remaining sentences
             if kept_sentences:
-                result_paragraphs.append(' '.join(kept_sentences))
+                return ' '.join(kept_sentences)
             # If all sentences dropped, skip this paragraph entirely
-        else:
-            result_paragraphs.append(para)
+            return None
+        return para
 
-    result = '\n\n'.join(result_paragraphs)
+    doc = as_document(text)
+    doc.rewrite_prose(rewrite_paragraph)
+    result = like_input(text, doc)
 
     if sentences_dropped > 0:
         logger.info(f"Meta-discourse gate: dropped {sentences_dropped} sentences")
@@ -2968,7 +2904,8 @@ def sanitize_meta_discourse(text: str) -> tuple[str, dict]:
     }
 
 
-def normalize_prose_punctuation(text: str) -> tuple[str, dict]:
+@timed_pass
+def normalize_prose_punctuation(text: DraftText) -> tuple[DraftText, dict]:
     """Ensure narrative prose paragraphs end with proper terminal punctuation.
 
     For narrative prose only (not blockquotes, not headings, not inside quotes):
@@ -2978,7 +2915,7 @@ def normalize_prose_punctuation(text: str) -> tuple[str, dict]:
     This is a final formatting pass that runs after all drops/repairs.
 
     Args:
-        text: The draft markdown text.
+        text: The draft markdown text, or a DraftDocument (edited in place).
 
     Returns:
         Tuple of (normalized_text, report_dict).
@@ -2986,57 +2923,17 @@ def normalize_prose_punctuation(text: str) -> tuple[str, dict]:
     fixes_applied = 0
     fix_details = []
 
-    # Process paragraph by paragraph
-    paragraphs = text.split('\n\n')
-    result_paragraphs = []
-
-    in_key_excerpts = False
-    in_core_claims = False
-
-    for para in paragraphs:
+    def rewrite_paragraph(para: str) -> Optional[str]:
+        nonlocal fixes_applied
         stripped = para.strip()
 
-        # Track section boundaries
-        if '### Key Excerpts' in stripped:
-            in_key_excerpts = True
-            in_core_claims = False
-            result_paragraphs.append(para)
-            continue
-        elif '### Core Claims' in stripped:
-            in_key_excerpts = False
-            in_core_claims = True
-            result_paragraphs.append(para)
-            continue
-        elif stripped.startswith('## '):
-            in_key_excerpts = False
-            in_core_claims = False
-            result_paragraphs.append(para)
-            continue
-        elif stripped.startswith('### '):
-            in_key_excerpts = False
-            in_core_claims = False
-            result_paragraphs.append(para)
-            continue
-
-        # Don't modify Key Excerpts or Core Claims content
-        if in_key_excerpts or in_core_claims:
-            result_paragraphs.append(para)
-            continue
-
-        # Skip blockquotes
-        if stripped.startswith('>'):
-            result_paragraphs.append(para)
-            continue
-
         # Skip headings (any level)
         if stripped.startswith('#'):
-            result_paragraphs.append(para)
-            continue
+            return para
 
         # Skip empty paragraphs
         if not stripped:
-            result_paragraphs.append(para)
-            continue
+            return para
 
         # Check if paragraph ends without terminal punctuation
         # Terminal punctuation: . ? ! … — "
@@ -3047,16 +2944,17 @@ def normalize_prose_punctuation(text: str) -> tuple[str, dict]:
             # Missing terminal punctuation - append period
             # Preserve original whitespace by working with the original para
             fixed_para = para.rstrip() + '.'
-            result_paragraphs.append(fixed_para)
             fixes_applied += 1
             fix_details.append({
                 "original_ending": stripped[-20:] if len(stripped) > 20 else stripped,
                 "fixed": True,
             })
-        else:
-            result_paragraphs.append(para)
+            return fixed_para
+        return para
 
-    result = '\n\n'.join(result_paragraphs)
+    doc = as_document(text)
+    doc.rewrite_prose(rewrite_paragraph)
+    result = like_input(text, doc)
 
     if fixes_applied > 0:
         logger.info(f"Prose punctuation normalizer: fixed {fixes_applied} paragraphs")
@@ -3067,7 +2965,8 @@ def normalize_prose_punctuation(text: str) -> tuple[str, dict]:
     }
 
 
-def cleanup_dangling_connectives(text: str) -> tuple[str, dict]:
+@timed_pass
+def cleanup_dangling_connectives(text: DraftText) -> tuple[DraftText, dict]:
     """Clean up dangling articles/connectives left when payload was dropped.
 
     When a gate drops a quote or clause but doesn't expand the deletion to
@@ -3078,7 +2977,7 @@ def cleanup_dangling_connectives(text: str) -> tuple[str, dict]:
     This function cleans up these orphaned connectives deterministically.
 
     Args:
-        text: The draft markdown text.
+        text: The draft markdown text, or a DraftDocument (edited in place).
 
     Returns:
         Tuple of (cleaned_text, report_dict).
@@ -3194,57 +3093,19 @@ def cleanup_dangling_connectives(text: str) -> tuple[str, dict]:
             # Not a clear case - leave it alone
             return match.group(0)
 
-    # Split into paragraphs and process only narrative prose
-    paragraphs = text.split('\n\n')
-    result_paragraphs = []
+    def rewrite_paragraph(para: str) -> Optional[str]:
 
-    in_key_excerpts = False
-    in_core_claims = False
+        # Apply cleanups to narrative prose
+        modified = para
+        modified = dangling_that_pattern.sub(fix_dangling_that, modified)
+        modified = dangling_article_pattern.sub(fix_dangling_article, modified)
+        modified = simple_dangling_pattern.sub(fix_simple_dangling, modified)
 
-    for para in paragraphs:
-        stripped = para.strip()
+        return modified
 
-        # Track section boundaries
-        if '### Key Excerpts' in stripped:
-            in_key_excerpts = True
-            in_core_claims = False
-            result_paragraphs.append(para)
-            continue
-        elif '### Core Claims' in stripped:
-            in_key_excerpts = False
-            in_core_claims = True
-            result_paragraphs.append(para)
-            continue
-        elif stripped.startswith('## '):
-            in_key_excerpts = False
-            in_core_claims = False
-            result_paragraphs.append(para)
-            continue
-        elif stripped.startswith('### '):
-            in_key_excerpts = False
-            in_core_claims = False
-            result_paragraphs.append(para)
-            continue
-
-        # Don't modify Key Excerpts or Core Claims content
-        if in_key_excerpts or in_core_claims:
-            result_paragraphs.append(para)
-            continue
-
-        # Skip blockquotes
-        if stripped.startswith('>'):
-            result_paragraphs.append(para)
-            continue
-
-        # Apply cleanups to narrative prose
-        modified = para
-        modified = dangling_that_pattern.sub(fix_dangling_that, modified)
-        modified = dangling_article_pattern.sub(fix_dangling_article, modified)
-        modified = simple_dangling_pattern.sub(fix_simple_dangling, modified)
-
-        result_paragraphs.append(modified)
-
-    result = '\n\n'.join(result_paragraphs)
+    doc = as_document(text)
+    doc.rewrite_prose(rewrite_paragraph)
+    result = like_input(text, doc)
 
     if cleanup_count > 0:
         logger.info(f"Dangling connective cleanup: fixed {cleanup_count} orphaned articles/connectives")
@@ -3255,6 +3116,7 @@ def cleanup_dangling_connectives(text: str) -> tuple[str, dict]:
     }
 
 
+@timed_pass
 def fix_truncated_attributions(text: str) -> tuple[str, dict]:
     """Fix attributions that got truncated at end of line/paragraph.
 
@@ -3349,6 +3211,7 @@ VALID_HE_WORDS = {
 }
 
 
+@timed_pass
 def validate_token_integrity(text: str) -> tuple[bool, dict]:
     """Validate that no token truncation artifacts exist in the draft.
 
@@ -3481,6 +3344,7 @@ def validate_token_integrity(text: str) -> tuple[bool, dict]:
     }
 
 
+@timed_pass
 def validate_structural_integrity(text: str) -> tuple[bool, dict]:
     """Validate structural integrity of the draft - HARD GATE.
 
@@ -3766,6 +3630,7 @@ def validate_structural_integrity(text: str) -> tuple[bool, dict]:
     }
 
 
+@timed_pass
 def cleanup_orphan_fragments_between_sections(text: str) -> tuple[str, dict]:
     """Remove orphan content fragments appearing between sections and chapters.
 
@@ -3940,6 +3805,7 @@ def _check_for_corruption(text: str, step_name: str, job_id: str = "") -> bool:
     return False
 
 
+@timed_pass
 def remove_discourse_markers(text: str) -> tuple[str, dict]:
     """Remove transcript discourse markers from prose.
 
@@ -4047,6 +3913,7 @@ def remove_discourse_markers(text: str) -> tuple[str, dict]:
     }
 
 
+@timed_pass
 def ensure_chapter_narrative_minimum(
     text: str,
     min_prose_paragraphs: int = 1,
@@ -4143,6 +4010,7 @@ def ensure_chapter_narrative_minimum(
     }
 
 
+@timed_pass
 def repair_orphan_chapter_openers(
     text: str,
     original_prose_by_chapter: dict[int, str] | None = None,
@@ -4365,6 +4233,7 @@ def repair_orphan_chapter_openers(
     }
 
 
+@timed_pass
 def repair_first_paragraph_pronouns(text: str) -> tuple[str, dict]:
     """Repair pronoun-start sentences within the first prose paragraph of each chapter.
 
@@ -4873,6 +4742,7 @@ def cleanup_dangling_attributions(text: str) -> tuple[str, int]:
     return result, removal_count
 
 
+@timed_pass
 def compute_chapter_prose_metrics(
     final_text: str,
     original_text: str | None = None,
@@ -4978,6 +4848,7 @@ def compute_chapter_prose_metrics(
     }
 
 
+@timed_pass
 def normalize_markdown_headers(text: str) -> tuple[str, dict]:
     """Ensure proper blank lines before markdown headers.
 
@@ -5033,6 +4904,7 @@ def normalize_markdown_headers(text: str) -> tuple[str, dict]:
     }
 
 
+@timed_pass
 def repair_whitespace(text: str) -> str:
     """Repair whitespace issues left after sentence/paragraph deletions.
 
@@ -5077,6 +4949,7 @@ def repair_whitespace(text: str) -> str:
     return result.strip()
 
 
+@timed_pass
 def fix_unquoted_excerpts(text: str) -> tuple[str, dict]:
     """Fix unquoted block quotes and Core Claims in Ideas Edition output.
 
@@ -5165,6 +5038,7 @@ def fix_unquoted_excerpts(text: str) -> tuple[str, dict]:
     return '\n'.join(fixed_lines), report
 
 
+@timed_pass
 def filter_anachronism_paragraphs(text: str) -> tuple[str, dict]:
     """Filter paragraphs containing anachronism keywords without validated quotes.
 
@@ -5228,6 +5102,7 @@ def filter_anachronism_paragraphs(text: str) -> tuple[str, dict]:
 
 
 # Keep old function name for backwards compatibility, but use hard enforcement
+@timed_pass
 def enforce_attributed_speech(
     text: str,
     transcript: str,
@@ -5319,26 +5194,25 @@ async def polish_chapter(
 
     Args:
         chapter_text: Raw chapter markdown text.
-        client: Optional LLM client (created if not provided).
+        client: Optional LLM client (the shared client if not provided).
 
     Returns:
         Polished chapter text.
     """
     if client is None:
-        from src.services.llm_client import get_llm_client
-        client = await get_llm_client()
+        client = get_llm_client()
 
     request = LLMRequest(
         model=POLISH_MODEL,
-        messages=[
-            ChatMessage(role="system", content=POLISH_SYSTEM_PROMPT),
-            ChatMessage(role="user", content=f"Polish this chapter:\n\n{chapter_text}"),
-        ],
+        messages=build_prefix_cached_messages(
+            POLISH_SYSTEM_PROMPT, f"Polish this chapter:\n\n{chapter_text}",
+        ),
         temperature=0.3,  # Lower temperature for more consistent editing
         max_tokens=4000,
     )
 
-    response = await client.generate(request)
+    with llm_stage("polish"):
+        response = await client.generate(request)
     return response.text
 
 
@@ -6420,6 +6294,7 @@ async def _generate_and_score_candidate(
         book_title=book_title,
         evidence_map=evidence_map,
         forced_candidates=forced_candidates,
+        use_cache=False,  # Identical requests must still yield distinct samples
     )
     markdown = _clean_markdown_title(markdown)
 
@@ -6433,6 +6308,92 @@ async def _generate_and_score_candidate(
     return markdown, score
 
 
+async def _generate_candidates_concurrently(
+    transcript: str,
+    book_title: str,
+    evidence_map: EvidenceMap,
+    candidate_count: int,
+    forced_candidates: Optional[list] = None,
+    concurrency: int = INTERVIEW_CANDIDATE_CONCURRENCY,
+    score_threshold: Optional[float] = None,
+) -> list[tuple[str, dict]]:
+    """Generate best-of-N interview candidates concurrently.
+
+    Candidates are launched under a semaphore and scored as they finish.
+    If score_threshold is set and a finished candidate reaches it, the
+    remaining in-flight candidates are cancelled.
+
+    Args:
+        transcript: Interview transcript.
+        book_title: Sanitized book title.
+        evidence_map: Evidence mapping for grounding.
+        candidate_count: Number of candidates to generate.
+        forced_candidates: Optional definitional candidates to force into Key Ideas.
+        concurrency: Maximum number of candidates in flight at once.
+        score_threshold: Optional "good enough" score for early termination.
+
+    Returns:
+        List of (markdown, score_breakdown) tuples, best first.
+
+    Raises:
+        Exception: The last candidate error if every candidate failed.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _bounded_candidate(candidate_num: int) -> tuple[int, str, dict]:
+        async with semaphore:
+            markdown, score = await _generate_and_score_candidate(
+                transcript=transcript,
+                book_title=book_title,
+                evidence_map=evidence_map,
+                forced_candidates=forced_candidates,
+                candidate_num=candidate_num,
+            )
+            return candidate_num, markdown, score
+
+    tasks = [
+        asyncio.create_task(_bounded_candidate(i + 1), name=f"interview_candidate_{i + 1}")
+        for i in range(candidate_count)
+    ]
+
+    scored: list[tuple[int, str, dict]] = []
+    last_error: Optional[Exception] = None
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            try:
+                candidate_num, markdown, score = await next_done
+            except Exception as e:
+                last_error = e
+                logger.warning(f"Candidate generation failed: {e}")
+                continue
+
+            scored.append((candidate_num, markdown, score))
+            if score_threshold is not None and score["total"] >= score_threshold:
+                logger.info(
+                    f"Candidate {candidate_num} reached score threshold "
+                    f"({score['total']:.0f} >= {score_threshold:.0f}), cancelling remaining candidates"
+                )
+                break
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    if not scored:
+        if last_error:
+            raise last_error
+        raise RuntimeError("No interview candidates were generated")
+
+    # Highest score first; candidate number breaks ties deterministically
+    scored.sort(key=lambda c: (-c[2]["total"], c[0]))
+    logger.info(
+        f"Selected candidate {scored[0][0]} of {len(scored)} scored "
+        f"(requested {candidate_count})"
+    )
+    return [(markdown, score) for _, markdown, score in scored]
+
+
 # ==============================================================================
 # Public API
 # ==============================================================================
@@ -6443,8 +6404,9 @@ async def start_generation(
 ) -> str:
     """Start draft generation and return job ID.
 
-    Creates a job and starts background generation task.
-    Returns immediately for async polling.
+    Creates a job and schedules background generation (or enqueues it for a
+    worker when the job queue is enabled). Returns immediately for async
+    polling.
 
     Args:
         request: Generation request with transcript, outline, style config.
@@ -6452,21 +6414,182 @@ async def start_generation(
 
     Returns:
         Job ID for status polling.
+
+    Raises:
+        SchedulerFullError: If too many generation jobs are already waiting.
+            No job is created.
     """
     store = get_job_store()
     job_id = await store.create_job(project_id=project_id)
+    # Keep the request on the job so an interrupted run can be resumed
+    request_data = request.model_dump(mode="json")
+    await store.update_job(job_id, request=request_data)
 
     logger.info(f"Starting draft generation job {job_id}")
 
-    # Start background task
-    asyncio.create_task(
-        _generate_draft_task(job_id, request),
-        name=f"draft_generation_{job_id}",
-    )
+    if job_queue_enabled():
+        await enqueue_job(TaskKind.draft, job_id, {"request": request_data})
+        return job_id
+
+    # Start background task once a generation slot is free
+    try:
+        task = get_job_scheduler().submit(
+            JobKind.draft,
+            job_id,
+            lambda: _generate_draft_task(job_id, request),
+            priority=request.priority,
+        )
+    except SchedulerFullError:
+        await store.delete_job(job_id)
+        raise
+    _track_job_task(job_id, task)
 
     return job_id
 
 
+async def run_generation_job(job_id: str, request: dict) -> None:
+    """Run a queued draft generation in a worker process.
+
+    A retried task resumes from the job's last checkpoint. The job is
+    cancelled as soon as a cancel request is seen (polled every
+    DRAFT_CANCEL_POLL_SECONDS), since cancel_job() runs in an API process.
+
+    Args:
+        job_id: The job identifier.
+        request: DraftGenerateRequest as enqueued by start_generation().
+    """
+    task = _track_job_task(
+        job_id,
+        asyncio.create_task(_generate_draft_task(job_id, DraftGenerateRequest.model_validate(request))),
+    )
+    try:
+        while not task.done():
+            await asyncio.wait({task}, timeout=DRAFT_CANCEL_POLL_SECONDS)
+            if task.done():
+                break
+            job = await get_job(job_id)
+            if job and job.cancel_requested:
+                task.cancel()
+                # The task records the cancellation; the queue task is done
+                await asyncio.gather(task, return_exceptions=True)
+                return
+        task.result()
+    except asyncio.CancelledError:
+        # Lost lease or worker shutdown: stop the job without cancelling it,
+        # so the retry resumes from its checkpoint
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        raise
+
+
+# Tasks running (or waiting to run) draft jobs in this process, by job ID
+_job_tasks: dict[str, asyncio.Task] = {}
+
+
+def _track_job_task(job_id: str, task: asyncio.Task) -> asyncio.Task:
+    """Remember a job's task so cancel_job() can cancel it."""
+    _job_tasks[job_id] = task
+
+    def _forget(done: asyncio.Task) -> None:
+        if _job_tasks.get(job_id) is done:
+            del _job_tasks[job_id]
+
+    task.add_done_callback(_forget)
+    return task
+
+
+# Statuses of jobs that were running (or waiting to run) when the process stopped
+_INTERRUPTIBLE_STATUSES = (
+    JobStatus.queued,
+    JobStatus.planning,
+    JobStatus.evidence_map,
+    JobStatus.generating,
+)
+
+
+async def resume_interrupted_jobs() -> int:
+    """Recovery sweep: resume jobs interrupted by a restart or crash.
+
+    Called once on API startup. Jobs that were not finished are rescheduled
+    and pick up after their last checkpoint. Jobs with a pending cancel are
+    cancelled, and jobs that cannot be resumed (no stored request, or
+    interrupted too many times) are failed so clients stop polling.
+
+    Each job is claimed with a conditional update on its status and resume
+    count before it is rescheduled, so when several API processes start
+    together only one of them resumes it. A process cannot tell whether a
+    job listed as unfinished is still running elsewhere, so the sweep still
+    assumes no other live process owns in-process jobs. With the job queue
+    enabled it does nothing: queue leases retry interrupted jobs on another
+    worker, and those retries resume from the checkpoint too.
+
+    Returns:
+        Number of jobs rescheduled.
+    """
+    if not DRAFT_RESUME_ENABLED or job_queue_enabled():
+        return 0
+
+    store = get_job_store()
+    # List every unfinished job before claiming any, so a job claimed here
+    # (set back to queued) is not listed again by this sweep
+    interrupted = [
+        job
+        for status in _INTERRUPTIBLE_STATUSES
+        for job in await store.list_jobs(status=status, limit=1000)
+    ]
+    resumed = 0
+    for job in interrupted:
+        job_id = job.job_id
+        if job.cancel_requested:
+            await update_job(job_id, status=JobStatus.cancelled)
+            logger.info(f"Job {job_id}: Cancelled while interrupted")
+            continue
+        if not job.request:
+            await update_job(
+                job_id,
+                status=JobStatus.failed,
+                error="Generation was interrupted by a server restart",
+                error_code="JOB_INTERRUPTED",
+            )
+            continue
+        if job.resume_count >= DRAFT_RESUME_MAX_ATTEMPTS:
+            await update_job(
+                job_id,
+                status=JobStatus.failed,
+                error=f"Generation was interrupted {job.resume_count + 1} times",
+                error_code="RESUME_LIMIT_EXCEEDED",
+            )
+            continue
+
+        request = DraftGenerateRequest.model_validate(job.request)
+        claimed = await store.claim_job(
+            job_id, job.status, job.resume_count,
+            status=JobStatus.queued, resume_count=job.resume_count + 1,
+        )
+        if claimed is None:
+            logger.info(f"Job {job_id}: Already resumed by another process")
+            continue
+        try:
+            task = get_job_scheduler().submit(
+                JobKind.draft,
+                job_id,
+                # Bind per iteration (the lambda runs after the loop moves on)
+                lambda job_id=job_id, request=request: _generate_draft_task(job_id, request),
+                priority=request.priority,
+            )
+        except SchedulerFullError as e:
+            await update_job(job_id, status=JobStatus.failed, error=str(e), error_code="QUEUE_FULL")
+            continue
+        _track_job_task(job_id, task)
+
+        logger.info(f"Job {job_id}: Rescheduled after interruption (resume {job.resume_count + 1})")
+        resumed += 1
+
+    if resumed:
+        logger.info(f"Recovery sweep resumed {resumed} interrupted generation job(s)")
+    return resumed
+
+
 async def get_job_status(job_id: str) -> Optional[DraftStatusData]:
     """Get current status of a generation job.
 
@@ -6529,6 +6652,9 @@ async def get_job_status(job_id: str) -> Optional[DraftStatusData]:
         draft_plan=job.draft_plan if is_completed else None,
         visual_plan=job.visual_plan if is_completed else None,
         generation_stats=job.get_stats() if is_completed else None,
+        queue_position=(
+            get_job_scheduler().queue_position(job_id) if job.status == JobStatus.queued else None
+        ),
         partial_draft_markdown=partial_draft,
         chapters_available=len(job.chapters_completed) if has_chapters else None,
         error_code=job.error_code if is_failed else None,
@@ -6540,9 +6666,12 @@ async def get_job_status(job_id: str) -> Optional[DraftStatusData]:
 
 
 async def cancel_job(job_id: str) -> Optional[DraftCancelData]:
-    """Request cancellation of a generation job.
+    """Cancel a generation job.
 
-    Cancellation happens after the current chapter completes.
+    A job still waiting for a slot is cancelled outright. A job running in
+    this process has its task cancelled, which aborts in-flight LLM calls and
+    frees its slot; chapters already finished are kept as a partial draft.
+    A job running on a queue worker stops within DRAFT_CANCEL_POLL_SECONDS.
 
     Args:
         job_id: The job identifier.
@@ -6564,14 +6693,34 @@ async def cancel_job(job_id: str) -> Optional[DraftCancelData]:
             chapters_available=len(job.chapters_completed) if job.chapters_completed else None,
         )
 
-    # Request cancellation
-    await update_job(job_id, cancel_requested=True)
+    # Request cancellation (a queued job never starts)
+    updates: dict = {"cancel_requested": True}
+    if job.status == JobStatus.queued:
+        updates["status"] = JobStatus.cancelled
+    job = await update_job(job_id, **updates) or job
+
+    task = _job_tasks.get(job_id)
+    if task is not None and not task.done():
+        task.cancel()
+        await asyncio.wait({task}, timeout=DRAFT_CANCEL_WAIT_SECONDS)
+        job = await get_job(job_id) or job
+
+    if job.status == JobStatus.cancelled:
+        logger.info(f"Job {job_id}: Cancelled")
+        return DraftCancelData(
+            job_id=job.job_id,
+            status=job.status,
+            cancelled=True,
+            message="Job cancelled.",
+            partial_draft_markdown=_assemble_partial_draft(job),
+            chapters_available=len(job.chapters_completed) if job.chapters_completed else None,
+        )
 
     return DraftCancelData(
         job_id=job.job_id,
         status=job.status,
         cancelled=True,
-        message="Cancellation requested. Job will stop after current chapter.",
+        message="Cancellation requested. Job will stop shortly.",
         partial_draft_markdown=None,
         chapters_available=len(job.chapters_completed) if job.chapters_completed else None,
     )
@@ -6628,1380 +6777,1308 @@ async def regenerate_section(
 
 
 # ==============================================================================
-# Background Generation Task
+# Post-Processing Passes
 # ==============================================================================
 
-async def _generate_draft_task(
-    job_id: str,
-    request: DraftGenerateRequest,
-) -> None:
-    """Background task that performs the actual generation.
+def _report_quote_whitelist(report: dict, sink: PassReportSink) -> None:
+    if report.get("dropped"):
+        sink.info(f"Whitelist enforcement - dropped {len(report['dropped'])} invalid quotes")
+        sink.warn(*(f"Quote dropped: \"{dropped[:40]}...\"" for dropped in report["dropped"][:3]))
+    if report.get("replaced"):
+        sink.info(f"Whitelist enforcement - replaced {len(report['replaced'])} quotes with exact text")
 
-    Args:
-        job_id: The job identifier.
-        request: Generation request.
-    """
-    try:
-        # Phase 1: Generate DraftPlan
-        await update_job(job_id, status=JobStatus.planning)
-        logger.info(f"Job {job_id}: Starting planning phase")
 
-        draft_plan = await generate_draft_plan(
-            transcript=request.transcript,
-            outline=request.outline,
-            style_config=request.style_config,
-            resources=request.resources,
+def _report_core_claims(report: dict, sink: PassReportSink) -> None:
+    if report.get("dropped"):
+        sink.info(
+            f"Core Claims enforcement - dropped {len(report['dropped'])}, kept {report.get('kept', 0)}"
+        )
+        sink.warn(*(
+            f"Core Claim dropped ({claim['reason']}): \"{claim['claim'][:30]}...\""
+            for claim in report["dropped"][:3]
+        ))
+
+
+def _report_verbatim_leaks(report: dict, sink: PassReportSink) -> None:
+    leak_count = report.get("leaks_found", 0)
+    if leak_count > 0:
+        sink.warning(f"Verbatim leakage removed - {leak_count} unquoted whitelist fragments from prose")
+        sink.warn(*(
+            f"Verbatim leak removed: \"{leak['text'][:40]}...\""
+            for leak in report.get("leaks_removed", [])[:3]
+        ))
+
+
+def _report_inline_quotes(report: dict, sink: PassReportSink) -> None:
+    if report["removed_count"] > 0:
+        sink.info(f"Removed {report['removed_count']} inline quotes from prose")
+        sink.warn(*(
+            f"Inline quote removed: \"{removed['text'][:40]}...\""
+            for removed in report["removed_quotes"][:3]
+        ))
+
+
+def _report_speaker_names(report: dict, sink: PassReportSink) -> None:
+    norm_count = report.get("normalized_count", 0)
+    if norm_count > 0:
+        sink.info(f"Normalized {norm_count} speaker attributions to canonical form")
+        sink.warn(*(
+            f"Speaker normalized: '{norm['original']}' → '{norm['canonical']}'"
+            for norm in report.get("normalizations", [])[:3]
+        ))
+
+
+def _report_final_speaker_names(report: dict, sink: PassReportSink) -> None:
+    final_norm_count = report.get("normalized_count", 0)
+    if final_norm_count > 0:
+        sink.info(f"Final speaker normalization - normalized {final_norm_count} attributions")
+
+
+def _report_claims_hard_gate(report: dict, sink: PassReportSink) -> None:
+    if report["dropped_count"] > 0:
+        sink.info(f"Core Claims hard gate - dropped {report['dropped_count']} claims with invalid quotes")
+        sink.warn(*(
+            f"Core Claim dropped ({dropped['reason']}): \"{dropped['quote'][:30]}...\""
+            for dropped in report["dropped_claims"][:3]
+        ))
+
+
+def _report_excerpts_hard_gate(report: dict, sink: PassReportSink) -> None:
+    if report["dropped_count"] > 0:
+        sink.info(f"Key Excerpts hard gate - dropped {report['dropped_count']} excerpts with invalid quotes")
+        for dropped in report["dropped_excerpts"][:3]:
+            reason = dropped.get('reason', 'invalid')
+            preview = dropped.get('quote', dropped.get('excerpt_preview', ''))[:30]
+            sink.warn(f"Key Excerpt dropped ({reason}): \"{preview}...\"")
+
+
+def _report_quote_grounding(report: dict, sink: PassReportSink) -> None:
+    if report["invalid_quotes"]:
+        sink.info(
+            f"Quote grounding - {report['summary']['invalid']} invalid quotes "
+            f"({report['summary']['ellipsis_violations']} ellipsis, "
+            f"{report['summary']['fabricated']} fabricated)"
         )
+        sink.warn(*(
+            f"Invalid quote ({invalid['reason']}): \"{invalid.get('quote', '')[:40]}...\""
+            for invalid in report["invalid_quotes"][:5]
+        ))
 
-        job = await get_job(job_id)
-        if not job:
-            return
 
-        await update_job(
-            job_id,
-            draft_plan=draft_plan,
-            visual_plan=draft_plan.visual_plan,
-            total_chapters=len(draft_plan.chapters),
-        )
+def _report_unquoted_excerpts(report: dict, sink: PassReportSink) -> None:
+    if report["fixes_made"] > 0:
+        sink.info(f"Fixed {report['fixes_made']} unquoted excerpts/claims")
 
-        # Check for cancellation
-        if job.cancel_requested:
-            await update_job(job_id, status=JobStatus.cancelled)
-            logger.info(f"Job {job_id}: Cancelled during planning")
-            return
 
-        # Phase 2: Generate Evidence Map (Spec 009)
-        await update_job(job_id, status=JobStatus.evidence_map)
-        logger.info(f"Job {job_id}: Starting evidence map generation")
+def _report_ellipsis_ban(report: dict, sink: PassReportSink) -> None:
+    if report["ellipses_found"]:
+        sink.info(f"Ellipsis ban - removed {len(report['removed_sentences'])} sentences containing ellipses")
+        sink.warn(*(
+            f"Ellipsis removed: \"{location['context'][:50]}...\""
+            for location in report["ellipsis_locations"][:3]
+        ))
 
-        # Extract content mode from style config
-        style_dict = request.style_config.get("style", request.style_config) if isinstance(request.style_config, dict) else {}
-        content_mode_str = style_dict.get("content_mode")
-        book_format = style_dict.get("book_format", "guide")
 
-        # Infer content_mode from book_format if not explicitly set (defensive)
-        if content_mode_str is None:
-            # interview_qa book_format → interview mode, everything else → essay mode
-            if book_format == "interview_qa":
-                content_mode = ContentMode.interview
-                logger.info(f"Job {job_id}: content_mode inferred as 'interview' from book_format='interview_qa'")
+def _report_attributed_speech(report: dict, sink: PassReportSink) -> None:
+    if report.get("invalid_deleted", 0) > 0:
+        sink.info(
+            f"Attribution enforcement (HARD) - deleted {report['invalid_deleted']} invalid attributions, "
+            f"wrapped {report.get('valid_converted', 0)} valid ones"
+        )
+        sink.warn(*(
+            f"Invalid attribution deleted ({detail['speaker']}): \"{detail['content'][:40]}...\""
+            for detail in report.get("invalid_details", [])[:3]
+        ))
+
+
+def _report_truncated_attributions(report: dict, sink: PassReportSink) -> None:
+    if report["fixes_applied"] > 0:
+        sink.info(f"Fixed {report['fixes_applied']} truncated attributions")
+        sink.warn(*(
+            f"Truncated attribution fixed: \"{detail['original_line'][:30]}...\""
+            for detail in report.get("fix_details", [])[:3]
+        ))
+
+
+def _report_dangling_attribution(report: dict, sink: PassReportSink) -> None:
+    if report["rewrites_applied"] > 0:
+        sink.info(f"Dangling attribution gate - rewrote {report['rewrites_applied']} patterns to indirect speech")
+        sink.warn(*(
+            f"Dangling attribution rewritten: \"{detail['original']}\" → indirect speech"
+            for detail in report.get("rewrite_details", [])[:3]
+        ))
+
+
+def _report_speaker_framing(report: dict, sink: PassReportSink) -> None:
+    if report["sentences_dropped"] > 0:
+        sink.info(f"Speaker-framing sanitizer - dropped {report['sentences_dropped']} sentences")
+        sink.warn(*(
+            f"Speaker framing sanitized ({detail['type']}): \"{detail['dropped_sentence'][:40]}...\""
+            for detail in report.get("drop_details", [])[:3]
+        ))
+
+
+def _report_no_names(report: dict, sink: PassReportSink) -> None:
+    if report["sentences_dropped"] > 0:
+        sink.info(f"No-names-in-prose invariant - dropped {report['sentences_dropped']} sentences")
+        sink.warn(*(
+            f"Person name dropped ({detail.get('matched_name', 'unknown')}): "
+            f"\"{detail['dropped_sentence'][:40]}...\""
+            for detail in report.get("drop_details", [])[:3]
+        ))
+    kept_count = report.get("sentences_kept_due_to_allowlist", 0)
+    if kept_count > 0:
+        sink.info(f"No-names-in-prose - kept {kept_count} sentences due to entity allowlist")
+
+
+def _report_meta_discourse(report: dict, sink: PassReportSink) -> None:
+    if report["sentences_dropped"] > 0:
+        sink.info(f"Meta-discourse gate - dropped {report['sentences_dropped']} sentences")
+        sink.warn(*(
+            f"Meta-discourse dropped: \"{detail['dropped_sentence'][:40]}...\""
+            for detail in report.get("drop_details", [])[:3]
+        ))
+
+
+def _report_dangling_connectives(report: dict, sink: PassReportSink) -> None:
+    if report["cleanups_applied"] > 0:
+        sink.info(f"Dangling connective cleanup - fixed {report['cleanups_applied']} orphaned connectives")
+        sink.warn(*(
+            f"Dangling connective cleaned: {detail['type']}"
+            for detail in report.get("cleanup_details", [])[:3]
+        ))
+
+
+def _report_discourse_markers(report: dict, sink: PassReportSink) -> None:
+    if report["markers_removed"] > 0:
+        sink.info(f"Removed {report['markers_removed']} discourse markers")
+        sink.warn(*(
+            f"Discourse marker removed: \"{detail['marker']}\""
+            for detail in report.get("removal_details", [])[:3]
+        ))
+
+
+def _report_verbatim_leak_gate(report: dict, sink: PassReportSink) -> None:
+    if report["paragraphs_dropped"] > 0:
+        sink.info(f"Verbatim leak gate - dropped {report['paragraphs_dropped']} paragraphs with whitelist leaks")
+        sink.warn(*(
+            f"Verbatim leak dropped ({detail['match_type']}): \"{detail['matched_quote'][:30]}...\""
+            for detail in report.get("dropped_details", [])[:3]
+        ))
+
+
+def _report_chapter_openers(report: dict, sink: PassReportSink) -> None:
+    if report["chapters_repaired"] > 0:
+        sink.info(f"Anchor-sentence policy - repaired {report['chapters_repaired']} chapter opener(s)")
+        sink.warn(*(
+            f"Chapter {r['chapter']} bad opener repaired ({r['action']})"
+            for r in report.get("repairs", [])[:3]
+        ))
+
+
+def _report_first_paragraph_pronouns(report: dict, sink: PassReportSink) -> None:
+    if report["sentences_repaired"] + report["sentences_dropped"] > 0:
+        sink.info(
+            f"First-paragraph pronoun repair - {report['sentences_repaired']} replaced, "
+            f"{report['sentences_dropped']} dropped"
+        )
+        for r in report.get("repairs", [])[:3]:
+            if r["action"] == "pronoun_replaced":
+                sink.warn(f"Chapter {r['chapter']} pronoun replaced with '{r['replacement_noun']}'")
             else:
-                content_mode = ContentMode.essay
-                logger.info(f"Job {job_id}: content_mode inferred as 'essay' from book_format='{book_format}'")
-        else:
-            try:
-                content_mode = ContentMode(content_mode_str)
-            except ValueError:
-                # Invalid content_mode value - infer from book_format instead of defaulting to interview
-                content_mode = ContentMode.interview if book_format == "interview_qa" else ContentMode.essay
-                logger.warning(f"Job {job_id}: Invalid content_mode '{content_mode_str}', inferred '{content_mode.value}' from book_format")
-        strict_grounded = style_dict.get("strict_grounded", True)
+                sink.warn(f"Chapter {r['chapter']} pronoun sentence dropped")
 
-        # Detect content type and generate warning if mismatch
-        constraint_warnings: list[str] = []
-        detected_mode, confidence = detect_content_type(request.transcript)
-        mode_warning = generate_mode_warning(detected_mode, content_mode, confidence)
-        if mode_warning:
-            constraint_warnings.append(mode_warning)
-            logger.warning(f"Job {job_id}: {mode_warning}")
 
-        # Generate Evidence Map
-        evidence_map = await generate_evidence_map(
-            project_id=job.project_id or job_id,
-            transcript=request.transcript,
-            chapters=draft_plan.chapters,
-            content_mode=content_mode,
-            strict_grounded=strict_grounded,
-            style_config=style_dict,
+def _report_anachronisms(report: dict, sink: PassReportSink) -> None:
+    if report["paragraphs_removed"] > 0:
+        sink.info(
+            f"Anachronism filter - removed {report['paragraphs_removed']} paragraphs with contemporary framing"
         )
+        sink.warn(*(
+            f"Anachronism filtered ('{detail['keyword']}'): \"{detail['paragraph'][:40]}...\""
+            for detail in report.get("removed_details", [])[:3]
+        ))
 
-        await update_job(
-            job_id,
-            evidence_map=evidence_map.model_dump(mode="json"),
-            content_mode=content_mode,
-            constraint_warnings=constraint_warnings,
-        )
 
-        logger.info(
-            f"Job {job_id}: Evidence Map complete - "
-            f"{sum(len(ch.claims) for ch in evidence_map.chapters)} claims across {len(evidence_map.chapters)} chapters"
-        )
+def _report_narrative_minimum(report: dict, sink: PassReportSink) -> None:
+    if report["chapters_fixed"] > 0:
+        sink.info(f"Chapter narrative fallback - fixed {report['chapters_fixed']} chapters with no prose")
+        sink.warn(*(
+            f"Chapter {detail['chapter']} prose collapsed, inserted fallback"
+            for detail in report.get("fixed_details", [])[:3]
+        ))
 
-        # Build quote whitelist for Ideas Edition
-        whitelist: list[WhitelistQuote] = []
-        if content_mode == ContentMode.essay and evidence_map:
-            try:
-                transcript_pair = TranscriptPair(
-                    raw=request.transcript,
-                    canonical=canonicalize_transcript(request.transcript),
-                )
-                whitelist = build_quote_whitelist(
-                    evidence_map=evidence_map,
-                    transcript=transcript_pair,
-                    known_guests=[],  # TODO: Get from project settings
-                    known_hosts=[],
-                )
-                logger.info(
-                    f"Job {job_id}: Built whitelist with {len(whitelist)} validated quotes"
-                )
 
-                # Generate coverage report and check for weak chapters
-                try:
-                    from hashlib import sha256
-                    transcript_hash = sha256(transcript_pair.canonical.encode()).hexdigest()[:32]
-                    coverage_report = generate_coverage_report(
-                        whitelist=whitelist,
-                        chapter_count=len(evidence_map.chapters),
-                        transcript_hash=transcript_hash,
-                    )
+def _report_prose_quote_chars(report: dict, sink: PassReportSink) -> None:
+    if report.get("quotes_stripped", 0) > 0:
+        sink.info(f"Prose quote cleanup - stripped {report['quotes_stripped']} quote chars")
 
-                    # Log coverage summary
-                    logger.info(
-                        f"Job {job_id}: Coverage report - "
-                        f"feasible={coverage_report.is_feasible}, "
-                        f"predicted_words={coverage_report.predicted_total_range}"
-                    )
 
-                    # Check for chapters that need merging
-                    merge_suggestions = suggest_chapter_merges(coverage_report.chapters)
-                    if merge_suggestions:
-                        for suggestion in merge_suggestions:
-                            if suggestion.get("action") == "abort":
-                                logger.warning(
-                                    f"Job {job_id}: MERGE SUGGESTION - {suggestion['reason']}"
-                                )
-                            else:
-                                logger.warning(
-                                    f"Job {job_id}: MERGE SUGGESTION - Chapter {suggestion['weak_chapter'] + 1} "
-                                    f"should merge into Chapter {suggestion['merge_into'] + 1}. "
-                                    f"Reason: {suggestion['reason']}"
-                                )
-                        logger.warning(
-                            f"Job {job_id}: {len(merge_suggestions)} chapter(s) have insufficient evidence. "
-                            f"Consider reducing chapter count or adding more source material."
-                        )
+def _report_final_dangling_attribution(report: dict, sink: PassReportSink) -> None:
+    if report["rewrites_applied"] > 0:
+        sink.info(f"Final dangling attribution pass - rewrote {report['rewrites_applied']} patterns")
 
-                    # PREFLIGHT GATE: If require_preflight_pass is True and coverage is not feasible, fail
-                    if request.require_preflight_pass and not coverage_report.is_feasible:
-                        error_msg = (
-                            f"Preflight coverage check failed. "
-                            f"Reasons: {'; '.join(coverage_report.feasibility_notes)}. "
-                            f"Set require_preflight_pass=False to generate anyway with warnings."
-                        )
-                        logger.error(f"Job {job_id}: PREFLIGHT GATE BLOCKED - {error_msg}")
-                        await update_job(
-                            job_id,
-                            status=JobStatus.failed,
-                            error_message=error_msg,
-                        )
-                        return
 
-                except Exception as e:
-                    logger.warning(f"Job {job_id}: Coverage analysis failed (non-fatal): {e}")
+def _report_final_speaker_framing(report: dict, sink: PassReportSink) -> None:
+    if report["sentences_dropped"] > 0:
+        sink.info(f"Final speaker-framing sanitizer - dropped {report['sentences_dropped']} sentences")
 
-            except Exception as e:
-                logger.error(f"Job {job_id}: Whitelist build failed (non-fatal): {e}", exc_info=True)
 
-        # Check for cancellation
-        job = await get_job(job_id)
-        if job and job.cancel_requested:
-            await update_job(job_id, status=JobStatus.cancelled)
-            logger.info(f"Job {job_id}: Cancelled during evidence map generation")
-            return
+def _report_final_no_names(report: dict, sink: PassReportSink) -> None:
+    if report["sentences_dropped"] > 0:
+        sink.info(f"Final no-names-in-prose - dropped {report['sentences_dropped']} sentences")
 
-        # Phase 3: Generate content
-        await update_job(job_id, status=JobStatus.generating)
 
-        # Compute words per chapter based on style config and chapter count
-        style_dict = request.style_config.get("style", request.style_config) if isinstance(request.style_config, dict) else {}
-        total_length_preset_str = style_dict.get("total_length_preset", "standard")
-        try:
-            total_length_preset = TotalLengthPreset(total_length_preset_str)
-        except ValueError:
-            total_length_preset = TotalLengthPreset.standard
-        # Get custom word count if preset is 'custom'
-        custom_total_words = style_dict.get("total_target_words")
-        words_per_chapter = compute_words_per_chapter(
-            total_length_preset,
-            len(draft_plan.chapters),
-            custom_total_words,
-        )
-        detail_level_str = style_dict.get("detail_level", "balanced")
-        book_format = style_dict.get("book_format", "guide")
+def _report_final_dangling_connectives(report: dict, sink: PassReportSink) -> None:
+    if report["cleanups_applied"] > 0:
+        sink.info(f"Final dangling connective pass - fixed {report['cleanups_applied']} orphaned connectives")
 
-        # P0: Use single-pass generation for interview mode with evidence
-        # Triggers when: content_mode=interview OR book_format=interview_qa
-        # Both should produce Key Ideas + Conversation structure
-        use_interview_single_pass = (
-            (content_mode == ContentMode.interview or book_format == "interview_qa")
-            and evidence_map
-            and sum(len(ch.claims) for ch in evidence_map.chapters) > 0
-        )
 
-        if use_interview_single_pass:
-            # Single-pass interview generation (P0: Key Ideas + Conversation)
-            logger.info(f"Job {job_id}: Using single-pass interview generation")
-            await update_job(job_id, current_chapter=1, total_chapters=1)
+def _report_core_claims_structure(report: dict, sink: PassReportSink) -> None:
+    if report["dropped_count"] > 0:
+        sink.warning(f"Core Claims structure validation - dropped {report['dropped_count']} malformed claims")
+        sink.warn(*(
+            f"Malformed Core Claim dropped ({detail['reason']})"
+            for detail in report.get("dropped", [])[:3]
+        ))
 
-            # Title guardrail: prevent generic titles like "Interview"
-            interview_book_title = sanitize_interview_title(
-                draft_plan.book_title,
-                fallback=request.project_name if hasattr(request, "project_name") else None,
-                transcript=request.transcript,
-            )
 
-            # Extract definitional candidates BEFORE generation for coverage check
-            definitional_candidates = extract_definitional_candidates(request.transcript)
-            if definitional_candidates:
-                logger.info(f"Job {job_id}: Found {len(definitional_candidates)} definitional candidates")
+def _report_empty_section_headers(report: dict, sink: PassReportSink) -> None:
+    if report["stripped"]:
+        sink.warning(f"Render guard stripped {len(report['stripped'])} empty section(s)")
 
-            # Determine forced candidates based on coverage requirements
-            forced_candidates_for_generation = None
 
-            # Best-of-N candidate selection
-            # Use request param, capped by server-side max
-            candidate_count = min(request.candidate_count, INTERVIEW_CANDIDATE_COUNT_MAX)
-            runner_up_data = None  # Store runner-up for debugging
+def _report_orphan_fragments(report: dict, sink: PassReportSink) -> None:
+    if report["fragments_removed"] > 0:
+        sink.warning(
+            f"Removed {report['fragments_removed']} orphan fragment(s): {report['removed_fragments'][:3]}"
+        )
 
-            if candidate_count > 1:
-                logger.info(f"Job {job_id}: Generating {candidate_count} candidates for best-of-N selection")
 
-                candidates = []
-                for i in range(candidate_count):
-                    markdown, score = await _generate_and_score_candidate(
-                        transcript=request.transcript,
-                        book_title=interview_book_title,
-                        evidence_map=evidence_map,
-                        forced_candidates=forced_candidates_for_generation,
-                        candidate_num=i + 1,
-                    )
-                    candidates.append((markdown, score))
+def _report_quote_artifacts(report: dict, sink: PassReportSink) -> None:
+    if report.get("fixes_applied", 0) > 0:
+        sink.info(f"Quote artifact cleanup - applied {report['fixes_applied']} fixes")
 
-                # Sort by score (highest first)
-                candidates.sort(key=lambda x: x[1]["total"], reverse=True)
-
-                # Pick the best
-                final_markdown, best_score = candidates[0]
-                logger.info(
-                    f"Job {job_id}: Selected candidate 1 with score {best_score['total']:.0f}"
-                )
 
-                # Store runner-up for debugging (if we have more than one)
-                if len(candidates) > 1:
-                    runner_up_markdown, runner_up_score = candidates[1]
-                    runner_up_data = {
-                        "score": runner_up_score,
-                        "markdown_preview": runner_up_markdown[:500] + "..." if len(runner_up_markdown) > 500 else runner_up_markdown,
-                    }
-                    logger.info(
-                        f"Job {job_id}: Runner-up score: {runner_up_score['total']:.0f} "
-                        f"(diff: {best_score['total'] - runner_up_score['total']:.0f})"
-                    )
+def _report_placeholder_glue(report: dict, sink: PassReportSink) -> None:
+    if report.get("glue_removed", 0) > 0:
+        sink.info(f"Cleaned {report['glue_removed']} placeholder glue strings")
 
-            else:
-                # Single candidate (default behavior)
-                final_markdown = await generate_interview_single_pass(
-                    transcript=request.transcript,
-                    book_title=interview_book_title,
-                    evidence_map=evidence_map,
-                )
-                # Clean up any trailing punctuation in H1 title
-                final_markdown = _clean_markdown_title(final_markdown)
 
-            # Key Ideas Coverage Guard: Check if core framework is surfaced
-            if definitional_candidates:
-                key_ideas_text = _extract_key_ideas_section(final_markdown)
-                coverage = check_key_ideas_coverage(key_ideas_text, definitional_candidates)
+def _report_prose_punctuation(report: dict, sink: PassReportSink) -> None:
+    if report.get("fixes_applied", 0) > 0:
+        sink.info(f"Prose punctuation normalizer - fixed {report['fixes_applied']} paragraphs")
 
-                if not coverage["covered"]:
-                    logger.warning(
-                        f"Job {job_id}: Key Ideas missing definitional coverage, re-running with forced candidates"
-                    )
-                    # Re-run with forced candidates (single pass, not best-of-N)
-                    final_markdown = await generate_interview_single_pass(
-                        transcript=request.transcript,
-                        book_title=interview_book_title,
-                        evidence_map=evidence_map,
-                        forced_candidates=coverage["missing_candidates"],
-                    )
-                    # Clean up any trailing punctuation in H1 title
-                    final_markdown = _clean_markdown_title(final_markdown)
-                    constraint_warnings.append(
-                        "Key Ideas re-generated to include core framework definitions"
-                    )
-                else:
-                    logger.info(
-                        f"Job {job_id}: Key Ideas coverage check passed "
-                        f"(matched: {coverage['matched_candidate']['keyword'] if coverage['matched_candidate'] else 'N/A'})"
-                    )
 
-            # Fix title format: "# The Enlightenment" -> "# David Deutsch on *The Beginning of Infinity*"
-            final_markdown = _fix_interview_title(final_markdown, request.transcript)
+def _report_token_integrity(report: dict, sink: PassReportSink) -> None:
+    # Currently logs warnings; will be elevated to hard-fail once source is identified.
+    if not report["is_valid"]:
+        sink.error(f"TOKEN INTEGRITY VIOLATION - {report['violation_count']} token truncation artifacts detected")
+        for v in report.get("violations", [])[:5]:
+            logger.error(
+                f"  - {v['type']} at line {v['line_num']}: '{v['matched']}' "
+                f"in context: '{v['context'][:60]}...'"
+            )
+            sink.warn(f"TOKEN CORRUPTION: {v['type']} - '{v['matched']}'")
 
-            # Post-process for structure polish (heading hierarchy, metadata, Thank you)
-            # Note: source_url could come from project metadata in future
-            final_markdown = postprocess_interview_markdown(final_markdown, source_url=None)
 
-            # Quote validation checks
-            key_ideas_text = _extract_key_ideas_section(final_markdown)
+def _report_prose_metrics(report: dict, sink: PassReportSink) -> None:
+    sink.info(
+        f"Prose metrics - "
+        f"{report['total_sentences_kept']} sentences kept across "
+        f"{report['total_chapters']} chapters, "
+        f"{report['fallback_chapters']} used fallback"
+    )
+    for ch_metrics in report.get("chapters", []):
+        if ch_metrics.get("fallback_used"):
+            logger.info(f"  - Chapter {ch_metrics['chapter']}: {ch_metrics['sentences_kept']} sentences (FALLBACK)")
+        elif ch_metrics["sentences_kept"] < 3:
+            logger.warning(f"  - Chapter {ch_metrics['chapter']}: {ch_metrics['sentences_kept']} sentences (LOW)")
+
+
+def _report_required_sections(report: dict, sink: PassReportSink) -> None:
+    if report["sections_inserted"] > 0:
+        sink.warning(
+            f"FINAL SECTION REPAIR - Inserted {report['sections_inserted']} "
+            f"missing section(s): {report['inserted']}"
+        )
 
-            # Check for fabricated quotes (not in transcript)
-            quote_validation = verify_key_ideas_quotes(key_ideas_text, request.transcript)
-            if not quote_validation["valid"]:
-                logger.warning(
-                    f"Job {job_id}: {len(quote_validation['invalid_quotes'])} potentially invalid quotes in Key Ideas"
-                )
-                for invalid in quote_validation["invalid_quotes"][:3]:
-                    constraint_warnings.append(
-                        f"Quote issue: {invalid['reason'][:50]}"
-                    )
 
-            # Check for truncated quotes
-            truncated = check_truncated_quotes(key_ideas_text)
-            if truncated:
-                logger.warning(f"Job {job_id}: {len(truncated)} truncated quotes in Key Ideas")
-                for issue in truncated[:2]:
-                    constraint_warnings.append(
-                        f"Truncated quote: ...{issue['quote'][-30:]}"
-                    )
+def _report_structural_integrity(report: dict, sink: PassReportSink) -> None:
+    # TODO: Elevate to hard-fail once we're confident in the detection
+    if not report["is_valid"]:
+        sink.error(f"STRUCTURAL INTEGRITY VIOLATION - {report['violation_count']} structural corruption detected")
+        for v in report.get("violations", [])[:5]:
+            logger.error(f"  - {v['type']}: {v.get('context', '')[:60]}...")
+            sink.warn(f"STRUCTURAL CORRUPTION: {v['type']}")
 
-            # Check for interview mode violations (pass transcript to avoid false positives)
-            violations = check_interview_constraints(final_markdown, transcript=request.transcript)
-            if violations:
-                logger.warning(f"Job {job_id}: {len(violations)} interview mode violations in output")
-                constraint_warnings.extend([
-                    f"{v['matched_text'][:50]}..." for v in violations[:5]
-                ])
 
-            # Update job with any constraint warnings
-            if constraint_warnings:
-                await update_job(job_id, constraint_warnings=constraint_warnings)
+def _report_output_contract(report: dict, sink: PassReportSink) -> None:
+    contract_violations = report["violations"]
+    if not contract_violations:
+        sink.info("Ideas Edition output contract validated successfully")
+        return
+    sink.error(f"IDEAS EDITION OUTPUT CONTRACT VIOLATION - {len(contract_violations)} issue(s) detected")
+    for violation in contract_violations:
+        logger.error(f"  - {violation}")
+        sink.warn(f"OUTPUT CONTRACT: {violation}")
+    # HARD FAIL: Ideas Edition output contract is a P0 invariant.
+    # Shipping malformed output wastes user trust and review cycles.
+    raise ValueError(f"Ideas Edition output contract violated: {'; '.join(contract_violations)}")
 
-            chapters_completed = [final_markdown]
 
-        else:
-            # Standard chapter-by-chapter generation
-            logger.info(f"Job {job_id}: Starting chapter generation ({len(draft_plan.chapters)} chapters)")
-            logger.info(f"Job {job_id}: Target ~{words_per_chapter} words/chapter, detail_level={detail_level_str}")
+def check_ideas_output_contract(text: str) -> tuple[str, dict]:
+    """Check Ideas Edition structure and interview template leakage.
 
-            chapters_completed: list[str] = []
+    Args:
+        text: The final draft markdown.
 
-            for i, chapter_plan in enumerate(draft_plan.chapters):
-                # Check for cancellation between chapters
-                job = await get_job(job_id)
-                if job and job.cancel_requested:
-                    await update_job(
-                        job_id,
-                        status=JobStatus.cancelled,
-                        chapters_completed=chapters_completed,
-                    )
-                    logger.info(f"Job {job_id}: Cancelled after chapter {i}")
-                    return
+    Returns:
+        Tuple of (unchanged text, report with a `violations` list).
+    """
+    contract_violations = []
+    if not re.search(r'(?m)^## Chapter \d+:', text):
+        contract_violations.append("Missing chapter structure (## Chapter N:)")
+    if '### Key Excerpts' not in text:
+        contract_violations.append("Missing Key Excerpts sections")
+    if '### Core Claims' not in text:
+        contract_violations.append("Missing Core Claims sections")
+    if re.search(r'(?m)^\*Interviewer:\*', text):
+        contract_violations.append("Interview template leakage (*Interviewer:*)")
+    if '*Format:* Interview' in text:
+        contract_violations.append("Interview format marker (*Format:* Interview)")
+    if '### The Conversation' in text:
+        contract_violations.append("Interview conversation header (### The Conversation)")
+    return text, {"violations": contract_violations}
 
-                await update_job(job_id, current_chapter=i + 1)
-                logger.debug(f"Job {job_id}: Generating chapter {i + 1}/{len(draft_plan.chapters)}")
 
-                # Get chapter evidence from Evidence Map
-                chapter_evidence = get_evidence_for_chapter(evidence_map, chapter_plan.chapter_number)
+# Pass adapters are module-level (used through functools.partial) so the
+# passes can be pickled and run in a post-processing worker process.
 
-                chapter_md = await generate_chapter(
-                    chapter_plan=chapter_plan,
-                    transcript=request.transcript,
-                    book_title=draft_plan.book_title,
-                    style_config=request.style_config,
-                    chapters_completed=chapters_completed,
-                    all_chapters=draft_plan.chapters,
-                    words_per_chapter_target=words_per_chapter,
-                    detail_level=detail_level_str,
-                    # Spec 009: Evidence-grounded generation
-                    chapter_evidence=chapter_evidence,
-                    content_mode=content_mode,
-                    strict_grounded=strict_grounded,
-                )
+def _without_report(fn: Callable[[str], str], text: str) -> tuple[str, dict]:
+    """Run a pass that returns only text, with an empty report."""
+    return fn(text), {}
 
-                # Check for interview mode violations (Spec 009 US2)
-                if content_mode == ContentMode.interview:
-                    violations = check_interview_constraints(chapter_md, transcript=request.transcript)
-                    if violations:
-                        logger.warning(
-                            f"Job {job_id}: Chapter {chapter_plan.chapter_number} has "
-                            f"{len(violations)} interview mode violations"
-                        )
-                        # Add to warnings but don't fail
-                        constraint_warnings.extend([
-                            f"Ch{chapter_plan.chapter_number}: {v['matched_text'][:50]}..."
-                            for v in violations[:3]
-                        ])
-                        await update_job(job_id, constraint_warnings=constraint_warnings)
 
-                chapters_completed.append(chapter_md)
-                await update_job(job_id, chapters_completed=chapters_completed)
+def _validation_pass(validate: Callable[[str], tuple[bool, dict]], text: str) -> tuple[str, dict]:
+    """Run a `validate(text) -> (is_valid, report)` check as a pass."""
+    is_valid, report = validate(text)
+    return text, {**report, "is_valid": is_valid}
 
-            # Assemble final draft for chapter-by-chapter mode
-            final_markdown = assemble_chapters(
-                book_title=draft_plan.book_title,
-                chapters=chapters_completed,
-            )
 
-            # Apply enforcement for essay format on final assembled draft
-            if book_format == "essay":
-                final_markdown, enforcement_report = enforce_prose_quality(final_markdown, book_format)
-                if enforcement_report["sections_removed"]:
-                    logger.info(
-                        f"Job {job_id}: Final draft enforcement removed sections: "
-                        f"{enforcement_report['sections_removed']}"
-                    )
-                if enforcement_report["banned_phrase_counts"]:
-                    logger.info(
-                        f"Job {job_id}: Final draft has {sum(enforcement_report['banned_phrase_counts'].values())} "
-                        f"banned phrase instances"
-                    )
+def _prose_metrics_pass(text: str) -> tuple[str, dict]:
+    """Per-chapter prose metrics as a (read-only) pass."""
+    return text, compute_chapter_prose_metrics(text)
 
-        # Whitelist-based enforcement (Ideas Edition only)
-        # When whitelist is available, use it for deterministic quote validation
-        if content_mode == ContentMode.essay and whitelist:
-            try:
-                # Step 1: Strip LLM-generated blockquotes outside Key Excerpts section
-                final_markdown = strip_llm_blockquotes(final_markdown)
-                logger.debug(f"Job {job_id}: Stripped LLM blockquotes outside Key Excerpts")
-
-                # Step 1.5: Inject excerpts into empty Key Excerpts sections
-                # This ensures each chapter has valid excerpts even if LLM generation failed
-                if evidence_map:
-                    try:
-                        logger.info(f"Job {job_id}: Calling inject_excerpts_into_empty_sections")
-                        final_markdown = inject_excerpts_into_empty_sections(
-                            final_markdown, whitelist, evidence_map
-                        )
-                        logger.info(f"Job {job_id}: Finished inject_excerpts_into_empty_sections")
-                    except Exception as e:
-                        logger.warning(f"Job {job_id}: Excerpt injection failed (non-fatal): {e}")
-
-                # Step 2: Enforce whitelist on remaining quotes (Core Claims, inline)
-                # Process each chapter separately to match quotes against the correct chapter's whitelist entries
-                chapter_pattern = re.compile(r'^## Chapter (\d+)', re.MULTILINE)
-                chapter_matches = list(chapter_pattern.finditer(final_markdown))
-
-                total_dropped = []
-                total_replaced = []
-
-                if chapter_matches:
-                    # Process chapters in reverse order to maintain string positions
-                    for i in range(len(chapter_matches) - 1, -1, -1):
-                        chapter_match = chapter_matches[i]
-                        chapter_num = int(chapter_match.group(1))
-                        chapter_idx = chapter_num - 1  # 0-based
-
-                        chapter_start = chapter_match.start()
-                        chapter_end = chapter_matches[i + 1].start() if i + 1 < len(chapter_matches) else len(final_markdown)
-                        chapter_text = final_markdown[chapter_start:chapter_end]
-
-                        # Enforce whitelist for this chapter
-                        enforcement_result = enforce_quote_whitelist(
-                            generated_text=chapter_text,
-                            whitelist=whitelist,
-                            chapter_index=chapter_idx,
-                        )
 
-                        # Replace chapter text with enforced version
-                        final_markdown = final_markdown[:chapter_start] + enforcement_result.text + final_markdown[chapter_end:]
+def _strip_empty_sections_pass(text: str) -> tuple[str, dict]:
+    """Render guard: remove empty Key Excerpts/Core Claims sections."""
+    text, stripped = strip_empty_section_headers(text)
+    return text, {"stripped": stripped}
 
-                        total_dropped.extend(enforcement_result.dropped)
-                        total_replaced.extend(enforcement_result.replaced)
-                else:
-                    # Fallback: no chapter structure found, enforce globally with chapter_index=0
-                    enforcement_result = enforce_quote_whitelist(
-                        generated_text=final_markdown,
-                        whitelist=whitelist,
-                        chapter_index=0,
-                    )
-                    final_markdown = enforcement_result.text
-                    total_dropped = enforcement_result.dropped
-                    total_replaced = enforcement_result.replaced
 
-                if total_dropped:
-                    logger.info(
-                        f"Job {job_id}: Whitelist enforcement - dropped {len(total_dropped)} invalid quotes"
-                    )
-                    for dropped in total_dropped[:3]:
-                        constraint_warnings.append(f"Quote dropped: \"{dropped[:40]}...\"")
+def _enforce_chapter_whitelist(
+    text: str,
+    chapter_index: int,
+    whitelist: list[WhitelistQuote],
+) -> tuple[str, dict]:
+    """Match one chapter's quotes against its whitelist entries."""
+    result = enforce_quote_whitelist(generated_text=text, whitelist=whitelist, chapter_index=chapter_index)
+    return result.text, {"dropped": result.dropped, "replaced": result.replaced}
 
-                if total_replaced:
-                    logger.info(
-                        f"Job {job_id}: Whitelist enforcement - replaced {len(total_replaced)} quotes with exact text"
-                    )
 
-                await update_job(job_id, constraint_warnings=constraint_warnings)
+def _build_name_policy(job_id: str, whitelist: list[WhitelistQuote], transcript: str) -> dict:
+    """Keyword arguments for enforce_no_names_in_prose.
 
-                # Step 2.5: Enforce Core Claims stricter rules (full-span match, min length)
-                # Core Claims require GUEST-only quotes with exact whitelist match
-                try:
-                    total_claims_dropped = []
-                    total_claims_kept = 0
-
-                    if chapter_matches:
-                        # Process per chapter
-                        for i in range(len(chapter_matches) - 1, -1, -1):
-                            chapter_match = chapter_matches[i]
-                            chapter_num = int(chapter_match.group(1))
-                            chapter_idx = chapter_num - 1
-
-                            chapter_start = chapter_match.start()
-                            chapter_end = chapter_matches[i + 1].start() if i + 1 < len(chapter_matches) else len(final_markdown)
-                            chapter_text = final_markdown[chapter_start:chapter_end]
-
-                            # Apply Core Claims enforcement
-                            enforced_chapter, claims_report = enforce_core_claims_text(
-                                chapter_text, whitelist, chapter_idx
-                            )
+    With DYNAMIC_NAME_POLICY_ENABLED the person blacklist comes from the
+    whitelist speakers and the entity allowlist from the transcript;
+    otherwise both are None and the legacy hardcoded names are used.
+    """
+    person_blacklist = None
+    entity_allowlist_obj = None
+    if DYNAMIC_NAME_POLICY_ENABLED:
+        if whitelist:
+            person_blacklist = build_person_blacklist_from_whitelist(whitelist)
+            logger.info(
+                f"Job {job_id}: Dynamic name policy - built person blacklist with "
+                f"{len(person_blacklist.full_names)} names"
+            )
+        if transcript:
+            entity_allowlist_obj = build_entity_allowlist(
+                transcript,
+                person_blacklist or PersonBlacklist(),
+            )
+            logger.info(
+                f"Job {job_id}: Dynamic name policy - built entity allowlist with "
+                f"{len(entity_allowlist_obj.org_names)} orgs, "
+                f"{len(entity_allowlist_obj.product_names)} products, "
+                f"{len(entity_allowlist_obj.acronyms)} acronyms"
+            )
+    return {"person_blacklist": person_blacklist, "entity_allowlist": entity_allowlist_obj}
 
-                            final_markdown = final_markdown[:chapter_start] + enforced_chapter + final_markdown[chapter_end:]
-                            total_claims_dropped.extend(claims_report.get("dropped", []))
-                            total_claims_kept += claims_report.get("kept", 0)
-                    else:
-                        # Single chapter
-                        final_markdown, claims_report = enforce_core_claims_text(
-                            final_markdown, whitelist, 0
-                        )
-                        total_claims_dropped = claims_report.get("dropped", [])
-                        total_claims_kept = claims_report.get("kept", 0)
 
-                    if total_claims_dropped:
-                        logger.info(
-                            f"Job {job_id}: Core Claims enforcement - dropped {len(total_claims_dropped)}, kept {total_claims_kept}"
-                        )
-                        for claim in total_claims_dropped[:3]:
-                            constraint_warnings.append(
-                                f"Core Claim dropped ({claim['reason']}): \"{claim['claim'][:30]}...\""
-                            )
-                        await update_job(job_id, constraint_warnings=constraint_warnings)
-                except Exception as e:
-                    logger.warning(f"Job {job_id}: Core Claims enforcement failed (non-fatal): {e}")
+def build_post_processing_passes(
+    job_id: str,
+    request: DraftGenerateRequest,
+    content_mode: ContentMode,
+    whitelist: list[WhitelistQuote],
+    evidence_map: Optional[EvidenceMap],
+) -> list[PassSpec]:
+    """Post-processing passes for an assembled draft, in run order.
 
-                # Step 3: Detect and REMOVE verbatim leakage (unquoted whitelist text in prose)
-                # Transcript-exact text in prose without quotation marks = leak
-                try:
-                    final_markdown, leak_report = detect_verbatim_leaks(
-                        final_markdown, whitelist, min_leak_words=6
-                    )
-                    leak_count = leak_report.get("leaks_found", 0)
-                    if leak_count > 0:
-                        logger.warning(
-                            f"Job {job_id}: Verbatim leakage removed - {leak_count} unquoted whitelist fragments from prose"
-                        )
-                        for leak in leak_report.get("leaks_removed", [])[:3]:
-                            constraint_warnings.append(f"Verbatim leak removed: \"{leak['text'][:40]}...\"")
-                        await update_job(job_id, constraint_warnings=constraint_warnings)
-                except Exception as e:
-                    logger.warning(f"Job {job_id}: Verbatim leakage removal failed (non-fatal): {e}")
-
-                # Step 4: Remove inline quotes from prose (Ideas Edition)
-                # Quotes are only allowed in Key Excerpts and Core Claims
-                try:
-                    final_markdown, inline_report = remove_inline_quotes(final_markdown)
-                    if inline_report["removed_count"] > 0:
-                        logger.info(
-                            f"Job {job_id}: Removed {inline_report['removed_count']} inline quotes from prose"
-                        )
-                        for removed in inline_report["removed_quotes"][:3]:
-                            constraint_warnings.append(f"Inline quote removed: \"{removed['text'][:40]}...\"")
-                        await update_job(job_id, constraint_warnings=constraint_warnings)
-                except Exception as e:
-                    logger.warning(f"Job {job_id}: Inline quote removal failed (non-fatal): {e}")
-
-                # Step 5: Normalize speaker attributions to canonical form
-                # Ensures "David" becomes "David Deutsch (GUEST)", etc.
-                try:
-                    speaker_registry = build_speaker_registry(whitelist)
-                    final_markdown, speaker_report = normalize_speaker_names(
-                        final_markdown, speaker_registry
-                    )
-                    norm_count = speaker_report.get("normalized_count", 0)
-                    if norm_count > 0:
-                        logger.info(
-                            f"Job {job_id}: Normalized {norm_count} speaker attributions to canonical form"
-                        )
-                        for norm in speaker_report.get("normalizations", [])[:3]:
-                            constraint_warnings.append(
-                                f"Speaker normalized: '{norm['original']}' → '{norm['canonical']}'"
-                            )
-                        await update_job(job_id, constraint_warnings=constraint_warnings)
-                except Exception as e:
-                    logger.warning(f"Job {job_id}: Speaker name normalization failed (non-fatal): {e}")
+    Whitelist-based enforcement runs when a whitelist is available (Ideas
+    Edition); the transcript-based hard gates are the fallback without one.
+    Most prose gates only apply to the Ideas Edition. The speaker, dangling
+    attribution, sanitizer, no-names and connective passes run a second
+    time after the injection and fallback passes; the PassEngine skips that
+    run when the draft has not changed since the first one.
 
-            except Exception as e:
-                logger.error(f"Job {job_id}: Whitelist enforcement failed (non-fatal): {e}", exc_info=True)
+    Every pass is a module-level function or a functools.partial of one,
+    so the passes can run in a post-processing worker process.
 
-        # Keep the old hard gates as fallback when whitelist is empty
-        elif content_mode == ContentMode.essay:
-            # Core Claims hard gate (Ideas Edition only)
-            # Drop entire Core Claim bullets if their supporting quotes fail validation
-            # This must run BEFORE general quote grounding so quotes are still in place
-            try:
-                final_markdown, claims_report = drop_claims_with_invalid_quotes(
-                    final_markdown,
-                    request.transcript,
-                )
-                if claims_report["dropped_count"] > 0:
-                    logger.info(
-                        f"Job {job_id}: Core Claims hard gate - dropped "
-                        f"{claims_report['dropped_count']} claims with invalid quotes"
-                    )
-                    # Add to constraint warnings
-                    for dropped in claims_report["dropped_claims"][:3]:
-                        constraint_warnings.append(
-                            f"Core Claim dropped ({dropped['reason']}): \"{dropped['quote'][:30]}...\""
-                        )
-                    await update_job(job_id, constraint_warnings=constraint_warnings)
-            except Exception as e:
-                logger.error(f"Job {job_id}: Core Claims hard gate failed (non-fatal): {e}", exc_info=True)
+    Args:
+        job_id: The job identifier (for logging).
+        request: Generation request (for the transcript).
+        content_mode: Content mode of the draft.
+        whitelist: Validated quote whitelist (may be empty).
+        evidence_map: Evidence Map, if one was built.
 
-            # Key Excerpts hard gate (Ideas Edition only)
-            # Drop entire excerpt blocks if their quotes fail validation or have Unknown attribution
-            # This must run BEFORE general quote grounding so quotes are still in place
-            try:
-                final_markdown, excerpts_report = drop_excerpts_with_invalid_quotes(
-                    final_markdown,
-                    request.transcript,
-                )
-                if excerpts_report["dropped_count"] > 0:
-                    logger.info(
-                        f"Job {job_id}: Key Excerpts hard gate - dropped "
-                        f"{excerpts_report['dropped_count']} excerpts with invalid quotes"
-                    )
-                    # Add to constraint warnings
-                    for dropped in excerpts_report["dropped_excerpts"][:3]:
-                        reason = dropped.get('reason', 'invalid')
-                        preview = dropped.get('quote', dropped.get('excerpt_preview', ''))[:30]
-                        constraint_warnings.append(
-                            f"Key Excerpt dropped ({reason}): \"{preview}...\""
-                        )
-                    await update_job(job_id, constraint_warnings=constraint_warnings)
-            except Exception as e:
-                logger.error(f"Job {job_id}: Key Excerpts hard gate failed (non-fatal): {e}", exc_info=True)
+    Returns:
+        Pass specs for a PassEngine.
+    """
+    essay = content_mode == ContentMode.essay
+    whitelist_quote_texts = [q.quote_text for q in whitelist]
+    passes: list[PassSpec] = []
 
-        # Quote grounding enforcement (applies to all modes)
-        # Validates quotes against transcript, converts invalid quotes to paraphrases
-        try:
-            final_markdown, quote_report = enforce_quote_grounding(
-                final_markdown,
-                request.transcript,
-                convert_invalid=True,
-            )
-            if quote_report["invalid_quotes"]:
-                logger.info(
-                    f"Job {job_id}: Quote grounding - {quote_report['summary']['invalid']} invalid quotes "
-                    f"({quote_report['summary']['ellipsis_violations']} ellipsis, "
-                    f"{quote_report['summary']['fabricated']} fabricated)"
-                )
-                # Add to constraint warnings
-                for invalid in quote_report["invalid_quotes"][:5]:
-                    quote_preview = invalid.get('quote', '')[:40]
-                    constraint_warnings.append(
-                        f"Invalid quote ({invalid['reason']}): \"{quote_preview}...\""
-                    )
-                await update_job(job_id, constraint_warnings=constraint_warnings)
-        except Exception as e:
-            logger.error(f"Job {job_id}: Quote grounding failed (non-fatal): {e}", exc_info=True)
-            # Continue without quote grounding - don't fail the whole generation
+    def add(name: str, run, label: str, on_report=None, **options) -> None:
+        passes.append(PassSpec(name=name, run=run, label=label, on_report=on_report, **options))
 
-        # Fix unquoted excerpts (Ideas Edition) - wrap block quotes and Core Claims in quotation marks
-        # This must run BEFORE validation so the newly-quoted content gets validated
-        if content_mode == ContentMode.essay:
-            try:
-                final_markdown, excerpt_fix_report = fix_unquoted_excerpts(final_markdown)
-                if excerpt_fix_report["fixes_made"] > 0:
-                    logger.info(
-                        f"Job {job_id}: Fixed {excerpt_fix_report['fixes_made']} unquoted excerpts/claims"
-                    )
-            except Exception as e:
-                logger.error(f"Job {job_id}: Unquoted excerpt fix failed (non-fatal): {e}", exc_info=True)
+    inject_excerpts = partial(
+        _without_report,
+        partial(inject_excerpts_into_empty_sections, whitelist=whitelist, evidence_map=evidence_map),
+    )
+    normalize_speakers = partial(
+        normalize_speaker_names,
+        registry=build_speaker_registry(whitelist) if whitelist else {},
+    )
+    if essay:
+        no_names_in_prose = partial(
+            enforce_no_names_in_prose,
+            **_build_name_policy(job_id, whitelist, request.transcript),
+        )
 
-        # Global ellipsis ban (Step B) - remove sentences containing ellipses
-        # Ellipses indicate truncation/approximation which is unacceptable for grounded content
-        try:
-            final_markdown, ellipsis_report = enforce_ellipsis_ban(
-                final_markdown,
-                remove_sentences=True,
-            )
-            if ellipsis_report["ellipses_found"]:
-                logger.info(
-                    f"Job {job_id}: Ellipsis ban - removed {len(ellipsis_report['removed_sentences'])} "
-                    f"sentences containing ellipses"
-                )
-                # Add to constraint warnings
-                for location in ellipsis_report["ellipsis_locations"][:3]:
-                    constraint_warnings.append(
-                        f"Ellipsis removed: \"{location['context'][:50]}...\""
-                    )
-                await update_job(job_id, constraint_warnings=constraint_warnings)
-        except Exception as e:
-            logger.error(f"Job {job_id}: Ellipsis ban failed (non-fatal): {e}", exc_info=True)
+    if essay and whitelist:
+        # Strip LLM-generated blockquotes outside Key Excerpts section
+        add("strip_llm_blockquotes", partial(_without_report, strip_llm_blockquotes), "LLM blockquote stripping")
+        # Inject excerpts into empty Key Excerpts sections
+        if evidence_map:
+            add("inject_excerpts_into_empty_sections", inject_excerpts, "Excerpt injection")
+        # Match quotes against each chapter's whitelist entries
+        add(
+            "enforce_quote_whitelist", partial(_enforce_chapter_whitelist, whitelist=whitelist),
+            "Whitelist enforcement", _report_quote_whitelist, scope=PassScope.chapter,
+        )
+        # Core Claims require GUEST-only quotes with exact whitelist match
+        add(
+            "enforce_core_claims_text", partial(enforce_core_claims_text, whitelist=whitelist),
+            "Core Claims enforcement", _report_core_claims, scope=PassScope.chapter,
+        )
+        # Transcript-exact text in prose without quotation marks = leak
+        add(
+            "detect_verbatim_leaks", partial(detect_verbatim_leaks, whitelist=whitelist, min_leak_words=6),
+            "Verbatim leakage removal", _report_verbatim_leaks,
+        )
+        # Quotes are only allowed in Key Excerpts and Core Claims
+        add("remove_inline_quotes", remove_inline_quotes, "Inline quote removal", _report_inline_quotes)
+        # Ensures "David" becomes "David Deutsch (GUEST)", etc.
+        add(
+            "normalize_speaker_names", normalize_speakers, "Speaker name normalization",
+            _report_speaker_names, idempotent=True,
+        )
+    elif essay:
+        # Hard gates without a whitelist; must run BEFORE quote grounding so quotes are still in place
+        add(
+            "drop_claims_with_invalid_quotes",
+            partial(drop_claims_with_invalid_quotes, transcript=request.transcript),
+            "Core Claims hard gate", _report_claims_hard_gate,
+        )
+        add(
+            "drop_excerpts_with_invalid_quotes",
+            partial(drop_excerpts_with_invalid_quotes, transcript=request.transcript),
+            "Key Excerpts hard gate", _report_excerpts_hard_gate,
+        )
 
-        # Attributed-speech enforcement (Step A) - validate "Deutsch argues, X" patterns
-        # These pseudo-quotes bypass quote validation and may contain fabricated content
-        try:
-            final_markdown, attribution_report = enforce_attributed_speech(
-                final_markdown,
-                request.transcript,
-                remediate_invalid=True,  # Ignored - always hard enforcement now
-            )
-            if attribution_report.get("invalid_deleted", 0) > 0:
-                logger.info(
-                    f"Job {job_id}: Attribution enforcement (HARD) - deleted "
-                    f"{attribution_report['invalid_deleted']} invalid attributions, "
-                    f"wrapped {attribution_report.get('valid_converted', 0)} valid ones"
-                )
-                # Add to constraint warnings
-                for detail in attribution_report.get("invalid_details", [])[:3]:
-                    constraint_warnings.append(
-                        f"Invalid attribution deleted ({detail['speaker']}): \"{detail['content'][:40]}...\""
-                    )
-                await update_job(job_id, constraint_warnings=constraint_warnings)
-        except Exception as e:
-            logger.error(f"Job {job_id}: Attribution enforcement failed (non-fatal): {e}", exc_info=True)
+    # Validates quotes against transcript, converts invalid quotes to paraphrases
+    add(
+        "enforce_quote_grounding",
+        partial(enforce_quote_grounding, transcript=request.transcript, convert_invalid=True),
+        "Quote grounding", _report_quote_grounding,
+    )
+    if essay:
+        # Wrap block quotes and Core Claims in quotation marks before validation
+        add("fix_unquoted_excerpts", fix_unquoted_excerpts, "Unquoted excerpt fix", _report_unquoted_excerpts)
+    # Remove sentences containing ellipses (truncation/approximation)
+    add(
+        "enforce_ellipsis_ban", partial(enforce_ellipsis_ban, remove_sentences=True),
+        "Ellipsis ban", _report_ellipsis_ban,
+    )
+    # Validate "Deutsch argues, X" pseudo-quotes (always hard enforcement)
+    add(
+        "enforce_attributed_speech",
+        partial(enforce_attributed_speech, transcript=request.transcript, remediate_invalid=True),
+        "Attribution enforcement", _report_attributed_speech,
+    )
 
-        # Fix Truncated Attributions (Ideas Edition only)
+    if essay:
         # Fixes "Deutsch notes," at end of line followed by content in next paragraph
-        if content_mode == ContentMode.essay:
-            try:
-                final_markdown, truncated_report = fix_truncated_attributions(final_markdown)
-                if truncated_report["fixes_applied"] > 0:
-                    logger.info(
-                        f"Job {job_id}: Fixed {truncated_report['fixes_applied']} truncated attributions"
-                    )
-                    for detail in truncated_report.get("fix_details", [])[:3]:
-                        constraint_warnings.append(
-                            f"Truncated attribution fixed: \"{detail['original_line'][:30]}...\""
-                        )
-                    await update_job(job_id, constraint_warnings=constraint_warnings)
-            except Exception as e:
-                logger.error(f"Job {job_id}: Truncated attribution fix failed (non-fatal): {e}", exc_info=True)
-
-        # Dangling Attribution Gate (Ideas Edition only)
+        add(
+            "fix_truncated_attributions", fix_truncated_attributions, "Truncated attribution fix",
+            _report_truncated_attributions,
+        )
         # Rewrites "Deutsch notes, For ages..." to "Deutsch notes that for ages..."
-        if content_mode == ContentMode.essay:
-            try:
-                final_markdown, dangling_report = enforce_dangling_attribution_gate(final_markdown)
-                if dangling_report["rewrites_applied"] > 0:
-                    logger.info(
-                        f"Job {job_id}: Dangling attribution gate - rewrote "
-                        f"{dangling_report['rewrites_applied']} patterns to indirect speech"
-                    )
-                    for detail in dangling_report.get("rewrite_details", [])[:3]:
-                        constraint_warnings.append(
-                            f"Dangling attribution rewritten: \"{detail['original']}\" → indirect speech"
-                        )
-                    await update_job(job_id, constraint_warnings=constraint_warnings)
-            except Exception as e:
-                logger.error(f"Job {job_id}: Dangling attribution gate failed (non-fatal): {e}", exc_info=True)
-
-        # Speaker-Framing Sanitizer (Ideas Edition only)
-        # Rewrites "Deutsch argues that..." → clause content, strips attribution wrappers
-        if content_mode == ContentMode.essay:
-            try:
-                final_markdown, sanitizer_report = sanitize_speaker_framing(final_markdown)
-                if sanitizer_report["rewrites_applied"] > 0:
-                    logger.info(
-                        f"Job {job_id}: Speaker-framing sanitizer - rewrote "
-                        f"{sanitizer_report['rewrites_applied']} patterns"
-                    )
-                    for detail in sanitizer_report.get("rewrite_details", [])[:3]:
-                        constraint_warnings.append(
-                            f"Speaker framing sanitized ({detail['type']}): starts with '{detail['replacement_start']}'"
-                        )
-                    await update_job(job_id, constraint_warnings=constraint_warnings)
-            except Exception as e:
-                logger.error(f"Job {job_id}: Speaker-framing sanitizer failed (non-fatal): {e}", exc_info=True)
-
-        # Speaker-Framing Invariant / No-Names-In-Prose (Ideas Edition only)
+        add(
+            "enforce_dangling_attribution_gate", enforce_dangling_attribution_gate, "Dangling attribution gate",
+            _report_dangling_attribution, scope=PassScope.paragraph,
+        )
+        # Drops sentences with attribution wrappers ("Deutsch argues that...")
+        add(
+            "sanitize_speaker_framing", sanitize_speaker_framing, "Speaker-framing sanitizer",
+            _report_speaker_framing, scope=PassScope.paragraph, idempotent=True,
+        )
         # Hard invariant: person names in prose are dropped (org/product names may be allowed)
-        # With DYNAMIC_NAME_POLICY_ENABLED: uses speaker blacklist + transcript entity allowlist
-        # Without flag: uses legacy hardcoded physicist names
-        if content_mode == ContentMode.essay:
-            try:
-                # Build dynamic blacklist/allowlist if flag enabled and data available
-                person_blacklist = None
-                entity_allowlist_obj = None
-
-                if DYNAMIC_NAME_POLICY_ENABLED:
-                    # Build person blacklist from whitelist speakers
-                    if whitelist:
-                        person_blacklist = build_person_blacklist_from_whitelist(whitelist)
-                        logger.info(
-                            f"Job {job_id}: Dynamic name policy - built person blacklist with "
-                            f"{len(person_blacklist.full_names)} names"
-                        )
-
-                    # Build entity allowlist from transcript
-                    if hasattr(request, 'transcript') and request.transcript:
-                        entity_allowlist_obj = build_entity_allowlist(
-                            request.transcript,
-                            person_blacklist or PersonBlacklist(),
-                        )
-                        logger.info(
-                            f"Job {job_id}: Dynamic name policy - built entity allowlist with "
-                            f"{len(entity_allowlist_obj.org_names)} orgs, "
-                            f"{len(entity_allowlist_obj.product_names)} products, "
-                            f"{len(entity_allowlist_obj.acronyms)} acronyms"
-                        )
+        add(
+            "enforce_no_names_in_prose", no_names_in_prose, "No-names-in-prose invariant",
+            _report_no_names, scope=PassScope.paragraph, idempotent=True,
+        )
+        # Drops sentences that describe the document itself (template/prompt leakage)
+        # Must run BEFORE orphan-pronoun repair so we can fix any new orphans created
+        add(
+            "sanitize_meta_discourse", sanitize_meta_discourse, "Meta-discourse gate",
+            _report_meta_discourse, scope=PassScope.paragraph,
+        )
+        # Fixes orphaned articles/connectives: "offers a ." → next sentence
+        add(
+            "cleanup_dangling_connectives", cleanup_dangling_connectives, "Dangling connective cleanup",
+            _report_dangling_connectives, scope=PassScope.paragraph, idempotent=True,
+        )
+        # Removes "Okay,", "In fact,", "Yes." from prose
+        add(
+            "remove_discourse_markers", remove_discourse_markers, "Discourse marker removal",
+            _report_discourse_markers,
+        )
+    if essay and whitelist:
+        # Catches whitelist quote text appearing in narrative prose
+        add(
+            "enforce_verbatim_leak_gate",
+            # Tightened from 25 to catch shorter verbatim leaks
+            partial(enforce_verbatim_leak_gate, whitelist_quotes=whitelist_quote_texts, min_match_len=12),
+            "Verbatim leak gate", _report_verbatim_leak_gate,
+        )
+    if essay:
+        # Chapters may start with orphan pronouns after sentence drops; prepend fallback
+        # (original prose is not available here, so salvage is not possible)
+        add(
+            "repair_orphan_chapter_openers",
+            partial(
+                repair_orphan_chapter_openers,
+                original_prose_by_chapter=None,  # TODO: wire up original prose for salvage
+                whitelist_quotes=whitelist_quote_texts,
+            ),
+            "Anchor-sentence policy", _report_chapter_openers,
+        )
+        # "It introduced..." → "The Enlightenment introduced..." in first paragraphs
+        add(
+            "repair_first_paragraph_pronouns", repair_first_paragraph_pronouns, "First-paragraph pronoun repair",
+            _report_first_paragraph_pronouns,
+        )
+        # Must run BEFORE Chapter Narrative Minimum so fallback can fix any prose-zero created
+        add(
+            "filter_anachronism_paragraphs", filter_anachronism_paragraphs, "Anachronism filter",
+            _report_anachronisms,
+        )
+        # Must run AFTER all paragraph-dropping gates (anachronism, leak, etc.)
+        add(
+            "ensure_chapter_narrative_minimum", partial(ensure_chapter_narrative_minimum, min_prose_paragraphs=1),
+            "Chapter narrative fallback", _report_narrative_minimum,
+        )
+        # Quotes only allowed in Key Excerpts blockquotes and Core Claims bullets
+        add(
+            "strip_prose_quote_chars", strip_prose_quote_chars, "Prose quote cleanup",
+            _report_prose_quote_chars,
+        )
+    if essay and evidence_map and whitelist:
+        # Refill sections whose excerpts were dropped by validation
+        add("inject_excerpts_into_empty_sections", inject_excerpts, "Second excerpt injection pass")
+    if essay and whitelist:
+        # Catch non-canonical names introduced by injection passes or other gates
+        add(
+            "normalize_speaker_names", normalize_speakers, "Final speaker normalization",
+            _report_final_speaker_names, idempotent=True,
+        )
 
-                # Call the enforcement function with dynamic params (or None for legacy mode)
-                final_markdown, invariant_report = enforce_no_names_in_prose(
-                    final_markdown,
-                    person_blacklist=person_blacklist,
-                    entity_allowlist=entity_allowlist_obj,
-                )
+    if essay:
+        # Re-run the prose gates after injection passes and fallback narratives
+        add(
+            "enforce_dangling_attribution_gate", enforce_dangling_attribution_gate,
+            "Final dangling attribution pass", _report_final_dangling_attribution, scope=PassScope.paragraph,
+        )
+        add(
+            "sanitize_speaker_framing", sanitize_speaker_framing, "Final speaker-framing sanitizer",
+            _report_final_speaker_framing, scope=PassScope.paragraph, idempotent=True,
+        )
+        add(
+            "enforce_no_names_in_prose", no_names_in_prose, "Final no-names-in-prose invariant",
+            _report_final_no_names, scope=PassScope.paragraph, idempotent=True,
+        )
+        add(
+            "cleanup_dangling_connectives", cleanup_dangling_connectives, "Final dangling connective pass",
+            _report_final_dangling_connectives, scope=PassScope.paragraph, idempotent=True,
+        )
+        # Safety net: drop malformed claims that slipped through enforcement
+        add(
+            "validate_core_claims_structure", validate_core_claims_structure,
+            "Core Claims structure validation", _report_core_claims_structure,
+        )
+        # Render guard: empty Key Excerpts/Core Claims sections are removed
+        add("strip_empty_section_headers", _strip_empty_sections_pass, "Render guard", _report_empty_section_headers)
+        # Removes debris like "ethos of inquiry." after Core Claims
+        add(
+            "cleanup_orphan_fragments_between_sections", cleanup_orphan_fragments_between_sections,
+            "Orphan fragment cleanup", _report_orphan_fragments,
+        )
 
-                # Log results
-                if invariant_report["sentences_dropped"] > 0:
-                    logger.info(
-                        f"Job {job_id}: No-names-in-prose invariant - dropped "
-                        f"{invariant_report['sentences_dropped']} sentences"
-                    )
-                    for detail in invariant_report.get("drop_details", [])[:3]:
-                        matched = detail.get("matched_name", "unknown")
-                        constraint_warnings.append(
-                            f"Person name dropped ({matched}): \"{detail['dropped_sentence'][:40]}...\""
-                        )
-                    await update_job(job_id, constraint_warnings=constraint_warnings)
+    # Clean up orphan quotes and stray punctuation left by upstream steps
+    add("fix_quote_artifacts", fix_quote_artifacts, "Quote artifact cleanup", _report_quote_artifacts)
+    # Fix formatting issues from deletions
+    add("repair_whitespace", partial(_without_report, repair_whitespace), "Whitespace repair")
+
+    if essay:
+        # Ensure blank lines before headers (formatting only)
+        add("normalize_markdown_headers", normalize_markdown_headers, "Header normalization")
+        # Remove "[as discussed in the excerpts above]" and similar markers
+        add("clean_placeholder_glue", clean_placeholder_glue, "Placeholder glue cleanup", _report_placeholder_glue)
+        # Narrative paragraphs end with terminal punctuation; after all content changes
+        add(
+            "normalize_prose_punctuation", normalize_prose_punctuation, "Prose punctuation normalizer",
+            _report_prose_punctuation, scope=PassScope.paragraph,
+        )
+        # Token truncation artifacts mean a pass corrupted text mid-word
+        add(
+            "validate_token_integrity", partial(_validation_pass, validate_token_integrity),
+            "Token integrity check", _report_token_integrity,
+        )
+        add("compute_chapter_prose_metrics", _prose_metrics_pass, "Prose metrics computation", _report_prose_metrics)
+        # Runs AFTER the render guards so removed sections are re-inserted with placeholders
+        add(
+            "ensure_required_sections_exist", ensure_required_sections_exist, "Final section repair",
+            _report_required_sections,
+        )
+        # P0 invariant: unclosed quotes, headings inside quotes, quote absorption
+        add(
+            "validate_structural_integrity", partial(_validation_pass, validate_structural_integrity),
+            "Structural integrity check", _report_structural_integrity,
+        )
+        add(
+            "check_ideas_output_contract", check_ideas_output_contract, "Output contract validation",
+            _report_output_contract,
+        )
 
-                # Log kept-due-to-allowlist metric
-                kept_count = invariant_report.get("sentences_kept_due_to_allowlist", 0)
-                if kept_count > 0:
-                    logger.info(
-                        f"Job {job_id}: No-names-in-prose - kept {kept_count} sentences "
-                        f"due to entity allowlist"
-                    )
+    return passes
 
-            except Exception as e:
-                logger.error(f"Job {job_id}: No-names-in-prose invariant failed (non-fatal): {e}", exc_info=True)
 
-        # Meta-Discourse Gate (Ideas Edition only)
-        # Drops sentences that describe the document itself (template/prompt leakage)
-        # E.g., "This chapter develops the theme...", "The excerpts preserve..."
-        # Must run BEFORE orphan-pronoun repair so we can fix any new orphans created
-        if content_mode == ContentMode.essay:
-            try:
-                final_markdown, meta_report = sanitize_meta_discourse(final_markdown)
-                if meta_report["sentences_dropped"] > 0:
-                    logger.info(
-                        f"Job {job_id}: Meta-discourse gate - dropped "
-                        f"{meta_report['sentences_dropped']} sentences"
-                    )
-                    for detail in meta_report.get("drop_details", [])[:3]:
-                        constraint_warnings.append(
-                            f"Meta-discourse dropped: \"{detail['dropped_sentence'][:40]}...\""
-                        )
-                    await update_job(job_id, constraint_warnings=constraint_warnings)
-            except Exception as e:
-                logger.error(f"Job {job_id}: Meta-discourse gate failed (non-fatal): {e}", exc_info=True)
+# ==============================================================================
+# Background Generation Task
+# ==============================================================================
 
-        # Dangling Connective Cleanup (Ideas Edition only)
-        # Fixes orphaned articles/connectives: "offers a ." → next sentence, ", suggesting that ." → "."
-        if content_mode == ContentMode.essay:
-            try:
-                final_markdown, connective_report = cleanup_dangling_connectives(final_markdown)
-                if connective_report["cleanups_applied"] > 0:
-                    logger.info(
-                        f"Job {job_id}: Dangling connective cleanup - fixed "
-                        f"{connective_report['cleanups_applied']} orphaned connectives"
-                    )
-                    for detail in connective_report.get("cleanup_details", [])[:3]:
-                        constraint_warnings.append(
-                            f"Dangling connective cleaned: {detail['type']}"
-                        )
-                    await update_job(job_id, constraint_warnings=constraint_warnings)
-            except Exception as e:
-                logger.error(f"Job {job_id}: Dangling connective cleanup failed (non-fatal): {e}", exc_info=True)
+async def _generate_draft_task(
+    job_id: str,
+    request: DraftGenerateRequest,
+) -> None:
+    """Background task that performs the actual generation.
 
-        # Remove Discourse Markers (Ideas Edition only)
-        # Removes "Okay,", "In fact,", "Yes." from prose
-        if content_mode == ContentMode.essay:
-            try:
-                final_markdown, discourse_report = remove_discourse_markers(final_markdown)
-                if discourse_report["markers_removed"] > 0:
-                    logger.info(
-                        f"Job {job_id}: Removed {discourse_report['markers_removed']} discourse markers"
-                    )
-                    for detail in discourse_report.get("removal_details", [])[:3]:
-                        constraint_warnings.append(
-                            f"Discourse marker removed: \"{detail['marker']}\""
-                        )
-                    await update_job(job_id, constraint_warnings=constraint_warnings)
-            except Exception as e:
-                logger.error(f"Job {job_id}: Discourse marker removal failed (non-fatal): {e}", exc_info=True)
+    Each stage records a checkpoint on the job. A job that already has one
+    (it was interrupted and resumed) skips the stages up to it and only
+    generates the chapters that are still missing.
 
-        # Verbatim Leak Gate (Ideas Edition only)
-        # Catches whitelist quote text appearing in narrative prose (outside Key Excerpts/Core Claims)
-        if content_mode == ContentMode.essay and whitelist:
-            try:
-                # Extract quote texts from whitelist for comparison
-                whitelist_quote_texts = [q.quote_text for q in whitelist]
-                final_markdown, leak_report = enforce_verbatim_leak_gate(
-                    final_markdown,
-                    whitelist_quote_texts,
-                    min_match_len=12,  # Tightened from 25 to catch shorter verbatim leaks
-                )
-                if leak_report["paragraphs_dropped"] > 0:
-                    logger.info(
-                        f"Job {job_id}: Verbatim leak gate - dropped "
-                        f"{leak_report['paragraphs_dropped']} paragraphs with whitelist leaks"
-                    )
-                    for detail in leak_report.get("dropped_details", [])[:3]:
-                        constraint_warnings.append(
-                            f"Verbatim leak dropped ({detail['match_type']}): \"{detail['matched_quote'][:30]}...\""
-                        )
-                    await update_job(job_id, constraint_warnings=constraint_warnings)
-            except Exception as e:
-                logger.error(f"Job {job_id}: Verbatim leak gate failed (non-fatal): {e}", exc_info=True)
+    Args:
+        job_id: The job identifier.
+        request: Generation request.
+    """
+    # Roll up every LLM call made by this job (including its subtasks)
+    llm_usage = LLMUsageRollup()
+    llm_usage_token = bind_llm_usage(llm_usage)
+    # Wall/CPU time per stage, chapter and enforcement pass
+    timings = TimingTrace()
+    timings_token = bind_timing_trace(timings)
+    try:
+        job = await get_job(job_id)
+        if not job:
+            return
+        # Carry over what earlier runs of a resumed or retried job spent, so
+        # the totals written below cover every run
+        llm_usage.merge(job.llm_usage)
+        timings.merge(job.timings)
+        if job.cancel_requested:
+            # Cancelled while waiting for a slot or a worker
+            await update_job(job_id, status=JobStatus.cancelled)
+            return
+        resume_from = job.checkpoint
+        if resume_from:
+            logger.info(f"Job {job_id}: Resuming after checkpoint '{resume_from.value}'")
+        stage_scope = _stage_cache_scope(job, request)
 
-        # Anchor-sentence policy (Ideas Edition only)
-        # Post sentence-drop, chapters may start with orphan pronouns/connectives
-        # (It/This/These/However) that lack antecedent because anchoring sentence was dropped.
-        # This repairs by prepending a safe salvage sentence or fallback.
-        if content_mode == ContentMode.essay:
-            try:
-                # Note: original_prose_by_chapter is not available at this point in the pipeline
-                # so salvage is not possible. We prepend fallback for bad openers.
-                whitelist_quote_texts = [q.quote_text for q in whitelist] if whitelist else []
-                final_markdown, opener_report = repair_orphan_chapter_openers(
-                    final_markdown,
-                    original_prose_by_chapter=None,  # TODO: wire up original prose for salvage
-                    whitelist_quotes=whitelist_quote_texts,
-                )
-                if opener_report["chapters_repaired"] > 0:
-                    logger.info(
-                        f"Job {job_id}: Anchor-sentence policy - repaired "
-                        f"{opener_report['chapters_repaired']} chapter opener(s)"
+        # Phase 1: Generate DraftPlan
+        if _checkpoint_reached(resume_from, GenerationCheckpoint.plan) and job.draft_plan:
+            draft_plan = job.draft_plan
+        else:
+            await update_job(job_id, status=JobStatus.planning)
+            logger.info(f"Job {job_id}: Starting planning phase")
+
+            with timed("planning"):
+                plan_key = _draft_plan_stage_key(request)
+                cached_plan = await _get_cached_stage(job_id, stage_scope, CachedStage.draft_plan, plan_key)
+                if cached_plan is not None:
+                    draft_plan = DraftPlan.model_validate(cached_plan)
+                else:
+                    draft_plan = await generate_draft_plan(
+                        transcript=request.transcript,
+                        outline=request.outline,
+                        style_config=request.style_config,
+                        resources=request.resources,
                     )
-                    for r in opener_report.get("repairs", [])[:3]:
-                        constraint_warnings.append(
-                            f"Chapter {r['chapter']} bad opener repaired ({r['action']})"
+                    if draft_plan.visual_plan.is_fallback:
+                        logger.info(f"Job {job_id}: Not caching draft plan with fallback visual plan")
+                    else:
+                        await _store_cached_stage(
+                            job_id, stage_scope, CachedStage.draft_plan, plan_key,
+                            draft_plan.model_dump(mode="json"),
                         )
-                    await update_job(job_id, constraint_warnings=constraint_warnings)
-            except Exception as e:
-                logger.error(f"Job {job_id}: Anchor-sentence policy failed (non-fatal): {e}", exc_info=True)
 
-        # First-Paragraph Pronoun Repair (Ideas Edition only)
-        # Fixes pronoun-start sentences (It/This/These/They) in first paragraph
-        # Replaces with chapter title noun (e.g., "It introduced..." → "The Enlightenment introduced...")
-        if content_mode == ContentMode.essay:
-            try:
-                final_markdown, pronoun_report = repair_first_paragraph_pronouns(final_markdown)
-                total_repairs = pronoun_report["sentences_repaired"] + pronoun_report["sentences_dropped"]
-                if total_repairs > 0:
-                    logger.info(
-                        f"Job {job_id}: First-paragraph pronoun repair - "
-                        f"{pronoun_report['sentences_repaired']} replaced, "
-                        f"{pronoun_report['sentences_dropped']} dropped"
-                    )
-                    for r in pronoun_report.get("repairs", [])[:3]:
-                        if r["action"] == "pronoun_replaced":
-                            constraint_warnings.append(
-                                f"Chapter {r['chapter']} pronoun replaced with '{r['replacement_noun']}'"
-                            )
-                        else:
-                            constraint_warnings.append(
-                                f"Chapter {r['chapter']} pronoun sentence dropped"
-                            )
-                    await update_job(job_id, constraint_warnings=constraint_warnings)
-            except Exception as e:
-                logger.error(f"Job {job_id}: First-paragraph pronoun repair failed (non-fatal): {e}", exc_info=True)
+            job = await get_job(job_id)
+            if not job:
+                return
 
-        # Anachronism filter (Ideas Edition safety net) - only for essay mode
-        # Catches contemporary framing that slipped past generation prompts
-        # NOTE: Must run BEFORE Chapter Narrative Minimum so fallback can fix any prose-zero created
-        if content_mode == ContentMode.essay:
-            try:
-                final_markdown, anachronism_report = filter_anachronism_paragraphs(final_markdown)
-                if anachronism_report["paragraphs_removed"] > 0:
-                    logger.info(
-                        f"Job {job_id}: Anachronism filter - removed "
-                        f"{anachronism_report['paragraphs_removed']} paragraphs with contemporary framing"
-                    )
-                    # Add to constraint warnings
-                    for detail in anachronism_report.get("removed_details", [])[:3]:
-                        constraint_warnings.append(
-                            f"Anachronism filtered ('{detail['keyword']}'): \"{detail['paragraph'][:40]}...\""
-                        )
-                    await update_job(job_id, constraint_warnings=constraint_warnings)
-            except Exception as e:
-                logger.error(f"Job {job_id}: Anachronism filter failed (non-fatal): {e}", exc_info=True)
+            await update_job(
+                job_id,
+                draft_plan=draft_plan,
+                visual_plan=draft_plan.visual_plan,
+                total_chapters=len(draft_plan.chapters),
+                checkpoint=GenerationCheckpoint.plan,
+            )
+            resume_from = None
 
-        # Chapter Narrative Minimum (Ideas Edition only)
-        # Ensures each chapter has at least one prose paragraph to prevent content collapse
-        # If gates dropped all prose, insert a safe fallback narrative
-        # NOTE: Must run AFTER all paragraph-dropping gates (anachronism, leak, etc.)
-        if content_mode == ContentMode.essay:
-            try:
-                final_markdown, narrative_report = ensure_chapter_narrative_minimum(
-                    final_markdown,
-                    min_prose_paragraphs=1,
-                )
-                if narrative_report["chapters_fixed"] > 0:
-                    logger.info(
-                        f"Job {job_id}: Chapter narrative fallback - fixed "
-                        f"{narrative_report['chapters_fixed']} chapters with no prose"
-                    )
-                    for detail in narrative_report.get("fixed_details", [])[:3]:
-                        constraint_warnings.append(
-                            f"Chapter {detail['chapter']} prose collapsed, inserted fallback"
-                        )
-                    await update_job(job_id, constraint_warnings=constraint_warnings)
-            except Exception as e:
-                logger.error(f"Job {job_id}: Chapter narrative fallback failed (non-fatal): {e}", exc_info=True)
+        # Check for cancellation
+        if job.cancel_requested:
+            await update_job(job_id, status=JobStatus.cancelled)
+            logger.info(f"Job {job_id}: Cancelled during planning")
+            return
+
+        # Phase 2: Generate Evidence Map (Spec 009)
+        await update_job(job_id, status=JobStatus.evidence_map)
+        logger.info(f"Job {job_id}: Starting evidence map generation")
 
-        # Strip quote characters from prose (Ideas Edition only)
-        # Policy: quotes only allowed in Key Excerpts blockquotes and Core Claims bullets
-        # Everywhere else (narrative paragraphs), quote characters are stripped
-        # This fixes unclosed inline quotes, orphan quotes, and half-quoted claims
-        if content_mode == ContentMode.essay:
+        # Extract content mode from style config
+        style_dict = request.style_config.get("style", request.style_config) if isinstance(request.style_config, dict) else {}
+        content_mode_str = style_dict.get("content_mode")
+        book_format = style_dict.get("book_format", "guide")
+
+        # Infer content_mode from book_format if not explicitly set (defensive)
+        if content_mode_str is None:
+            # interview_qa book_format → interview mode, everything else → essay mode
+            if book_format == "interview_qa":
+                content_mode = ContentMode.interview
+                logger.info(f"Job {job_id}: content_mode inferred as 'interview' from book_format='interview_qa'")
+            else:
+                content_mode = ContentMode.essay
+                logger.info(f"Job {job_id}: content_mode inferred as 'essay' from book_format='{book_format}'")
+        else:
             try:
-                final_markdown, prose_quote_report = strip_prose_quote_chars(final_markdown)
-                if prose_quote_report.get("quotes_stripped", 0) > 0:
-                    logger.info(
-                        f"Job {job_id}: Prose quote cleanup - stripped {prose_quote_report['quotes_stripped']} quote chars"
+                content_mode = ContentMode(content_mode_str)
+            except ValueError:
+                # Invalid content_mode value - infer from book_format instead of defaulting to interview
+                content_mode = ContentMode.interview if book_format == "interview_qa" else ContentMode.essay
+                logger.warning(f"Job {job_id}: Invalid content_mode '{content_mode_str}', inferred '{content_mode.value}' from book_format")
+        strict_grounded = style_dict.get("strict_grounded", True)
+
+        # Detect content type and generate warning if mismatch
+        # (a resumed job keeps the warnings recorded before the interruption)
+        constraint_warnings: list[str] = list(job.constraint_warnings) if resume_from else []
+        detected_mode, confidence = detect_content_type(request.transcript)
+        mode_warning = generate_mode_warning(detected_mode, content_mode, confidence)
+        if mode_warning and mode_warning not in constraint_warnings:
+            constraint_warnings.append(mode_warning)
+            logger.warning(f"Job {job_id}: {mode_warning}")
+
+        # A stored Evidence Map is reused as is; pipelining only helps when
+        # evidence still has to be extracted
+        stored_evidence_map = (
+            job.evidence_map
+            if _checkpoint_reached(resume_from, GenerationCheckpoint.evidence_map)
+            else None
+        )
+        evidence_key = _evidence_map_stage_key(request, draft_plan, content_mode, strict_grounded)
+        cached_evidence_map = None
+        if not stored_evidence_map:
+            cached_evidence_map = await _get_cached_stage(
+                job_id, stage_scope, CachedStage.evidence_map, evidence_key,
+            )
+
+        # Pipelined mode streams each chapter from extraction into generation,
+        # so the Evidence Map and whitelist are only complete after Phase 3.
+        # The preflight gate needs the full map before generating, and
+        # interview drafts pick their path from the total claim count.
+        use_pipeline = (
+            DRAFT_PIPELINE_ENABLED
+            and min(CHAPTER_GENERATION_CONCURRENCY, len(draft_plan.chapters)) > 1
+            and content_mode != ContentMode.interview
+            and book_format != "interview_qa"
+            and not request.require_preflight_pass
+            and not stored_evidence_map
+            and cached_evidence_map is None
+        )
+
+        evidence_project_id = job.project_id or job_id
+        evidence_map: Optional[EvidenceMap] = None
+        whitelist: list[WhitelistQuote] = []
+        if use_pipeline:
+            logger.info(f"Job {job_id}: Evidence extraction pipelined with chapter generation")
+            await update_job(
+                job_id,
+                content_mode=content_mode,
+                constraint_warnings=constraint_warnings,
+            )
+        elif stored_evidence_map:
+            evidence_map = EvidenceMap.model_validate(stored_evidence_map)
+            logger.info(f"Job {job_id}: Evidence Map restored from checkpoint")
+        else:
+            with timed("evidence_map"):
+                if cached_evidence_map is not None:
+                    evidence_map = EvidenceMap.model_validate(cached_evidence_map)
+                    evidence_map.project_id = evidence_project_id
+                else:
+                    # Generate Evidence Map
+                    evidence_map = await generate_evidence_map(
+                        project_id=evidence_project_id,
+                        transcript=request.transcript,
+                        chapters=draft_plan.chapters,
+                        content_mode=content_mode,
+                        strict_grounded=strict_grounded,
+                        style_config=style_dict,
                     )
-            except Exception as e:
-                logger.warning(f"Job {job_id}: Prose quote cleanup failed (non-fatal): {e}")
+                    await _store_evidence_map_stage(job_id, stage_scope, evidence_key, evidence_map)
+
+            await update_job(
+                job_id,
+                evidence_map=evidence_map.model_dump(mode="json"),
+                content_mode=content_mode,
+                constraint_warnings=constraint_warnings,
+                checkpoint=GenerationCheckpoint.evidence_map,
+            )
 
-        # Second pass: Inject excerpts into sections that became empty after enforcement
-        # This catches cases where LLM-generated excerpts were dropped by validation
-        if content_mode == ContentMode.essay and evidence_map and whitelist:
-            try:
-                logger.info(
-                    f"Job {job_id}: Second pass - inject_excerpts_into_empty_sections "
-                    f"(whitelist has {len(whitelist)} quotes)"
+            logger.info(
+                f"Job {job_id}: Evidence Map complete - "
+                f"{sum(len(ch.claims) for ch in evidence_map.chapters)} claims across {len(evidence_map.chapters)} chapters"
+            )
+
+        if evidence_map is not None:
+            # Build quote whitelist for Ideas Edition
+            with timed("whitelist"):
+                whitelist, preflight_error = await _build_whitelist_and_coverage(
+                    job_id, request, evidence_map, content_mode, stage_scope,
                 )
-                final_markdown = inject_excerpts_into_empty_sections(
-                    final_markdown, whitelist, evidence_map
+            if preflight_error:
+                await update_job(
+                    job_id,
+                    status=JobStatus.failed,
+                    error_message=preflight_error,
                 )
-            except Exception as e:
-                logger.warning(f"Job {job_id}: Second excerpt injection pass failed (non-fatal): {e}")
+                return
 
-        # Final speaker normalization pass (Ideas Edition only)
-        # Re-run after all content modifications to catch any non-canonical names
-        # introduced by injection passes or other gates
-        if content_mode == ContentMode.essay and whitelist:
-            try:
-                speaker_registry = build_speaker_registry(whitelist)
-                final_markdown, final_speaker_report = normalize_speaker_names(
-                    final_markdown, speaker_registry
-                )
-                final_norm_count = final_speaker_report.get("normalized_count", 0)
-                if final_norm_count > 0:
-                    logger.info(
-                        f"Job {job_id}: Final speaker normalization - normalized {final_norm_count} attributions"
-                    )
-            except Exception as e:
-                logger.warning(f"Job {job_id}: Final speaker normalization failed (non-fatal): {e}")
+        # Check for cancellation
+        job = await get_job(job_id)
+        if job and job.cancel_requested:
+            await update_job(job_id, status=JobStatus.cancelled)
+            logger.info(f"Job {job_id}: Cancelled during evidence map generation")
+            return
 
-        # Final dangling attribution pass (Ideas Edition only)
-        # Re-run after all content modifications to catch any patterns
-        # introduced by injection passes, fallback narratives, or other gates
-        if content_mode == ContentMode.essay:
-            try:
-                final_markdown, final_dangling_report = enforce_dangling_attribution_gate(final_markdown)
-                if final_dangling_report["rewrites_applied"] > 0:
-                    logger.info(
-                        f"Job {job_id}: Final dangling attribution pass - rewrote "
-                        f"{final_dangling_report['rewrites_applied']} patterns"
-                    )
-            except Exception as e:
-                logger.warning(f"Job {job_id}: Final dangling attribution pass failed (non-fatal): {e}")
+        # Phase 3: Generate content
+        await update_job(job_id, status=JobStatus.generating)
+        chapters_timing = start_timing("chapters")
 
-        # Final speaker-framing sanitizer pass (Ideas Edition only)
-        # Re-run after all modifications to catch any patterns introduced by injection/fallback
-        if content_mode == ContentMode.essay:
-            try:
-                final_markdown, final_sanitizer_report = sanitize_speaker_framing(final_markdown)
-                if final_sanitizer_report["rewrites_applied"] > 0:
-                    logger.info(
-                        f"Job {job_id}: Final speaker-framing sanitizer - rewrote "
-                        f"{final_sanitizer_report['rewrites_applied']} patterns"
-                    )
-            except Exception as e:
-                logger.warning(f"Job {job_id}: Final speaker-framing sanitizer failed (non-fatal): {e}")
+        # Compute words per chapter based on style config and chapter count
+        style_dict = request.style_config.get("style", request.style_config) if isinstance(request.style_config, dict) else {}
+        total_length_preset_str = style_dict.get("total_length_preset", "standard")
+        try:
+            total_length_preset = TotalLengthPreset(total_length_preset_str)
+        except ValueError:
+            total_length_preset = TotalLengthPreset.standard
+        # Get custom word count if preset is 'custom'
+        custom_total_words = style_dict.get("total_target_words")
+        words_per_chapter = compute_words_per_chapter(
+            total_length_preset,
+            len(draft_plan.chapters),
+            custom_total_words,
+        )
+        detail_level_str = style_dict.get("detail_level", "balanced")
+        book_format = style_dict.get("book_format", "guide")
 
-        # Final no-names-in-prose invariant pass (Ideas Edition only)
-        # Re-run to enforce hard invariant after all modifications
-        if content_mode == ContentMode.essay:
-            try:
-                # Rebuild blacklist/allowlist if flag enabled (same as earlier pass)
-                final_person_blacklist = None
-                final_entity_allowlist = None
-
-                if DYNAMIC_NAME_POLICY_ENABLED:
-                    if whitelist:
-                        final_person_blacklist = build_person_blacklist_from_whitelist(whitelist)
-                    if hasattr(request, 'transcript') and request.transcript:
-                        final_entity_allowlist = build_entity_allowlist(
-                            request.transcript,
-                            final_person_blacklist or PersonBlacklist(),
-                        )
+        # P0: Use single-pass generation for interview mode with evidence
+        # Triggers when: content_mode=interview OR book_format=interview_qa
+        # Both should produce Key Ideas + Conversation structure
+        use_interview_single_pass = (
+            (content_mode == ContentMode.interview or book_format == "interview_qa")
+            and evidence_map
+            and sum(len(ch.claims) for ch in evidence_map.chapters) > 0
+        )
+        chapters_restored = _checkpoint_reached(resume_from, GenerationCheckpoint.chapters)
+
+        if use_interview_single_pass and chapters_restored:
+            # Generated and checked before the interruption
+            logger.info(f"Job {job_id}: Interview draft restored from checkpoint")
+            final_markdown = job.chapters_completed[0]
+            chapters_completed = [final_markdown]
+
+        elif use_interview_single_pass:
+            # Single-pass interview generation (P0: Key Ideas + Conversation)
+            logger.info(f"Job {job_id}: Using single-pass interview generation")
+            await update_job(job_id, current_chapter=1, total_chapters=1)
 
-                final_markdown, final_invariant_report = enforce_no_names_in_prose(
-                    final_markdown,
-                    person_blacklist=final_person_blacklist,
-                    entity_allowlist=final_entity_allowlist,
+            # Title guardrail: prevent generic titles like "Interview"
+            interview_book_title = sanitize_interview_title(
+                draft_plan.book_title,
+                fallback=request.project_name if hasattr(request, "project_name") else None,
+                transcript=request.transcript,
+            )
+
+            # Extract definitional candidates BEFORE generation for coverage check
+            definitional_candidates = extract_definitional_candidates(request.transcript)
+            if definitional_candidates:
+                logger.info(f"Job {job_id}: Found {len(definitional_candidates)} definitional candidates")
+
+            # Determine forced candidates based on coverage requirements
+            forced_candidates_for_generation = None
+
+            # Best-of-N candidate selection
+            # Use request param, capped by server-side max
+            candidate_count = min(request.candidate_count, INTERVIEW_CANDIDATE_COUNT_MAX)
+            runner_up_data = None  # Store runner-up for debugging
+
+            if candidate_count > 1:
+                logger.info(f"Job {job_id}: Generating {candidate_count} candidates for best-of-N selection")
+
+                # Candidates run concurrently and come back sorted (highest score first)
+                candidates = await _generate_candidates_concurrently(
+                    transcript=request.transcript,
+                    book_title=interview_book_title,
+                    evidence_map=evidence_map,
+                    candidate_count=candidate_count,
+                    forced_candidates=forced_candidates_for_generation,
+                    score_threshold=request.candidate_score_threshold,
                 )
-                if final_invariant_report["sentences_dropped"] > 0:
-                    logger.info(
-                        f"Job {job_id}: Final no-names-in-prose - dropped "
-                        f"{final_invariant_report['sentences_dropped']} sentences"
-                    )
-            except Exception as e:
-                logger.warning(f"Job {job_id}: Final no-names-in-prose invariant failed (non-fatal): {e}")
 
-        # Final dangling connective cleanup (Ideas Edition only)
-        # Re-run after all modifications to catch any orphaned articles/connectives
-        if content_mode == ContentMode.essay:
-            try:
-                final_markdown, final_connective_report = cleanup_dangling_connectives(final_markdown)
-                if final_connective_report["cleanups_applied"] > 0:
+                # Pick the best
+                final_markdown, best_score = candidates[0]
+                logger.info(
+                    f"Job {job_id}: Selected best candidate with score {best_score['total']:.0f}"
+                )
+
+                # Store runner-up for debugging (if we have more than one)
+                if len(candidates) > 1:
+                    runner_up_markdown, runner_up_score = candidates[1]
+                    runner_up_data = {
+                        "score": runner_up_score,
+                        "markdown_preview": runner_up_markdown[:500] + "..." if len(runner_up_markdown) > 500 else runner_up_markdown,
+                    }
                     logger.info(
-                        f"Job {job_id}: Final dangling connective pass - fixed "
-                        f"{final_connective_report['cleanups_applied']} orphaned connectives"
+                        f"Job {job_id}: Runner-up score: {runner_up_score['total']:.0f} "
+                        f"(diff: {best_score['total'] - runner_up_score['total']:.0f})"
                     )
-            except Exception as e:
-                logger.warning(f"Job {job_id}: Final dangling connective pass failed (non-fatal): {e}")
 
-        # Core Claims structure validation (Ideas Edition safety net)
-        # Catches malformed claims that slipped through enforcement (e.g., due to exceptions)
-        # Drops claims with missing closing quotes or known garbage suffixes
-        if content_mode == ContentMode.essay:
-            try:
-                final_markdown, structure_report = validate_core_claims_structure(final_markdown)
-                if structure_report["dropped_count"] > 0:
-                    logger.warning(
-                        f"Job {job_id}: Core Claims structure validation - dropped "
-                        f"{structure_report['dropped_count']} malformed claims"
-                    )
-                    for detail in structure_report.get("dropped", [])[:3]:
-                        constraint_warnings.append(
-                            f"Malformed Core Claim dropped ({detail['reason']})"
-                        )
-                    await update_job(job_id, constraint_warnings=constraint_warnings)
-            except Exception as e:
-                logger.warning(f"Job {job_id}: Core Claims structure validation failed (non-fatal): {e}")
+            else:
+                # Single candidate (default behavior)
+                final_markdown = await generate_interview_single_pass(
+                    transcript=request.transcript,
+                    book_title=interview_book_title,
+                    evidence_map=evidence_map,
+                    job_id=job_id,
+                )
+                # Clean up any trailing punctuation in H1 title
+                final_markdown = _clean_markdown_title(final_markdown)
 
-        # Strip empty section headers (Ideas Edition render guard)
-        # This is the render guard - empty Key Excerpts/Core Claims sections are removed
-        if content_mode == ContentMode.essay:
-            try:
-                final_markdown, stripped_report = strip_empty_section_headers(final_markdown)
-                if stripped_report:
+            # Key Ideas Coverage Guard: Check if core framework is surfaced
+            if definitional_candidates:
+                key_ideas_text = _extract_key_ideas_section(final_markdown)
+                coverage = check_key_ideas_coverage(key_ideas_text, definitional_candidates)
+
+                if not coverage["covered"]:
                     logger.warning(
-                        f"Job {job_id}: Render guard stripped {len(stripped_report)} empty section(s)"
+                        f"Job {job_id}: Key Ideas missing definitional coverage, re-running with forced candidates"
+                    )
+                    # Re-run with forced candidates (single pass, not best-of-N)
+                    final_markdown = await generate_interview_single_pass(
+                        transcript=request.transcript,
+                        book_title=interview_book_title,
+                        evidence_map=evidence_map,
+                        forced_candidates=coverage["missing_candidates"],
+                    )
+                    # Clean up any trailing punctuation in H1 title
+                    final_markdown = _clean_markdown_title(final_markdown)
+                    constraint_warnings.append(
+                        "Key Ideas re-generated to include core framework definitions"
                     )
                 else:
-                    logger.debug(f"Job {job_id}: Applied render guard - no empty sections found")
-            except Exception as e:
-                logger.warning(f"Job {job_id}: Render guard failed (non-fatal): {e}")
-
-        # Clean up orphan fragments between sections (Ideas Edition structural cleanup)
-        # Removes debris like "ethos of inquiry." that can appear after Core Claims
-        # when a transform drops part of a sentence, leaving a tail
-        if content_mode == ContentMode.essay:
-            try:
-                final_markdown, orphan_report = cleanup_orphan_fragments_between_sections(final_markdown)
-                if orphan_report["fragments_removed"] > 0:
-                    logger.warning(
-                        f"Job {job_id}: Removed {orphan_report['fragments_removed']} orphan fragment(s): "
-                        f"{orphan_report['removed_fragments'][:3]}"
+                    logger.info(
+                        f"Job {job_id}: Key Ideas coverage check passed "
+                        f"(matched: {coverage['matched_candidate']['keyword'] if coverage['matched_candidate'] else 'N/A'})"
                     )
-            except Exception as e:
-                logger.warning(f"Job {job_id}: Orphan fragment cleanup failed (non-fatal): {e}")
 
-        # Quote artifact cleanup (final pass) - must run LAST after all other processing
-        # Cleans up orphan quotes, stray punctuation, and mangled attributions
-        # that may have been introduced by upstream enforcement steps
-        try:
-            final_markdown, artifact_report = fix_quote_artifacts(final_markdown)
-            if artifact_report.get("fixes_applied", 0) > 0:
-                logger.info(
-                    f"Job {job_id}: Quote artifact cleanup - applied {artifact_report['fixes_applied']} fixes"
-                )
-        except Exception as e:
-            logger.warning(f"Job {job_id}: Quote artifact cleanup failed (non-fatal): {e}")
+            # Fix title format: "# The Enlightenment" -> "# David Deutsch on *The Beginning of Infinity*"
+            final_markdown = _fix_interview_title(final_markdown, request.transcript)
 
-        # Final whitespace repair pass - fix formatting issues from deletions
-        try:
-            final_markdown = repair_whitespace(final_markdown)
-        except Exception as e:
-            logger.error(f"Job {job_id}: Whitespace repair failed (non-fatal): {e}", exc_info=True)
+            # Post-process for structure polish (heading hierarchy, metadata, Thank you)
+            # Note: source_url could come from project metadata in future
+            final_markdown = postprocess_interview_markdown(final_markdown, source_url=None)
 
-        # Markdown header normalization (Ideas Edition) - ensure blank lines before headers
-        # This is a pure formatting pass that fixes cosmetic issues
-        if content_mode == ContentMode.essay:
-            try:
-                final_markdown, header_report = normalize_markdown_headers(final_markdown)
-                if header_report.get("blank_lines_inserted", 0) > 0:
-                    logger.debug(
-                        f"Job {job_id}: Header normalizer inserted {header_report['blank_lines_inserted']} blank lines"
+            # Quote validation checks
+            key_ideas_text = _extract_key_ideas_section(final_markdown)
+
+            # Check for fabricated quotes (not in transcript)
+            quote_validation = verify_key_ideas_quotes(key_ideas_text, request.transcript)
+            if not quote_validation["valid"]:
+                logger.warning(
+                    f"Job {job_id}: {len(quote_validation['invalid_quotes'])} potentially invalid quotes in Key Ideas"
+                )
+                for invalid in quote_validation["invalid_quotes"][:3]:
+                    constraint_warnings.append(
+                        f"Quote issue: {invalid['reason'][:50]}"
                     )
-            except Exception as e:
-                logger.warning(f"Job {job_id}: Header normalization failed (non-fatal): {e}")
 
-        # Placeholder glue cleanup (Ideas Edition) - remove any leftover artifact strings
-        # This catches "[as discussed in the excerpts above]" and similar markers
-        if content_mode == ContentMode.essay:
-            try:
-                final_markdown, glue_report = clean_placeholder_glue(final_markdown)
-                if glue_report.get("glue_removed", 0) > 0:
-                    logger.info(
-                        f"Job {job_id}: Cleaned {glue_report['glue_removed']} placeholder glue strings"
+            # Check for truncated quotes
+            truncated = check_truncated_quotes(key_ideas_text)
+            if truncated:
+                logger.warning(f"Job {job_id}: {len(truncated)} truncated quotes in Key Ideas")
+                for issue in truncated[:2]:
+                    constraint_warnings.append(
+                        f"Truncated quote: ...{issue['quote'][-30:]}"
                     )
-            except Exception as e:
-                logger.warning(f"Job {job_id}: Placeholder glue cleanup failed (non-fatal): {e}")
 
-        # Prose punctuation normalizer (Ideas Edition) - final formatting pass
-        # Ensures narrative prose paragraphs end with proper terminal punctuation
-        # Must run after all content-modifying passes, before validation
-        if content_mode == ContentMode.essay:
-            try:
-                final_markdown, punct_report = normalize_prose_punctuation(final_markdown)
-                if punct_report.get("fixes_applied", 0) > 0:
+            # Check for interview mode violations (pass transcript to avoid false positives)
+            violations = check_interview_constraints(final_markdown, transcript=request.transcript)
+            if violations:
+                logger.warning(f"Job {job_id}: {len(violations)} interview mode violations in output")
+                constraint_warnings.extend([
+                    f"{v['matched_text'][:50]}..." for v in violations[:5]
+                ])
+
+            # Update job with any constraint warnings
+            if constraint_warnings:
+                await update_job(job_id, constraint_warnings=constraint_warnings)
+
+            chapters_completed = [final_markdown]
+            await update_job(
+                job_id,
+                chapters_completed=chapters_completed,
+                checkpoint=GenerationCheckpoint.chapters,
+            )
+
+        else:
+            # Standard chapter-by-chapter generation
+            logger.info(f"Job {job_id}: Starting chapter generation ({len(draft_plan.chapters)} chapters)")
+            logger.info(f"Job {job_id}: Target ~{words_per_chapter} words/chapter, detail_level={detail_level_str}")
+
+            chapters_completed: list[str] = []
+            chapter_concurrency = min(CHAPTER_GENERATION_CONCURRENCY, len(draft_plan.chapters))
+            # Chapters finished before an interruption, by chapter number
+            resumed_chapters = (
+                dict(zip(job.completed_chapter_numbers, job.chapters_completed, strict=True))
+                if resume_from and len(job.completed_chapter_numbers) == len(job.chapters_completed)
+                else {}
+            )
+            if resumed_chapters:
+                logger.info(f"Job {job_id}: {len(resumed_chapters)} chapter(s) restored from checkpoint")
+
+            if chapters_restored:
+                chapters_completed = list(job.chapters_completed)
+            elif use_pipeline:
+                logger.info(f"Job {job_id}: Pipelined chapter generation (concurrency={chapter_concurrency})")
+                chapters_completed, evidence_map, was_cancelled = await _generate_chapters_pipelined(
+                    job_id=job_id,
+                    request=request,
+                    draft_plan=draft_plan,
+                    project_id=evidence_project_id,
+                    words_per_chapter=words_per_chapter,
+                    detail_level=detail_level_str,
+                    content_mode=content_mode,
+                    strict_grounded=strict_grounded,
+                    style_config=style_dict,
+                    constraint_warnings=constraint_warnings,
+                    concurrency=chapter_concurrency,
+                    completed=resumed_chapters,
+                )
+                await update_job(job_id, evidence_map=evidence_map.model_dump(mode="json"))
+                if was_cancelled:
+                    await update_job(
+                        job_id,
+                        status=JobStatus.cancelled,
+                        chapters_completed=chapters_completed,
+                    )
                     logger.info(
-                        f"Job {job_id}: Prose punctuation normalizer - fixed {punct_report['fixes_applied']} paragraphs"
+                        f"Job {job_id}: Cancelled with {len(chapters_completed)} chapter(s) completed"
                     )
-            except Exception as e:
-                logger.warning(f"Job {job_id}: Prose punctuation normalizer failed (non-fatal): {e}")
+                    return
 
-        # TOKEN INTEGRITY HARD GATE (Ideas Edition)
-        # This is the final structural invariant check - if violations are found,
-        # the draft pipeline has a bug that corrupted text mid-word.
-        # Currently logs warnings; will be elevated to hard-fail once source is identified.
-        if content_mode == ContentMode.essay:
-            try:
-                is_valid, integrity_report = validate_token_integrity(final_markdown)
-                if not is_valid:
-                    logger.error(
-                        f"Job {job_id}: TOKEN INTEGRITY VIOLATION - "
-                        f"{integrity_report['violation_count']} token truncation artifacts detected"
-                    )
-                    for v in integrity_report.get("violations", [])[:5]:
-                        logger.error(
-                            f"  - {v['type']} at line {v['line_num']}: '{v['matched']}' "
-                            f"in context: '{v['context'][:60]}...'"
-                        )
-                        constraint_warnings.append(
-                            f"TOKEN CORRUPTION: {v['type']} - '{v['matched']}'"
-                        )
-                    await update_job(job_id, constraint_warnings=constraint_warnings)
-                    # TODO: Once root cause is identified and fixed, elevate to hard-fail:
-                    # raise ValueError(f"Token integrity check failed: {integrity_report['violation_count']} violations")
-            except Exception as e:
-                logger.error(f"Job {job_id}: Token integrity check failed: {e}", exc_info=True)
+                await _store_evidence_map_stage(job_id, stage_scope, evidence_key, evidence_map)
 
-        # Per-chapter prose metrics (Ideas Edition quality tracking)
-        if content_mode == ContentMode.essay:
-            try:
-                prose_metrics = compute_chapter_prose_metrics(final_markdown)
-                logger.info(
-                    f"Job {job_id}: Prose metrics - "
-                    f"{prose_metrics['total_sentences_kept']} sentences kept across "
-                    f"{prose_metrics['total_chapters']} chapters, "
-                    f"{prose_metrics['fallback_chapters']} used fallback"
+                # Whole-document evidence work runs once every chapter has landed
+                with timed("whitelist"):
+                    whitelist, _ = await _build_whitelist_and_coverage(
+                        job_id, request, evidence_map, content_mode, stage_scope,
+                    )
+            elif chapter_concurrency > 1:
+                logger.info(f"Job {job_id}: Parallel chapter generation (concurrency={chapter_concurrency})")
+                chapters_completed, was_cancelled = await _generate_chapters_parallel(
+                    job_id=job_id,
+                    request=request,
+                    draft_plan=draft_plan,
+                    evidence_map=evidence_map,
+                    words_per_chapter=words_per_chapter,
+                    detail_level=detail_level_str,
+                    content_mode=content_mode,
+                    strict_grounded=strict_grounded,
+                    constraint_warnings=constraint_warnings,
+                    concurrency=chapter_concurrency,
+                    completed=resumed_chapters,
                 )
-                for ch_metrics in prose_metrics.get("chapters", []):
-                    if ch_metrics.get("fallback_used"):
-                        logger.info(
-                            f"  - Chapter {ch_metrics['chapter']}: "
-                            f"{ch_metrics['sentences_kept']} sentences (FALLBACK)"
-                        )
-                    elif ch_metrics["sentences_kept"] < 3:
-                        logger.warning(
-                            f"  - Chapter {ch_metrics['chapter']}: "
-                            f"{ch_metrics['sentences_kept']} sentences (LOW)"
-                        )
-            except Exception as e:
-                logger.warning(f"Job {job_id}: Prose metrics computation failed (non-fatal): {e}")
-
-        # FINAL SECTION REPAIR (Ideas Edition) - runs AFTER all transforms/render guards
-        # This ensures sections can never disappear. Must run AFTER strip_empty_section_headers
-        # so any sections removed by render guards are re-inserted with placeholders.
-        if content_mode == ContentMode.essay:
-            try:
-                final_markdown, sections_report = ensure_required_sections_exist(final_markdown)
-                if sections_report["sections_inserted"] > 0:
-                    logger.warning(
-                        f"Job {job_id}: FINAL SECTION REPAIR - Inserted {sections_report['sections_inserted']} "
-                        f"missing section(s): {sections_report['inserted']}"
+                if was_cancelled:
+                    await update_job(
+                        job_id,
+                        status=JobStatus.cancelled,
+                        chapters_completed=chapters_completed,
                     )
-            except Exception as e:
-                logger.warning(f"Job {job_id}: Final section repair failed (non-fatal): {e}")
-
-        # STRUCTURAL INTEGRITY HARD GATE (Ideas Edition)
-        # P0 invariant: unclosed quotes, headings inside quotes, quote absorption
-        # These indicate fundamental corruption that cannot be safely patched.
-        # Runs immediately after section repair to validate the final structure.
-        if content_mode == ContentMode.essay:
-            try:
-                is_valid, struct_report = validate_structural_integrity(final_markdown)
-                if not is_valid:
-                    logger.error(
-                        f"Job {job_id}: STRUCTURAL INTEGRITY VIOLATION - "
-                        f"{struct_report['violation_count']} structural corruption detected"
+                    logger.info(
+                        f"Job {job_id}: Cancelled with {len(chapters_completed)} chapter(s) completed"
                     )
-                    for v in struct_report.get("violations", [])[:5]:
-                        logger.error(
-                            f"  - {v['type']}: {v.get('context', '')[:60]}..."
+                    return
+            else:
+                completed_numbers: list[int] = []
+                for i, chapter_plan in enumerate(draft_plan.chapters):
+                    if chapter_plan.chapter_number in resumed_chapters:
+                        chapters_completed.append(resumed_chapters[chapter_plan.chapter_number])
+                        completed_numbers.append(chapter_plan.chapter_number)
+                        continue
+
+                    # Check for cancellation between chapters
+                    job = await get_job(job_id)
+                    if job and job.cancel_requested:
+                        await update_job(
+                            job_id,
+                            status=JobStatus.cancelled,
+                            chapters_completed=chapters_completed,
                         )
-                        constraint_warnings.append(
-                            f"STRUCTURAL CORRUPTION: {v['type']}"
+                        logger.info(f"Job {job_id}: Cancelled after chapter {i}")
+                        return
+
+                    await update_job(job_id, current_chapter=i + 1)
+                    logger.debug(f"Job {job_id}: Generating chapter {i + 1}/{len(draft_plan.chapters)}")
+
+                    # Get chapter evidence from Evidence Map
+                    chapter_evidence = get_evidence_for_chapter(evidence_map, chapter_plan.chapter_number)
+
+                    with timed("chapter", kind=TimingKind.chapter, chapter=chapter_plan.chapter_number):
+                        chapter_md = await generate_chapter(
+                            chapter_plan=chapter_plan,
+                            transcript=request.transcript,
+                            book_title=draft_plan.book_title,
+                            style_config=request.style_config,
+                            chapters_completed=chapters_completed,
+                            all_chapters=draft_plan.chapters,
+                            words_per_chapter_target=words_per_chapter,
+                            detail_level=detail_level_str,
+                            # Spec 009: Evidence-grounded generation
+                            chapter_evidence=chapter_evidence,
+                            content_mode=content_mode,
+                            strict_grounded=strict_grounded,
+                            job_id=job_id,
                         )
-                    await update_job(job_id, constraint_warnings=constraint_warnings)
-                    # TODO: Elevate to hard-fail once we're confident in the detection:
-                    # raise ValueError(f"Structural integrity check failed: {struct_report['violation_count']} violations")
-            except Exception as e:
-                logger.error(f"Job {job_id}: Structural integrity check failed: {e}", exc_info=True)
 
-            # IDEAS EDITION OUTPUT CONTRACT VALIDATION
-            # Ensures Ideas Edition output has proper structure and no interview template leakage
-            try:
-                import re
-                has_chapters = bool(re.search(r'(?m)^## Chapter \d+:', final_markdown))
-                has_excerpts = '### Key Excerpts' in final_markdown
-                has_claims = '### Core Claims' in final_markdown
-                has_interview_leak = bool(re.search(r'(?m)^\*Interviewer:\*', final_markdown))
-                has_format_interview = '*Format:* Interview' in final_markdown
-                has_conversation_header = '### The Conversation' in final_markdown
-
-                contract_violations = []
-                if not has_chapters:
-                    contract_violations.append("Missing chapter structure (## Chapter N:)")
-                if not has_excerpts:
-                    contract_violations.append("Missing Key Excerpts sections")
-                if not has_claims:
-                    contract_violations.append("Missing Core Claims sections")
-                if has_interview_leak:
-                    contract_violations.append("Interview template leakage (*Interviewer:*)")
-                if has_format_interview:
-                    contract_violations.append("Interview format marker (*Format:* Interview)")
-                if has_conversation_header:
-                    contract_violations.append("Interview conversation header (### The Conversation)")
-
-                if contract_violations:
-                    logger.error(
-                        f"Job {job_id}: IDEAS EDITION OUTPUT CONTRACT VIOLATION - "
-                        f"{len(contract_violations)} issue(s) detected"
+                        # Check for interview mode violations (Spec 009 US2)
+                        if content_mode == ContentMode.interview:
+                            violations = check_interview_constraints(chapter_md, transcript=request.transcript)
+                            if violations:
+                                logger.warning(
+                                    f"Job {job_id}: Chapter {chapter_plan.chapter_number} has "
+                                    f"{len(violations)} interview mode violations"
+                                )
+                                # Add to warnings but don't fail
+                                constraint_warnings.extend([
+                                    f"Ch{chapter_plan.chapter_number}: {v['matched_text'][:50]}..."
+                                    for v in violations[:3]
+                                ])
+                                await update_job(job_id, constraint_warnings=constraint_warnings)
+
+                    chapters_completed.append(chapter_md)
+                    completed_numbers.append(chapter_plan.chapter_number)
+                    await update_job(
+                        job_id,
+                        chapters_completed=chapters_completed,
+                        completed_chapter_numbers=completed_numbers,
                     )
-                    for violation in contract_violations:
-                        logger.error(f"  - {violation}")
-                        constraint_warnings.append(f"OUTPUT CONTRACT: {violation}")
-                    await update_job(job_id, constraint_warnings=constraint_warnings)
-                    # HARD FAIL: Ideas Edition output contract is a P0 invariant.
-                    # Shipping malformed output wastes user trust and review cycles.
-                    raise ValueError(
-                        f"Ideas Edition output contract violated: {'; '.join(contract_violations)}"
+                    get_draft_stream_hub().publish(
+                        job_id, "chapter_complete",
+                        {"chapter": chapter_plan.chapter_number, "markdown": chapter_md},
                     )
-                else:
-                    logger.info(f"Job {job_id}: Ideas Edition output contract validated successfully")
-            except Exception as e:
-                logger.error(f"Job {job_id}: Output contract validation failed: {e}", exc_info=True)
 
+            if not chapters_restored:
+                await update_job(
+                    job_id,
+                    chapters_completed=chapters_completed,
+                    checkpoint=GenerationCheckpoint.chapters,
+                )
+
+            # Assemble final draft for chapter-by-chapter mode
+            final_markdown = assemble_chapters(
+                book_title=draft_plan.book_title,
+                chapters=chapters_completed,
+            )
+
+            # Apply enforcement for essay format on final assembled draft
+            if book_format == "essay":
+                final_markdown, enforcement_report = enforce_prose_quality(final_markdown, book_format)
+                if enforcement_report["sections_removed"]:
+                    logger.info(
+                        f"Job {job_id}: Final draft enforcement removed sections: "
+                        f"{enforcement_report['sections_removed']}"
+                    )
+                if enforcement_report["banned_phrase_counts"]:
+                    logger.info(
+                        f"Job {job_id}: Final draft has {sum(enforcement_report['banned_phrase_counts'].values())} "
+                        f"banned phrase instances"
+                    )
+
+        chapters_timing.stop()
+        post_process_timing = start_timing("post_process")
+
+        # Registered post-processing passes (see build_post_processing_passes)
+        sink = PassReportSink(job_id, constraint_warnings)
+        engine = PassEngine(
+            build_post_processing_passes(job_id, request, content_mode, whitelist, evidence_map),
+            sink,
+            on_warnings=lambda warnings: update_job(job_id, constraint_warnings=warnings),
+            check=(
+                (lambda text, step: _check_for_corruption(text, step, job_id))
+                if DRAFT_PASS_CORRUPTION_CHECK else None
+            ),
+            executor=get_pass_executor(),
+        )
+        final_markdown = await engine.run(final_markdown)
+        summary = sink.summary()
+        logger.info(
+            f"Job {job_id}: Post-processing ran {summary['passes']} passes "
+            f"({summary['changed']} changed, {summary['skipped']} skipped, {summary['failed']} failed) "
+            f"in {summary['wall_ms']:.0f}ms"
+        )
+
+        post_process_timing.stop()
         await update_job(
             job_id,
             status=JobStatus.completed,
@@ -8016,6 +8093,15 @@ async def _generate_draft_task(
         if job and job.project_id:
             await _trigger_qa_analysis(job.project_id, final_markdown, request.transcript)
 
+    except asyncio.CancelledError:
+        # Cancelled by cancel_job(), or stopped by a shutdown (left resumable)
+        job = await get_job(job_id)
+        if job and job.cancel_requested and not job.is_terminal():
+            await update_job(job_id, status=JobStatus.cancelled)
+            logger.info(
+                f"Job {job_id}: Cancelled with {len(job.chapters_completed)} chapter(s) completed"
+            )
+        raise
     except Exception as e:
         logger.error(f"Job {job_id}: Generation failed: {e}", exc_info=True)
         await update_job(
@@ -8024,6 +8110,16 @@ async def _generate_draft_task(
             error=str(e),
             error_code="GENERATION_ERROR",
         )
+    finally:
+        unbind_llm_usage(llm_usage_token)
+        unbind_timing_trace(timings_token)
+        await update_job(
+            job_id,
+            total_prompt_tokens=llm_usage.prompt_tokens,
+            total_completion_tokens=llm_usage.completion_tokens,
+            llm_usage=llm_usage.to_list(),
+            timings=timings.to_list(),
+        )
 
 
 # ==============================================================================
@@ -8183,7 +8279,7 @@ async def _generate_visual_plan(
         return VisualPlan(opportunities=[], assets=[])
 
     try:
-        client = LLMClient()
+        client = get_llm_client()
 
         # Build prompts
         user_prompt = build_visual_opportunity_user_prompt(chapters, visual_density)
@@ -8209,7 +8305,8 @@ async def _generate_visual_plan(
             ),
         )
 
-        response = await client.generate(request)
+        with llm_stage("planning"):
+            response = await client.generate(request)
 
         # Parse response
         import json
@@ -8256,7 +8353,40 @@ async def _generate_visual_plan(
     except Exception as e:
         # On LLM failure, log and return empty opportunities (draft still succeeds)
         logger.error(f"Failed to generate visual opportunities: {e}")
-        return VisualPlan(opportunities=[], assets=[])
+        return VisualPlan.fallback()
+
+
+async def _complete_with_live_stream(
+    client: LLMClient,
+    request: LLMRequest,
+    job_id: Optional[str],
+    chapter_number: int,
+) -> str:
+    """Run an LLM request, streaming tokens when someone is watching the job.
+
+    Without SSE subscribers this is a plain generate() call; with them the
+    request is streamed and each delta is published to the draft stream hub.
+
+    Args:
+        client: LLM client to use.
+        request: LLM request to send.
+        job_id: Owning job (None disables streaming).
+        chapter_number: Chapter the tokens belong to.
+
+    Returns:
+        Full response text.
+    """
+    hub = get_draft_stream_hub()
+    if not job_id or not hub.has_subscribers(job_id):
+        response = await client.generate(request)
+        return response.text
+
+    parts: list[str] = []
+    async for chunk in client.stream(request):
+        if chunk.delta:
+            parts.append(chunk.delta)
+            hub.publish(job_id, "token", {"chapter": chapter_number, "delta": chunk.delta})
+    return "".join(parts)
 
 
 async def generate_chapter(
@@ -8272,6 +8402,8 @@ async def generate_chapter(
     chapter_evidence: Optional[ChapterEvidence] = None,
     content_mode: ContentMode = ContentMode.interview,
     strict_grounded: bool = True,
+    previous_chapter_ending: Optional[str] = None,
+    job_id: Optional[str] = None,
 ) -> str:
     """Generate a single chapter using LLM.
 
@@ -8287,11 +8419,14 @@ async def generate_chapter(
         chapter_evidence: Evidence Map data for this chapter (Spec 009).
         content_mode: Content mode (interview/essay/tutorial) (Spec 009).
         strict_grounded: Whether to enforce strict grounding (Spec 009).
+        previous_chapter_ending: Explicit continuity context. Overrides the
+            ending derived from chapters_completed (used by parallel generation).
+        job_id: Owning job, used to stream tokens to live subscribers.
 
     Returns:
         Generated chapter markdown.
     """
-    client = LLMClient()
+    client = get_llm_client()
 
     # Extract style config if wrapped
     if "style" in style_config:
@@ -8299,17 +8434,38 @@ async def generate_chapter(
     else:
         style_dict = style_config
 
-    # Get transcript segment for this chapter
-    transcript_segment = extract_transcript_segment(transcript, chapter_plan)
-
     # Check if using Interview Q&A format
     book_format = style_dict.get("book_format", "guide")
+    grounded = book_format != "interview_qa" and bool(chapter_evidence and chapter_evidence.claims)
 
     # Get context from previous/next chapters
-    previous_ending = get_previous_chapter_ending(chapters_completed)
+    if previous_chapter_ending is not None:
+        previous_ending = previous_chapter_ending
+    else:
+        previous_ending = get_previous_chapter_ending(chapters_completed)
     chapter_index = chapter_plan.chapter_number - 1
     next_preview = get_next_chapter_preview(all_chapters, chapter_index)
 
+    # Get transcript segment for this chapter and fit inputs to the model budget
+    transcript_segment, evidence_claims, previous_ending = _fit_chapter_inputs(
+        chapter_plan=chapter_plan,
+        transcript_segment=extract_transcript_segment(
+            transcript,
+            chapter_plan,
+            # Unmapped chapters retrieve spans; claims sharpen the query
+            extra_query=[claim.claim for claim in chapter_evidence.claims] if chapter_evidence else (),
+        ),
+        evidence_claims=(
+            [claim.model_dump() for claim in chapter_evidence.claims] if grounded else []
+        ),
+        previous_ending=previous_ending,
+        grounded=grounded,
+    )
+    # Chapters without mapped segments all see the full transcript; send it as
+    # a shared prefix so providers can cache it across the job's chapter calls
+    source_shared = transcript_segment == transcript
+    shared_source: Optional[str] = None
+
     if book_format == "interview_qa":
         # Use Q&A-specific prompts (Interview Q&A format from main)
         speaker_name = _extract_speaker_name(transcript)
@@ -8322,11 +8478,14 @@ async def generate_chapter(
             transcript_segment=transcript_segment,
             speaker_name=speaker_name,
         )
-    elif chapter_evidence and chapter_evidence.claims:
+    elif grounded:
         # Use grounded chapter generation prompts (Spec 009)
+        if source_shared:
+            shared_source = transcript_segment[:GROUNDED_TRANSCRIPT_REFERENCE_CHARS]
+        # Chapter number lives in the user prompt so the system prompt is cacheable
         system_prompt = build_grounded_chapter_system_prompt(
             book_title=book_title,
-            chapter_number=chapter_plan.chapter_number,
+            chapter_number=None,
             style_config=style_dict,
             words_per_chapter_target=words_per_chapter_target,
             detail_level=detail_level,
@@ -8335,21 +8494,24 @@ async def generate_chapter(
         )
         user_prompt = build_grounded_chapter_user_prompt(
             chapter_plan=chapter_plan,
-            evidence_claims=[claim.model_dump() for claim in chapter_evidence.claims],
+            evidence_claims=evidence_claims,
             must_include=[item.model_dump() for item in chapter_evidence.must_include],
             transcript_segment=transcript_segment,
             previous_chapter_ending=previous_ending,
             next_chapter_preview=next_preview,
+            source_in_context=source_shared,
         )
         logger.debug(
             f"Using grounded prompts for chapter {chapter_plan.chapter_number} "
-            f"({len(chapter_evidence.claims)} claims)"
+            f"({len(evidence_claims)}/{len(chapter_evidence.claims)} claims)"
         )
     else:
         # Fall back to standard prompts (no evidence available)
+        if source_shared:
+            shared_source = transcript_segment
         system_prompt = build_chapter_system_prompt(
             book_title=book_title,
-            chapter_number=chapter_plan.chapter_number,
+            chapter_number=None,
             style_config=style_dict,
             words_per_chapter_target=words_per_chapter_target,
             detail_level=detail_level,
@@ -8359,6 +8521,7 @@ async def generate_chapter(
             transcript_segment=transcript_segment,
             previous_chapter_ending=previous_ending,
             next_chapter_preview=next_preview,
+            source_in_context=source_shared,
         )
         logger.debug(
             f"Using standard prompts for chapter {chapter_plan.chapter_number} "
@@ -8367,20 +8530,19 @@ async def generate_chapter(
 
     request = LLMRequest(
         model=CHAPTER_MODEL,
-        messages=[
-            ChatMessage(role="system", content=system_prompt),
-            ChatMessage(role="user", content=user_prompt),
-        ],
+        messages=build_prefix_cached_messages(system_prompt, user_prompt, shared_source),
         temperature=0.7,
         max_tokens=4000,
     )
 
-    response = await client.generate(request)
+    with llm_stage("chapter"):
+        chapter_text = await _complete_with_live_stream(
+            client, request, job_id, chapter_plan.chapter_number,
+        )
 
-    logger.debug(f"Generated chapter {chapter_plan.chapter_number}: {len(response.text)} chars")
+    logger.debug(f"Generated chapter {chapter_plan.chapter_number}: {len(chapter_text)} chars")
 
     # Apply enforcement for essay format
-    chapter_text = response.text
     if book_format == "essay":
         chapter_text, enforcement_report = enforce_prose_quality(chapter_text, book_format)
         if enforcement_report["sections_removed"]:
@@ -8402,6 +8564,568 @@ async def generate_chapter(
     return chapter_text
 
 
+def _fit_chapter_inputs(
+    chapter_plan: ChapterPlan,
+    transcript_segment: str,
+    evidence_claims: list[dict],
+    previous_ending: Optional[str],
+    grounded: bool,
+) -> tuple[str, list[dict], Optional[str]]:
+    """Fit chapter prompt inputs into CHAPTER_MODEL's input budget.
+
+    Inputs are kept by priority: evidence claims (most confident first), then
+    the transcript segment (paragraphs most relevant to the chapter's title,
+    goals and key points), then the previous chapter's ending. Inputs that fit
+    are returned unchanged.
+
+    Args:
+        chapter_plan: The plan for this chapter.
+        transcript_segment: Mapped transcript text (or the full transcript).
+        evidence_claims: EvidenceEntry dicts (grounded generation only).
+        previous_ending: Continuity context from the previous chapter.
+        grounded: Grounded prompts only send a bounded transcript reference.
+
+    Returns:
+        Tuple of (transcript_segment, evidence_claims, previous_ending).
+    """
+    budget = PromptBudget.for_model(CHAPTER_MODEL, CHAPTER_PROMPT_RESERVED_TOKENS)
+
+    evidence_claims = fit_claims(evidence_claims, budget.remaining)
+    budget.spend(sum(estimate_claim_tokens(claim) for claim in evidence_claims))
+
+    if grounded:
+        budget.reserve(transcript_segment[:GROUNDED_TRANSCRIPT_REFERENCE_CHARS])
+    else:
+        priority_terms = [chapter_plan.title, *chapter_plan.goals, *chapter_plan.key_points]
+        transcript_segment = fit_text(transcript_segment, budget.remaining, priority_terms)
+        budget.reserve(transcript_segment)
+
+    if previous_ending:
+        previous_ending = fit_tail(previous_ending, budget.remaining) or None
+
+    return transcript_segment, evidence_claims, previous_ending
+
+
+def _stage_cache_scope(job: GenerationJob, request: DraftGenerateRequest) -> str:
+    """Project key that scopes a job's stage cache entries.
+
+    Jobs without a project are scoped by their canonical transcript, so
+    re-runs of the same content share (and are capped together).
+    """
+    return job.project_id or f"transcript:{content_hash(canonicalize_transcript(request.transcript))}"
+
+
+def _draft_plan_stage_key(request: DraftGenerateRequest) -> str:
+    """Stage cache key for generate_draft_plan().
+
+    Chapter offsets refer to the raw transcript, so the key hashes the exact
+    text rather than its canonical form.
+    """
+    style_dict = request.style_config.get("style", request.style_config) if isinstance(request.style_config, dict) else {}
+    return compute_stage_key(
+        CachedStage.draft_plan,
+        transcript=content_hash(request.transcript),
+        outline=content_hash(request.outline),
+        book_format=style_dict.get("book_format", "guide"),
+        visual_density=style_dict.get("visual_density", "medium"),
+        prompt=prompt_version(VISUAL_OPPORTUNITY_SYSTEM_PROMPT, PLANNING_MODEL),
+    )
+
+
+def _evidence_map_stage_key(
+    request: DraftGenerateRequest,
+    draft_plan: DraftPlan,
+    content_mode: ContentMode,
+    strict_grounded: bool,
+) -> str:
+    """Stage cache key for generate_evidence_map()."""
+    return compute_stage_key(
+        CachedStage.evidence_map,
+        transcript=content_hash(request.transcript),
+        chapters=content_hash([chapter.model_dump(mode="json") for chapter in draft_plan.chapters]),
+        content_mode=content_mode.value,
+        strict_grounded=strict_grounded,
+        prompt=prompt_version(
+            EVIDENCE_EXTRACTION_SYSTEM_PROMPT,
+            EVIDENCE_EXTRACTION_MODEL,
+            EVIDENCE_PROMPT_RESERVED_TOKENS,
+        ),
+    )
+
+
+async def _get_cached_stage(
+    job_id: str,
+    scope: str,
+    stage: CachedStage,
+    key: str,
+) -> Optional[object]:
+    """Look up a cached stage output (None if disabled, missing or unavailable)."""
+    cache = get_stage_cache()
+    if cache is None:
+        return None
+    try:
+        value = await cache.get(scope, stage, key)
+    except Exception as e:
+        logger.warning(f"Job {job_id}: Stage cache lookup failed (non-fatal): {e}")
+        return None
+    if value is not None:
+        logger.info(f"Job {job_id}: Reusing cached {stage.value}")
+    return value
+
+
+async def _store_cached_stage(
+    job_id: str,
+    scope: str,
+    stage: CachedStage,
+    key: str,
+    value: object,
+) -> None:
+    """Store a stage output; cache failures never fail the job."""
+    cache = get_stage_cache()
+    if cache is None:
+        return
+    try:
+        await cache.set(scope, stage, key, value)
+    except Exception as e:
+        logger.warning(f"Job {job_id}: Stage cache store failed (non-fatal): {e}")
+
+
+async def _store_evidence_map_stage(
+    job_id: str,
+    scope: str,
+    key: str,
+    evidence_map: EvidenceMap,
+) -> None:
+    """Store an Evidence Map, unless a chapter's extraction failed.
+
+    A failed extraction leaves an empty placeholder; caching it would keep
+    the chapter claim-less on every regeneration instead of retrying.
+    """
+    if evidence_map.has_failed_extractions:
+        logger.info(f"Job {job_id}: Not caching Evidence Map with failed chapter extractions")
+        return
+    await _store_cached_stage(
+        job_id, scope, CachedStage.evidence_map, key, evidence_map.model_dump(mode="json"),
+    )
+
+
+async def _build_whitelist_and_coverage(
+    job_id: str,
+    request: DraftGenerateRequest,
+    evidence_map: Optional[EvidenceMap],
+    content_mode: ContentMode,
+    stage_scope: Optional[str] = None,
+) -> tuple[list[WhitelistQuote], Optional[str]]:
+    """Build the quote whitelist and run the coverage preflight (Ideas Edition).
+
+    Whitelist and coverage failures are non-fatal and only logged. The
+    preflight gate is the exception: when request.require_preflight_pass is
+    set and coverage is not feasible, its error message is returned so the
+    caller can fail the job.
+
+    Args:
+        job_id: The job identifier (for logging).
+        request: Generation request.
+        evidence_map: Evidence Map for the whole draft.
+        content_mode: Content mode; whitelisting only applies to essay mode.
+        stage_scope: Stage cache project key; the whitelist is reused from
+            the stage cache when set.
+
+    Returns:
+        Tuple of (whitelist, preflight error message or None).
+    """
+    whitelist: list[WhitelistQuote] = []
+    if content_mode == ContentMode.essay and evidence_map:
+        try:
+            transcript_pair = TranscriptPair(
+                raw=request.transcript,
+                canonical=canonicalize_transcript(request.transcript),
+            )
+            whitelist_key = compute_stage_key(
+                CachedStage.whitelist,
+                transcript=content_hash(request.transcript),
+                evidence=content_hash(
+                    evidence_map.model_dump(mode="json", exclude={"project_id", "generated_at"})
+                ),
+            )
+            cached_whitelist = (
+                await _get_cached_stage(job_id, stage_scope, CachedStage.whitelist, whitelist_key)
+                if stage_scope
+                else None
+            )
+            if cached_whitelist is not None:
+                whitelist = [WhitelistQuote.model_validate(quote) for quote in cached_whitelist]
+            else:
+                whitelist = build_quote_whitelist(
+                    evidence_map=evidence_map,
+                    transcript=transcript_pair,
+                    known_guests=[],  # TODO: Get from project settings
+                    known_hosts=[],
+                )
+                if stage_scope:
+                    await _store_cached_stage(
+                        job_id, stage_scope, CachedStage.whitelist, whitelist_key,
+                        [quote.model_dump(mode="json") for quote in whitelist],
+                    )
+            logger.info(
+                f"Job {job_id}: Built whitelist with {len(whitelist)} validated quotes"
+            )
+
+            # Generate coverage report and check for weak chapters
+            try:
+                from hashlib import sha256
+                transcript_hash = sha256(transcript_pair.canonical.encode()).hexdigest()[:32]
+                coverage_report = generate_coverage_report(
+                    whitelist=whitelist,
+                    chapter_count=len(evidence_map.chapters),
+                    transcript_hash=transcript_hash,
+                )
+
+                # Log coverage summary
+                logger.info(
+                    f"Job {job_id}: Coverage report - "
+                    f"feasible={coverage_report.is_feasible}, "
+                    f"predicted_words={coverage_report.predicted_total_range}"
+                )
+
+                # Check for chapters that need merging
+                merge_suggestions = suggest_chapter_merges(coverage_report.chapters)
+                if merge_suggestions:
+                    for suggestion in merge_suggestions:
+                        if suggestion.get("action") == "abort":
+                            logger.warning(
+                                f"Job {job_id}: MERGE SUGGESTION - {suggestion['reason']}"
+                            )
+                        else:
+                            logger.warning(
+                                f"Job {job_id}: MERGE SUGGESTION - Chapter {suggestion['weak_chapter'] + 1} "
+                                f"should merge into Chapter {suggestion['merge_into'] + 1}. "
+                                f"Reason: {suggestion['reason']}"
+                            )
+                    logger.warning(
+                        f"Job {job_id}: {len(merge_suggestions)} chapter(s) have insufficient evidence. "
+                        f"Consider reducing chapter count or adding more source material."
+                    )
+
+                # PREFLIGHT GATE: If require_preflight_pass is True and coverage is not feasible, fail
+                if request.require_preflight_pass and not coverage_report.is_feasible:
+                    error_msg = (
+                        f"Preflight coverage check failed. "
+                        f"Reasons: {'; '.join(coverage_report.feasibility_notes)}. "
+                        f"Set require_preflight_pass=False to generate anyway with warnings."
+                    )
+                    logger.error(f"Job {job_id}: PREFLIGHT GATE BLOCKED - {error_msg}")
+                    return whitelist, error_msg
+
+            except Exception as e:
+                logger.warning(f"Job {job_id}: Coverage analysis failed (non-fatal): {e}")
+
+        except Exception as e:
+            logger.error(f"Job {job_id}: Whitelist build failed (non-fatal): {e}", exc_info=True)
+
+    return whitelist, None
+
+
+async def _generate_chapter_stage(
+    job_id: str,
+    request: DraftGenerateRequest,
+    draft_plan: DraftPlan,
+    index: int,
+    chapter_evidence: Optional[ChapterEvidence],
+    words_per_chapter: int,
+    detail_level: str,
+    content_mode: ContentMode,
+    strict_grounded: bool,
+    constraint_warnings: list[str],
+) -> str:
+    """Generate one chapter independently and run its chapter-scoped checks.
+
+    Continuity context comes from the DraftPlan rather than finished chapter
+    text, so the chapter can be generated in any order.
+
+    Args:
+        job_id: The job identifier.
+        request: Generation request.
+        draft_plan: DraftPlan with the chapter structure.
+        index: 0-based chapter index into draft_plan.chapters.
+        chapter_evidence: Evidence for this chapter.
+        words_per_chapter: Target word count per chapter.
+        detail_level: Detail level (concise/balanced/detailed).
+        content_mode: Content mode for generation.
+        strict_grounded: Whether to enforce strict grounding.
+        constraint_warnings: Shared warnings list (appended in place).
+
+    Returns:
+        Generated chapter markdown.
+    """
+    chapters = draft_plan.chapters
+    chapter_plan = chapters[index]
+
+    with timed("chapter", kind=TimingKind.chapter, chapter=chapter_plan.chapter_number):
+        chapter_md = await generate_chapter(
+            chapter_plan=chapter_plan,
+            transcript=request.transcript,
+            book_title=draft_plan.book_title,
+            style_config=request.style_config,
+            chapters_completed=[],
+            all_chapters=chapters,
+            words_per_chapter_target=words_per_chapter,
+            detail_level=detail_level,
+            chapter_evidence=chapter_evidence,
+            content_mode=content_mode,
+            strict_grounded=strict_grounded,
+            previous_chapter_ending=get_previous_chapter_plan_ending(chapters, index),
+            job_id=job_id,
+        )
+
+        # Check for interview mode violations (Spec 009 US2)
+        if content_mode == ContentMode.interview:
+            violations = check_interview_constraints(chapter_md, transcript=request.transcript)
+            if violations:
+                logger.warning(
+                    f"Job {job_id}: Chapter {chapter_plan.chapter_number} has "
+                    f"{len(violations)} interview mode violations"
+                )
+                constraint_warnings.extend([
+                    f"Ch{chapter_plan.chapter_number}: {v['matched_text'][:50]}..."
+                    for v in violations[:3]
+                ])
+                await update_job(job_id, constraint_warnings=constraint_warnings)
+
+    return chapter_md
+
+
+async def _report_chapter_landed(
+    job_id: str,
+    results: list[Optional[str]],
+    index: int,
+    chapters: list[ChapterPlan],
+) -> None:
+    """Update job progress after an out-of-order chapter finishes.
+
+    chapters_completed holds finished chapters in chapter order (with their
+    chapter numbers, so a resumed job knows which are done); the current
+    chapter is the first one still pending. Live stream subscribers receive
+    the finished chapter text.
+    """
+    get_draft_stream_hub().publish(
+        job_id, "chapter_complete",
+        {"chapter": chapters[index].chapter_number, "markdown": results[index]},
+    )
+    done = [i for i, md in enumerate(results) if md is not None]
+    pending = [i for i, md in enumerate(results) if md is None]
+    await update_job(
+        job_id,
+        chapters_completed=[results[i] for i in done],
+        completed_chapter_numbers=[chapters[i].chapter_number for i in done],
+        current_chapter=pending[0] + 1 if pending else len(results),
+    )
+
+
+def _checkpoint_reached(
+    checkpoint: Optional[GenerationCheckpoint],
+    stage: GenerationCheckpoint,
+) -> bool:
+    """Check whether a job's checkpoint is at or past a stage."""
+    if checkpoint is None:
+        return False
+    stages = list(GenerationCheckpoint)
+    return stages.index(checkpoint) >= stages.index(stage)
+
+
+async def _generate_chapters_parallel(
+    job_id: str,
+    request: DraftGenerateRequest,
+    draft_plan: DraftPlan,
+    evidence_map: EvidenceMap,
+    words_per_chapter: int,
+    detail_level: str,
+    content_mode: ContentMode,
+    strict_grounded: bool,
+    constraint_warnings: list[str],
+    concurrency: int,
+    completed: Optional[dict[int, str]] = None,
+) -> tuple[list[str], bool]:
+    """Generate chapters concurrently with a bounded number in flight.
+
+    Continuity context comes from the DraftPlan (previous chapter's plan and
+    next chapter preview) rather than from already-finished chapter text, so
+    chapters do not depend on each other. Results are reassembled in chapter
+    order; the job store is updated as each chapter lands.
+
+    Args:
+        job_id: The job identifier.
+        request: Generation request.
+        draft_plan: DraftPlan with the chapter structure.
+        evidence_map: Evidence Map for grounded generation.
+        words_per_chapter: Target word count per chapter.
+        detail_level: Detail level (concise/balanced/detailed).
+        content_mode: Content mode for generation.
+        strict_grounded: Whether to enforce strict grounding.
+        constraint_warnings: Shared warnings list (appended in place).
+        concurrency: Maximum number of chapters generated at once.
+        completed: Chapters already finished (by chapter number), e.g. when
+            resuming an interrupted job. They are not regenerated.
+
+    Returns:
+        Tuple of (completed chapters in chapter order, was_cancelled).
+    """
+    chapters = draft_plan.chapters
+    completed = completed or {}
+    results: list[Optional[str]] = [completed.get(c.chapter_number) for c in chapters]
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    cancelled = False
+
+    async def _run_chapter(index: int, chapter_plan: ChapterPlan) -> None:
+        nonlocal cancelled
+        async with semaphore:
+            # Check for cancellation before starting each chapter
+            if cancelled:
+                return
+            job = await get_job(job_id)
+            if job and job.cancel_requested:
+                cancelled = True
+                return
+
+            logger.debug(f"Job {job_id}: Generating chapter {index + 1}/{len(chapters)} (parallel)")
+            results[index] = await _generate_chapter_stage(
+                job_id=job_id,
+                request=request,
+                draft_plan=draft_plan,
+                index=index,
+                chapter_evidence=get_evidence_for_chapter(evidence_map, chapter_plan.chapter_number),
+                words_per_chapter=words_per_chapter,
+                detail_level=detail_level,
+                content_mode=content_mode,
+                strict_grounded=strict_grounded,
+                constraint_warnings=constraint_warnings,
+            )
+
+        await _report_chapter_landed(job_id, results, index, chapters)
+        logger.debug(f"Job {job_id}: Chapter {chapter_plan.chapter_number} landed")
+
+    await update_job(job_id, current_chapter=1)
+    tasks = [
+        asyncio.create_task(
+            _run_chapter(i, chapter_plan),
+            name=f"draft_chapter_{job_id}_{chapter_plan.chapter_number}",
+        )
+        for i, chapter_plan in enumerate(chapters)
+        if results[i] is None
+    ]
+
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        # One chapter failed (or we were cancelled) - stop the rest
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+    return [md for md in results if md is not None], cancelled
+
+
+async def _generate_chapters_pipelined(
+    job_id: str,
+    request: DraftGenerateRequest,
+    draft_plan: DraftPlan,
+    project_id: str,
+    words_per_chapter: int,
+    detail_level: str,
+    content_mode: ContentMode,
+    strict_grounded: bool,
+    style_config: dict,
+    constraint_warnings: list[str],
+    concurrency: int,
+    completed: Optional[dict[int, str]] = None,
+) -> tuple[list[str], EvidenceMap, bool]:
+    """Stream each chapter through evidence extraction and generation.
+
+    Instead of waiting for the whole Evidence Map, each chapter is generated
+    as soon as its own evidence is ready (bounded by concurrency), so a slow
+    extraction only delays its own chapter. Whole-document work (whitelist,
+    coverage, enforcement passes) is left to the caller once all chapters
+    have landed.
+
+    No enforcement runs per chapter here, including the chapter-scoped
+    passes (whitelist and Core Claims enforcement). Those check each
+    chapter against the quote whitelist. The whitelist is built from the
+    complete Evidence Map, and quotes are deduplicated and attributed
+    across chapters. A whitelist built from one chapter's evidence could
+    drop quotes the full whitelist allows, so these passes wait for the
+    last chapter.
+
+    Args:
+        job_id: The job identifier.
+        request: Generation request.
+        draft_plan: DraftPlan with the chapter structure.
+        project_id: Project ID recorded on the Evidence Map.
+        words_per_chapter: Target word count per chapter.
+        detail_level: Detail level (concise/balanced/detailed).
+        content_mode: Content mode for extraction and generation.
+        strict_grounded: Whether to enforce strict grounding.
+        style_config: Style dict passed to evidence extraction.
+        constraint_warnings: Shared warnings list (appended in place).
+        concurrency: Maximum number of chapters generated at once.
+        completed: Chapters already finished (by chapter number), e.g. when
+            resuming an interrupted job. Their evidence is still extracted
+            (the whitelist needs the full map) but they are not regenerated.
+
+    Returns:
+        Tuple of (completed chapters in chapter order, Evidence Map, was_cancelled).
+    """
+    chapters = draft_plan.chapters
+    index_by_number = {c.chapter_number: i for i, c in enumerate(chapters)}
+    completed = completed or {}
+    results: list[Optional[str]] = [completed.get(c.chapter_number) for c in chapters]
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    cancelled = False
+
+    async def _on_chapter_evidence(chapter_plan: ChapterPlan, chapter_evidence: ChapterEvidence) -> None:
+        nonlocal cancelled
+        index = index_by_number[chapter_plan.chapter_number]
+        if results[index] is not None:
+            return
+        async with semaphore:
+            if cancelled:
+                return
+            job = await get_job(job_id)
+            if job and job.cancel_requested:
+                cancelled = True
+                return
+
+            logger.debug(f"Job {job_id}: Generating chapter {index + 1}/{len(chapters)} (pipelined)")
+            results[index] = await _generate_chapter_stage(
+                job_id=job_id,
+                request=request,
+                draft_plan=draft_plan,
+                index=index,
+                chapter_evidence=chapter_evidence,
+                words_per_chapter=words_per_chapter,
+                detail_level=detail_level,
+                content_mode=content_mode,
+                strict_grounded=strict_grounded,
+                constraint_warnings=constraint_warnings,
+            )
+
+        await _report_chapter_landed(job_id, results, index, chapters)
+        logger.debug(f"Job {job_id}: Chapter {chapter_plan.chapter_number} landed")
+
+    await update_job(job_id, current_chapter=1)
+    evidence_map = await generate_evidence_map(
+        project_id=project_id,
+        transcript=request.transcript,
+        chapters=chapters,
+        content_mode=content_mode,
+        strict_grounded=strict_grounded,
+        style_config=style_config,
+        on_chapter_evidence=_on_chapter_evidence,
+    )
+
+    return [md for md in results if md is not None], evidence_map, cancelled
+
+
 def _extract_speaker_name(transcript: str) -> str:
     """Extract the primary speaker name from transcript.
 
@@ -8443,6 +9167,8 @@ async def generate_interview_single_pass(
     book_title: str,
     evidence_map: EvidenceMap,
     forced_candidates: Optional[list[dict]] = None,
+    use_cache: bool = True,
+    job_id: Optional[str] = None,
 ) -> str:
     """Generate interview ebook using single-pass approach (P0).
 
@@ -8455,11 +9181,14 @@ async def generate_interview_single_pass(
         book_title: Title of the ebook.
         evidence_map: Evidence Map with extracted claims.
         forced_candidates: Optional list of definitional candidates to force into Key Ideas.
+        use_cache: Allow a cached LLM response. Best-of-N candidates pass False
+            so each candidate is an independent sample.
+        job_id: Owning job, used to stream tokens to live subscribers.
 
     Returns:
         Generated markdown with Key Ideas + Conversation structure.
     """
-    client = LLMClient()
+    client = get_llm_client()
 
     # Extract speaker name
     speaker_name = _extract_speaker_name(transcript)
@@ -8499,12 +9228,15 @@ async def generate_interview_single_pass(
         ],
         temperature=0.7,
         max_tokens=8000,  # Larger for single-pass
+        cache=use_cache,
     )
 
-    response = await client.generate(request)
+    # Single-pass output is one document, streamed as chapter 1
+    with llm_stage("interview"):
+        response_text = await _complete_with_live_stream(client, request, job_id, 1)
 
     # Strip any H1 heading the LLM might have generated (we add our own)
-    content = response.text.strip()
+    content = response_text.strip()
     if content.startswith("# "):
         # Remove the first H1 line
         lines = content.split("\n")
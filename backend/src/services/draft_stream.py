@@ -0,0 +1,84 @@
+"""In-process event hub for live draft streaming.
+
+Draft generation publishes chapter token deltas here while the SSE endpoint
+(/ai/draft/stream/{job_id}) subscribes to them. Publishing never blocks
+generation: each subscriber has a bounded queue, and when a slow client
+falls behind, its oldest events are dropped (the final chapter text still
+arrives via chapter_complete events and /status).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Max buffered events per subscriber before the oldest are dropped
+DRAFT_STREAM_QUEUE_SIZE = int(os.environ.get("DRAFT_STREAM_QUEUE_SIZE", "2000"))
+
+
+class DraftStreamHub:
+    """Fan-out of per-job draft events to SSE subscribers."""
+
+    def __init__(self, queue_size: int = DRAFT_STREAM_QUEUE_SIZE):
+        """Initialize hub.
+
+        Args:
+            queue_size: Max buffered events per subscriber.
+        """
+        self._queue_size = queue_size
+        self._subscribers: dict[str, set[asyncio.Queue]] = {}
+
+    def subscribe(self, job_id: str) -> asyncio.Queue:
+        """Register a subscriber for a job and return its event queue."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self._queue_size)
+        self._subscribers.setdefault(job_id, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, job_id: str, queue: asyncio.Queue) -> None:
+        """Remove a subscriber queue."""
+        queues = self._subscribers.get(job_id)
+        if queues is None:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self._subscribers[job_id]
+
+    def has_subscribers(self, job_id: str) -> bool:
+        """Check whether anyone is listening to a job's stream."""
+        return bool(self._subscribers.get(job_id))
+
+    def publish(self, job_id: str, event: str, data: dict[str, Any]) -> None:
+        """Publish an event to every subscriber of a job.
+
+        Args:
+            job_id: The job identifier.
+            event: SSE event name (e.g. "token", "chapter_complete").
+            data: JSON-serializable event payload.
+        """
+        for queue in self._subscribers.get(job_id, ()):
+            if queue.full():
+                # Drop the oldest event rather than stalling generation
+                queue.get_nowait()
+            queue.put_nowait((event, data))
+
+
+# Module-level singleton
+_default_hub: DraftStreamHub | None = None
+
+
+def get_draft_stream_hub() -> DraftStreamHub:
+    """Get the default draft stream hub singleton."""
+    global _default_hub
+    if _default_hub is None:
+        _default_hub = DraftStreamHub()
+    return _default_hub
+
+
+def set_draft_stream_hub(hub: DraftStreamHub) -> None:
+    """Set the draft stream hub instance (for testing)."""
+    global _default_hub
+    _default_hub = hub
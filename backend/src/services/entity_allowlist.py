@@ -13,6 +13,8 @@ import re
 from dataclasses import dataclass, field
 from typing import Set
 
+from src.services.stage_timing import timed_pass
+
 
 # Org suffixes that strongly indicate an organization
 ORG_SUFFIXES = {
@@ -148,6 +150,7 @@ def build_person_blacklist(
     return blacklist
 
 
+@timed_pass
 def build_person_blacklist_from_whitelist(
     whitelist_quotes: list,
 ) -> PersonBlacklist:
@@ -293,6 +296,7 @@ def classify_entity(
     return "AMBIGUOUS"
 
 
+@timed_pass
 def build_entity_allowlist(
     transcript_text: str,
     person_blacklist: PersonBlacklist | None = None,
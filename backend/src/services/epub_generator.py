@@ -44,6 +44,8 @@ from src.services.image_utils import (
     get_epub_image_extension,
 )
 from src.services.project_service import get_project
+from src.services.job_scheduler import JobKind, SchedulerFullError, get_job_scheduler
+from src.services.work_queue import TaskKind, enqueue_job, job_queue_enabled
 
 logger = logging.getLogger(__name__)
 
@@ -510,7 +512,8 @@ class EpubGenerator:
 async def start_epub_export(project_id: str) -> str:
     """Start EPUB export for a project.
 
-    Creates an export job and starts background generation.
+    Creates an export job and schedules background generation (or enqueues
+    it for a worker when the job queue is enabled).
 
     Args:
         project_id: The project to export.
@@ -520,6 +523,7 @@ async def start_epub_export(project_id: str) -> str:
 
     Raises:
         ValueError: If project not found or has no draft content.
+        SchedulerFullError: If too many exports are already waiting.
     """
     # Validate project exists and has content
     project = await get_project(project_id)
@@ -541,15 +545,31 @@ async def start_epub_export(project_id: str) -> str:
 
     logger.info(f"Starting EPUB export job {job_id} for project {project_id}")
 
-    # Start background task
-    asyncio.create_task(
-        _epub_export_task(job_id, project),
-        name=f"epub_export_{job_id}",
-    )
+    if job_queue_enabled():
+        await enqueue_job(TaskKind.epub_export, job_id, {"project_id": project_id})
+        return job_id
+
+    # Start background task once an export slot is free
+    try:
+        get_job_scheduler().submit(JobKind.export, job_id, lambda: _epub_export_task(job_id, project))
+    except SchedulerFullError:
+        await store.delete_job(job_id)
+        raise
 
     return job_id
 
 
+async def run_epub_export_job(job_id: str, project_id: str) -> None:
+    """Run a queued EPUB export in a worker process.
+
+    Args:
+        job_id: The export job ID.
+        project_id: The project to export.
+    """
+    project = await get_project(project_id)
+    await _epub_export_task(job_id, project)
+
+
 async def _epub_export_task(job_id: str, project: Project) -> None:
     """Background task for EPUB generation.
 
@@ -7,14 +7,16 @@ and content mode detection.
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 import logging
+import os
 import re
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Optional
 
-from src.llm import LLMClient, LLMRequest, ChatMessage, ResponseFormat
+from src.llm import LLMRequest, ResponseFormat, get_llm_client, llm_stage
 from src.models import (
     ChapterPlan,
     StyleConfig,
@@ -37,15 +39,23 @@ from src.models.style_config import ContentMode
 from .prompts import (
     EVIDENCE_EXTRACTION_SYSTEM_PROMPT,
     build_claim_extraction_prompt,
+    build_prefix_cached_messages,
     INTERVIEW_FORBIDDEN_PATTERNS,
     extract_transcript_segment,
 )
+from .token_budget import fit_text, get_input_token_budget
 
 logger = logging.getLogger(__name__)
 
 # LLM model for evidence extraction
 EVIDENCE_EXTRACTION_MODEL = "gpt-4o-mini"
 
+# Extraction prompt tokens reserved for instructions; the rest goes to the transcript
+EVIDENCE_PROMPT_RESERVED_TOKENS = 2000
+
+# Maximum number of chapter claim extractions in flight at once
+EVIDENCE_EXTRACTION_CONCURRENCY = int(os.environ.get("EVIDENCE_EXTRACTION_CONCURRENCY", "4"))
+
 
 # ==============================================================================
 # Evidence Map Generation (T018)
@@ -58,11 +68,13 @@ async def generate_evidence_map(
     content_mode: ContentMode = ContentMode.interview,
     strict_grounded: bool = True,
     style_config: Optional[dict] = None,
+    on_chapter_evidence: Optional[Callable[[ChapterPlan, ChapterEvidence], Awaitable[None]]] = None,
 ) -> EvidenceMap:
     """Generate an Evidence Map from transcript for all chapters.
 
-    This is the main entry point for evidence extraction. Iterates through
-    chapters, extracting claims and building the Evidence Map structure.
+    This is the main entry point for evidence extraction. Extracts claims for
+    all chapters concurrently (bounded by EVIDENCE_EXTRACTION_CONCURRENCY),
+    alongside the global context, and builds the Evidence Map structure.
 
     Args:
         project_id: Associated project ID.
@@ -71,6 +83,10 @@ async def generate_evidence_map(
         content_mode: Content mode (interview/essay/tutorial).
         strict_grounded: Whether to enforce strict grounding.
         style_config: Optional style config for additional context.
+        on_chapter_evidence: Optional coroutine called with each chapter's
+            evidence as soon as it is ready, so callers can start per-chapter
+            downstream work without waiting for the whole map. It runs outside
+            the extraction semaphore; if it raises, remaining work is cancelled.
 
     Returns:
         Populated EvidenceMap with per-chapter evidence.
@@ -89,25 +105,29 @@ async def generate_evidence_map(
         generated_at=datetime.utcnow(),
     )
 
-    # Extract global context first
-    evidence_map.global_context = await _extract_global_context(transcript)
+    semaphore = asyncio.Semaphore(max(1, EVIDENCE_EXTRACTION_CONCURRENCY))
 
-    # Process each chapter
-    chapter_evidences: list[ChapterEvidence] = []
-    for chapter in chapters:
-        logger.debug(f"Extracting evidence for chapter {chapter.chapter_number}: {chapter.title}")
+    async def _extract_chapter(chapter: ChapterPlan) -> ChapterEvidence:
+        async with semaphore:
+            logger.debug(f"Extracting evidence for chapter {chapter.chapter_number}: {chapter.title}")
 
-        # Get transcript segment for this chapter
-        segment = extract_transcript_segment(transcript, chapter)
+            # Get transcript segment for this chapter, fitted to the model budget
+            segment = fit_text(
+                extract_transcript_segment(transcript, chapter),
+                get_input_token_budget(EVIDENCE_EXTRACTION_MODEL) - EVIDENCE_PROMPT_RESERVED_TOKENS,
+                [chapter.title, *chapter.key_points],
+            )
 
-        # Extract claims for this chapter
-        chapter_evidence = await extract_claims_for_chapter(
-            chapter_index=chapter.chapter_number,
-            chapter_title=chapter.title,
-            transcript_segment=segment,
-            content_mode=content_mode,
-            outline_item_id=chapter.outline_item_id,
-        )
+            # Extract claims for this chapter
+            chapter_evidence = await extract_claims_for_chapter(
+                chapter_index=chapter.chapter_number,
+                chapter_title=chapter.title,
+                transcript_segment=segment,
+                content_mode=content_mode,
+                outline_item_id=chapter.outline_item_id,
+                # Unmapped chapters all get the full transcript
+                shared_source=segment == transcript,
+            )
 
         # Handle empty evidence (T021)
         chapter_evidence = handle_empty_evidence(
@@ -125,8 +145,25 @@ async def generate_evidence_map(
                 "motivational_platitudes",
             ]
 
-        chapter_evidences.append(chapter_evidence)
+        if on_chapter_evidence is not None:
+            await on_chapter_evidence(chapter, chapter_evidence)
+
+        return chapter_evidence
 
+    # Chapters are independent given their transcript segment, so extract them
+    # concurrently alongside the global context. gather() preserves chapter order.
+    tasks = [
+        asyncio.create_task(_extract_global_context(transcript)),
+        *(asyncio.create_task(_extract_chapter(chapter)) for chapter in chapters),
+    ]
+    try:
+        global_context, *chapter_evidences = await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    evidence_map.global_context = global_context
     evidence_map.chapters = chapter_evidences
 
     logger.info(
@@ -146,6 +183,7 @@ async def extract_claims_for_chapter(
     transcript_segment: str,
     content_mode: str = "interview",
     outline_item_id: Optional[str] = None,
+    shared_source: bool = False,
 ) -> ChapterEvidence:
     """Extract claims and evidence for a single chapter.
 
@@ -158,6 +196,8 @@ async def extract_claims_for_chapter(
         transcript_segment: Transcript text for this chapter.
         content_mode: Content mode affecting extraction focus.
         outline_item_id: Optional outline item ID.
+        shared_source: The same transcript text is sent for other chapters
+            too, so send it as a cacheable prefix message.
 
     Returns:
         ChapterEvidence with extracted claims.
@@ -167,22 +207,25 @@ async def extract_claims_for_chapter(
         chapter_title=chapter_title,
         transcript_segment=transcript_segment,
         content_mode=content_mode,
+        source_in_context=shared_source,
     )
 
     # Call LLM
-    client = LLMClient()
+    client = get_llm_client()
     request = LLMRequest(
         model=EVIDENCE_EXTRACTION_MODEL,
-        messages=[
-            ChatMessage(role="system", content=EVIDENCE_EXTRACTION_SYSTEM_PROMPT),
-            ChatMessage(role="user", content=user_prompt),
-        ],
+        messages=build_prefix_cached_messages(
+            EVIDENCE_EXTRACTION_SYSTEM_PROMPT,
+            user_prompt,
+            transcript_segment if shared_source else None,
+        ),
         response_format=ResponseFormat(type="json_object"),
         temperature=0.3,  # Lower temperature for more consistent extraction
     )
 
     try:
-        response = await client.generate(request)
+        with llm_stage("evidence"):
+            response = await client.generate(request)
 
         # Parse response
         result = json.loads(response.text)
@@ -205,18 +248,10 @@ async def extract_claims_for_chapter(
 
     except json.JSONDecodeError as e:
         logger.warning(f"Failed to parse LLM response for chapter {chapter_index}: {e}")
-        return ChapterEvidence(
-            chapter_index=chapter_index,
-            chapter_title=chapter_title,
-            outline_item_id=outline_item_id,
-        )
+        return ChapterEvidence.failed_extraction(chapter_index, chapter_title, outline_item_id)
     except Exception as e:
         logger.error(f"Error extracting claims for chapter {chapter_index}: {e}")
-        return ChapterEvidence(
-            chapter_index=chapter_index,
-            chapter_title=chapter_title,
-            outline_item_id=outline_item_id,
-        )
+        return ChapterEvidence.failed_extraction(chapter_index, chapter_title, outline_item_id)
 
 
 def _parse_claims_response(
@@ -950,7 +985,9 @@ def format_candidates_for_prompt(candidates: list[dict], max_candidates: int = 5
 async def _extract_global_context(transcript: str) -> GlobalContext:
     """Extract global context (speakers, topics) from transcript.
 
-    This is a lightweight extraction for cross-chapter context.
+    This is a lightweight extraction for cross-chapter context. The regex
+    scan runs in a worker thread so it does not block the event loop while
+    chapter extractions are in flight.
 
     Args:
         transcript: Full transcript text.
@@ -958,6 +995,11 @@ async def _extract_global_context(transcript: str) -> GlobalContext:
     Returns:
         GlobalContext with speakers and topics.
     """
+    return await asyncio.to_thread(_extract_global_context_sync, transcript)
+
+
+def _extract_global_context_sync(transcript: str) -> GlobalContext:
+    """Synchronous heuristic behind _extract_global_context."""
     # Simple heuristic extraction (could be enhanced with LLM)
     speakers: list[SpeakerInfo] = []
 
@@ -0,0 +1,319 @@
+"""In-process admission control and priority scheduling for background jobs.
+
+Background jobs used to start as soon as they were requested. A burst of
+draft, QA, rewrite, export and theme requests then ran all at once,
+oversubscribing the event loop, LLM quotas and WeasyPrint threads.
+
+The scheduler gives each job kind a concurrency limit and a bounded waiting
+queue. Requests beyond the queue bound are rejected with SchedulerFullError,
+which the API returns as 429 with Retry-After. Waiting jobs start in
+priority order (interactive, then normal, then batch), FIFO within a
+priority, so a corpus run cannot starve users.
+
+Queue depth, running jobs, rejections and wait times are exported with the
+LLM metrics on GET /metrics. Status endpoints report each waiting job's
+queue position.
+
+Configuration (env vars):
+- JOB_LIMIT_<KIND>: Concurrent jobs per kind (draft 2, regenerate 4, qa 2,
+  rewrite 2, export 1, themes 2)
+- JOB_MAX_WAITING: Waiting jobs per kind before requests are rejected (default: 50)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import os
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass, field
+from enum import Enum
+from typing import Any, Optional, TypeVar
+
+from src.llm.metrics import Histogram
+from src.models import JobPriority
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class JobKind(str, Enum):
+    """Kinds of background work with separate limits."""
+    draft = "draft"
+    regenerate = "regenerate"
+    qa = "qa"
+    rewrite = "rewrite"
+    export = "export"
+    themes = "themes"
+
+
+DEFAULT_JOB_LIMITS = {
+    JobKind.draft: 2,
+    JobKind.regenerate: 4,
+    JobKind.qa: 2,
+    JobKind.rewrite: 2,
+    # PDF rendering is CPU-bound in WeasyPrint threads
+    JobKind.export: 1,
+    JobKind.themes: 2,
+}
+JOB_MAX_WAITING = int(os.environ.get("JOB_MAX_WAITING", "50"))
+
+# Wait-time histogram bucket upper bounds in seconds
+WAIT_BUCKETS_SECONDS = (0.1, 1, 5, 15, 30, 60, 120, 300, 600, 1800)
+
+# Dispatch order (lower runs first)
+_PRIORITY_RANK = {JobPriority.interactive: 0, JobPriority.normal: 1, JobPriority.batch: 2}
+
+
+def _limit_from_env(kind: JobKind) -> int:
+    """Read JOB_LIMIT_<KIND>, falling back to the default limit."""
+    return int(os.environ.get(f"JOB_LIMIT_{kind.value.upper()}", str(DEFAULT_JOB_LIMITS[kind])))
+
+
+class SchedulerFullError(Exception):
+    """Raised when a job kind's waiting queue is full."""
+
+    def __init__(self, kind: JobKind, retry_after_seconds: int):
+        self.kind = kind
+        self.retry_after_seconds = retry_after_seconds
+        super().__init__(f"Too many {kind.value} jobs queued. Retry in {retry_after_seconds}s.")
+
+
+@dataclass
+class SchedulerStats:
+    """Counters for one job kind."""
+
+    kind: str
+    limit: int
+    running: int = 0
+    waiting: int = 0
+    admitted: int = 0
+    rejected: int = 0
+    completed: int = 0
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary."""
+        return asdict(self)
+
+
+@dataclass(order=True)
+class _Entry:
+    """A job waiting for a slot (ordered by priority, then arrival)."""
+
+    rank: int
+    seq: int
+    job_id: Optional[str] = field(compare=False)
+    enqueued_at: float = field(compare=False)
+    granted: asyncio.Future = field(compare=False)
+
+
+@dataclass
+class _KindState:
+    stats: SchedulerStats
+    waiting: list[_Entry] = field(default_factory=list)
+    wait_seconds: Histogram = field(default_factory=lambda: Histogram(WAIT_BUCKETS_SECONDS))
+    # Recent run durations, used to suggest Retry-After
+    avg_run_seconds: float = 30.0
+
+
+class JobScheduler:
+    """Per-kind concurrency limits with bounded priority queues."""
+
+    def __init__(
+        self,
+        limits: Optional[dict[JobKind, int]] = None,
+        max_waiting: int = JOB_MAX_WAITING,
+    ):
+        """Initialize scheduler.
+
+        Args:
+            limits: Concurrent jobs per kind. Defaults to JOB_LIMIT_<KIND>.
+            max_waiting: Waiting jobs per kind before submissions are rejected.
+        """
+        limits = limits or {}
+        self.max_waiting = max_waiting
+        self._kinds = {
+            kind: _KindState(stats=SchedulerStats(kind=kind.value, limit=max(1, limits.get(kind, _limit_from_env(kind)))))
+            for kind in JobKind
+        }
+        self._seq = itertools.count()
+        self._tasks: set[asyncio.Task] = set()
+
+    def _admit(self, kind: JobKind, job_id: Optional[str], priority: JobPriority) -> _Entry:
+        """Queue an entry, or raise if the kind's queue is full."""
+        state = self._kinds[kind]
+        stats = state.stats
+        if stats.running >= stats.limit and len(state.waiting) >= self.max_waiting:
+            stats.rejected += 1
+            # Time for the queue ahead to drain at the current throughput
+            retry_after = max(1, round(state.avg_run_seconds * (len(state.waiting) + 1) / stats.limit))
+            logger.warning(f"Rejected {kind.value} job {job_id}: {len(state.waiting)} waiting")
+            raise SchedulerFullError(kind, retry_after)
+
+        entry = _Entry(
+            rank=_PRIORITY_RANK[JobPriority(priority)],
+            seq=next(self._seq),
+            job_id=job_id,
+            enqueued_at=time.monotonic(),
+            granted=asyncio.get_running_loop().create_future(),
+        )
+        heapq.heappush(state.waiting, entry)
+        stats.admitted += 1
+        stats.waiting = len(state.waiting)
+        self._dispatch(kind)
+        return entry
+
+    def _dispatch(self, kind: JobKind) -> None:
+        """Grant free slots to the highest-priority waiting entries."""
+        state = self._kinds[kind]
+        while state.waiting and state.stats.running < state.stats.limit:
+            entry = heapq.heappop(state.waiting)
+            if entry.granted.done():
+                continue  # Cancelled while waiting
+            state.stats.running += 1
+            state.wait_seconds.observe(time.monotonic() - entry.enqueued_at)
+            entry.granted.set_result(None)
+        state.stats.waiting = len(state.waiting)
+
+    def _release(self, kind: JobKind, run_seconds: float) -> None:
+        """Free a slot and start the next waiting entry."""
+        state = self._kinds[kind]
+        state.stats.running -= 1
+        state.stats.completed += 1
+        state.avg_run_seconds = 0.8 * state.avg_run_seconds + 0.2 * run_seconds
+        self._dispatch(kind)
+
+    async def _run_entry(self, kind: JobKind, entry: _Entry, factory: Callable[[], Awaitable[T]]) -> T:
+        """Wait for a slot, run the job, then release the slot."""
+        state = self._kinds[kind]
+        try:
+            await entry.granted
+        except asyncio.CancelledError:
+            if entry in state.waiting:
+                state.waiting.remove(entry)
+                heapq.heapify(state.waiting)
+                state.stats.waiting = len(state.waiting)
+            elif entry.granted.done() and not entry.granted.cancelled():
+                # Granted just before cancellation: give the slot back
+                self._release(kind, 0.0)
+            raise
+
+        started = time.monotonic()
+        try:
+            return await factory()
+        finally:
+            self._release(kind, time.monotonic() - started)
+
+    def submit(
+        self,
+        kind: JobKind,
+        job_id: str,
+        factory: Callable[[], Awaitable[Any]],
+        priority: JobPriority = JobPriority.normal,
+    ) -> asyncio.Task:
+        """Schedule a background job.
+
+        Args:
+            kind: Job kind (selects the concurrency limit).
+            job_id: Job identifier, for queue positions.
+            factory: Creates the job coroutine once a slot is free.
+            priority: Dispatch priority.
+
+        Returns:
+            The task running the job (after it waits for a slot).
+
+        Raises:
+            SchedulerFullError: If too many jobs of this kind are waiting.
+        """
+        entry = self._admit(kind, job_id, priority)
+        task = asyncio.create_task(self._run_entry(kind, entry, factory), name=f"{kind.value}_{job_id}")
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def run(
+        self,
+        kind: JobKind,
+        factory: Callable[[], Awaitable[T]],
+        priority: JobPriority = JobPriority.interactive,
+    ) -> T:
+        """Run work inline once a slot is free (for request-scoped work).
+
+        Raises:
+            SchedulerFullError: If too many jobs of this kind are waiting.
+        """
+        entry = self._admit(kind, None, priority)
+        return await self._run_entry(kind, entry, factory)
+
+    def queue_position(self, job_id: str) -> Optional[int]:
+        """Get a waiting job's 1-based position in its queue.
+
+        Returns:
+            The position, or None if the job is not waiting (running,
+            finished, or unknown).
+        """
+        for state in self._kinds.values():
+            ordered = sorted(e for e in state.waiting if not e.granted.done())
+            for position, entry in enumerate(ordered, start=1):
+                if entry.job_id == job_id:
+                    return position
+        return None
+
+    def get_stats(self) -> list[dict]:
+        """Get counters per job kind."""
+        return [state.stats.to_dict() for state in self._kinds.values()]
+
+    def render_prometheus(self) -> str:
+        """Render scheduler metrics in the Prometheus text exposition format."""
+        lines: list[str] = []
+        gauges = (
+            ("job_queue_depth", "Jobs waiting for a slot.", "waiting"),
+            ("job_running", "Jobs currently running.", "running"),
+            ("job_concurrency_limit", "Concurrent jobs allowed.", "limit"),
+        )
+        counters = (
+            ("job_admitted_total", "Jobs accepted by admission control.", "admitted"),
+            ("job_rejected_total", "Jobs rejected because the queue was full.", "rejected"),
+        )
+        for kind_type, metrics in (("gauge", gauges), ("counter", counters)):
+            for name, help_text, attr in metrics:
+                lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind_type}"]
+                for state in self._kinds.values():
+                    lines.append(f'{name}{{kind="{state.stats.kind}"}} {getattr(state.stats, attr)}')
+
+        name = "job_queue_wait_seconds"
+        lines += [f"# HELP {name} Time jobs waited for a slot.", f"# TYPE {name} histogram"]
+        for state in self._kinds.values():
+            histogram = state.wait_seconds
+            if not histogram.count:
+                continue
+            labels = f'kind="{state.stats.kind}"'
+            for bound, count in zip(histogram.buckets, histogram.counts, strict=True):
+                lines.append(f'{name}_bucket{{{labels},le="{bound:g}"}} {count}')
+            lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+            lines.append(f"{name}_sum{{{labels}}} {histogram.sum:g}")
+            lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+
+        return "\n".join(lines) + "\n"
+
+
+# Module-level singleton
+_default_scheduler: Optional[JobScheduler] = None
+
+
+def get_job_scheduler() -> JobScheduler:
+    """Get the process-wide job scheduler."""
+    global _default_scheduler
+    if _default_scheduler is None:
+        _default_scheduler = JobScheduler()
+    return _default_scheduler
+
+
+def set_job_scheduler(scheduler: Optional[JobScheduler]) -> None:
+    """Set the job scheduler instance (for testing)."""
+    global _default_scheduler
+    _default_scheduler = scheduler
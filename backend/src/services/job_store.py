@@ -20,7 +20,7 @@ from datetime import datetime, timedelta, timezone
 from typing import Optional
 from uuid import uuid4
 
-from src.models import GenerationJob, JobStatus, DraftPlan, VisualPlan
+from src.models import GenerationCheckpoint, GenerationJob, JobStatus, DraftPlan, VisualPlan
 from src.models.style_config import ContentMode
 
 logger = logging.getLogger(__name__)
@@ -35,6 +35,25 @@ CLEANUP_INTERVAL_SECONDS = 300
 JOBS_COLLECTION = "generation_jobs"
 
 
+def _apply_updates(job: GenerationJob, updates: dict) -> None:
+    """Set updated fields on a job and its status timestamps."""
+    for key, value in updates.items():
+        if hasattr(job, key):
+            setattr(job, key, value)
+        else:
+            logger.warning(f"Unknown field {key} for job update")
+
+    # Auto-set timestamps
+    if updates.get("status") == JobStatus.planning and not job.started_at:
+        job.started_at = datetime.now(timezone.utc)
+    if updates.get("status") in (
+        JobStatus.completed,
+        JobStatus.cancelled,
+        JobStatus.failed,
+    ):
+        job.completed_at = datetime.now(timezone.utc)
+
+
 class BaseJobStore(ABC):
     """Abstract base class for job stores.
 
@@ -66,6 +85,22 @@ class BaseJobStore(ABC):
         """Update a job's fields."""
         pass
 
+    @abstractmethod
+    async def claim_job(
+        self,
+        job_id: str,
+        expected_status: JobStatus,
+        expected_resume_count: int,
+        **updates,
+    ) -> Optional[GenerationJob]:
+        """Update a job only if its status and resume count are unchanged.
+
+        Returns:
+            The updated job, or None if it is gone or another process
+            changed it first.
+        """
+        pass
+
     @abstractmethod
     async def delete_job(self, job_id: str) -> bool:
         """Delete a job."""
@@ -171,23 +206,26 @@ class InMemoryJobStore(BaseJobStore):
             job = self._jobs.get(job_id)
             if not job:
                 return None
+            _apply_updates(job, updates)
+            return job
 
-            for key, value in updates.items():
-                if hasattr(job, key):
-                    setattr(job, key, value)
-                else:
-                    logger.warning(f"Unknown field {key} for job update")
-
-            # Auto-set timestamps
-            if updates.get("status") == JobStatus.planning and not job.started_at:
-                job.started_at = datetime.now(timezone.utc)
-            if updates.get("status") in (
-                JobStatus.completed,
-                JobStatus.cancelled,
-                JobStatus.failed,
+    async def claim_job(
+        self,
+        job_id: str,
+        expected_status: JobStatus,
+        expected_resume_count: int,
+        **updates,
+    ) -> Optional[GenerationJob]:
+        """Update a job only if its status and resume count are unchanged."""
+        async with self._lock:
+            job = self._jobs.get(job_id)
+            if (
+                not job
+                or job.status != expected_status
+                or job.resume_count != expected_resume_count
             ):
-                job.completed_at = datetime.now(timezone.utc)
-
+                return None
+            _apply_updates(job, updates)
             return job
 
     async def delete_job(self, job_id: str) -> bool:
@@ -282,14 +320,24 @@ class MongoJobStore(BaseJobStore):
             "current_chapter": job.current_chapter,
             "total_chapters": job.total_chapters,
             "chapters_completed": job.chapters_completed,
+            "completed_chapter_numbers": job.completed_chapter_numbers,
             "draft_markdown": job.draft_markdown,
             "cancel_requested": job.cancel_requested,
+            # Checkpointing
+            "request": job.request,
+            "checkpoint": job.checkpoint.value if job.checkpoint else None,
+            "resume_count": job.resume_count,
             "error": job.error,
             "error_code": job.error_code,
             # Evidence Map fields (Spec 009)
             "evidence_map": job.evidence_map,
             "content_mode": job.content_mode.value if job.content_mode else None,
             "constraint_warnings": job.constraint_warnings,
+            # LLM usage rollup
+            "total_prompt_tokens": job.total_prompt_tokens,
+            "total_completion_tokens": job.total_completion_tokens,
+            "llm_usage": job.llm_usage,
+            "timings": job.timings,
         }
 
         # Serialize complex objects
@@ -331,16 +379,26 @@ class MongoJobStore(BaseJobStore):
             current_chapter=doc.get("current_chapter", 0),
             total_chapters=doc.get("total_chapters", 0),
             chapters_completed=doc.get("chapters_completed", []),
+            completed_chapter_numbers=doc.get("completed_chapter_numbers", []),
             draft_plan=draft_plan,
             visual_plan=visual_plan,
             draft_markdown=doc.get("draft_markdown"),
             cancel_requested=doc.get("cancel_requested", False),
+            # Checkpointing
+            request=doc.get("request"),
+            checkpoint=GenerationCheckpoint(doc["checkpoint"]) if doc.get("checkpoint") else None,
+            resume_count=doc.get("resume_count", 0),
             error=doc.get("error"),
             error_code=doc.get("error_code"),
             # Evidence Map fields (Spec 009)
             evidence_map=doc.get("evidence_map"),
             content_mode=content_mode,
             constraint_warnings=doc.get("constraint_warnings", []),
+            # LLM usage rollup
+            total_prompt_tokens=doc.get("total_prompt_tokens", 0),
+            total_completion_tokens=doc.get("total_completion_tokens", 0),
+            llm_usage=doc.get("llm_usage", []),
+            timings=doc.get("timings", []),
         )
 
     async def create_job(self, project_id: Optional[str] = None) -> str:
@@ -382,23 +440,7 @@ class MongoJobStore(BaseJobStore):
             return None
 
         job = self._doc_to_job(doc)
-
-        # Apply updates
-        for key, value in updates.items():
-            if hasattr(job, key):
-                setattr(job, key, value)
-            else:
-                logger.warning(f"Unknown field {key} for job update")
-
-        # Auto-set timestamps
-        if updates.get("status") == JobStatus.planning and not job.started_at:
-            job.started_at = datetime.now(timezone.utc)
-        if updates.get("status") in (
-            JobStatus.completed,
-            JobStatus.cancelled,
-            JobStatus.failed,
-        ):
-            job.completed_at = datetime.now(timezone.utc)
+        _apply_updates(job, updates)
 
         # Save back to MongoDB
         new_doc = self._job_to_doc(job)
@@ -406,6 +448,34 @@ class MongoJobStore(BaseJobStore):
 
         return job
 
+    async def claim_job(
+        self,
+        job_id: str,
+        expected_status: JobStatus,
+        expected_resume_count: int,
+        **updates,
+    ) -> Optional[GenerationJob]:
+        """Update a job only if its status and resume count are unchanged.
+
+        The replace is filtered on both fields, so of several processes
+        claiming the same job only one matches.
+        """
+        collection = await self._get_collection()
+        expected = {
+            "job_id": job_id,
+            "status": expected_status.value,
+            # Jobs stored before resume_count existed have no such field
+            "resume_count": expected_resume_count or {"$in": [0, None]},
+        }
+        doc = await collection.find_one(expected)
+        if not doc:
+            return None
+
+        job = self._doc_to_job(doc)
+        _apply_updates(job, updates)
+        result = await collection.replace_one(expected, self._job_to_doc(job))
+        return job if result.matched_count else None
+
     async def delete_job(self, job_id: str) -> bool:
         """Delete a job from MongoDB."""
         collection = await self._get_collection()
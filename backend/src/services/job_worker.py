@@ -0,0 +1,217 @@
+"""Worker that runs queued background jobs.
+
+Workers claim tasks from the work queue (see work_queue), run the matching
+job handler and heartbeat the lease while it runs. Start any number of
+them, on any number of machines, with scripts/run_worker.py. API nodes set
+JOB_QUEUE_ENABLED=true and only enqueue.
+
+If a worker loses its lease (e.g. it stalled past the visibility timeout and
+another worker reclaimed the task), it cancels its copy of the job. If a
+handler raises, the task is retried after a delay. When a task runs out of
+attempts, its job is marked failed so clients stop polling.
+
+Configuration (env vars):
+- JOB_WORKER_CONCURRENCY: Jobs run concurrently per worker (default: 2)
+- JOB_QUEUE_POLL_SECONDS: Idle wait between claim attempts (default: 2)
+- JOB_QUEUE_HEARTBEAT_SECONDS: Lease renewal interval (default: 15)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import socket
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Optional
+from uuid import uuid4
+
+from .work_queue import BaseWorkQueue, QueuedTask, TaskKind, TaskStatus, get_work_queue
+
+logger = logging.getLogger(__name__)
+
+JOB_WORKER_CONCURRENCY = int(os.environ.get("JOB_WORKER_CONCURRENCY", "2"))
+JOB_QUEUE_POLL_SECONDS = float(os.environ.get("JOB_QUEUE_POLL_SECONDS", "2"))
+JOB_QUEUE_HEARTBEAT_SECONDS = float(os.environ.get("JOB_QUEUE_HEARTBEAT_SECONDS", "15"))
+
+# Error code set on jobs whose task ran out of attempts
+WORKER_FAILED_ERROR_CODE = "WORKER_FAILED"
+
+
+@dataclass
+class JobHandler:
+    """How to run a kind of job, and how to fail it for good."""
+
+    run: Callable[[str, dict], Awaitable[None]]
+    mark_failed: Callable[[str, str], Awaitable[None]]
+
+
+async def _run_draft(job_id: str, payload: dict) -> None:
+    from .draft_service import run_generation_job
+    await run_generation_job(job_id, payload["request"])
+
+
+async def _fail_draft(job_id: str, error: str) -> None:
+    from src.models import JobStatus
+
+    from .job_store import update_job
+    await update_job(job_id, status=JobStatus.failed, error=error, error_code=WORKER_FAILED_ERROR_CODE)
+
+
+async def _run_qa(job_id: str, payload: dict) -> None:
+    from src.api.routes.qa import run_qa_analysis
+    await run_qa_analysis(job_id, payload["project_id"])
+
+
+async def _fail_qa(job_id: str, error: str) -> None:
+    from src.models import QAJobStatus
+
+    from .qa_job_store import update_qa_job
+    await update_qa_job(job_id, status=QAJobStatus.failed, error=error, error_code=WORKER_FAILED_ERROR_CODE)
+
+
+async def _run_pdf_export(job_id: str, payload: dict) -> None:
+    from .pdf_generator import run_pdf_export_job
+    await run_pdf_export_job(job_id, payload["project_id"])
+
+
+async def _run_epub_export(job_id: str, payload: dict) -> None:
+    from .epub_generator import run_epub_export_job
+    await run_epub_export_job(job_id, payload["project_id"])
+
+
+async def _fail_export(job_id: str, error: str) -> None:
+    from src.models import ExportJobStatus
+
+    from .export_job_store import update_export_job
+    await update_export_job(job_id, status=ExportJobStatus.failed, error_message=error)
+
+
+async def _run_themes(job_id: str, payload: dict) -> None:
+    from src.api.routes.themes import run_theme_proposal
+    await run_theme_proposal(job_id, payload["project_id"])
+
+
+async def _fail_themes(job_id: str, error: str) -> None:
+    from src.models.theme_job import ThemeJobStatus
+
+    from .theme_job_store import get_theme_job_store
+    await get_theme_job_store().update_job(job_id, status=ThemeJobStatus.FAILED, error=error)
+
+
+def default_handlers() -> dict[TaskKind, JobHandler]:
+    """Handlers for every job kind the API enqueues."""
+    return {
+        TaskKind.draft: JobHandler(_run_draft, _fail_draft),
+        TaskKind.qa: JobHandler(_run_qa, _fail_qa),
+        TaskKind.pdf_export: JobHandler(_run_pdf_export, _fail_export),
+        TaskKind.epub_export: JobHandler(_run_epub_export, _fail_export),
+        TaskKind.themes: JobHandler(_run_themes, _fail_themes),
+    }
+
+
+class Worker:
+    """Claims and runs queued jobs."""
+
+    def __init__(
+        self,
+        queue: Optional[BaseWorkQueue] = None,
+        handlers: Optional[dict[TaskKind, JobHandler]] = None,
+        worker_id: Optional[str] = None,
+        concurrency: int = JOB_WORKER_CONCURRENCY,
+        poll_seconds: float = JOB_QUEUE_POLL_SECONDS,
+        heartbeat_seconds: float = JOB_QUEUE_HEARTBEAT_SECONDS,
+    ):
+        """Initialize worker.
+
+        Args:
+            queue: Work queue. Defaults to the process-wide queue.
+            handlers: Handlers by job kind. Only these kinds are claimed.
+            worker_id: Lease owner identifier. Defaults to host:pid:random.
+            concurrency: Jobs run concurrently.
+            poll_seconds: Idle wait between claim attempts.
+            heartbeat_seconds: Lease renewal interval. Keep well below the
+                queue's lease_seconds.
+        """
+        self.queue = queue or get_work_queue()
+        self.handlers = handlers if handlers is not None else default_handlers()
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+        self.concurrency = max(1, concurrency)
+        self.poll_seconds = poll_seconds
+        self.heartbeat_seconds = heartbeat_seconds
+
+    async def run_once(self) -> bool:
+        """Claim and run one task.
+
+        Returns:
+            True if a task was run, False if none was available.
+        """
+        task = await self.queue.claim(self.worker_id, kinds=list(self.handlers))
+        if task is None:
+            return False
+        await self._execute(task)
+        return True
+
+    async def run(self, stop: asyncio.Event) -> None:
+        """Run jobs until stop is set, then finish the jobs in flight."""
+        logger.info(f"Worker {self.worker_id} started (concurrency={self.concurrency})")
+        running: set[asyncio.Task] = set()
+        while not stop.is_set():
+            await self._reap_expired()
+            while len(running) < self.concurrency:
+                task = await self.queue.claim(self.worker_id, kinds=list(self.handlers))
+                if task is None:
+                    break
+                job = asyncio.create_task(self._execute(task), name=f"worker_{task.kind.value}_{task.job_id}")
+                running.add(job)
+                job.add_done_callback(running.discard)
+
+            # Wake on stop, on a finished job (free slot), or after the poll interval
+            waiters = {asyncio.create_task(stop.wait()), *running}
+            await asyncio.wait(waiters, timeout=self.poll_seconds, return_when=asyncio.FIRST_COMPLETED)
+            for waiter in waiters - running:
+                waiter.cancel()
+
+        if running:
+            logger.info(f"Worker {self.worker_id} draining {len(running)} job(s)")
+            await asyncio.gather(*running, return_exceptions=True)
+        logger.info(f"Worker {self.worker_id} stopped")
+
+    async def _reap_expired(self) -> None:
+        """Fail jobs whose tasks ran out of attempts on lost leases."""
+        try:
+            for task in await self.queue.reap_expired():
+                logger.error(f"Task {task.task_id} ({task.kind.value} job {task.job_id}) ran out of attempts")
+                handler = self.handlers.get(task.kind)
+                if handler:
+                    await handler.mark_failed(task.job_id, "Job was interrupted too many times")
+        except Exception as e:
+            logger.error(f"Error reaping expired tasks: {e}")
+
+    async def _execute(self, task: QueuedTask) -> None:
+        """Run one claimed task while heartbeating its lease."""
+        handler = self.handlers[task.kind]
+        logger.info(f"Worker {self.worker_id}: running {task.kind.value} job {task.job_id} (attempt {task.attempts})")
+        work = asyncio.create_task(handler.run(task.job_id, task.payload))
+        try:
+            while not work.done():
+                await asyncio.wait({work}, timeout=self.heartbeat_seconds)
+                if not work.done() and not await self.queue.heartbeat(task.task_id, self.worker_id):
+                    logger.warning(f"Worker {self.worker_id}: lost lease on job {task.job_id}, cancelling")
+                    work.cancel()
+                    await asyncio.gather(work, return_exceptions=True)
+                    return
+            work.result()
+        except asyncio.CancelledError:
+            # Worker shutdown: leave the lease to expire so another worker retries
+            work.cancel()
+            raise
+        except Exception as e:
+            logger.exception(f"Worker {self.worker_id}: {task.kind.value} job {task.job_id} raised")
+            error = str(e)[:500]
+            if await self.queue.fail(task, self.worker_id, error) == TaskStatus.dead:
+                await handler.mark_failed(task.job_id, error)
+            return
+
+        await self.queue.complete(task.task_id, self.worker_id)
@@ -0,0 +1,451 @@
+"""Registered post-processing passes over an assembled draft.
+
+Post-processing is a list of PassSpec entries run in order by a PassEngine.
+Each spec declares its scope:
+
+- document: `run(markdown) -> (markdown, report)` on the whole draft.
+- chapter: `run(chapter_markdown, chapter_index=...) -> (markdown, report)`,
+  called once per `## Chapter N` section (chapter_index is 0-based). The
+  chapter reports are merged (counts summed, lists concatenated). Drafts
+  without chapter headings are passed whole with chapter_index 0.
+- paragraph: `run(document) -> (document, report)` on a DraftDocument.
+  Consecutive paragraph passes share one parsed document, and the draft
+  is only serialized when a document or chapter pass needs the markdown.
+
+A pass that fails is logged and skipped; the draft keeps its previous text.
+Report hooks (`on_report`) turn a report into log lines and constraint
+warnings on the shared PassReportSink. The engine hands new warnings to
+its `on_warnings` callback after each pass.
+
+Fingerprints: a pass whose key appears more than once in the pipeline
+(the same pass re-run with the same inputs) remembers a hash of the draft
+it last saw and of the draft it produced. Its next run is skipped when the
+draft is unchanged since then:
+- the input matches the last input: passes are deterministic, so the last
+  output is reused;
+- the input matches the last output and the spec is `idempotent`: running
+  the pass again would change nothing.
+
+Every pass that runs is timed into the bound TimingTrace under its name
+(see stage_timing.pass_timing); skipped passes cost one hash lookup.
+
+Executor: given an executor (see pass_pool), passes run off the event loop.
+Chapter passes are submitted once per chapter and paragraph passes once per
+chapter's paragraphs (plus the preamble), and the results are put back
+together in the parent; document passes are submitted whole. Fingerprints,
+report hooks and warnings stay in the parent. A pass whose `run` cannot be
+pickled runs inline. If the pool breaks (a worker was killed) the pool is
+discarded and the pass and the rest of the pipeline run inline: a broken
+pool never counts as a pass failure, so enforcement is never skipped. Pass
+wall time then covers the wait for the workers, and each worker call
+measures its own CPU time, which is added to the pass's timing entry.
+"""
+
+import asyncio
+import hashlib
+import logging
+import pickle
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable, Iterable
+from concurrent.futures import BrokenExecutor, Executor
+from dataclasses import asdict, dataclass
+from enum import Enum
+from functools import partial
+from itertools import pairwise
+from typing import Any, Optional
+
+from .draft_document import DraftDocument
+from .pass_pool import discard_pass_executor
+from .stage_timing import add_pass_cpu, pass_timing
+
+logger = logging.getLogger(__name__)
+
+
+class PassScope(str, Enum):
+    """What a pass is handed."""
+    document = "document"
+    chapter = "chapter"
+    paragraph = "paragraph"
+
+
+@dataclass(frozen=True)
+class PassSpec:
+    """One registered post-processing pass."""
+
+    name: str
+    run: Callable[..., tuple[Any, dict]]
+    scope: PassScope = PassScope.document
+    # Human-readable name for log lines ("Dangling attribution gate")
+    label: str = ""
+    # Runs with the same key are the same pass with the same inputs
+    key: Optional[str] = None
+    # Running the pass on its own output changes nothing
+    idempotent: bool = False
+    on_report: Optional[Callable[[dict, "PassReportSink"], None]] = None
+
+    @property
+    def fingerprint_key(self) -> str:
+        """Key identifying identical runs of this pass."""
+        return self.key or self.name
+
+
+@dataclass
+class PassRun:
+    """Outcome of one pass in one pipeline run."""
+
+    name: str
+    scope: str
+    changed: bool = False
+    skipped: bool = False
+    failed: bool = False
+    wall_ms: float = 0.0
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary."""
+        data = asdict(self)
+        data["wall_ms"] = round(self.wall_ms, 3)
+        return data
+
+
+@dataclass
+class _PassMemo:
+    """Fingerprints of a pass's last run (output kept only if it changed)."""
+
+    input_fp: str
+    output_fp: str
+    output: Optional[str] = None
+
+
+class PassReportSink:
+    """Collects pass reports, per-pass outcomes and constraint warnings."""
+
+    def __init__(self, job_id: str = "", warnings: Optional[list[str]] = None):
+        """Initialize the sink.
+
+        Args:
+            job_id: Job identifier used to prefix log lines.
+            warnings: Constraint warning list to append to (shared with
+                the job); a new list if not given.
+        """
+        self.job_id = job_id
+        self.warnings = warnings if warnings is not None else []
+        self.reports: dict[str, dict] = {}
+        self.runs: list[PassRun] = []
+        self._flushed = len(self.warnings)
+
+    def info(self, message: str) -> None:
+        """Log at INFO with the job prefix."""
+        logger.info(f"Job {self.job_id}: {message}")
+
+    def warning(self, message: str) -> None:
+        """Log at WARNING with the job prefix."""
+        logger.warning(f"Job {self.job_id}: {message}")
+
+    def error(self, message: str) -> None:
+        """Log at ERROR with the job prefix."""
+        logger.error(f"Job {self.job_id}: {message}")
+
+    def warn(self, *messages: str) -> None:
+        """Add constraint warnings."""
+        self.warnings.extend(messages)
+
+    def take_new_warnings(self) -> bool:
+        """Whether warnings were added since the last call."""
+        added = len(self.warnings) != self._flushed
+        self._flushed = len(self.warnings)
+        return added
+
+    def summary(self) -> dict:
+        """Counts of passes run, changed, skipped and failed."""
+        return {
+            "passes": len(self.runs),
+            "changed": sum(1 for run in self.runs if run.changed),
+            "skipped": sum(1 for run in self.runs if run.skipped),
+            "failed": sum(1 for run in self.runs if run.failed),
+            "wall_ms": round(sum(run.wall_ms for run in self.runs), 3),
+        }
+
+
+def fingerprint(text: str) -> str:
+    """Content hash of a draft."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _run_paragraph_pass(
+    run: Callable[[DraftDocument], tuple[DraftDocument, dict]],
+    paragraphs: list[str],
+) -> tuple[list[str], dict]:
+    """Run a paragraph pass on a slice of a document (executor worker)."""
+    doc = DraftDocument(paragraphs)
+    result, report = run(doc)
+    if result is not doc:
+        raise TypeError("paragraph passes must edit the document in place")
+    return doc.paragraphs, report or {}
+
+
+def _timed_call(fn: Callable, args: tuple, kwargs: dict) -> tuple[Any, float]:
+    """Call fn and measure its CPU time in ms (executor worker)."""
+    cpu_start = time.thread_time()
+    result = fn(*args, **kwargs)
+    return result, (time.thread_time() - cpu_start) * 1000
+
+
+def _picklable(fn: Callable) -> bool:
+    """Whether a pass can be sent to a worker process."""
+    try:
+        pickle.dumps(fn)
+    except Exception:
+        return False
+    return True
+
+
+def merge_reports(reports: Iterable[dict]) -> dict:
+    """Merge per-chapter reports: numbers are summed, lists concatenated.
+
+    Other values keep the last chapter's value.
+    """
+    merged: dict = {}
+    for report in reports:
+        for key, value in report.items():
+            previous = merged.get(key)
+            if isinstance(value, bool) or previous is None:
+                merged[key] = list(value) if isinstance(value, list) else value
+            elif isinstance(value, (int, float)) and isinstance(previous, (int, float)):
+                merged[key] = previous + value
+            elif isinstance(value, list) and isinstance(previous, list):
+                previous.extend(value)
+            else:
+                merged[key] = value
+    return merged
+
+
+class PassEngine:
+    """Runs registered passes over a draft."""
+
+    def __init__(
+        self,
+        passes: list[PassSpec],
+        sink: Optional[PassReportSink] = None,
+        on_warnings: Optional[Callable[[list[str]], Awaitable[None]]] = None,
+        check: Optional[Callable[[str, str], object]] = None,
+        executor: Optional[Executor] = None,
+    ):
+        """Initialize the engine.
+
+        Args:
+            passes: Passes in run order.
+            sink: Report sink (a new one if not given).
+            on_warnings: Awaited with the warning list after a pass adds
+                constraint warnings.
+            check: Called with (markdown, pass name) after each pass that
+                changed the draft (e.g. a corruption detector).
+            executor: Runs the passes off the event loop (e.g. the
+                post-processing process pool); inline if not given.
+        """
+        self.passes = passes
+        self.sink = sink or PassReportSink()
+        self.on_warnings = on_warnings
+        self.check = check
+        self.executor = executor
+        self._inline: set[int] = set()
+        if executor is not None:
+            for spec in passes:
+                if not _picklable(spec.run):
+                    self._inline.add(id(spec))
+                    logger.warning(f"Pass {spec.name} cannot be pickled; running it inline")
+        counts = Counter(spec.fingerprint_key for spec in passes)
+        self._repeated = {key for key, count in counts.items() if count > 1}
+        self._memo: dict[str, _PassMemo] = {}
+        self._text: Optional[str] = None
+        self._doc: Optional[DraftDocument] = None
+        self._revision = 0
+        self._fingerprint: Optional[tuple[int, str]] = None
+
+    async def run(self, markdown: str) -> str:
+        """Run every pass in order and return the final markdown."""
+        self._text, self._doc = markdown, None
+        for spec in self.passes:
+            await self.run_pass(spec)
+        return self._markdown()
+
+    async def run_pass(self, spec: PassSpec) -> None:
+        """Run one pass on the current draft (skipped if fingerprinted)."""
+        record = PassRun(name=spec.name, scope=spec.scope.value)
+        self.sink.runs.append(record)
+
+        key = spec.fingerprint_key
+        memo = self._memo.get(key) if key in self._repeated else None
+        input_fp = self._current_fingerprint() if key in self._repeated else None
+        if memo is not None and input_fp in (memo.input_fp, memo.output_fp if spec.idempotent else None):
+            record.skipped = True
+            if input_fp == memo.input_fp and memo.output is not None:
+                self._replace_text(memo.output)
+                record.changed = True
+            return
+
+        start = time.perf_counter()
+        try:
+            with pass_timing(spec.name):
+                try:
+                    report, changed = await self._apply(spec)
+                except (BrokenExecutor, pickle.PicklingError) as e:
+                    # The pass did not run; nothing was applied to the draft
+                    self._run_inline(spec, e)
+                    report, changed = await self._apply(spec)
+            record.changed = changed
+            if input_fp is not None:
+                output_fp = self._current_fingerprint()
+                self._memo[key] = _PassMemo(
+                    input_fp=input_fp,
+                    output_fp=output_fp,
+                    output=self._markdown() if changed else None,
+                )
+            self.sink.reports[spec.name] = report
+            if changed and self.check is not None:
+                self.check(self._markdown(), spec.name)
+            if spec.on_report is not None:
+                spec.on_report(report, self.sink)
+        except Exception as e:
+            record.failed = True
+            logger.error(
+                f"Job {self.sink.job_id}: {spec.label or spec.name} failed (non-fatal): {e}",
+                exc_info=True,
+            )
+        finally:
+            record.wall_ms = (time.perf_counter() - start) * 1000
+            if self.sink.take_new_warnings() and self.on_warnings is not None:
+                await self.on_warnings(self.sink.warnings)
+
+    async def _apply(self, spec: PassSpec) -> tuple[dict, bool]:
+        """Run the pass for its scope; returns (report, changed)."""
+        if spec.scope == PassScope.paragraph:
+            doc = self._document()
+            if self._offloaded(spec):
+                paragraphs, report = await self._run_paragraphs(spec, doc)
+                changed = paragraphs != doc.paragraphs
+                if changed:
+                    doc.set_paragraphs(paragraphs)
+                    self._text = None
+                    self._revision += 1
+                return report, changed
+            version = doc.version
+            try:
+                result, report = spec.run(doc)
+            finally:
+                # Document passes edit in place, even if they fail afterwards
+                changed = doc.version != version
+                if changed:
+                    self._text = None
+                    self._revision += 1
+            if result is not doc:
+                raise TypeError(f"paragraph pass {spec.name} must edit the document in place")
+            return report or {}, changed
+
+        text = self._markdown()
+        if spec.scope == PassScope.chapter:
+            result, report = await self._run_chapters(spec, text)
+        else:
+            result, report = await self._call(spec, spec.run, text)
+        changed = result != text
+        if changed:
+            self._replace_text(result)
+        return report or {}, changed
+
+    async def _run_chapters(self, spec: PassSpec, text: str) -> tuple[str, dict]:
+        """Run a chapter pass on each chapter and merge the reports."""
+        doc = DraftDocument.parse(text, chapter_breaks=True)
+        chapters = doc.chapters()
+        if not chapters:
+            return await self._call(spec, spec.run, text, chapter_index=0)
+        if self._offloaded(spec):
+            results = await self._gather(
+                self._call(spec, spec.run, doc.chapter_text(chapter), chapter_index=chapter.number - 1)
+                for chapter in chapters
+            )
+        else:
+            results = [
+                spec.run(doc.chapter_text(chapter), chapter_index=chapter.number - 1)
+                for chapter in chapters
+            ]
+        outputs = iter(results)
+        doc.map_chapters(lambda chapter, chapter_text: next(outputs)[0])
+        return doc.to_markdown(), merge_reports(report or {} for _, report in results)
+
+    async def _run_paragraphs(self, spec: PassSpec, doc: DraftDocument) -> tuple[list[str], dict]:
+        """Run a paragraph pass on the preamble and each chapter in parallel.
+
+        Sections reset at every `## ` heading, so each chapter's paragraphs
+        are classified the same on their own as in the whole draft.
+        """
+        paragraphs = doc.paragraphs
+        bounds = [0] + [chapter.first for chapter in doc.chapters()] + [len(paragraphs)]
+        slices = [paragraphs[start:end] for start, end in pairwise(bounds) if end > start]
+        results = await self._gather(
+            self._call(spec, _run_paragraph_pass, spec.run, part) for part in slices
+        )
+        return [p for part, _ in results for p in part], merge_reports(report for _, report in results)
+
+    @staticmethod
+    async def _gather(calls: Iterable[Awaitable]) -> list:
+        """Wait for every call, then raise the first failure (if any)."""
+        results = await asyncio.gather(*calls, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
+
+    def _run_inline(self, spec: PassSpec, error: Exception) -> None:
+        """Stop offloading after an executor error so the pass can be re-run.
+
+        A pass that cannot be pickled runs inline from now on; a broken pool
+        is discarded and the rest of the pipeline runs inline.
+        """
+        if isinstance(error, BrokenExecutor):
+            logger.error(
+                f"Job {self.sink.job_id}: post-processing pool broke during {spec.name} ({error}); "
+                f"running the remaining passes inline"
+            )
+            executor, self.executor = self.executor, None
+            discard_pass_executor(executor)
+        else:
+            logger.warning(
+                f"Job {self.sink.job_id}: {spec.name} could not be sent to the pool ({error}); running it inline"
+            )
+            self._inline.add(id(spec))
+
+    def _offloaded(self, spec: PassSpec) -> bool:
+        """Whether the pass runs in the executor."""
+        return self.executor is not None and id(spec) not in self._inline
+
+    async def _call(self, spec: PassSpec, fn: Callable, *args, **kwargs):
+        """Call fn in the executor if the pass is offloaded, else inline."""
+        if not self._offloaded(spec):
+            return fn(*args, **kwargs)
+        loop = asyncio.get_running_loop()
+        result, cpu_ms = await loop.run_in_executor(self.executor, partial(_timed_call, fn, args, kwargs))
+        add_pass_cpu(cpu_ms)
+        return result
+
+    def _markdown(self) -> str:
+        """Current draft as markdown (serializes the document if needed)."""
+        if self._text is None:
+            self._text = self._doc.to_markdown()
+        return self._text
+
+    def _document(self) -> DraftDocument:
+        """Current draft as a parsed document (parses if needed)."""
+        if self._doc is None:
+            self._doc = DraftDocument.parse(self._markdown())
+        return self._doc
+
+    def _replace_text(self, text: str) -> None:
+        """Set new markdown; the parsed document is rebuilt on demand."""
+        self._text, self._doc = text, None
+        self._revision += 1
+
+    def _current_fingerprint(self) -> str:
+        """Fingerprint of the current draft, cached per revision."""
+        if self._fingerprint is None or self._fingerprint[0] != self._revision:
+            self._fingerprint = (self._revision, fingerprint(self._markdown()))
+        return self._fingerprint[1]
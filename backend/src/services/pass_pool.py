@@ -0,0 +1,69 @@
+"""Process pool for CPU-bound draft post-processing passes.
+
+The deterministic enforcement passes are pure CPU work on the assembled
+draft. Run on the event loop, a long pipeline over a large draft stalls
+every other request and job progress update in the process. With workers
+enabled the PassEngine submits its passes to this pool instead: chapter
+and paragraph passes are split per chapter and run in parallel, document
+passes run whole in a worker. The event loop only waits on the futures.
+
+Workers are started with the "spawn" method, since forking a process that
+runs an event loop and driver threads is unsafe. Each worker imports the
+pass modules once, on its first task.
+
+Configuration (env vars):
+- DRAFT_POSTPROCESS_WORKERS: Worker processes for post-processing passes;
+  0 runs the passes on the event loop (default: 0)
+"""
+
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+DRAFT_POSTPROCESS_WORKERS = int(os.environ.get("DRAFT_POSTPROCESS_WORKERS", "0"))
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def get_pass_executor() -> Optional[ProcessPoolExecutor]:
+    """Get the shared post-processing pool, starting it on first use.
+
+    Returns:
+        The process pool, or None when DRAFT_POSTPROCESS_WORKERS is 0.
+    """
+    global _executor
+    if DRAFT_POSTPROCESS_WORKERS <= 0:
+        return None
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=DRAFT_POSTPROCESS_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        logger.info(f"Started post-processing pool with {DRAFT_POSTPROCESS_WORKERS} workers")
+    return _executor
+
+
+def discard_pass_executor(executor: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next job starts a fresh one.
+
+    Args:
+        executor: The pool that broke. It is shut down, and cleared if it
+            is still the shared pool.
+    """
+    global _executor
+    if executor is _executor:
+        _executor = None
+        logger.warning("Post-processing pool is broken; a new pool is started for the next job")
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_pass_executor() -> None:
+    """Stop the post-processing pool (if started), cancelling queued passes."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
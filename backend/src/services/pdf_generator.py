@@ -61,6 +61,8 @@ from src.services.export_job_store import (
     update_export_job,
 )
 from src.services.project_service import get_project
+from src.services.job_scheduler import JobKind, SchedulerFullError, get_job_scheduler
+from src.services.work_queue import TaskKind, enqueue_job, job_queue_enabled
 
 logger = logging.getLogger(__name__)
 
@@ -278,7 +280,8 @@ class PdfGenerator:
 async def start_pdf_export(project_id: str) -> str:
     """Start PDF export for a project.
 
-    Creates an export job and starts background generation.
+    Creates an export job and schedules background generation (or enqueues
+    it for a worker when the job queue is enabled).
 
     Args:
         project_id: The project to export.
@@ -288,6 +291,7 @@ async def start_pdf_export(project_id: str) -> str:
 
     Raises:
         ValueError: If project not found or has no draft content.
+        SchedulerFullError: If too many exports are already waiting.
     """
     # Validate project exists and has content
     project = await get_project(project_id)
@@ -309,15 +313,31 @@ async def start_pdf_export(project_id: str) -> str:
 
     logger.info(f"Starting PDF export job {job_id} for project {project_id}")
 
-    # Start background task
-    asyncio.create_task(
-        _pdf_export_task(job_id, project),
-        name=f"pdf_export_{job_id}",
-    )
+    if job_queue_enabled():
+        await enqueue_job(TaskKind.pdf_export, job_id, {"project_id": project_id})
+        return job_id
+
+    # Start background task once an export slot is free
+    try:
+        get_job_scheduler().submit(JobKind.export, job_id, lambda: _pdf_export_task(job_id, project))
+    except SchedulerFullError:
+        await store.delete_job(job_id)
+        raise
 
     return job_id
 
 
+async def run_pdf_export_job(job_id: str, project_id: str) -> None:
+    """Run a queued PDF export in a worker process.
+
+    Args:
+        job_id: The export job ID.
+        project_id: The project to export.
+    """
+    project = await get_project(project_id)
+    await _pdf_export_task(job_id, project)
+
+
 async def _pdf_export_task(job_id: str, project: Project) -> None:
     """Background task for PDF generation.
 
@@ -15,6 +15,7 @@ from src.models.project import (
     WebinarType,
 )
 from src.services.normalization import normalize_project_data
+from src.services.stage_cache import get_stage_cache
 
 COLLECTION_NAME = "projects"
 
@@ -265,4 +266,9 @@ async def delete_project(project_id: str) -> bool:
     file_service.cleanup_project_files(project_id)
 
     await collection.delete_one({"_id": object_id})
+
+    # Cached plan/evidence stages are keyed by project
+    stage_cache = get_stage_cache()
+    if stage_cache is not None:
+        await stage_cache.invalidate(project_id)
     return True
@@ -8,11 +8,15 @@ Contains system and user prompts for:
 from __future__ import annotations
 
 import json
+from collections.abc import Sequence
 from typing import Any, Optional
 
 from typing import List
+from src.llm import ChatMessage
 from src.models import ChapterPlan, StyleConfig, StyleConfigEnvelope, TranscriptSegment
 
+from .transcript_retrieval import retrieve_transcript_segments
+
 
 # ==============================================================================
 # DraftPlan Prompts
@@ -181,7 +185,7 @@ def build_visual_opportunity_user_prompt(
 
 def build_chapter_system_prompt(
     book_title: str,
-    chapter_number: int,
+    chapter_number: Optional[int],
     style_config: dict,
     words_per_chapter_target: int = 625,
     detail_level: str = "balanced",
@@ -190,7 +194,9 @@ def build_chapter_system_prompt(
 
     Args:
         book_title: Title of the ebook.
-        chapter_number: 1-based chapter number.
+        chapter_number: 1-based chapter number, or None to leave it to the
+            user prompt so the system prompt is identical for every chapter
+            (and can be served from the provider's prompt cache).
         style_config: StyleConfig dict (unwrapped from envelope).
         words_per_chapter_target: Target word count for this chapter.
         detail_level: Detail level (concise/balanced/detailed).
@@ -219,8 +225,18 @@ def build_chapter_system_prompt(
     }
     detail_instruction = detail_guidance.get(detail_level, detail_guidance["balanced"])
 
+    if chapter_number is None:
+        intro = (
+            f'You are writing a chapter of an ebook titled "{book_title}". '
+            "The chapter number and title are given in the instructions."
+        )
+        heading = "- Chapter heading: ## Chapter [Number]: [Title]"
+    else:
+        intro = f'You are writing chapter {chapter_number} of an ebook titled "{book_title}".'
+        heading = f"- Chapter heading: ## Chapter {chapter_number}: [Title]"
+
     lines = [
-        f'You are writing chapter {chapter_number} of an ebook titled "{book_title}".',
+        intro,
         "",
         "Length and detail:",
         f"- Target length: approximately {words_per_chapter_target} words for this chapter",
@@ -234,7 +250,7 @@ def build_chapter_system_prompt(
         f"- Reading level: {reading_level}",
         "",
         "Structure guidelines:",
-        f"- Chapter heading: ## Chapter {chapter_number}: [Title]",
+        heading,
         "- Use ### for sections, #### for subsections (no deeper)",
     ]
 
@@ -303,6 +319,7 @@ def build_chapter_user_prompt(
     transcript_segment: str,
     previous_chapter_ending: Optional[str] = None,
     next_chapter_preview: Optional[tuple[str, list[str]]] = None,
+    source_in_context: bool = False,
 ) -> str:
     """Build user prompt for chapter generation.
 
@@ -311,6 +328,9 @@ def build_chapter_user_prompt(
         transcript_segment: The mapped transcript text for this chapter.
         previous_chapter_ending: Last 2 paragraphs of previous chapter (for continuity).
         next_chapter_preview: Tuple of (title, first_points) for next chapter (for setup).
+        source_in_context: The transcript was already sent as a shared source
+            message (see build_prefix_cached_messages), so refer to it instead
+            of repeating it.
 
     Returns:
         Formatted user prompt string.
@@ -336,11 +356,9 @@ def build_chapter_user_prompt(
     else:
         parts.append("- Extract and organize the main ideas from the transcript")
 
-    parts.extend([
-        "",
-        "## Source Material (Transcript Segment)",
-        f"```\n{transcript_segment}\n```",
-    ])
+    parts.extend([""] + _source_material_lines(
+        "## Source Material (Transcript Segment)", transcript_segment, source_in_context,
+    ))
 
     if previous_chapter_ending:
         parts.extend([
@@ -368,25 +386,87 @@ def build_chapter_user_prompt(
     return "\n".join(parts)
 
 
+def _source_material_lines(heading: str, transcript_segment: str, source_in_context: bool) -> list[str]:
+    """Build the source material block of a user prompt."""
+    if source_in_context:
+        return [heading, "Use the source transcript provided above."]
+    return [heading, f"```\n{transcript_segment}\n```"]
+
+
+def build_shared_source_prompt(transcript: str) -> str:
+    """Build the shared source message sent ahead of per-chapter instructions.
+
+    Args:
+        transcript: Transcript text shared by every chapter call of a job.
+
+    Returns:
+        Formatted source message.
+    """
+    return f"## Source Transcript\n```\n{transcript}\n```"
+
+
+def build_prefix_cached_messages(
+    system_prompt: str,
+    user_prompt: str,
+    shared_source: Optional[str] = None,
+) -> list[ChatMessage]:
+    """Order chat messages so stable content forms a cacheable prompt prefix.
+
+    Layout: system prompt, then the shared source transcript (if any), then
+    the per-call user prompt. The stable messages carry cache breakpoints, so
+    providers with prompt caching only process them once across a job's
+    chapter calls; only the trailing user prompt differs between calls.
+
+    Args:
+        system_prompt: System prompt, identical across the job's calls.
+        user_prompt: Call-specific instructions.
+        shared_source: Transcript text shared across calls. Only pass this
+            when the same text is sent for several calls (e.g. chapters with
+            no mapped segments); unique text gains nothing from caching.
+
+    Returns:
+        Chat messages for an LLMRequest.
+    """
+    messages = [ChatMessage(role="system", content=system_prompt, cache_breakpoint=True)]
+    if shared_source:
+        messages.append(ChatMessage(
+            role="user",
+            content=build_shared_source_prompt(shared_source),
+            cache_breakpoint=True,
+        ))
+    messages.append(ChatMessage(role="user", content=user_prompt))
+    return messages
+
+
 def extract_transcript_segment(
     transcript: str,
     chapter_plan: ChapterPlan,
+    extra_query: Sequence[str] = (),
 ) -> str:
     """Extract the transcript segment for a chapter.
 
+    Chapters without mapped segments get the spans most relevant to their
+    title, goals and key points (see transcript_retrieval). Short transcripts,
+    and chapters that match nothing, get the entire transcript.
+
     Args:
         transcript: Full transcript text.
         chapter_plan: The chapter plan with transcript_segments.
+        extra_query: Additional retrieval query text (e.g. evidence claims).
 
     Returns:
         The concatenated transcript text for this chapter.
     """
-    if not chapter_plan.transcript_segments:
-        # Fallback: use entire transcript (not ideal)
+    mapped = chapter_plan.transcript_segments
+    if not mapped:
+        query = [chapter_plan.title, *chapter_plan.goals, *chapter_plan.key_points, *extra_query]
+        mapped = retrieve_transcript_segments(transcript, query)
+    if not mapped:
+        # Fallback: use entire transcript
         return transcript
 
     segments = []
-    for seg in chapter_plan.transcript_segments:
+    for seg in mapped:
         start = max(0, seg.start_char)
         end = min(len(transcript), seg.end_char)
         if start < end:
@@ -450,6 +530,36 @@ def get_next_chapter_preview(
     return (next_chapter.title, next_chapter.key_points[:3])
 
 
+def get_previous_chapter_plan_ending(
+    chapters: list[ChapterPlan],
+    current_index: int,
+) -> Optional[str]:
+    """Describe the previous chapter from its plan for continuity.
+
+    Used when chapters are generated in parallel and the previous chapter's
+    text is not available yet, so continuity comes from the DraftPlan instead.
+
+    Args:
+        chapters: All chapter plans.
+        current_index: 0-based index of current chapter.
+
+    Returns:
+        Short description of the previous chapter, or None for the first chapter.
+    """
+    previous_index = current_index - 1
+    if previous_index < 0 or previous_index >= len(chapters):
+        return None
+
+    previous_chapter = chapters[previous_index]
+    lines = [f'Previous chapter: "{previous_chapter.title}"']
+    if previous_chapter.key_points:
+        lines.append(f"Topics covered: {', '.join(previous_chapter.key_points[:3])}")
+    if previous_chapter.goals:
+        lines.append(f"Goals: {', '.join(previous_chapter.goals[:2])}")
+
+    return "\n".join(lines)
+
+
 # ==============================================================================
 # Outline-Driven Chapter Structure
 # ==============================================================================
@@ -984,6 +1094,7 @@ def build_claim_extraction_prompt(
     chapter_title: str,
     transcript_segment: str,
     content_mode: str = "interview",
+    source_in_context: bool = False,
 ) -> str:
     """Build user prompt for claim extraction from transcript.
 
@@ -991,6 +1102,8 @@ def build_claim_extraction_prompt(
         chapter_title: Title of the chapter being processed.
         transcript_segment: The transcript text to extract claims from.
         content_mode: Content mode (interview/essay/tutorial).
+        source_in_context: The transcript was already sent as a shared source
+            message, so refer to it instead of repeating it.
 
     Returns:
         Formatted user prompt string.
@@ -1015,16 +1128,15 @@ def build_claim_extraction_prompt(
     }
 
     guidance = mode_guidance.get(content_mode, mode_guidance["interview"])
+    source = "\n".join(_source_material_lines("## Transcript Segment", transcript_segment, source_in_context))
 
-    return f"""## Chapter: {chapter_title}
-
-## Content Mode: {content_mode}
+    # Stable content first, chapter-specific content last (prompt-cache friendly)
+    return f"""## Content Mode: {content_mode}
 {guidance}
 
-## Transcript Segment
-```
-{transcript_segment}
-```
+{source}
+
+## Chapter: {chapter_title}
 
 ## Instructions
 Extract all supportable claims from this transcript segment. For each claim:
@@ -1216,9 +1328,13 @@ def get_content_mode_prompt(content_mode: str) -> str:
 # Evidence-Grounded Chapter Generation (Spec 009)
 # ==============================================================================
 
+# Transcript reference included with evidence-grounded chapter prompts
+GROUNDED_TRANSCRIPT_REFERENCE_CHARS = 5000
+
+
 def build_grounded_chapter_system_prompt(
     book_title: str,
-    chapter_number: int,
+    chapter_number: Optional[int],
     style_config: dict,
     words_per_chapter_target: int = 625,
     detail_level: str = "balanced",
@@ -1231,7 +1347,8 @@ def build_grounded_chapter_system_prompt(
 
     Args:
         book_title: Title of the ebook.
-        chapter_number: 1-based chapter number.
+        chapter_number: 1-based chapter number, or None for a chapter-agnostic
+            (cacheable) prompt.
         style_config: StyleConfig dict (unwrapped from envelope).
         words_per_chapter_target: Target word count for this chapter.
         detail_level: Detail level (concise/balanced/detailed).
@@ -1284,6 +1401,7 @@ def build_grounded_chapter_user_prompt(
     transcript_segment: str,
     previous_chapter_ending: Optional[str] = None,
     next_chapter_preview: Optional[tuple[str, list[str]]] = None,
+    source_in_context: bool = False,
 ) -> str:
     """Build user prompt for evidence-grounded chapter generation.
 
@@ -1294,6 +1412,8 @@ def build_grounded_chapter_user_prompt(
         transcript_segment: The mapped transcript text.
         previous_chapter_ending: Last paragraphs of previous chapter.
         next_chapter_preview: Tuple of (title, first_points) for next chapter.
+        source_in_context: The transcript reference was already sent as a
+            shared source message, so refer to it instead of repeating it.
 
     Returns:
         Formatted user prompt string.
@@ -1322,11 +1442,11 @@ def build_grounded_chapter_user_prompt(
             priority = item.get('priority', 'important')
             parts.append(f"- [{priority.upper()}] {item.get('point', '')}")
 
-    parts.extend([
-        "",
+    parts.extend([""] + _source_material_lines(
         "## Raw Transcript Segment (for reference)",
-        f"```\n{transcript_segment[:5000]}\n```",  # Truncate if very long
-    ])
+        transcript_segment[:GROUNDED_TRANSCRIPT_REFERENCE_CHARS],  # Truncate if very long
+        source_in_context,
+    ))
 
     if previous_chapter_ending:
         parts.extend([
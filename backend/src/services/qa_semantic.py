@@ -14,7 +14,7 @@ import logging
 from dataclasses import dataclass
 from typing import Optional
 
-from src.llm import LLMClient, LLMRequest, ChatMessage
+from src.llm import LLMRequest, ChatMessage, get_llm_client, llm_stage
 from src.models.qa_report import QAIssue, IssueSeverity, IssueType
 
 logger = logging.getLogger(__name__)
@@ -197,7 +197,7 @@ async def analyze_faithfulness(
 
     try:
         import json
-        client = LLMClient()
+        client = get_llm_client()
         request = LLMRequest(
             model="gpt-4o-mini",
             messages=[
@@ -210,7 +210,8 @@ async def analyze_faithfulness(
             temperature=0.3,  # Low temperature for consistency
             max_tokens=2000,
         )
-        response = await client.generate(request)
+        with llm_stage("qa_faithfulness"):
+            response = await client.generate(request)
         data = json.loads(response.text)
 
         score = max(1, min(100, data.get("score", 80)))
@@ -278,7 +279,7 @@ async def analyze_clarity_semantic(draft: str) -> ClarityResult:
 
     try:
         import json
-        client = LLMClient()
+        client = get_llm_client()
         request = LLMRequest(
             model="gpt-4o-mini",
             messages=[
@@ -288,7 +289,8 @@ async def analyze_clarity_semantic(draft: str) -> ClarityResult:
             temperature=0.3,
             max_tokens=2000,
         )
-        response = await client.generate(request)
+        with llm_stage("qa_clarity"):
+            response = await client.generate(request)
         data = json.loads(response.text)
 
         score = max(1, min(100, data.get("score", 80)))
@@ -345,7 +347,7 @@ async def analyze_completeness(
 
     try:
         import json
-        client = LLMClient()
+        client = get_llm_client()
         request = LLMRequest(
             model="gpt-4o-mini",
             messages=[
@@ -358,7 +360,8 @@ async def analyze_completeness(
             temperature=0.3,
             max_tokens=2000,
         )
-        response = await client.generate(request)
+        with llm_stage("qa_completeness"):
+            response = await client.generate(request)
         data = json.loads(response.text)
 
         score = max(1, min(100, data.get("score", 80)))
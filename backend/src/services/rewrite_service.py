@@ -21,7 +21,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Optional
 
-from src.llm import LLMClient, LLMRequest, ChatMessage, ResponseFormat
+from src.llm import LLMRequest, ChatMessage, ResponseFormat, get_llm_client, llm_stage
 from src.models.evidence_map import EvidenceMap, ChapterEvidence, EvidenceEntry
 from src.models.qa_report import QAIssue, QAReport, IssueType
 from src.models.rewrite_plan import (
@@ -456,7 +456,7 @@ async def _rewrite_section(
     )
 
     # Call LLM
-    client = LLMClient()
+    client = get_llm_client()
     request = LLMRequest(
         model=REWRITE_MODEL,
         messages=[
@@ -466,7 +466,8 @@ async def _rewrite_section(
         temperature=0.3,  # Lower temperature for consistent rewrites
     )
 
-    response = await client.complete(request)
+    with llm_stage("rewrite"):
+        response = await client.complete(request)
 
     # Clean response - remove markdown code blocks if present
     rewritten = response.content.strip()
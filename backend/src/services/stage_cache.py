@@ -0,0 +1,353 @@
+"""Stage-level cache for upstream draft generation work.
+
+Generating the same project again with a tweaked downstream option (length,
+detail level, tone) used to recompute the DraftPlan, the Evidence Map (one
+LLM call per chapter) and the quote whitelist from scratch. Those stages
+only depend on the transcript, the outline and a few style fields, so their
+outputs are cached under a key built from exactly those inputs.
+
+Invalidation rules:
+- A stage key hashes every input that can change the stage's output: the
+  exact transcript text, the outline (or the chapters derived from it), the
+  style fields the stage reads, and the stage's prompt version (system
+  prompt, model and STAGE_CACHE_VERSION). Changing any of them misses.
+- Bump STAGE_CACHE_VERSION when stage logic changes in ways the prompt
+  fingerprint cannot see (outline parsing, claim post-processing).
+- Entries expire STAGE_CACHE_TTL_SECONDS after they were stored.
+- Each project keeps at most STAGE_CACHE_MAX_ENTRIES_PER_PROJECT entries;
+  the least recently used ones are evicted first.
+- invalidate(project_key) drops a project's entries (called when a project
+  is deleted).
+
+Entries are scoped by project key: the project ID when the job has one,
+otherwise the canonical transcript hash.
+
+Supports two backends:
+1. MongoDB (durable) - shared by API nodes and queue workers
+2. In-memory (fallback) - for testing or single-process use
+
+Configuration (env vars):
+- STAGE_CACHE_ENABLED: Reuse cached plan/evidence/whitelist stages (default: false)
+- STAGE_CACHE_MAX_ENTRIES_PER_PROJECT: Entries kept per project (default: 24)
+- STAGE_CACHE_TTL_SECONDS: Entry lifetime (default: 7 days)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+STAGE_CACHE_ENABLED = os.environ.get("STAGE_CACHE_ENABLED", "false").lower() == "true"
+STAGE_CACHE_MAX_ENTRIES_PER_PROJECT = int(os.environ.get("STAGE_CACHE_MAX_ENTRIES_PER_PROJECT", "24"))
+STAGE_CACHE_TTL_SECONDS = float(os.environ.get("STAGE_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+
+# Bump to invalidate every cached stage after a logic change
+STAGE_CACHE_VERSION = 1
+
+# Collection name for MongoDB storage
+STAGE_CACHE_COLLECTION = "stage_cache"
+
+
+class CachedStage(str, Enum):
+    """Draft generation stages whose outputs are cached."""
+    draft_plan = "draft_plan"
+    evidence_map = "evidence_map"
+    whitelist = "whitelist"
+
+
+def content_hash(value: Any) -> str:
+    """Compute a stable SHA-256 over a JSON-serializable value.
+
+    Strings are hashed as is; anything else as canonical JSON.
+    """
+    if isinstance(value, str):
+        payload = value
+    else:
+        payload = json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def prompt_version(*parts: Any) -> str:
+    """Fingerprint a stage's prompt inputs (system prompt, model, limits).
+
+    Args:
+        *parts: Values that change the stage's LLM calls.
+
+    Returns:
+        Short hash that also covers STAGE_CACHE_VERSION.
+    """
+    return content_hash([STAGE_CACHE_VERSION, *parts])[:16]
+
+
+def compute_stage_key(stage: CachedStage, **inputs: Any) -> str:
+    """Compute the cache key for one stage run.
+
+    Args:
+        stage: The cached stage.
+        **inputs: Every input that can change the stage's output (hashes,
+            style fields, prompt version). Values must be JSON-serializable.
+
+    Returns:
+        Hex-encoded SHA-256 key.
+    """
+    return content_hash({"stage": CachedStage(stage).value, "version": STAGE_CACHE_VERSION, **inputs})
+
+
+@dataclass
+class StageCacheStats:
+    """Counters for stage cache activity."""
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary."""
+        return asdict(self)
+
+
+class BaseStageCache(ABC):
+    """Abstract base class for stage caches.
+
+    Values are JSON-compatible (model_dump(mode="json") output); callers
+    validate them back into models.
+    """
+
+    def __init__(
+        self,
+        max_entries_per_project: int = STAGE_CACHE_MAX_ENTRIES_PER_PROJECT,
+        ttl_seconds: float = STAGE_CACHE_TTL_SECONDS,
+    ):
+        """Initialize cache.
+
+        Args:
+            max_entries_per_project: Entries kept per project before LRU eviction.
+            ttl_seconds: Entry lifetime in seconds.
+        """
+        self.max_entries_per_project = max(1, max_entries_per_project)
+        self.ttl_seconds = ttl_seconds
+        self.stats = StageCacheStats()
+
+    @abstractmethod
+    async def get(self, project_key: str, stage: CachedStage, key: str) -> Optional[Any]:
+        """Get a cached stage output, or None on a miss."""
+        pass
+
+    @abstractmethod
+    async def set(self, project_key: str, stage: CachedStage, key: str, value: Any) -> None:
+        """Store a stage output, evicting the project's oldest entries past the cap."""
+        pass
+
+    @abstractmethod
+    async def invalidate(self, project_key: str, stage: Optional[CachedStage] = None) -> int:
+        """Drop a project's entries (optionally one stage only).
+
+        Returns:
+            Number of entries removed.
+        """
+        pass
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Remove all entries."""
+        pass
+
+
+class InMemoryStageCache(BaseStageCache):
+    """In-memory stage cache with a per-project LRU.
+
+    Entries are lost on server restart and are not shared between processes.
+    """
+
+    def __init__(self, **kwargs):
+        """Initialize cache (see BaseStageCache)."""
+        super().__init__(**kwargs)
+        # project_key -> key -> (stage, stored_at, value), least recently used first
+        self._projects: dict[str, OrderedDict[str, tuple[CachedStage, float, Any]]] = {}
+        self._lock = asyncio.Lock()
+
+    async def get(self, project_key: str, stage: CachedStage, key: str) -> Optional[Any]:
+        async with self._lock:
+            entries = self._projects.get(project_key)
+            entry = entries.get(key) if entries else None
+            if entry is None or entry[0] != stage:
+                self.stats.misses += 1
+                return None
+            if time.time() - entry[1] > self.ttl_seconds:
+                del entries[key]
+                self.stats.evictions += 1
+                self.stats.misses += 1
+                return None
+            entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry[2]
+
+    async def set(self, project_key: str, stage: CachedStage, key: str, value: Any) -> None:
+        async with self._lock:
+            entries = self._projects.setdefault(project_key, OrderedDict())
+            entries[key] = (CachedStage(stage), time.time(), value)
+            entries.move_to_end(key)
+            self.stats.stores += 1
+            while len(entries) > self.max_entries_per_project:
+                entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    async def invalidate(self, project_key: str, stage: Optional[CachedStage] = None) -> int:
+        async with self._lock:
+            entries = self._projects.get(project_key)
+            if not entries:
+                return 0
+            doomed = [key for key, entry in entries.items() if stage is None or entry[0] == stage]
+            for key in doomed:
+                del entries[key]
+            if not entries:
+                del self._projects[project_key]
+            self.stats.invalidations += len(doomed)
+            return len(doomed)
+
+    async def clear(self) -> None:
+        async with self._lock:
+            self._projects.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached entries (for testing)."""
+        return sum(len(entries) for entries in self._projects.values())
+
+
+class MongoStageCache(BaseStageCache):
+    """MongoDB-backed stage cache.
+
+    Expired entries are removed by a TTL index. The per-project cap is
+    enforced on write by deleting the least recently used entries.
+    """
+
+    def __init__(self, **kwargs):
+        """Initialize cache (see BaseStageCache)."""
+        super().__init__(**kwargs)
+        self._index_created = False
+
+    async def _get_collection(self):
+        """Get the MongoDB collection."""
+        from src.db.mongo import get_database
+        db = await get_database()
+        return db[STAGE_CACHE_COLLECTION]
+
+    async def ensure_indexes(self) -> None:
+        """Create stage cache indexes if not exists."""
+        if self._index_created:
+            return
+
+        try:
+            collection = await self._get_collection()
+            # TTL index - entries are deleted STAGE_CACHE_TTL_SECONDS after being stored
+            await collection.create_index("expires_at", expireAfterSeconds=0, background=True)
+            await collection.create_index([("project_key", 1), ("key", 1)], unique=True)
+            # Eviction scans a project's entries by last use
+            await collection.create_index([("project_key", 1), ("last_used", 1)])
+            self._index_created = True
+            logger.info("MongoDB stage cache indexes created")
+        except Exception as e:
+            logger.warning(f"Failed to create MongoDB stage cache indexes: {e}")
+
+    async def get(self, project_key: str, stage: CachedStage, key: str) -> Optional[Any]:
+        await self.ensure_indexes()
+        collection = await self._get_collection()
+        now = datetime.now(timezone.utc)
+        doc = await collection.find_one_and_update(
+            {
+                "project_key": project_key,
+                "key": key,
+                "stage": CachedStage(stage).value,
+                # The TTL monitor only runs once a minute
+                "expires_at": {"$gt": now},
+            },
+            {"$set": {"last_used": time.time()}},
+        )
+        if doc is None:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return doc["value"]
+
+    async def set(self, project_key: str, stage: CachedStage, key: str, value: Any) -> None:
+        await self.ensure_indexes()
+        collection = await self._get_collection()
+        now = datetime.now(timezone.utc)
+        await collection.replace_one(
+            {"project_key": project_key, "key": key},
+            {
+                "project_key": project_key,
+                "key": key,
+                "stage": CachedStage(stage).value,
+                "value": value,
+                "stored_at": now,
+                # Epoch seconds: BSON dates only keep milliseconds, too coarse for LRU order
+                "last_used": time.time(),
+                "expires_at": now + timedelta(seconds=self.ttl_seconds),
+            },
+            upsert=True,
+        )
+        self.stats.stores += 1
+
+        # Keep the newest entries and drop the rest
+        stale = await collection.find(
+            {"project_key": project_key},
+            {"_id": 1},
+        ).sort("last_used", -1).skip(self.max_entries_per_project).to_list(length=None)
+        if stale:
+            result = await collection.delete_many({"_id": {"$in": [doc["_id"] for doc in stale]}})
+            self.stats.evictions += result.deleted_count
+
+    async def invalidate(self, project_key: str, stage: Optional[CachedStage] = None) -> int:
+        collection = await self._get_collection()
+        query: dict[str, Any] = {"project_key": project_key}
+        if stage is not None:
+            query["stage"] = CachedStage(stage).value
+        result = await collection.delete_many(query)
+        self.stats.invalidations += result.deleted_count
+        return result.deleted_count
+
+    async def clear(self) -> None:
+        collection = await self._get_collection()
+        await collection.delete_many({})
+
+
+# Module-level singleton instance
+_default_cache: Optional[BaseStageCache] = None
+
+
+def get_stage_cache() -> Optional[BaseStageCache]:
+    """Get the default stage cache, or None if STAGE_CACHE_ENABLED is off.
+
+    Uses MongoDB unless JOB_STORE_BACKEND selects the in-memory stores.
+    """
+    global _default_cache
+    if _default_cache is None and STAGE_CACHE_ENABLED:
+        use_mongo = os.getenv("JOB_STORE_BACKEND", "mongo").lower() == "mongo"
+        if use_mongo:
+            _default_cache = MongoStageCache()
+            logger.info("Using MongoDB stage cache")
+        else:
+            _default_cache = InMemoryStageCache()
+            logger.info("Using in-memory stage cache")
+    return _default_cache
+
+
+def set_stage_cache(cache: Optional[BaseStageCache]) -> None:
+    """Set the stage cache instance (for testing)."""
+    global _default_cache
+    _default_cache = cache
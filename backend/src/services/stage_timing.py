@@ -0,0 +1,246 @@
+"""Wall and CPU time per generation stage, chapter and enforcement pass.
+
+A generation job binds a TimingTrace with `bind_timing_trace()` and wraps
+its stages in `timed("planning")`. Chapter generation uses
+`timed("chapter", kind=TimingKind.chapter, chapter=n)`. Deterministic
+enforcement passes are decorated with `@timed_pass`, so they are timed
+wherever they are called from. A pass that runs inside a chapter block is
+attributed to that chapter.
+
+The trace and the current chapter are ContextVars, so asyncio tasks created
+inside a block report against the same trace and chapter. With no trace
+bound, `@timed_pass` costs a single ContextVar lookup.
+
+CPU time is the event loop thread's CPU time (time.thread_time()). It is
+exact for passes, which are synchronous. A pass run in worker processes
+reports the workers' CPU time with `add_pass_cpu()`. Async stages and
+chapters run alongside other coroutines, so their CPU time includes
+whatever else the loop ran while they were awaiting (LLM calls, concurrent
+chapters).
+Only the outermost pass is recorded when passes call each other, so pass
+totals do not double count.
+"""
+
+import functools
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import asdict, dataclass
+from enum import Enum
+from typing import Optional, TypeVar
+
+F = TypeVar("F", bound=Callable)
+
+
+class TimingKind(str, Enum):
+    """Granularity of a timing entry."""
+    stage = "stage"
+    chapter = "chapter"
+    pass_ = "pass"
+
+
+_current_trace: ContextVar["TimingTrace | None"] = ContextVar("timing_trace", default=None)
+_current_chapter: ContextVar[Optional[int]] = ContextVar("timing_chapter", default=None)
+_in_pass: ContextVar[bool] = ContextVar("timing_in_pass", default=False)
+# CPU time the current pass spent outside this thread, in ms
+_pass_cpu: ContextVar[Optional[list[float]]] = ContextVar("timing_pass_cpu", default=None)
+
+
+@dataclass
+class StageTimingStats:
+    """Accumulated time for one (kind, name, chapter)."""
+
+    name: str
+    kind: str
+    chapter: Optional[int] = None
+    wall_ms: float = 0.0
+    cpu_ms: float = 0.0
+    count: int = 0
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary (times rounded to microseconds)."""
+        data = asdict(self)
+        data["wall_ms"] = round(self.wall_ms, 3)
+        data["cpu_ms"] = round(self.cpu_ms, 3)
+        return data
+
+
+class TimingTrace:
+    """Per-job timing entries keyed by (kind, name, chapter)."""
+
+    def __init__(self) -> None:
+        self._stats: dict[tuple[str, str, int], StageTimingStats] = {}
+
+    def record(
+        self,
+        name: str,
+        kind: TimingKind,
+        chapter: Optional[int],
+        wall_ms: float,
+        cpu_ms: float,
+    ) -> None:
+        """Add one timed run to the entry for (kind, name, chapter)."""
+        kind = TimingKind(kind).value
+        # -1 sorts whole-document entries before chapter entries
+        key = (kind, name, -1 if chapter is None else chapter)
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = StageTimingStats(name=name, kind=kind, chapter=chapter)
+            self._stats[key] = stats
+        stats.wall_ms += wall_ms
+        stats.cpu_ms += cpu_ms
+        stats.count += 1
+
+    def merge(self, entries: list[dict]) -> None:
+        """Add entries saved by to_list() (e.g. from an earlier run of a job)."""
+        for entry in entries:
+            kind = TimingKind(entry["kind"]).value
+            chapter = entry.get("chapter")
+            key = (kind, entry["name"], -1 if chapter is None else chapter)
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = StageTimingStats(name=entry["name"], kind=kind, chapter=chapter)
+                self._stats[key] = stats
+            stats.wall_ms += entry.get("wall_ms", 0.0)
+            stats.cpu_ms += entry.get("cpu_ms", 0.0)
+            stats.count += entry.get("count", 0)
+
+    def to_list(self) -> list[dict]:
+        """Entries as dicts, sorted by kind, name and chapter."""
+        return [self._stats[key].to_dict() for key in sorted(self._stats)]
+
+
+class TimingSpan:
+    """A running measurement; call stop() to record it."""
+
+    def __init__(
+        self,
+        trace: Optional[TimingTrace],
+        name: str,
+        kind: TimingKind,
+        chapter: Optional[int],
+    ) -> None:
+        self._trace = trace
+        self._name = name
+        self._kind = kind
+        self._chapter = chapter
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.thread_time()
+        self._stopped = False
+
+    def stop(self) -> None:
+        """Record the elapsed time (only the first call records)."""
+        if self._stopped:
+            return
+        self._stopped = True
+        if self._trace is not None:
+            self._trace.record(
+                self._name,
+                self._kind,
+                self._chapter,
+                (time.perf_counter() - self._wall_start) * 1000,
+                (time.thread_time() - self._cpu_start) * 1000,
+            )
+
+
+def bind_timing_trace(trace: TimingTrace) -> Token:
+    """Collect timings made in the current context into a trace.
+
+    Returns:
+        Token to pass to unbind_timing_trace().
+    """
+    return _current_trace.set(trace)
+
+
+def unbind_timing_trace(token: Token) -> None:
+    """Stop collecting into the trace bound by bind_timing_trace()."""
+    _current_trace.reset(token)
+
+
+def start_timing(
+    name: str,
+    kind: TimingKind = TimingKind.stage,
+    chapter: Optional[int] = None,
+) -> TimingSpan:
+    """Start timing a stage that does not fit in a `with` block.
+
+    A span started with no trace bound records nothing.
+    """
+    return TimingSpan(_current_trace.get(), name, kind, chapter)
+
+
+@contextmanager
+def timed(
+    name: str,
+    kind: TimingKind = TimingKind.stage,
+    chapter: Optional[int] = None,
+) -> Iterator[None]:
+    """Time the block as a stage (or chapter) of the bound trace.
+
+    Inside a chapter block, passes are attributed to that chapter.
+    """
+    span = start_timing(name, kind, chapter)
+    token = _current_chapter.set(chapter) if kind == TimingKind.chapter else None
+    try:
+        yield
+    finally:
+        if token is not None:
+            _current_chapter.reset(token)
+        span.stop()
+
+
+@contextmanager
+def pass_timing(name: str) -> Iterator[None]:
+    """Time the block as an enforcement pass named `name`.
+
+    Passes timed inside the block are not recorded separately.
+    """
+    trace = _current_trace.get()
+    if trace is None or _in_pass.get():
+        yield
+        return
+    token = _in_pass.set(True)
+    elsewhere: list[float] = []
+    cpu_token = _pass_cpu.set(elsewhere)
+    wall_start = time.perf_counter()
+    cpu_start = time.thread_time()
+    try:
+        yield
+    finally:
+        trace.record(
+            name,
+            TimingKind.pass_,
+            _current_chapter.get(),
+            (time.perf_counter() - wall_start) * 1000,
+            (time.thread_time() - cpu_start) * 1000 + sum(elsewhere),
+        )
+        _pass_cpu.reset(cpu_token)
+        _in_pass.reset(token)
+
+
+def add_pass_cpu(cpu_ms: float) -> None:
+    """Add CPU time the current pass spent in another thread or process.
+
+    Does nothing outside a recorded pass_timing() block.
+    """
+    elsewhere = _pass_cpu.get()
+    if elsewhere is not None:
+        elsewhere.append(cpu_ms)
+
+
+def timed_pass(fn: F) -> F:
+    """Time each call of a synchronous enforcement pass.
+
+    The pass is recorded under its function name and the current chapter.
+    """
+    name = fn.__name__
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if _current_trace.get() is None:
+            return fn(*args, **kwargs)
+        with pass_timing(name):
+            return fn(*args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
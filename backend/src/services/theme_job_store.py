@@ -1,13 +1,26 @@
 """Theme job store for proposal jobs.
 
-In-memory store for tracking theme proposal job status.
+Tracks theme proposal job status. Jobs are kept in memory unless the job
+queue is enabled: queued jobs run in worker processes, so their status must
+be shared through MongoDB.
 """
 
 import asyncio
-from datetime import UTC, datetime
+import logging
+import os
+from datetime import UTC, datetime, timedelta
 from uuid import uuid4
 
 from src.models.theme_job import ThemeJob, ThemeJobStatus
+from src.services.work_queue import job_queue_enabled
+
+logger = logging.getLogger(__name__)
+
+# Default TTL for completed/failed jobs (1 hour)
+DEFAULT_THEME_JOB_TTL_SECONDS = 3600
+
+# Collection name for MongoDB storage
+THEME_JOBS_COLLECTION = "theme_jobs"
 
 
 class InMemoryThemeJobStore:
@@ -99,13 +112,120 @@ class InMemoryThemeJobStore:
             return False
 
 
+class MongoThemeJobStore:
+    """MongoDB-backed store for theme proposal jobs with TTL index."""
+
+    def __init__(self, ttl_seconds: int = DEFAULT_THEME_JOB_TTL_SECONDS):
+        self._ttl_seconds = ttl_seconds
+        self._index_created = False
+
+    async def _get_collection(self):
+        """Get the MongoDB collection."""
+        from src.db.mongo import get_database
+        db = await get_database()
+        return db[THEME_JOBS_COLLECTION]
+
+    async def _ensure_indexes(self) -> None:
+        """Create TTL and lookup indexes if not exists."""
+        if self._index_created:
+            return
+
+        try:
+            collection = await self._get_collection()
+            await collection.create_index("expires_at", expireAfterSeconds=0, background=True)
+            await collection.create_index("job_id", unique=True)
+            self._index_created = True
+        except Exception as e:
+            logger.warning(f"Failed to create MongoDB theme job indexes: {e}")
+
+    def _job_to_doc(self, job: ThemeJob) -> dict:
+        """Convert ThemeJob to MongoDB document."""
+        doc = job.model_dump(mode="json", exclude={"created_at", "started_at", "completed_at"})
+        doc["created_at"] = job.created_at
+        doc["started_at"] = job.started_at
+        doc["completed_at"] = job.completed_at
+
+        # Set expires_at for TTL cleanup
+        if job.is_terminal() and job.completed_at:
+            doc["expires_at"] = job.completed_at + timedelta(seconds=self._ttl_seconds)
+        else:
+            doc["expires_at"] = None
+
+        return doc
+
+    def _doc_to_job(self, doc: dict) -> ThemeJob:
+        """Convert MongoDB document to ThemeJob."""
+        fields = {key: doc[key] for key in ThemeJob.model_fields if key in doc}
+        return ThemeJob.model_validate(fields)
+
+    async def create_job(self, project_id: str) -> str:
+        """Create a new theme proposal job in MongoDB."""
+        await self._ensure_indexes()
+
+        job_id = str(uuid4())
+        job = ThemeJob(
+            job_id=job_id,
+            project_id=project_id,
+            status=ThemeJobStatus.QUEUED,
+            created_at=datetime.now(UTC),
+        )
+        collection = await self._get_collection()
+        await collection.insert_one(self._job_to_doc(job))
+        return job_id
+
+    async def get_job(self, job_id: str) -> ThemeJob | None:
+        """Get a job by ID from MongoDB."""
+        collection = await self._get_collection()
+        doc = await collection.find_one({"job_id": job_id})
+        return self._doc_to_job(doc) if doc else None
+
+    async def update_job(self, job_id: str, **updates) -> ThemeJob | None:
+        """Update a job's fields in MongoDB (same semantics as in-memory)."""
+        collection = await self._get_collection()
+        doc = await collection.find_one({"job_id": job_id})
+        if not doc:
+            return None
+
+        job = self._doc_to_job(doc)
+        for key, value in updates.items():
+            if hasattr(job, key):
+                setattr(job, key, value)
+
+        # Auto-set timestamps based on status transitions
+        if updates.get("status") == ThemeJobStatus.PROCESSING:
+            job.started_at = datetime.now(UTC)
+        if updates.get("status") in (
+            ThemeJobStatus.COMPLETED,
+            ThemeJobStatus.FAILED,
+            ThemeJobStatus.CANCELLED,
+        ):
+            job.completed_at = datetime.now(UTC)
+
+        await collection.replace_one({"job_id": job_id}, self._job_to_doc(job))
+        return job
+
+    async def delete_job(self, job_id: str) -> bool:
+        """Delete a job from MongoDB."""
+        collection = await self._get_collection()
+        result = await collection.delete_one({"job_id": job_id})
+        return result.deleted_count > 0
+
+
 # Singleton instance
-_store: InMemoryThemeJobStore | None = None
+_store: InMemoryThemeJobStore | MongoThemeJobStore | None = None
+
 
+def get_theme_job_store() -> InMemoryThemeJobStore | MongoThemeJobStore:
+    """Get the singleton theme job store instance.
 
-def get_theme_job_store() -> InMemoryThemeJobStore:
-    """Get the singleton theme job store instance."""
+    Uses MongoDB when the job queue is enabled, so API and worker processes
+    see the same jobs.
+    """
     global _store
     if _store is None:
-        _store = InMemoryThemeJobStore()
+        use_mongo = os.getenv("JOB_STORE_BACKEND", "mongo").lower() == "mongo"
+        if use_mongo and job_queue_enabled():
+            _store = MongoThemeJobStore()
+        else:
+            _store = InMemoryThemeJobStore()
     return _store
@@ -10,11 +10,12 @@ import re
 import uuid
 from typing import Any
 
-from src.llm import LLMClient
+from src.llm import LLMClient, get_llm_client, llm_stage
 from src.llm.models import ChatMessage, LLMRequest, ResponseFormat
 from src.models.edition import Coverage, SegmentRef, Theme
 from src.services.canonical_service import canonicalize, compute_hash, normalize_for_comparison
 from src.services.coverage_service import score_coverage
+from src.services.token_budget import estimate_tokens
 
 logger = logging.getLogger(__name__)
 
@@ -53,12 +54,11 @@ TRANSCRIPT:
 
 
 def estimate_token_count(text: str) -> int:
-    """Estimate token count for a text segment.
+    """Estimate token count for a text segment (for coverage scoring).
 
-    Uses simple heuristic: ~4 characters per token on average.
-    This is a rough estimate for coverage scoring.
+    Uses the shared cached estimator from token_budget.
     """
-    return max(1, len(text) // 4)
+    return max(1, estimate_tokens(text))
 
 
 def _strip_quotes_for_matching(text: str) -> str:
@@ -241,7 +241,7 @@ async def propose_themes(
 
     # Create LLM client if not provided
     if llm_client is None:
-        llm_client = LLMClient()
+        llm_client = get_llm_client()
 
     # Build prompt
     prompt = THEME_PROPOSAL_PROMPT + transcript[:50000]  # Cap at ~50k chars
@@ -258,7 +258,8 @@ async def propose_themes(
     )
 
     # Call LLM
-    response = await llm_client.generate(request)
+    with llm_stage("themes"):
+        response = await llm_client.generate(request)
 
     if not response.text:
         logger.error("LLM returned empty response for theme proposal")
@@ -0,0 +1,303 @@
+"""Token budget service for prompt construction.
+
+Prompt builders used to send whatever they were given. A chapter with no
+mapped segments got the entire transcript, and long transcripts made prompts
+slow or pushed them past the model's context window. This module estimates
+tokens cheaply and fits prompt inputs into a per-model input budget. It keeps
+content by priority instead of cutting at a character offset:
+
+- transcript text: paragraphs most relevant to the chapter are kept, in order
+- evidence claims: highest-confidence claims are kept
+- previous-chapter context: the closing paragraphs are kept
+
+Token estimates use tiktoken when it is installed, and otherwise a
+word/punctuation heuristic. Either way, estimates are cached per text, so
+re-estimating the same transcript for every chapter is free.
+"""
+
+import logging
+import math
+import re
+from collections.abc import Sequence
+from functools import lru_cache
+
+try:
+    import tiktoken
+except ImportError:  # Optional: fall back to the heuristic estimator
+    tiktoken = None
+
+logger = logging.getLogger(__name__)
+
+# Input token budgets by model prefix (longest match wins). Kept well below
+# each model's context window: oversized prompts are slow even when they fit.
+MODEL_INPUT_TOKEN_BUDGETS = {
+    "gpt-4o": 64_000,
+    "gpt-4.1": 64_000,
+    "claude": 100_000,
+}
+DEFAULT_INPUT_TOKEN_BUDGET = 32_000
+
+# Texts whose estimates are kept in the cache
+TOKEN_ESTIMATE_CACHE_SIZE = 4096
+
+# Tokenizer used when tiktoken is available
+TIKTOKEN_ENCODING = "o200k_base"
+
+# Inserted where paragraphs were left out of a fitted text
+OMISSION_MARKER = "[...]"
+
+# Per-claim allowance for the labels around claim text in prompts
+CLAIM_FORMAT_OVERHEAD_TOKENS = 20
+
+_WORD_OR_SYMBOL = re.compile(r"[^\W\d_]+|\d+|[^\w\s]", re.UNICODE)
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+")
+_TERM = re.compile(r"[a-z0-9']+")
+
+# Words too common to signal relevance
+_STOPWORDS = frozenset(
+    "a an and are as at be but by for from has have how in into is it its of on or "
+    "that the their this to was what when where which who why will with you your".split()
+)
+
+
+@lru_cache(maxsize=1)
+def _get_encoding():
+    """Load the tiktoken encoding, or None when unavailable."""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.get_encoding(TIKTOKEN_ENCODING)
+    except Exception as e:  # e.g. encoding file not downloadable offline
+        logger.warning(f"tiktoken encoding {TIKTOKEN_ENCODING} unavailable, using heuristic: {e}")
+        return None
+
+
+def _heuristic_token_count(text: str) -> int:
+    """Estimate BPE tokens from words, numbers and punctuation.
+
+    Common words are one token; long words split into roughly one token per
+    six characters; numbers into one token per three digits.
+    """
+    count = 0
+    for piece in _WORD_OR_SYMBOL.findall(text):
+        if piece.isdigit():
+            count += math.ceil(len(piece) / 3)
+        elif len(piece) > 6:
+            count += math.ceil(len(piece) / 6)
+        else:
+            count += 1
+    return count
+
+
+@lru_cache(maxsize=TOKEN_ESTIMATE_CACHE_SIZE)
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of tokens in a text (cached).
+
+    Args:
+        text: Text to measure.
+
+    Returns:
+        Estimated token count (0 for empty text).
+    """
+    if not text:
+        return 0
+    encoding = _get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    return _heuristic_token_count(text)
+
+
+def get_input_token_budget(model: str) -> int:
+    """Get the prompt input budget for a model.
+
+    Args:
+        model: Model identifier.
+
+    Returns:
+        Maximum input tokens for prompts sent to the model.
+    """
+    matches = [prefix for prefix in MODEL_INPUT_TOKEN_BUDGETS if model.startswith(prefix)]
+    if not matches:
+        return DEFAULT_INPUT_TOKEN_BUDGET
+    return MODEL_INPUT_TOKEN_BUDGETS[max(matches, key=len)]
+
+
+class PromptBudget:
+    """Remaining input tokens while a prompt is being assembled."""
+
+    def __init__(self, total: int, reserved_tokens: int = 0):
+        """Initialize budget.
+
+        Args:
+            total: Total input tokens available.
+            reserved_tokens: Tokens set aside up front (e.g. for the system
+                prompt and instructions).
+        """
+        self.total = total
+        self.used = reserved_tokens
+
+    @classmethod
+    def for_model(cls, model: str, reserved_tokens: int = 0) -> "PromptBudget":
+        """Create a budget sized for a model."""
+        return cls(get_input_token_budget(model), reserved_tokens)
+
+    @property
+    def remaining(self) -> int:
+        """Tokens still available."""
+        return max(0, self.total - self.used)
+
+    def reserve(self, *texts: str | None) -> None:
+        """Account for prompt text that will be sent."""
+        self.used += sum(estimate_tokens(text) for text in texts if text)
+
+    def spend(self, tokens: int) -> None:
+        """Account for an already-estimated number of tokens."""
+        self.used += tokens
+
+
+def _terms(text: str) -> set[str]:
+    """Lowercase content words of a text."""
+    return {t for t in _TERM.findall(text.lower()) if len(t) > 2 and t not in _STOPWORDS}
+
+
+def _split_units(text: str, max_unit_tokens: int) -> list[tuple[int, str]]:
+    """Split text into (paragraph index, unit) pairs.
+
+    Paragraphs larger than max_unit_tokens are split into sentences so a
+    single oversized paragraph cannot block the whole budget.
+    """
+    units: list[tuple[int, str]] = []
+    paragraphs = [p.strip() for p in _PARAGRAPH_BREAK.split(text) if p.strip()]
+    for index, paragraph in enumerate(paragraphs):
+        if estimate_tokens(paragraph) > max_unit_tokens:
+            units.extend((index, s) for s in _SENTENCE_BREAK.split(paragraph) if s)
+        else:
+            units.append((index, paragraph))
+    return units
+
+
+def _join_units(units: list[tuple[int, int, str]], total: int) -> str:
+    """Join kept (position, paragraph index, unit) triples, marking gaps.
+
+    Args:
+        units: Kept units in order.
+        total: Number of units before selection.
+    """
+    parts: list[str] = []
+    previous: tuple[int, int] | None = None
+    for position, paragraph, unit in units:
+        if previous is None:
+            if position > 0:
+                parts.append(OMISSION_MARKER + "\n\n")
+        elif position != previous[0] + 1:
+            parts.append("\n\n" + OMISSION_MARKER + "\n\n")
+        elif paragraph == previous[1]:
+            parts.append(" ")
+        else:
+            parts.append("\n\n")
+        parts.append(unit)
+        previous = (position, paragraph)
+    if previous is not None and previous[0] < total - 1:
+        parts.append("\n\n" + OMISSION_MARKER)
+    return "".join(parts)
+
+
+def fit_text(text: str, max_tokens: int, priority_terms: Sequence[str] = ()) -> str:
+    """Fit text into a token budget, keeping the most relevant paragraphs.
+
+    Paragraphs are ranked by how many priority terms they mention (ties keep
+    earlier paragraphs) and kept greedily while they fit. Kept paragraphs are
+    returned in their original order, with OMISSION_MARKER where content was
+    left out.
+
+    Args:
+        text: Text to fit (e.g. a transcript segment).
+        max_tokens: Token budget for the text.
+        priority_terms: Phrases describing what matters (e.g. chapter title
+            and key points). Without them, earlier paragraphs win.
+
+    Returns:
+        The text unchanged if it fits, otherwise the selected paragraphs.
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    if max_tokens <= 0:
+        return ""
+
+    terms = _terms(" ".join(priority_terms))
+    units = _split_units(text, max_tokens)
+    scores = [len(terms & _terms(unit)) for _, unit in units]
+    ranked = sorted(range(len(units)), key=lambda i: (-scores[i], i))
+
+    marker_tokens = estimate_tokens(OMISSION_MARKER)
+    remaining = max_tokens
+    kept: list[int] = []
+    for i in ranked:
+        cost = estimate_tokens(units[i][1]) + marker_tokens
+        if cost <= remaining:
+            kept.append(i)
+            remaining -= cost
+
+    kept.sort()
+    logger.debug(f"Fitted text to {max_tokens} tokens: kept {len(kept)}/{len(units)} paragraphs")
+    return _join_units([(i, units[i][0], units[i][1]) for i in kept], len(units))
+
+
+def fit_tail(text: str, max_tokens: int) -> str:
+    """Fit text into a token budget, keeping its closing paragraphs.
+
+    Used for continuity context, where the end of the previous chapter
+    matters most.
+
+    Args:
+        text: Text to fit.
+        max_tokens: Token budget for the text.
+
+    Returns:
+        The text unchanged if it fits, otherwise its last paragraphs that fit
+        (possibly empty).
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    kept: list[str] = []
+    remaining = max_tokens
+    for paragraph in reversed([p for p in _PARAGRAPH_BREAK.split(text) if p.strip()]):
+        cost = estimate_tokens(paragraph)
+        if cost > remaining:
+            break
+        kept.append(paragraph)
+        remaining -= cost
+    return "\n\n".join(reversed(kept))
+
+
+def estimate_claim_tokens(claim: dict) -> int:
+    """Estimate prompt tokens for an evidence claim and its quotes."""
+    texts = [claim.get("claim", "")] + [q.get("quote", "") for q in claim.get("support", [])]
+    return sum(estimate_tokens(t) for t in texts) + CLAIM_FORMAT_OVERHEAD_TOKENS
+
+
+def fit_claims(claims: list[dict], max_tokens: int) -> list[dict]:
+    """Fit evidence claims into a token budget, keeping the most confident.
+
+    Args:
+        claims: EvidenceEntry dicts.
+        max_tokens: Token budget for all claims.
+
+    Returns:
+        The claims that fit, in their original order.
+    """
+    costs = [estimate_claim_tokens(claim) for claim in claims]
+    if sum(costs) <= max_tokens:
+        return claims
+
+    ranked = sorted(range(len(claims)), key=lambda i: (-claims[i].get("confidence", 0.0), i))
+    remaining = max_tokens
+    kept: list[int] = []
+    for i in ranked:
+        if costs[i] <= remaining:
+            kept.append(i)
+            remaining -= costs[i]
+
+    logger.debug(f"Fitted evidence to {max_tokens} tokens: kept {len(kept)}/{len(claims)} claims")
+    return [claims[i] for i in sorted(kept)]
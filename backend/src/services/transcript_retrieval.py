@@ -0,0 +1,207 @@
+"""Lexical retrieval over transcript spans.
+
+Chapters whose plan has no transcript_segments used to get the whole
+transcript, so on long webinars every chapter paid for every word. This
+module indexes a transcript once, as spans of consecutive lines, and ranks
+spans against a chapter query with BM25. Chapters then get only their most
+relevant spans.
+
+Indexes are cached by transcript hash. A job that generates a dozen chapters
+(and extracts evidence for each) tokenizes its transcript once.
+
+Configuration (env vars):
+- TRANSCRIPT_RETRIEVAL_ENABLED: Retrieve spans for unmapped chapters (default: true)
+- TRANSCRIPT_RETRIEVAL_MIN_CHARS: Shorter transcripts are sent whole (default: 20000)
+- TRANSCRIPT_RETRIEVAL_TOP_K: Spans selected per chapter (default: 8)
+- TRANSCRIPT_RETRIEVAL_SPAN_CHARS: Target span length (default: 1500)
+"""
+
+import hashlib
+import logging
+import math
+import os
+import re
+from collections import Counter, OrderedDict
+from collections.abc import Sequence
+
+from src.models import TranscriptRelevance, TranscriptSegment
+
+logger = logging.getLogger(__name__)
+
+TRANSCRIPT_RETRIEVAL_ENABLED = os.environ.get("TRANSCRIPT_RETRIEVAL_ENABLED", "true").lower() == "true"
+# Below this size the full transcript is cheap enough, and sending it whole
+# keeps the shared prefix that providers cache across chapter calls
+TRANSCRIPT_RETRIEVAL_MIN_CHARS = int(os.environ.get("TRANSCRIPT_RETRIEVAL_MIN_CHARS", "20000"))
+TRANSCRIPT_RETRIEVAL_TOP_K = int(os.environ.get("TRANSCRIPT_RETRIEVAL_TOP_K", "8"))
+TRANSCRIPT_RETRIEVAL_SPAN_CHARS = int(os.environ.get("TRANSCRIPT_RETRIEVAL_SPAN_CHARS", "1500"))
+
+# Transcript indexes kept in the cache
+TRANSCRIPT_INDEX_CACHE_SIZE = 16
+
+# BM25 parameters
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+_TERM = re.compile(r"[a-z0-9']+")
+_LINE = re.compile(r"[^\n]*\n?")
+
+# Words too common to signal relevance
+_STOPWORDS = frozenset(
+    "a an and are as at be but by can do for from has have how i if in into is it its "
+    "just like me my not of on or so that the their then there they this to was we "
+    "what when where which who why will with you your".split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase content words of a text, in order."""
+    return [t for t in _TERM.findall(text.lower()) if len(t) > 2 and t not in _STOPWORDS]
+
+
+def _split_spans(transcript: str, span_chars: int) -> list[tuple[int, int]]:
+    """Split a transcript into (start, end) spans of whole lines.
+
+    Consecutive lines are merged until a span reaches span_chars, so spans
+    follow speaker turns and paragraph breaks rather than cutting mid-line.
+    A single line longer than span_chars becomes its own span.
+    """
+    spans: list[tuple[int, int]] = []
+    start = 0
+    for match in _LINE.finditer(transcript):
+        end = match.end()
+        if end == match.start():
+            break
+        if end - start >= span_chars:
+            spans.append((start, end))
+            start = end
+    if start < len(transcript):
+        spans.append((start, len(transcript)))
+    return spans
+
+
+class TranscriptIndex:
+    """BM25 index over the spans of one transcript."""
+
+    def __init__(self, transcript: str, span_chars: int = TRANSCRIPT_RETRIEVAL_SPAN_CHARS):
+        """Build the index.
+
+        Args:
+            transcript: Full transcript text.
+            span_chars: Target span length in characters.
+        """
+        self.spans = _split_spans(transcript, span_chars)
+        self._term_counts = [Counter(tokenize(transcript[s:e])) for s, e in self.spans]
+        self._lengths = [sum(counts.values()) for counts in self._term_counts]
+        self._avg_length = (sum(self._lengths) / len(self._lengths)) if self._lengths else 0.0
+
+        document_frequency: Counter[str] = Counter()
+        for counts in self._term_counts:
+            document_frequency.update(counts.keys())
+        n = len(self.spans)
+        self._idf = {
+            term: math.log(1 + (n - df + 0.5) / (df + 0.5))
+            for term, df in document_frequency.items()
+        }
+
+    def score(self, query: Sequence[str]) -> list[float]:
+        """Score every span against a query.
+
+        Args:
+            query: Query phrases (e.g. chapter title and key points).
+
+        Returns:
+            BM25 score per span, in span order.
+        """
+        terms = Counter(tokenize(" ".join(query)))
+        scores = [0.0] * len(self.spans)
+        if not terms or not self._avg_length:
+            return scores
+        for i, counts in enumerate(self._term_counts):
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * self._lengths[i] / self._avg_length)
+            total = 0.0
+            for term, query_count in terms.items():
+                tf = counts.get(term)
+                if tf:
+                    total += query_count * self._idf[term] * tf * (BM25_K1 + 1) / (tf + norm)
+            scores[i] = total
+        return scores
+
+    def search(self, query: Sequence[str], top_k: int = TRANSCRIPT_RETRIEVAL_TOP_K) -> list[TranscriptSegment]:
+        """Select the spans most relevant to a query.
+
+        Args:
+            query: Query phrases.
+            top_k: Maximum number of spans to select.
+
+        Returns:
+            Selected spans in transcript order, with adjacent spans merged.
+            Empty if no span mentions any query term.
+        """
+        scores = self.score(query)
+        ranked = sorted(range(len(scores)), key=lambda i: (-scores[i], i))
+        selected = sorted(i for i in ranked[:top_k] if scores[i] > 0)
+
+        segments: list[TranscriptSegment] = []
+        for i in selected:
+            start, end = self.spans[i]
+            if segments and segments[-1].end_char == start:
+                segments[-1].end_char = end
+            else:
+                segments.append(
+                    TranscriptSegment(
+                        start_char=start,
+                        end_char=end,
+                        relevance=TranscriptRelevance.supporting,
+                    )
+                )
+        return segments
+
+
+_index_cache: "OrderedDict[str, TranscriptIndex]" = OrderedDict()
+
+
+def get_transcript_index(transcript: str) -> TranscriptIndex:
+    """Get the index for a transcript, building it on first use."""
+    key = hashlib.sha256(transcript.encode()).hexdigest()
+    index = _index_cache.get(key)
+    if index is not None:
+        _index_cache.move_to_end(key)
+        return index
+
+    index = TranscriptIndex(transcript)
+    _index_cache[key] = index
+    if len(_index_cache) > TRANSCRIPT_INDEX_CACHE_SIZE:
+        _index_cache.popitem(last=False)
+    logger.debug(f"Indexed transcript {key[:12]}: {len(index.spans)} spans")
+    return index
+
+
+def clear_transcript_index_cache() -> None:
+    """Drop all cached transcript indexes (for testing)."""
+    _index_cache.clear()
+
+
+def retrieve_transcript_segments(
+    transcript: str,
+    query: Sequence[str],
+    top_k: int = TRANSCRIPT_RETRIEVAL_TOP_K,
+) -> list[TranscriptSegment]:
+    """Select transcript spans relevant to a chapter.
+
+    Args:
+        transcript: Full transcript text.
+        query: Chapter title, goals, key points, evidence claims, etc.
+        top_k: Maximum number of spans to select.
+
+    Returns:
+        Selected segments, or an empty list when retrieval does not apply
+        (disabled, short transcript, or nothing matched). Callers then fall
+        back to the full transcript.
+    """
+    if not TRANSCRIPT_RETRIEVAL_ENABLED or len(transcript) < TRANSCRIPT_RETRIEVAL_MIN_CHARS:
+        return []
+    segments = get_transcript_index(transcript).search(query, top_k)
+    if segments:
+        selected_chars = sum(s.end_char - s.start_char for s in segments)
+        logger.debug(f"Retrieved {len(segments)} spans ({selected_chars}/{len(transcript)} chars)")
+    return segments
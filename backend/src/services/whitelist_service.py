@@ -44,6 +44,7 @@ from src.models.edition import (
     WhitelistQuote,
 )
 from src.models.evidence_map import ChapterEvidence, EvidenceMap
+from src.services.stage_timing import timed_pass
 
 
 class CoreClaimProtocol(Protocol):
@@ -260,6 +261,7 @@ def format_speaker_attribution(speaker: SpeakerRef) -> str:
     return f"{speaker.speaker_name} ({role_label})"
 
 
+@timed_pass
 def build_speaker_registry(whitelist: list[WhitelistQuote]) -> dict[str, str]:
     """Build a canonical speaker registry from whitelist.
 
@@ -299,6 +301,7 @@ def build_speaker_registry(whitelist: list[WhitelistQuote]) -> dict[str, str]:
     return registry
 
 
+@timed_pass
 def normalize_speaker_names(text: str, registry: dict[str, str]) -> tuple[str, dict]:
     """Normalize speaker attributions in markdown to canonical form.
 
@@ -559,6 +562,7 @@ def build_quote_whitelist(
 MIN_INLINE_QUOTE_LENGTH = 5
 
 
+@timed_pass
 def remove_inline_quotes(
     text: str,
     min_quote_length: int = MIN_INLINE_QUOTE_LENGTH,
@@ -642,6 +646,7 @@ def remove_inline_quotes(
 MIN_LEAK_WORDS = 8
 
 
+@timed_pass
 def detect_verbatim_leaks(
     text: str,
     whitelist: list,
@@ -809,6 +814,7 @@ PLACEHOLDER_GLUE_PATTERNS = [
 ]
 
 
+@timed_pass
 def clean_placeholder_glue(text: str) -> tuple[str, dict]:
     """Remove placeholder glue strings that indicate removed quote artifacts.
 
@@ -1136,6 +1142,7 @@ def select_deterministic_excerpts_with_claims(
     return select_deterministic_excerpts(whitelist, chapter_index, coverage_level)
 
 
+@timed_pass
 def enforce_quote_whitelist(
     generated_text: str,
     whitelist: list[WhitelistQuote],
@@ -1364,6 +1371,7 @@ SHORT_ACKNOWLEDGEMENT_COMPILED = [
 ]
 
 
+@timed_pass
 def enforce_core_claims_text(
     text: str,
     whitelist: list[WhitelistQuote],
@@ -1676,6 +1684,7 @@ def _extract_claim_topic(quote_text: str) -> str:
     return text[:50].rstrip(',.;:—– ') + ("..." if len(text) > 50 else "")
 
 
+@timed_pass
 def strip_llm_blockquotes(generated_text: str) -> str:
     """Remove blockquote syntax LLM added outside Key Excerpts.
 
@@ -1724,6 +1733,7 @@ def strip_llm_blockquotes(generated_text: str) -> str:
     return result
 
 
+@timed_pass
 def fix_quote_artifacts(text: str) -> tuple[str, dict]:
     """Remove stray quote marks and malformed quote patterns.
 
@@ -1836,6 +1846,7 @@ def fix_quote_artifacts(text: str) -> tuple[str, dict]:
     return result, report
 
 
+@timed_pass
 def strip_prose_quote_chars(text: str) -> tuple[str, dict]:
     """Strip quote characters from narrative prose, preserving them only in allowed contexts.
 
@@ -0,0 +1,484 @@
+"""Durable work queue for background jobs.
+
+By default, API handlers run background jobs in their own process with
+asyncio.create_task / BackgroundTasks. Jobs then die with the process and
+cannot spread across uvicorn workers or machines. With JOB_QUEUE_ENABLED,
+API nodes only enqueue. Standalone workers (scripts/run_worker.py) claim
+and run the tasks.
+
+A task is claimed atomically (findOneAndUpdate) under a lease. The worker
+extends the lease with heartbeats while the job runs. If a worker dies, its
+lease expires (the visibility timeout) and another worker claims the task
+again. After JOB_QUEUE_MAX_ATTEMPTS claims the task is dead and its job is
+marked failed.
+
+Supports two backends:
+1. MongoDB (durable) - shared by every API and worker process
+2. In-memory (fallback) - for testing or single-process use
+
+Configuration (env vars):
+- JOB_QUEUE_ENABLED: Enqueue jobs for workers instead of running them in
+  the API process (default: false)
+- JOB_QUEUE_LEASE_SECONDS: Lease (visibility timeout) per claim (default: 60)
+- JOB_QUEUE_MAX_ATTEMPTS: Claims per task before it is dead (default: 3)
+- JOB_QUEUE_RETRY_DELAY_SECONDS: Delay before retrying a failed task (default: 30)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import Any, Optional
+from uuid import uuid4
+
+from pymongo import ReturnDocument
+
+logger = logging.getLogger(__name__)
+
+JOB_QUEUE_ENABLED = os.environ.get("JOB_QUEUE_ENABLED", "false").lower() == "true"
+JOB_QUEUE_LEASE_SECONDS = float(os.environ.get("JOB_QUEUE_LEASE_SECONDS", "60"))
+JOB_QUEUE_MAX_ATTEMPTS = int(os.environ.get("JOB_QUEUE_MAX_ATTEMPTS", "3"))
+JOB_QUEUE_RETRY_DELAY_SECONDS = float(os.environ.get("JOB_QUEUE_RETRY_DELAY_SECONDS", "30"))
+
+# How long finished tasks are kept (1 day)
+FINISHED_TASK_TTL_SECONDS = 86400
+
+# Collection name for MongoDB storage
+WORK_QUEUE_COLLECTION = "job_queue"
+
+
+class TaskKind(str, Enum):
+    """Kind of background job a task runs."""
+    draft = "draft"
+    qa = "qa"
+    pdf_export = "pdf_export"
+    epub_export = "epub_export"
+    themes = "themes"
+
+
+class TaskStatus(str, Enum):
+    """Lifecycle of a queued task."""
+    pending = "pending"
+    leased = "leased"
+    done = "done"
+    dead = "dead"
+
+
+@dataclass
+class QueuedTask:
+    """A claimed unit of work."""
+
+    task_id: str
+    kind: TaskKind
+    job_id: str
+    payload: dict[str, Any] = field(default_factory=dict)
+    attempts: int = 0
+    lease_owner: Optional[str] = None
+
+
+def job_queue_enabled() -> bool:
+    """Whether API nodes enqueue jobs instead of running them."""
+    return JOB_QUEUE_ENABLED
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class BaseWorkQueue(ABC):
+    """Abstract base class for work queues."""
+
+    def __init__(
+        self,
+        lease_seconds: float = JOB_QUEUE_LEASE_SECONDS,
+        max_attempts: int = JOB_QUEUE_MAX_ATTEMPTS,
+        retry_delay_seconds: float = JOB_QUEUE_RETRY_DELAY_SECONDS,
+    ):
+        """Initialize queue.
+
+        Args:
+            lease_seconds: Lease granted per claim and per heartbeat.
+            max_attempts: Claims per task before it is dead.
+            retry_delay_seconds: Delay before a failed task is visible again.
+        """
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.retry_delay_seconds = retry_delay_seconds
+
+    @abstractmethod
+    async def enqueue(self, kind: TaskKind, job_id: str, payload: Optional[dict] = None) -> str:
+        """Add a task for a job. Returns the task ID."""
+        pass
+
+    @abstractmethod
+    async def claim(self, worker_id: str, kinds: Optional[list[TaskKind]] = None) -> Optional[QueuedTask]:
+        """Atomically lease the oldest available task, if any.
+
+        Available tasks are pending tasks past their retry delay, and leased
+        tasks whose lease expired with attempts left.
+        """
+        pass
+
+    @abstractmethod
+    async def heartbeat(self, task_id: str, worker_id: str) -> bool:
+        """Extend a lease. Returns False if the worker no longer holds it."""
+        pass
+
+    @abstractmethod
+    async def complete(self, task_id: str, worker_id: str) -> bool:
+        """Mark a leased task done. Returns False if the lease was lost."""
+        pass
+
+    @abstractmethod
+    async def fail(self, task: QueuedTask, worker_id: str, error: str) -> Optional[TaskStatus]:
+        """Release a task after an error.
+
+        Returns:
+            TaskStatus.pending if the task will be retried, TaskStatus.dead if
+            it ran out of attempts, or None if the worker no longer held the
+            lease (another worker owns the task now).
+        """
+        pass
+
+    @abstractmethod
+    async def reap_expired(self) -> list[QueuedTask]:
+        """Mark tasks dead whose lease expired with no attempts left.
+
+        Returns:
+            The tasks marked dead, so their jobs can be failed.
+        """
+        pass
+
+
+class InMemoryWorkQueue(BaseWorkQueue):
+    """In-memory work queue.
+
+    Only shared by workers in the same process. Tasks are lost on restart.
+    """
+
+    def __init__(self, **kwargs):
+        """Initialize queue (see BaseWorkQueue)."""
+        super().__init__(**kwargs)
+        self._tasks: dict[str, dict] = {}
+        self._lock = asyncio.Lock()
+
+    async def enqueue(self, kind: TaskKind, job_id: str, payload: Optional[dict] = None) -> str:
+        """Add a task for a job."""
+        task_id = str(uuid4())
+        now = _utcnow()
+        async with self._lock:
+            self._tasks[task_id] = {
+                "task_id": task_id,
+                "kind": TaskKind(kind),
+                "job_id": job_id,
+                "payload": payload or {},
+                "status": TaskStatus.pending,
+                "attempts": 0,
+                "lease_owner": None,
+                "lease_expires_at": None,
+                "available_at": now,
+                "created_at": now,
+                "last_error": None,
+            }
+        logger.debug(f"Enqueued {kind} task {task_id} for job {job_id}")
+        return task_id
+
+    def _is_available(self, doc: dict, now: datetime) -> bool:
+        if doc["status"] == TaskStatus.pending:
+            return doc["available_at"] <= now
+        return (
+            doc["status"] == TaskStatus.leased
+            and doc["lease_expires_at"] <= now
+            and doc["attempts"] < self.max_attempts
+        )
+
+    async def claim(self, worker_id: str, kinds: Optional[list[TaskKind]] = None) -> Optional[QueuedTask]:
+        """Atomically lease the oldest available task, if any."""
+        now = _utcnow()
+        async with self._lock:
+            candidates = [
+                doc for doc in self._tasks.values()
+                if (kinds is None or doc["kind"] in kinds) and self._is_available(doc, now)
+            ]
+            if not candidates:
+                return None
+            doc = min(candidates, key=lambda d: d["created_at"])
+            doc["status"] = TaskStatus.leased
+            doc["lease_owner"] = worker_id
+            doc["lease_expires_at"] = now + timedelta(seconds=self.lease_seconds)
+            doc["attempts"] += 1
+            return _doc_to_task(doc)
+
+    def _held(self, task_id: str, worker_id: str) -> Optional[dict]:
+        doc = self._tasks.get(task_id)
+        if doc and doc["status"] == TaskStatus.leased and doc["lease_owner"] == worker_id:
+            return doc
+        return None
+
+    async def heartbeat(self, task_id: str, worker_id: str) -> bool:
+        """Extend a lease."""
+        async with self._lock:
+            doc = self._held(task_id, worker_id)
+            if doc is None:
+                return False
+            doc["lease_expires_at"] = _utcnow() + timedelta(seconds=self.lease_seconds)
+            return True
+
+    async def complete(self, task_id: str, worker_id: str) -> bool:
+        """Mark a leased task done."""
+        async with self._lock:
+            doc = self._held(task_id, worker_id)
+            if doc is None:
+                return False
+            doc["status"] = TaskStatus.done
+            doc["lease_owner"] = None
+            return True
+
+    async def fail(self, task: QueuedTask, worker_id: str, error: str) -> Optional[TaskStatus]:
+        """Release a task after an error."""
+        async with self._lock:
+            doc = self._held(task.task_id, worker_id)
+            if doc is None:
+                return None
+            status = TaskStatus.pending if doc["attempts"] < self.max_attempts else TaskStatus.dead
+            doc["status"] = status
+            doc["available_at"] = _utcnow() + timedelta(seconds=self.retry_delay_seconds)
+            doc["lease_owner"] = None
+            doc["last_error"] = error
+            return status
+
+    async def reap_expired(self) -> list[QueuedTask]:
+        """Mark tasks dead whose lease expired with no attempts left."""
+        now = _utcnow()
+        reaped = []
+        async with self._lock:
+            for doc in self._tasks.values():
+                if (
+                    doc["status"] == TaskStatus.leased
+                    and doc["lease_expires_at"] <= now
+                    and doc["attempts"] >= self.max_attempts
+                ):
+                    doc["status"] = TaskStatus.dead
+                    doc["last_error"] = "Lease expired"
+                    reaped.append(_doc_to_task(doc))
+        return reaped
+
+    async def get_status(self, task_id: str) -> Optional[TaskStatus]:
+        """Get a task's status (for testing)."""
+        async with self._lock:
+            doc = self._tasks.get(task_id)
+            return doc["status"] if doc else None
+
+
+class MongoWorkQueue(BaseWorkQueue):
+    """MongoDB-backed work queue.
+
+    Claims use findOneAndUpdate, so concurrent workers never lease the same
+    task. Finished tasks are removed by a TTL index.
+    """
+
+    def __init__(self, **kwargs):
+        """Initialize queue (see BaseWorkQueue)."""
+        super().__init__(**kwargs)
+        self._index_created = False
+
+    async def _get_collection(self):
+        """Get the MongoDB collection."""
+        from src.db.mongo import get_database
+        db = await get_database()
+        return db[WORK_QUEUE_COLLECTION]
+
+    async def ensure_indexes(self) -> None:
+        """Create queue indexes if not exists."""
+        if self._index_created:
+            return
+
+        try:
+            collection = await self._get_collection()
+            # TTL index - finished tasks are deleted after FINISHED_TASK_TTL_SECONDS
+            await collection.create_index("expires_at", expireAfterSeconds=0, background=True)
+            await collection.create_index("task_id", unique=True)
+            # Claim queries scan by status, then visibility time
+            await collection.create_index([("status", 1), ("available_at", 1)])
+            await collection.create_index([("status", 1), ("lease_expires_at", 1)])
+            self._index_created = True
+            logger.info("MongoDB work queue indexes created")
+        except Exception as e:
+            logger.warning(f"Failed to create MongoDB work queue indexes: {e}")
+
+    async def enqueue(self, kind: TaskKind, job_id: str, payload: Optional[dict] = None) -> str:
+        """Add a task for a job."""
+        await self.ensure_indexes()
+
+        task_id = str(uuid4())
+        now = _utcnow()
+        collection = await self._get_collection()
+        await collection.insert_one({
+            "task_id": task_id,
+            "kind": TaskKind(kind).value,
+            "job_id": job_id,
+            "payload": payload or {},
+            "status": TaskStatus.pending.value,
+            "attempts": 0,
+            "lease_owner": None,
+            "lease_expires_at": None,
+            "available_at": now,
+            "created_at": now,
+            "last_error": None,
+            "expires_at": None,
+        })
+        logger.debug(f"Enqueued {kind} task {task_id} for job {job_id}")
+        return task_id
+
+    async def claim(self, worker_id: str, kinds: Optional[list[TaskKind]] = None) -> Optional[QueuedTask]:
+        """Atomically lease the oldest available task, if any."""
+        collection = await self._get_collection()
+        now = _utcnow()
+        query: dict[str, Any] = {
+            "$or": [
+                {"status": TaskStatus.pending.value, "available_at": {"$lte": now}},
+                {
+                    "status": TaskStatus.leased.value,
+                    "lease_expires_at": {"$lte": now},
+                    "attempts": {"$lt": self.max_attempts},
+                },
+            ],
+        }
+        if kinds is not None:
+            query["kind"] = {"$in": [TaskKind(k).value for k in kinds]}
+
+        doc = await collection.find_one_and_update(
+            query,
+            {
+                "$set": {
+                    "status": TaskStatus.leased.value,
+                    "lease_owner": worker_id,
+                    "lease_expires_at": now + timedelta(seconds=self.lease_seconds),
+                },
+                "$inc": {"attempts": 1},
+            },
+            sort=[("created_at", 1)],
+            return_document=ReturnDocument.AFTER,
+        )
+        return _doc_to_task(doc) if doc else None
+
+    def _held(self, task_id: str, worker_id: str) -> dict:
+        """Filter matching a task only while the worker holds its lease."""
+        return {"task_id": task_id, "status": TaskStatus.leased.value, "lease_owner": worker_id}
+
+    async def heartbeat(self, task_id: str, worker_id: str) -> bool:
+        """Extend a lease."""
+        collection = await self._get_collection()
+        result = await collection.update_one(
+            self._held(task_id, worker_id),
+            {"$set": {"lease_expires_at": _utcnow() + timedelta(seconds=self.lease_seconds)}},
+        )
+        return result.matched_count == 1
+
+    async def complete(self, task_id: str, worker_id: str) -> bool:
+        """Mark a leased task done."""
+        collection = await self._get_collection()
+        result = await collection.update_one(
+            self._held(task_id, worker_id),
+            {"$set": {
+                "status": TaskStatus.done.value,
+                "lease_owner": None,
+                "expires_at": _utcnow() + timedelta(seconds=FINISHED_TASK_TTL_SECONDS),
+            }},
+        )
+        return result.matched_count == 1
+
+    async def fail(self, task: QueuedTask, worker_id: str, error: str) -> Optional[TaskStatus]:
+        """Release a task after an error."""
+        collection = await self._get_collection()
+        now = _utcnow()
+        status = TaskStatus.pending if task.attempts < self.max_attempts else TaskStatus.dead
+        update: dict[str, Any] = {
+            "status": status.value,
+            "available_at": now + timedelta(seconds=self.retry_delay_seconds),
+            "lease_owner": None,
+            "last_error": error,
+        }
+        if status == TaskStatus.dead:
+            update["expires_at"] = now + timedelta(seconds=FINISHED_TASK_TTL_SECONDS)
+        result = await collection.update_one(self._held(task.task_id, worker_id), {"$set": update})
+        return status if result.matched_count == 1 else None
+
+    async def reap_expired(self) -> list[QueuedTask]:
+        """Mark tasks dead whose lease expired with no attempts left."""
+        collection = await self._get_collection()
+        now = _utcnow()
+        query = {
+            "status": TaskStatus.leased.value,
+            "lease_expires_at": {"$lte": now},
+            "attempts": {"$gte": self.max_attempts},
+        }
+        reaped = []
+        async for doc in collection.find(query):
+            # Guarded update: another worker may reap the same task concurrently
+            result = await collection.update_one(
+                {**query, "task_id": doc["task_id"]},
+                {"$set": {
+                    "status": TaskStatus.dead.value,
+                    "last_error": "Lease expired",
+                    "expires_at": now + timedelta(seconds=FINISHED_TASK_TTL_SECONDS),
+                }},
+            )
+            if result.modified_count == 1:
+                reaped.append(_doc_to_task(doc))
+        return reaped
+
+    async def get_status(self, task_id: str) -> Optional[TaskStatus]:
+        """Get a task's status (for testing)."""
+        collection = await self._get_collection()
+        doc = await collection.find_one({"task_id": task_id})
+        return TaskStatus(doc["status"]) if doc else None
+
+
+def _doc_to_task(doc: dict) -> QueuedTask:
+    """Convert a queue document to a QueuedTask."""
+    return QueuedTask(
+        task_id=doc["task_id"],
+        kind=TaskKind(doc["kind"]),
+        job_id=doc["job_id"],
+        payload=doc.get("payload") or {},
+        attempts=doc.get("attempts", 0),
+        lease_owner=doc.get("lease_owner"),
+    )
+
+
+# Module-level singleton instance
+_default_queue: Optional[BaseWorkQueue] = None
+
+
+def get_work_queue() -> BaseWorkQueue:
+    """Get the default work queue singleton.
+
+    Uses MongoDB unless JOB_STORE_BACKEND selects the in-memory stores.
+    """
+    global _default_queue
+    if _default_queue is None:
+        use_mongo = os.getenv("JOB_STORE_BACKEND", "mongo").lower() == "mongo"
+        if use_mongo:
+            _default_queue = MongoWorkQueue()
+            logger.info("Using MongoDB work queue")
+        else:
+            _default_queue = InMemoryWorkQueue()
+            logger.info("Using in-memory work queue")
+    return _default_queue
+
+
+def set_work_queue(queue: Optional[BaseWorkQueue]) -> None:
+    """Set the work queue instance (for testing)."""
+    global _default_queue
+    _default_queue = queue
+
+
+async def enqueue_job(kind: TaskKind, job_id: str, payload: Optional[dict] = None) -> str:
+    """Enqueue a job using the default queue."""
+    return await get_work_queue().enqueue(kind, job_id, payload)
@@ -11,6 +11,8 @@ from mongomock_motor import AsyncMongoMockClient
 
 from src.api.main import app
 from src.db import mongo
+from src.llm.circuit_breaker import set_circuit_breakers
+from src.llm.client import set_llm_client
 
 
 @pytest.fixture(scope="session")
@@ -21,6 +23,22 @@ def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+def reset_circuit_breakers() -> Generator[None, None, None]:
+    """Give each test fresh provider circuit breakers."""
+    set_circuit_breakers(None)
+    yield
+    set_circuit_breakers(None)
+
+
+@pytest.fixture(autouse=True)
+def reset_llm_client() -> Generator[None, None, None]:
+    """Give each test a fresh shared LLM client (built from its registries)."""
+    set_llm_client(None)
+    yield
+    set_llm_client(None)
+
+
 @pytest_asyncio.fixture
 async def mock_db() -> AsyncGenerator[Any, None]:
     """Provide a mock MongoDB database for testing."""
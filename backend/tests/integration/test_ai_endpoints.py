@@ -32,10 +32,10 @@ class TestCleanTranscriptEndpoint:
             latency_ms=500,
         )
 
-        with patch("src.services.ai_service.LLMClient") as mock_client_class:
+        with patch("src.services.ai_service.get_llm_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.generate = AsyncMock(return_value=mock_response)
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             response = client.post(
                 "/api/ai/clean-transcript",
@@ -88,10 +88,10 @@ class TestCleanTranscriptEndpoint:
             latency_ms=500,
         )
 
-        with patch("src.services.ai_service.LLMClient") as mock_client_class:
+        with patch("src.services.ai_service.get_llm_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.generate = AsyncMock(return_value=mock_response)
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             # Create transcript at exactly 500,000 characters
             max_transcript = "a" * 500000
@@ -105,12 +105,12 @@ class TestCleanTranscriptEndpoint:
 
     def test_clean_transcript_llm_rate_limit_error(self):
         """Test that LLM rate limit error returns 503."""
-        with patch("src.services.ai_service.LLMClient") as mock_client_class:
+        with patch("src.services.ai_service.get_llm_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.generate = AsyncMock(
                 side_effect=RateLimitError("Rate limit exceeded", provider="openai")
             )
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             response = client.post(
                 "/api/ai/clean-transcript",
@@ -123,12 +123,12 @@ class TestCleanTranscriptEndpoint:
 
     def test_clean_transcript_llm_auth_error(self):
         """Test that LLM authentication error returns 503."""
-        with patch("src.services.ai_service.LLMClient") as mock_client_class:
+        with patch("src.services.ai_service.get_llm_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.generate = AsyncMock(
                 side_effect=AuthenticationError("Invalid API key", provider="openai")
             )
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             response = client.post(
                 "/api/ai/clean-transcript",
@@ -157,10 +157,10 @@ Technical terms like "API" and "JSON" are preserved."""
             latency_ms=750,
         )
 
-        with patch("src.services.ai_service.LLMClient") as mock_client_class:
+        with patch("src.services.ai_service.get_llm_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.generate = AsyncMock(return_value=mock_response)
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             response = client.post(
                 "/api/ai/clean-transcript",
@@ -189,10 +189,10 @@ class TestSuggestOutlineEndpoint:
             latency_ms=1200,
         )
 
-        with patch("src.services.ai_service.LLMClient") as mock_client_class:
+        with patch("src.services.ai_service.get_llm_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.generate = AsyncMock(return_value=mock_response)
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             response = client.post(
                 "/api/ai/suggest-outline",
@@ -240,12 +240,12 @@ class TestSuggestOutlineEndpoint:
 
     def test_suggest_outline_llm_rate_limit_error(self):
         """Test that LLM rate limit error returns 503."""
-        with patch("src.services.ai_service.LLMClient") as mock_client_class:
+        with patch("src.services.ai_service.get_llm_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.generate = AsyncMock(
                 side_effect=RateLimitError("Rate limit exceeded", provider="openai")
             )
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             response = client.post(
                 "/api/ai/suggest-outline",
@@ -270,10 +270,10 @@ class TestSuggestOutlineEndpoint:
             latency_ms=1500,
         )
 
-        with patch("src.services.ai_service.LLMClient") as mock_client_class:
+        with patch("src.services.ai_service.get_llm_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.generate = AsyncMock(return_value=mock_response)
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             response = client.post(
                 "/api/ai/suggest-outline",
@@ -300,10 +300,10 @@ class TestSuggestOutlineEndpoint:
             latency_ms=500,
         )
 
-        with patch("src.services.ai_service.LLMClient") as mock_client_class:
+        with patch("src.services.ai_service.get_llm_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.generate = AsyncMock(return_value=mock_response)
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             response = client.post(
                 "/api/ai/suggest-outline",
@@ -332,10 +332,10 @@ class TestSuggestResourcesEndpoint:
             latency_ms=800,
         )
 
-        with patch("src.services.ai_service.LLMClient") as mock_client_class:
+        with patch("src.services.ai_service.get_llm_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.generate = AsyncMock(return_value=mock_response)
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             response = client.post(
                 "/api/ai/suggest-resources",
@@ -382,12 +382,12 @@ class TestSuggestResourcesEndpoint:
 
     def test_suggest_resources_llm_rate_limit_error(self):
         """Test that LLM rate limit error returns 503."""
-        with patch("src.services.ai_service.LLMClient") as mock_client_class:
+        with patch("src.services.ai_service.get_llm_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.generate = AsyncMock(
                 side_effect=RateLimitError("Rate limit exceeded", provider="openai")
             )
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             response = client.post(
                 "/api/ai/suggest-resources",
@@ -412,10 +412,10 @@ class TestSuggestResourcesEndpoint:
             latency_ms=600,
         )
 
-        with patch("src.services.ai_service.LLMClient") as mock_client_class:
+        with patch("src.services.ai_service.get_llm_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.generate = AsyncMock(return_value=mock_response)
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             response = client.post(
                 "/api/ai/suggest-resources",
@@ -444,10 +444,10 @@ class TestSuggestResourcesEndpoint:
             latency_ms=400,
         )
 
-        with patch("src.services.ai_service.LLMClient") as mock_client_class:
+        with patch("src.services.ai_service.get_llm_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.generate = AsyncMock(return_value=mock_response)
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             response = client.post(
                 "/api/ai/suggest-resources",
@@ -27,7 +27,7 @@ from src.models import JobStatus
 @pytest.fixture
 def mock_llm_client():
     """Mock LLM client to avoid actual API calls."""
-    with patch("src.services.draft_service.LLMClient") as mock:
+    with patch("src.services.draft_service.get_llm_client") as mock:
         mock_instance = AsyncMock()
         mock.return_value = mock_instance
 
@@ -52,10 +52,10 @@ class TestEvidenceMapIntegration:
             "must_include": [],
         })
 
-        with patch("src.services.evidence_service.LLMClient") as mock_client_class:
+        with patch("src.services.evidence_service.get_llm_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.complete.return_value = mock_response
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             evidence_map = await generate_evidence_map(
                 project_id="test_project",
@@ -86,10 +86,10 @@ class TestEvidenceMapIntegration:
         mock_response = MagicMock()
         mock_response.content = json.dumps({"claims": [], "must_include": []})
 
-        with patch("src.services.evidence_service.LLMClient") as mock_client_class:
+        with patch("src.services.evidence_service.get_llm_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.complete.return_value = mock_response
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             evidence_map = await generate_evidence_map(
                 project_id="test",
@@ -121,10 +121,10 @@ class TestEvidenceMapIntegration:
         mock_response = MagicMock()
         mock_response.content = json.dumps({"claims": [], "must_include": []})
 
-        with patch("src.services.evidence_service.LLMClient") as mock_client_class:
+        with patch("src.services.evidence_service.get_llm_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.complete.return_value = mock_response
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             evidence_map = await generate_evidence_map(
                 project_id="test",
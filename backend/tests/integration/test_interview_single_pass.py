@@ -270,8 +270,8 @@ class TestGenerateInterviewSinglePass:
 Sarah Chen founded DataFlow in 2019 after observing...
 """
 
-        with patch("src.services.draft_service.LLMClient") as MockClient:
-            mock_client = MockClient.return_value
+        with patch("src.services.draft_service.get_llm_client") as mock_get_client:
+            mock_client = mock_get_client.return_value
             mock_client.generate = AsyncMock(return_value=mock_response)
 
             result = await generate_interview_single_pass(
@@ -290,8 +290,8 @@ Sarah Chen founded DataFlow in 2019 after observing...
         mock_response = MagicMock()
         mock_response.text = "## Key Ideas...\n\n## The Conversation..."
 
-        with patch("src.services.draft_service.LLMClient") as MockClient:
-            mock_client = MockClient.return_value
+        with patch("src.services.draft_service.get_llm_client") as mock_get_client:
+            mock_client = mock_get_client.return_value
             mock_client.generate = AsyncMock(return_value=mock_response)
 
             result = await generate_interview_single_pass(
@@ -308,8 +308,8 @@ Sarah Chen founded DataFlow in 2019 after observing...
         mock_response = MagicMock()
         mock_response.text = "Content..."
 
-        with patch("src.services.draft_service.LLMClient") as MockClient:
-            mock_client = MockClient.return_value
+        with patch("src.services.draft_service.get_llm_client") as mock_get_client:
+            mock_client = mock_get_client.return_value
             mock_client.generate = AsyncMock(return_value=mock_response)
 
             await generate_interview_single_pass(
@@ -879,6 +879,108 @@ Content.
             assert key in score, f"Missing expected key: {key}"
 
 
+class TestConcurrentCandidateGeneration:
+    """Tests for concurrent best-of-N candidate generation."""
+
+    @staticmethod
+    def _fake_candidates(totals, delays=None, fail=(), tracker=None):
+        """Build a fake _generate_and_score_candidate keyed by candidate_num."""
+        import asyncio
+
+        async def fake(transcript, book_title, evidence_map, forced_candidates=None, candidate_num=1):
+            if tracker is not None:
+                tracker["active"] += 1
+                tracker["peak"] = max(tracker["peak"], tracker["active"])
+            try:
+                await asyncio.sleep((delays or {}).get(candidate_num, 0.01))
+                if candidate_num in fail:
+                    raise RuntimeError(f"candidate {candidate_num} failed")
+                return f"# Draft {candidate_num}", {"total": totals[candidate_num]}
+            finally:
+                if tracker is not None:
+                    tracker["active"] -= 1
+
+        return fake
+
+    @pytest.mark.asyncio
+    async def test_returns_candidates_best_first(self):
+        """Should return all candidates sorted by score, best first."""
+        from src.services.draft_service import _generate_candidates_concurrently
+
+        fake = self._fake_candidates({1: 50, 2: 90, 3: 70})
+        with patch("src.services.draft_service._generate_and_score_candidate", side_effect=fake):
+            candidates = await _generate_candidates_concurrently(
+                "transcript", "Title", MagicMock(), candidate_count=3, concurrency=3,
+            )
+
+        assert [score["total"] for _, score in candidates] == [90, 70, 50]
+        assert candidates[0][0] == "# Draft 2"
+
+    @pytest.mark.asyncio
+    async def test_respects_concurrency_limit(self):
+        """Should never run more candidates at once than the concurrency limit."""
+        from src.services.draft_service import _generate_candidates_concurrently
+
+        tracker = {"active": 0, "peak": 0}
+        fake = self._fake_candidates({i: i for i in range(1, 6)}, tracker=tracker)
+        with patch("src.services.draft_service._generate_and_score_candidate", side_effect=fake):
+            candidates = await _generate_candidates_concurrently(
+                "transcript", "Title", MagicMock(), candidate_count=5, concurrency=2,
+            )
+
+        assert len(candidates) == 5
+        assert tracker["peak"] == 2
+
+    @pytest.mark.asyncio
+    async def test_score_threshold_cancels_remaining(self):
+        """Should stop early once a candidate reaches the score threshold."""
+        from src.services.draft_service import _generate_candidates_concurrently
+
+        fake = self._fake_candidates(
+            {1: 95, 2: 40, 3: 60},
+            delays={1: 0.01, 2: 0.5, 3: 0.5},
+        )
+        with patch("src.services.draft_service._generate_and_score_candidate", side_effect=fake):
+            candidates = await _generate_candidates_concurrently(
+                "transcript", "Title", MagicMock(), candidate_count=3, concurrency=3,
+                score_threshold=90,
+            )
+
+        assert len(candidates) == 1
+        assert candidates[0][1]["total"] == 95
+
+    @pytest.mark.asyncio
+    async def test_tolerates_individual_failures(self):
+        """Should keep successful candidates when some candidates fail."""
+        from src.services.draft_service import _generate_candidates_concurrently
+
+        fake = self._fake_candidates({1: 10, 2: 20, 3: 30}, fail={3})
+        with patch("src.services.draft_service._generate_and_score_candidate", side_effect=fake):
+            candidates = await _generate_candidates_concurrently(
+                "transcript", "Title", MagicMock(), candidate_count=3, concurrency=3,
+            )
+
+        assert [score["total"] for _, score in candidates] == [20, 10]
+
+    @pytest.mark.asyncio
+    async def test_raises_when_all_candidates_fail(self):
+        """Should raise the candidate error when no candidate succeeds."""
+        from src.services.draft_service import _generate_candidates_concurrently
+
+        fake = self._fake_candidates({1: 10, 2: 20}, fail={1, 2})
+        with patch("src.services.draft_service._generate_and_score_candidate", side_effect=fake):
+            with pytest.raises(RuntimeError, match="failed"):
+                await _generate_candidates_concurrently(
+                    "transcript", "Title", MagicMock(), candidate_count=2, concurrency=2,
+                )
+
+    def test_request_threshold_defaults_to_none(self):
+        """candidate_score_threshold should be optional and default to None."""
+        from src.models import DraftGenerateRequest
+
+        assert DraftGenerateRequest.model_fields["candidate_score_threshold"].default is None
+
+
 class TestInterviewTitlePostProcessing:
     """Tests for interview title post-processing (NLP-based fix)."""
 
@@ -149,10 +149,10 @@ More details about the important data. Data is discussed in detail.
         mock_response = MagicMock()
         mock_response.content = "## Chapter 1: Introduction\n\nImproved content without repetition."
 
-        with patch("src.services.rewrite_service.LLMClient") as mock_client_class:
+        with patch("src.services.rewrite_service.get_llm_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.complete.return_value = mock_response
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             result = await execute_targeted_rewrite(
                 draft=sample_draft,
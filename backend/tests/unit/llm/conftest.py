@@ -0,0 +1,37 @@
+"""Shared request and response factories for LLM tests."""
+
+from src.llm.models import ChatMessage, LLMRequest, LLMResponse, Usage
+
+
+def make_request(content: str = "Hello", model: str = "gpt-4o", **kwargs) -> LLMRequest:
+    """Create a single-message request for testing."""
+    return LLMRequest(
+        model=model,
+        messages=[ChatMessage(role="user", content=content)],
+        **kwargs,
+    )
+
+
+def make_response(
+    text: str = "Test response",
+    provider: str = "openai",
+    model: str = "gpt-4o",
+    latency_ms: int = 100,
+    prompt_tokens: int = 10,
+    completion_tokens: int = 5,
+    **kwargs,
+) -> LLMResponse:
+    """Create a completed response for testing."""
+    return LLMResponse(
+        text=text,
+        finish_reason="stop",
+        usage=Usage(
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=prompt_tokens + completion_tokens,
+        ),
+        model=model,
+        provider=provider,
+        latency_ms=latency_ms,
+        **kwargs,
+    )
@@ -25,6 +25,21 @@ from src.llm.models import ChatMessage, LLMRequest, ResponseFormat
 from src.llm.providers.anthropic import AnthropicProvider
 
 
+class FakeStream:
+    """Fake SDK AsyncStream: async iteration plus an awaitable close()."""
+
+    def __init__(self, items):
+        self.items = list(items)
+        self.closed = False
+
+    async def __aiter__(self):
+        for item in self.items:
+            yield item
+
+    async def close(self):
+        self.closed = True
+
+
 class FakeAPIStatusError(Exception):
     """Fake API error for testing exception chaining."""
 
@@ -133,6 +148,29 @@ class TestAnthropicRequestBuilding:
         assert len(anthropic_request["messages"]) == 1
         assert anthropic_request["messages"][0]["role"] == "user"
 
+    def test_cache_breakpoints_become_cache_control(self):
+        """Test that cache_breakpoint messages get ephemeral cache_control."""
+        provider = AnthropicProvider(api_key="test-key")
+        request = LLMRequest(
+            messages=[
+                ChatMessage(role="system", content="Stable system.", cache_breakpoint=True),
+                ChatMessage(role="user", content="Shared transcript.", cache_breakpoint=True),
+                ChatMessage(role="user", content="Write chapter 2."),
+            ],
+            model="claude-sonnet-4-5-20250929",
+        )
+
+        anthropic_request = provider._build_request(request)
+
+        assert anthropic_request["system"] == [{
+            "type": "text",
+            "text": "Stable system.",
+            "cache_control": {"type": "ephemeral"},
+        }]
+        shared, instructions = anthropic_request["messages"]
+        assert shared["content"][-1]["cache_control"] == {"type": "ephemeral"}
+        assert instructions["content"] == "Write chapter 2."
+
     def test_build_request_with_json_schema(self):
         """Test building a request with JSON schema response format (tool_use pattern)."""
         provider = AnthropicProvider(api_key="test-key")
@@ -232,6 +270,35 @@ class TestAnthropicResponseParsing:
         assert response.model == "claude-sonnet-4-5-20250929"
         assert response.latency_ms == 100
 
+    def test_parse_usage_with_prompt_cache(self):
+        """Test that cache reads/writes are reported and counted as prompt tokens."""
+        provider = AnthropicProvider(api_key="test-key")
+        request = LLMRequest(
+            messages=[ChatMessage(role="user", content="Hello")],
+            model="claude-sonnet-4-5-20250929",
+        )
+
+        mock_text_block = MagicMock()
+        mock_text_block.type = "text"
+        mock_text_block.text = "Hi"
+        mock_response = MagicMock()
+        mock_response.id = "req_123"
+        mock_response.model = "claude-sonnet-4-5-20250929"
+        mock_response.content = [mock_text_block]
+        mock_response.stop_reason = "end_turn"
+        mock_response.usage.input_tokens = 100
+        mock_response.usage.cache_read_input_tokens = 5000
+        mock_response.usage.cache_creation_input_tokens = 0
+        mock_response.usage.output_tokens = 50
+        mock_response.model_dump = MagicMock(return_value={})
+
+        response = provider._parse_response(mock_response, latency_ms=100, request=request)
+
+        assert response.usage.prompt_tokens == 5100
+        assert response.usage.cached_tokens == 5000
+        assert response.usage.cache_write_tokens == 0
+        assert response.usage.total_tokens == 5150
+
     def test_parse_tool_use_response(self):
         """Test parsing a response with tool use."""
         provider = AnthropicProvider(api_key="test-key")
@@ -531,3 +598,69 @@ class TestAnthropicProviderGenerate:
             _ = provider.client
 
         assert "API key not configured" in str(exc_info.value)
+
+
+class TestAnthropicProviderStream:
+    """Tests for Anthropic provider streaming."""
+
+    @staticmethod
+    def _events(*deltas, stop_reason="end_turn"):
+        start = MagicMock(type="message_start")
+        start.message.model = "claude-sonnet-4-5"
+        start.message.usage.input_tokens = 10
+        events = [start]
+        for delta_type, value in deltas:
+            event = MagicMock(type="content_block_delta")
+            event.delta.type = delta_type
+            event.delta.text = value
+            event.delta.partial_json = value
+            events.append(event)
+        end = MagicMock(type="message_delta")
+        end.delta.stop_reason = stop_reason
+        end.usage.output_tokens = 4
+        events.append(end)
+        return events
+
+    async def _collect(self, provider, events, request):
+        stream = FakeStream(events)
+        mock_client = AsyncMock()
+        mock_client.messages.create = AsyncMock(return_value=stream)
+        with patch.object(provider, "_client", mock_client):
+            chunks = [c async for c in provider.stream(request)]
+        assert stream.closed
+        return chunks
+
+    @pytest.mark.asyncio
+    async def test_stream_text_deltas(self):
+        """Test that text deltas stream with a final usage chunk."""
+        provider = AnthropicProvider(api_key="test-key")
+        request = LLMRequest(messages=[ChatMessage(role="user", content="Hi")], model="claude-sonnet-4-5")
+
+        chunks = await self._collect(
+            provider,
+            self._events(("text_delta", "Hel"), ("text_delta", "lo"), stop_reason="max_tokens"),
+            request,
+        )
+
+        assert "".join(c.delta for c in chunks) == "Hello"
+        assert chunks[-1].finish_reason == "length"
+        assert chunks[-1].usage.prompt_tokens == 10
+        assert chunks[-1].usage.completion_tokens == 4
+
+    @pytest.mark.asyncio
+    async def test_stream_structured_output_json(self):
+        """Test that json_schema output streams the tool's partial JSON."""
+        provider = AnthropicProvider(api_key="test-key")
+        request = LLMRequest(
+            messages=[ChatMessage(role="user", content="Hi")],
+            model="claude-sonnet-4-5",
+            response_format=ResponseFormat(type="json_schema", json_schema={"type": "object"}),
+        )
+
+        chunks = await self._collect(
+            provider,
+            self._events(("input_json_delta", '{"a":'), ("input_json_delta", " 1}"), stop_reason="tool_use"),
+            request,
+        )
+
+        assert json.loads("".join(c.delta for c in chunks)) == {"a": 1}
@@ -0,0 +1,184 @@
+"""Unit tests for offline batch execution."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.llm.batch import (
+    BatchSession,
+    BatchStatus,
+    LocalFileBatchProvider,
+    OpenAIBatchProvider,
+    get_active_batch_session,
+)
+from src.llm.client import LLMClient
+from src.llm.errors import ProviderError
+from src.llm.models import LLMRequest, LLMResponse, Usage
+
+from .conftest import make_request
+
+
+def upper_responder(request: LLMRequest) -> LLMResponse:
+    """Answer with the upper-cased prompt, failing on 'boom'."""
+    content = request.messages[-1].content
+    if content == "boom":
+        raise ValueError("responder failed")
+    return LLMResponse(
+        text=content.upper(),
+        finish_reason="stop",
+        usage=Usage(prompt_tokens=1, completion_tokens=1, total_tokens=2),
+        model=request.model,
+        provider="local",
+        latency_ms=0,
+    )
+
+
+def make_session(tmp_path, **kwargs) -> BatchSession:
+    """Create a session over the local file provider with fast polling."""
+    provider = LocalFileBatchProvider(batch_dir=tmp_path, responder=upper_responder)
+    kwargs.setdefault("max_wait_seconds", 0.01)
+    return BatchSession(provider, poll_seconds=0, **kwargs)
+
+
+class TestBatchSession:
+    """Tests for collecting requests into batch jobs."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_batch(self, tmp_path):
+        """Test that requests in the collection window go out as one batch."""
+        async with make_session(tmp_path) as session:
+            responses = await asyncio.gather(
+                session.generate(make_request("a")),
+                session.generate(make_request("b")),
+                session.generate(make_request("c")),
+            )
+
+        assert [r.text for r in responses] == ["A", "B", "C"]
+        assert session.get_stats()["batches_submitted"] == 1
+        batch_dirs = list(tmp_path.iterdir())
+        assert len(batch_dirs) == 1
+        assert len((batch_dirs[0] / "input.jsonl").read_text().splitlines()) == 3
+
+    @pytest.mark.asyncio
+    async def test_max_batch_size_splits_batches(self, tmp_path):
+        """Test that a full batch is submitted without waiting."""
+        async with make_session(tmp_path, max_batch_size=2, max_wait_seconds=60) as session:
+            responses = await asyncio.gather(
+                *(session.generate(make_request(c)) for c in "abcd")
+            )
+
+        assert [r.text for r in responses] == ["A", "B", "C", "D"]
+        assert session.get_stats()["batches_submitted"] == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_item_only_fails_its_caller(self, tmp_path):
+        """Test that per-request errors are raised to the right coroutine."""
+        async with make_session(tmp_path) as session:
+            ok, failed = await asyncio.gather(
+                session.generate(make_request("ok")),
+                session.generate(make_request("boom")),
+                return_exceptions=True,
+            )
+
+        assert ok.text == "OK"
+        assert isinstance(failed, ProviderError)
+        assert "responder failed" in str(failed)
+        assert session.get_stats()["failed_requests"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_fails_all_callers(self, tmp_path):
+        """Test that a failed batch job raises for every request."""
+        provider = LocalFileBatchProvider(batch_dir=tmp_path)
+        provider.poll = AsyncMock(return_value=BatchStatus.FAILED)
+
+        async with BatchSession(provider, max_wait_seconds=0.01, poll_seconds=0) as session:
+            results = await asyncio.gather(
+                session.generate(make_request("a")),
+                session.generate(make_request("b")),
+                return_exceptions=True,
+            )
+
+        assert all(isinstance(r, ProviderError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_session_is_scoped_to_context(self, tmp_path):
+        """Test that the session is only active inside the async with block."""
+        async with make_session(tmp_path) as session:
+            assert get_active_batch_session() is session
+        assert get_active_batch_session() is None
+
+    @pytest.mark.asyncio
+    async def test_client_generate_routes_through_session(self, tmp_path, monkeypatch):
+        """Test that LLMClient.generate uses the active batch session."""
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        client = LLMClient()
+        client._providers["openai"].generate = AsyncMock()
+
+        async with make_session(tmp_path):
+            # Tasks created inside the session inherit it
+            response = await asyncio.create_task(client.generate(make_request("hello")))
+
+        assert response.text == "HELLO"
+        client._providers["openai"].generate.assert_not_called()
+
+
+class TestOpenAIBatchProvider:
+    """Tests for the OpenAI Batch API provider."""
+
+    def _provider(self):
+        openai = MagicMock()
+        openai._build_request = lambda request: {"model": request.model, "messages": []}
+        openai._parse_response = lambda completion, latency_ms: completion.choices[0].message.content
+        client = openai.client
+        client.files.create = AsyncMock(return_value=MagicMock(id="file-in"))
+        client.batches.create = AsyncMock(return_value=MagicMock(id="batch-1"))
+        return OpenAIBatchProvider(provider=openai), client
+
+    @pytest.mark.asyncio
+    async def test_submit_uploads_jsonl(self):
+        """Test that requests are uploaded as chat completion batch lines."""
+        provider, client = self._provider()
+
+        batch_id = await provider.submit({"req-1": make_request("a")})
+
+        assert batch_id == "batch-1"
+        _, payload = client.files.create.call_args.kwargs["file"]
+        line = json.loads(payload.decode().splitlines()[0])
+        assert line["custom_id"] == "req-1"
+        assert line["url"] == "/v1/chat/completions"
+        assert client.batches.create.call_args.kwargs["input_file_id"] == "file-in"
+
+    @pytest.mark.asyncio
+    async def test_poll_and_fetch_results(self):
+        """Test status mapping and parsing of output and error lines."""
+        provider, client = self._provider()
+        client.batches.retrieve = AsyncMock(return_value=MagicMock(
+            status="completed", output_file_id="file-out", error_file_id=None,
+        ))
+        completion = {
+            "id": "chatcmpl-1",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "gpt-4o-mini",
+            "choices": [{
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": "done"},
+            }],
+        }
+        output = "\n".join([
+            json.dumps({"custom_id": "ok", "response": {"status_code": 200, "body": completion}}),
+            json.dumps({"custom_id": "bad", "response": {
+                "status_code": 400, "body": {"error": {"message": "bad request"}},
+            }}),
+        ])
+        client.files.content = AsyncMock(return_value=MagicMock(text=output))
+
+        assert await provider.poll("batch-1") == BatchStatus.COMPLETED
+        results = await provider.fetch_results("batch-1")
+
+        assert results["ok"].response == "done"
+        assert results["bad"].response is None
+        assert results["bad"].error == "bad request"
@@ -0,0 +1,125 @@
+"""Unit tests for the content-addressed LLM response cache."""
+
+import os
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.llm.cache import DiskResponseCache, compute_request_key
+from src.llm.client import LLMClient
+from src.llm.models import ResponseFormat
+
+from .conftest import make_request, make_response
+
+
+class TestComputeRequestKey:
+    """Tests for request hashing."""
+
+    def test_identical_requests_share_key(self):
+        """Test that equal payloads hash the same."""
+        assert compute_request_key(make_request()) == compute_request_key(make_request())
+
+    def test_output_affecting_fields_change_key(self):
+        """Test that model, messages, temperature, format and tools change the key."""
+        base = compute_request_key(make_request())
+
+        assert compute_request_key(make_request("Other")) != base
+        assert compute_request_key(make_request(temperature=0.2)) != base
+        assert compute_request_key(make_request(response_format=ResponseFormat(type="json_object"))) != base
+        assert compute_request_key(make_request(tools=[{"type": "function", "name": "f"}])) != base
+
+    def test_metadata_and_cache_flag_ignored(self):
+        """Test that fields not sent to the provider do not change the key."""
+        base = compute_request_key(make_request())
+
+        assert compute_request_key(make_request(metadata={"stage": "plan"})) == base
+        assert compute_request_key(make_request(cache=False)) == base
+
+
+class TestDiskResponseCache:
+    """Tests for the disk cache backend."""
+
+    def test_round_trip_and_counters(self, tmp_path):
+        """Test store, hit and miss accounting."""
+        cache = DiskResponseCache(cache_dir=tmp_path)
+
+        assert cache.get("a" * 64) is None
+        cache.set("a" * 64, make_response("Cached text"))
+        cached = cache.get("a" * 64)
+
+        assert cached.text == "Cached text"
+        assert cached.raw is None  # raw provider payload is not stored
+        assert cache.stats.to_dict() == {"hits": 1, "misses": 1, "stores": 1, "evictions": 0}
+
+    def test_expired_entries_are_misses(self, tmp_path, monkeypatch):
+        """Test that entries older than the TTL are evicted on read."""
+        cache = DiskResponseCache(cache_dir=tmp_path, ttl_seconds=60)
+        cache.set("b" * 64, make_response())
+
+        later = time.time() + 120
+        monkeypatch.setattr(time, "time", lambda: later)
+        assert cache.get("b" * 64) is None
+
+        assert cache.stats.evictions == 1
+        assert not any(tmp_path.glob("*/*.json"))
+
+    def test_lru_eviction_by_entry_count(self, tmp_path):
+        """Test that the least recently used entry is evicted first."""
+        cache = DiskResponseCache(cache_dir=tmp_path, max_entries=2)
+        cache.set("1" * 64, make_response("one"))
+        cache.set("2" * 64, make_response("two"))
+        cache.get("1" * 64)  # "one" is now most recently used
+        cache.set("3" * 64, make_response("three"))
+
+        assert cache.get("2" * 64) is None
+        assert cache.get("1" * 64).text == "one"
+        assert cache.get("3" * 64).text == "three"
+
+    def test_eviction_by_size(self, tmp_path):
+        """Test that the cache stays under its byte budget."""
+        cache = DiskResponseCache(cache_dir=tmp_path, max_bytes=600)
+        for i in range(5):
+            cache.set(f"{i}" * 64, make_response("x" * 100))
+
+        total = sum(os.path.getsize(p) for p in tmp_path.glob("*/*.json"))
+        assert total <= 600
+        assert cache.stats.evictions > 0
+
+    def test_index_rebuilt_from_disk(self, tmp_path):
+        """Test that a new cache instance sees entries written earlier."""
+        DiskResponseCache(cache_dir=tmp_path).set("c" * 64, make_response())
+
+        assert DiskResponseCache(cache_dir=tmp_path).get("c" * 64) is not None
+
+
+class TestClientCaching:
+    """Tests for cache integration in LLMClient.generate."""
+
+    @pytest.fixture
+    def client(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        client = LLMClient(cache=DiskResponseCache(cache_dir=tmp_path))
+        client._providers["openai"].generate = AsyncMock(return_value=make_response("fresh"))
+        return client
+
+    @pytest.mark.asyncio
+    async def test_second_identical_request_is_cache_hit(self, client):
+        """Test that a repeated request skips the provider."""
+        first = await client.generate(make_request())
+        second = await client.generate(make_request())
+
+        assert client._providers["openai"].generate.await_count == 1
+        assert first.cache_hit is False
+        assert second.cache_hit is True
+        assert second.latency_ms == 0
+        assert second.text == "fresh"
+
+    @pytest.mark.asyncio
+    async def test_opt_out_always_calls_provider(self, client):
+        """Test that cache=False requests bypass lookup and storage."""
+        await client.generate(make_request(cache=False))
+        await client.generate(make_request(cache=False))
+
+        assert client._providers["openai"].generate.await_count == 2
+        assert client._cache.stats.stores == 0
@@ -0,0 +1,177 @@
+"""Unit tests for per-provider circuit breakers."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api.main import app
+from src.llm.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitState,
+    get_circuit_breakers,
+)
+from src.llm.client import LLMClient
+from src.llm.errors import CircuitOpenError, InvalidRequestError, ProviderError, TimeoutError
+
+from .conftest import make_request, make_response
+
+
+class TestCircuitBreaker:
+    """Tests for breaker state transitions."""
+
+    def test_opens_on_error_rate(self):
+        """Test that the circuit opens once the error rate crosses the threshold."""
+        breaker = CircuitBreaker("openai", min_calls=4, error_rate_threshold=0.5)
+        breaker.record_success()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == CircuitState.CLOSED
+
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.OPEN
+        assert not breaker.allow_request()
+
+    def test_needs_min_calls(self):
+        """Test that a single failure does not open the circuit."""
+        breaker = CircuitBreaker("openai", min_calls=5)
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.allow_request()
+
+    def test_consecutive_timeouts_open_circuit(self):
+        """Test that a run of timeouts opens the circuit before min_calls."""
+        breaker = CircuitBreaker("openai", min_calls=100, timeout_threshold=2)
+        breaker.record_failure(timeout=True)
+        breaker.record_failure(timeout=True)
+
+        assert breaker.state == CircuitState.OPEN
+
+    def test_half_open_probe_success_closes(self):
+        """Test that a successful probe closes the circuit."""
+        breaker = CircuitBreaker("openai", min_calls=1, cooldown_seconds=0, half_open_probes=1)
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.allow_request()
+        assert not breaker.allow_request()  # Only one probe at a time
+
+        breaker.record_success()
+
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.error_rate() == 0.0
+
+    def test_half_open_probe_failure_reopens(self):
+        """Test that a failed probe re-opens the circuit."""
+        breaker = CircuitBreaker("openai", min_calls=1, cooldown_seconds=60)
+        breaker.record_failure()
+        breaker._opened_at -= 60
+
+        assert breaker.allow_request()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.snapshot()["times_opened"] == 2
+
+    def test_disabled_registry_returns_none(self):
+        """Test that disabled breakers are never consulted."""
+        assert CircuitBreakerRegistry(enabled=False).get("openai") is None
+
+
+class TestClientCircuitBreaking:
+    """Tests for breaker integration in LLMClient."""
+
+    def _client(self, registry: CircuitBreakerRegistry) -> tuple[LLMClient, AsyncMock, AsyncMock]:
+        client = LLMClient(
+            openai_api_key="test-openai",
+            anthropic_api_key="test-anthropic",
+            max_retries=2,
+            circuit_breakers=registry,
+        )
+        mock_openai = AsyncMock()
+        mock_openai.generate = AsyncMock(side_effect=ProviderError("down"))
+        mock_anthropic = AsyncMock()
+        mock_anthropic.generate = AsyncMock(return_value=make_response("anthropic response", provider="anthropic"))
+        client._providers = {"openai": mock_openai, "anthropic": mock_anthropic}
+        return client, mock_openai, mock_anthropic
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_skips_provider_without_retries(self):
+        """Test that an open circuit routes straight to the fallback provider."""
+        registry = CircuitBreakerRegistry(min_calls=2, cooldown_seconds=60)
+        client, mock_openai, mock_anthropic = self._client(registry)
+
+        with patch.object(client, "is_provider_available", return_value=True):
+            with patch("asyncio.sleep", new_callable=AsyncMock) as sleep:
+                first = await client.generate(make_request())
+                # Circuit opened during the first call's retries
+                assert mock_openai.generate.call_count == 2
+                sleep.reset_mock()
+
+                second = await client.generate(make_request())
+
+        assert first.provider == "anthropic"
+        assert second.provider == "anthropic"
+        assert mock_openai.generate.call_count == 2
+        sleep.assert_not_called()
+        assert registry.get("openai").state == CircuitState.OPEN
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_without_fallback_raises(self):
+        """Test that an open circuit fails fast when fallback is disabled."""
+        registry = CircuitBreakerRegistry(min_calls=1, cooldown_seconds=60)
+        registry.get("openai").record_failure()
+        client, mock_openai, _ = self._client(registry)
+
+        with patch.object(client, "is_provider_available", return_value=True):
+            with pytest.raises(CircuitOpenError):
+                await client.generate(make_request(), provider="openai", fallback=False)
+
+        mock_openai.generate.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_non_retryable_errors_do_not_trip(self):
+        """Test that client-side errors count as provider successes."""
+        registry = CircuitBreakerRegistry(min_calls=1)
+        client, mock_openai, _ = self._client(registry)
+        mock_openai.generate.side_effect = InvalidRequestError("bad request")
+
+        with patch.object(client, "is_provider_available", return_value=True):
+            with pytest.raises(InvalidRequestError):
+                await client.generate(make_request())
+
+        assert registry.get("openai").state == CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_timeouts_recorded_as_timeouts(self):
+        """Test that provider timeouts feed the consecutive-timeout trip."""
+        registry = CircuitBreakerRegistry(min_calls=100, timeout_threshold=3)
+        client, mock_openai, _ = self._client(registry)
+        mock_openai.generate.side_effect = TimeoutError("slow")
+
+        with patch.object(client, "is_provider_available", return_value=True):
+            with patch("asyncio.sleep", new_callable=AsyncMock):
+                await client.generate(make_request())
+
+        assert mock_openai.generate.call_count == 3
+        assert registry.get("openai").state == CircuitState.OPEN
+
+
+class TestHealthEndpoint:
+    """Tests for breaker state in /health."""
+
+    def test_health_reports_breaker_state(self):
+        """Test that /health lists provider circuit states."""
+        breaker = get_circuit_breakers().get("openai")
+        breaker.min_calls = 1
+        breaker.record_failure()
+
+        response = TestClient(app).get("/health")
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["status"] == "ok"
+        assert data["llm_providers"]["openai"]["state"] == "open"
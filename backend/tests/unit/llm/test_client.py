@@ -13,7 +13,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from src.llm.client import LLMClient, get_client, generate
+from src.llm.circuit_breaker import CircuitBreakerRegistry
+from src.llm.client import LLMClient, close_llm_client, get_client, get_llm_client, generate
 from src.llm.errors import (
     AuthenticationError,
     ContentFilterError,
@@ -23,20 +24,9 @@ from src.llm.errors import (
     RateLimitError,
     TimeoutError,
 )
-from src.llm.models import ChatMessage, LLMRequest, LLMResponse, Usage
+from src.llm.models import ChatMessage, LLMRequest, StreamChunk
 
-
-def create_mock_response(text: str = "Test response", provider: str = "openai") -> LLMResponse:
-    """Create a mock LLMResponse for testing."""
-    return LLMResponse(
-        text=text,
-        tool_calls=None,
-        finish_reason="stop",
-        usage=Usage(prompt_tokens=10, completion_tokens=5, total_tokens=15),
-        model="test-model",
-        provider=provider,
-        latency_ms=100,
-    )
+from .conftest import make_response
 
 
 class TestLLMClientInit:
@@ -126,7 +116,7 @@ class TestLLMClientRetry:
     async def test_successful_first_attempt(self):
         """Test successful request on first attempt."""
         client = LLMClient(openai_api_key="test-key")
-        mock_response = create_mock_response()
+        mock_response = make_response()
 
         mock_provider = AsyncMock()
         mock_provider.generate = AsyncMock(return_value=mock_response)
@@ -147,7 +137,7 @@ class TestLLMClientRetry:
     async def test_retry_on_rate_limit(self):
         """Test retry on rate limit error."""
         client = LLMClient(openai_api_key="test-key", max_retries=2)
-        mock_response = create_mock_response()
+        mock_response = make_response()
 
         mock_provider = AsyncMock()
         mock_provider.generate = AsyncMock(
@@ -174,7 +164,7 @@ class TestLLMClientRetry:
     async def test_retry_on_timeout(self):
         """Test retry on timeout error."""
         client = LLMClient(openai_api_key="test-key", max_retries=2)
-        mock_response = create_mock_response()
+        mock_response = make_response()
 
         mock_provider = AsyncMock()
         mock_provider.generate = AsyncMock(
@@ -201,7 +191,7 @@ class TestLLMClientRetry:
     async def test_retry_on_provider_error(self):
         """Test retry on provider (5xx) error."""
         client = LLMClient(openai_api_key="test-key", max_retries=2)
-        mock_response = create_mock_response()
+        mock_response = make_response()
 
         mock_provider = AsyncMock()
         mock_provider.generate = AsyncMock(
@@ -260,8 +250,8 @@ class TestLLMClientFallback:
             max_retries=2,
         )
 
-        openai_response = create_mock_response(provider="openai")
-        anthropic_response = create_mock_response(text="Anthropic response", provider="anthropic")
+        openai_response = make_response(provider="openai")
+        anthropic_response = make_response(text="Anthropic response", provider="anthropic")
 
         mock_openai = AsyncMock()
         mock_openai.generate = AsyncMock(side_effect=RateLimitError("Rate limited"))
@@ -296,7 +286,7 @@ class TestLLMClientFallback:
             max_retries=1,
         )
 
-        anthropic_response = create_mock_response(text="Fallback response", provider="anthropic")
+        anthropic_response = make_response(text="Fallback response", provider="anthropic")
 
         mock_openai = AsyncMock()
         mock_openai.generate = AsyncMock(side_effect=TimeoutError("Timeout"))
@@ -326,7 +316,7 @@ class TestLLMClientFallback:
             max_retries=1,
         )
 
-        anthropic_response = create_mock_response(provider="anthropic")
+        anthropic_response = make_response(provider="anthropic")
 
         mock_openai = AsyncMock()
         mock_openai.generate = AsyncMock(side_effect=ProviderError("Server error"))
@@ -573,6 +563,107 @@ class TestLLMClientCorrelationId:
         assert exc_info.value.correlation_id is not None
 
 
+class TestLLMClientStream:
+    """Tests for streaming with retry and fallback."""
+
+    @staticmethod
+    def _provider(name, *attempts):
+        """Build a provider whose stream() plays one scripted attempt per call.
+
+        Each attempt is a list of deltas, optionally ending in an exception.
+        """
+        scripted = list(attempts)
+        provider = MagicMock()
+        provider.name = name
+        provider.calls = 0
+
+        async def stream(request):
+            provider.calls += 1
+            for item in scripted.pop(0):
+                if isinstance(item, Exception):
+                    raise item
+                yield StreamChunk(delta=item, provider=name)
+
+        provider.stream = stream
+        return provider
+
+    def _request(self):
+        return LLMRequest(messages=[ChatMessage(role="user", content="Hi")], model="gpt-4o")
+
+    @pytest.mark.asyncio
+    async def test_retries_before_first_chunk(self):
+        """Test that errors before any output are retried."""
+        client = LLMClient(max_retries=2)
+        provider = self._provider("openai", [TimeoutError("slow")], ["a", "b"])
+
+        with patch.object(client, "_providers", {"openai": provider}):
+            with patch.object(client, "is_provider_available", return_value=True):
+                with patch("asyncio.sleep", new_callable=AsyncMock):
+                    chunks = [c async for c in client.stream(self._request(), provider="openai", fallback=False)]
+
+        assert [c.delta for c in chunks] == ["a", "b"]
+        assert provider.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_no_retry_after_partial_output(self):
+        """Test that a mid-stream error is raised instead of replaying output."""
+        client = LLMClient(max_retries=2)
+        provider = self._provider("openai", ["a", ProviderError("dropped")], ["never"])
+
+        received = []
+        with patch.object(client, "_providers", {"openai": provider}):
+            with patch.object(client, "is_provider_available", return_value=True):
+                with pytest.raises(ProviderError):
+                    async for chunk in client.stream(self._request(), provider="openai", fallback=False):
+                        received.append(chunk.delta)
+
+        assert received == ["a"]
+        assert provider.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_next_provider(self):
+        """Test that exhausted retries fall back to the next provider."""
+        client = LLMClient(max_retries=0)
+        openai = self._provider("openai", [ProviderError("down")])
+        anthropic = self._provider("anthropic", ["from anthropic"])
+
+        with patch.object(client, "_providers", {"openai": openai, "anthropic": anthropic}):
+            with patch.object(client, "is_provider_available", return_value=True):
+                chunks = [c async for c in client.stream(self._request())]
+
+        assert [c.provider for c in chunks] == ["anthropic"]
+
+    @pytest.mark.asyncio
+    async def test_non_retryable_error_raises(self):
+        """Test that non-retryable errors are not retried."""
+        client = LLMClient(max_retries=2)
+        provider = self._provider("openai", [AuthenticationError("bad key")])
+
+        with patch.object(client, "_providers", {"openai": provider}):
+            with patch.object(client, "is_provider_available", return_value=True):
+                with pytest.raises(AuthenticationError):
+                    async for _ in client.stream(self._request()):
+                        pass
+
+        assert provider.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_skips_provider(self):
+        """Test that a provider with an open circuit is not streamed from."""
+        registry = CircuitBreakerRegistry(min_calls=1, cooldown_seconds=60)
+        registry.get("openai").record_failure()
+        client = LLMClient(max_retries=2, circuit_breakers=registry)
+        openai = self._provider("openai", ["never"])
+        anthropic = self._provider("anthropic", ["from anthropic"])
+
+        with patch.object(client, "_providers", {"openai": openai, "anthropic": anthropic}):
+            with patch.object(client, "is_provider_available", return_value=True):
+                chunks = [c async for c in client.stream(self._request())]
+
+        assert [c.provider for c in chunks] == ["anthropic"]
+        assert openai.calls == 0
+
+
 class TestModuleLevelFunctions:
     """Tests for module-level convenience functions."""
 
@@ -587,10 +678,22 @@ class TestModuleLevelFunctions:
 
         assert client1 is client2
 
+    @pytest.mark.asyncio
+    async def test_shared_client_reused_until_closed(self):
+        """Test that services share one client and shutdown drops it."""
+        client = get_llm_client()
+
+        assert get_llm_client() is client
+        assert get_client() is client
+
+        await close_llm_client()
+
+        assert get_llm_client() is not client
+
     @pytest.mark.asyncio
     async def test_generate_function(self):
         """Test the module-level generate function."""
-        mock_response = create_mock_response()
+        mock_response = make_response()
 
         with patch("src.llm.client.get_client") as mock_get_client:
             mock_client = AsyncMock()
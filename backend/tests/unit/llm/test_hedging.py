@@ -0,0 +1,169 @@
+"""Unit tests for hedged LLM requests."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.llm.client import LLMClient
+from src.llm.errors import ProviderError
+from src.llm.hedging import HedgingPolicy, LatencyTracker
+
+from .conftest import make_request, make_response
+
+
+def warmed_policy(**kwargs) -> HedgingPolicy:
+    """Create a policy with enough 10ms samples to hedge gpt-4o."""
+    kwargs.setdefault("min_delay_seconds", 0.01)
+    kwargs.setdefault("budget_ratio", 1.0)
+    policy = HedgingPolicy(enabled=True, min_samples=5, **kwargs)
+    for _ in range(5):
+        policy.record_latency("gpt-4o", 10)
+    return policy
+
+
+def scripted_generate(*calls):
+    """Build a provider generate() that plays (delay, result) per call."""
+    scripted = list(calls)
+    cancelled = []
+
+    async def generate(request):
+        delay, result = scripted.pop(0)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled.append(result)
+            raise
+        if isinstance(result, Exception):
+            raise result
+        return make_response(result)
+
+    return AsyncMock(side_effect=generate), cancelled
+
+
+def make_client(policy: HedgingPolicy, generate: AsyncMock) -> LLMClient:
+    """Create a client whose OpenAI provider uses the scripted generate()."""
+    client = LLMClient(max_retries=0, hedging=policy)
+    client._providers["openai"].generate = generate
+    return client
+
+
+class TestLatencyTracker:
+    """Tests for per-model latency tracking."""
+
+    def test_percentile_nearest_rank(self):
+        """Test nearest-rank percentile over recorded samples."""
+        tracker = LatencyTracker()
+        for latency in range(1, 101):
+            tracker.record("gpt-4o", latency)
+
+        assert tracker.percentile("gpt-4o", 95) == 95
+        assert tracker.percentile("gpt-4o", 50) == 50
+        assert tracker.percentile("claude", 95) is None
+
+    def test_window_keeps_recent_samples(self):
+        """Test that old samples fall out of the window."""
+        tracker = LatencyTracker(window=3)
+        for latency in (1000, 1000, 10, 10, 10):
+            tracker.record("gpt-4o", latency)
+
+        assert tracker.percentile("gpt-4o", 100) == 10
+
+
+class TestHedgingPolicy:
+    """Tests for hedge decisions and budget."""
+
+    def test_no_hedge_without_samples(self):
+        """Test that cold models are never hedged."""
+        assert HedgingPolicy(min_samples=5).hedge_delay("gpt-4o") is None
+
+    def test_delay_respects_floor(self):
+        """Test that the hedge delay never drops below the minimum."""
+        policy = warmed_policy(min_delay_seconds=0.5)
+
+        assert policy.hedge_delay("gpt-4o") == 0.5
+
+    def test_budget_caps_hedge_ratio(self):
+        """Test that hedges stay within the configured fraction of requests."""
+        policy = HedgingPolicy(budget_ratio=0.5)
+        policy.start_request()
+        policy.start_request()
+
+        assert policy.try_acquire_hedge()
+        assert not policy.try_acquire_hedge()
+        assert policy.get_stats()["budget_denied"] == 1
+
+
+class TestClientHedging:
+    """Tests for hedging in LLMClient.generate."""
+
+    @pytest.mark.asyncio
+    async def test_hedge_wins_and_primary_is_cancelled(self, monkeypatch):
+        """Test that a fast duplicate beats a slow original."""
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        policy = warmed_policy()
+        generate, cancelled = scripted_generate((5.0, "slow"), (0.0, "hedge"))
+        client = make_client(policy, generate)
+
+        response = await client.generate(make_request(), provider="openai", fallback=False)
+        await asyncio.sleep(0)
+
+        assert response.text == "hedge"
+        assert cancelled == ["slow"]
+        assert policy.get_stats()["hedge_wins"] == 1
+
+    @pytest.mark.asyncio
+    async def test_fast_call_is_not_hedged(self, monkeypatch):
+        """Test that calls finishing before the delay are not duplicated."""
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        policy = warmed_policy(min_delay_seconds=1.0)
+        generate, _ = scripted_generate((0.0, "fast"))
+        client = make_client(policy, generate)
+
+        response = await client.generate(make_request(), provider="openai", fallback=False)
+
+        assert response.text == "fast"
+        assert generate.call_count == 1
+        assert policy.get_stats()["hedges_launched"] == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_hedge_falls_back_to_primary(self, monkeypatch):
+        """Test that a failing duplicate does not fail the call."""
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        policy = warmed_policy()
+        generate, _ = scripted_generate((0.05, "primary"), (0.0, ProviderError("down")))
+        client = make_client(policy, generate)
+
+        with patch("src.llm.client.LLMClient._calculate_backoff", return_value=0):
+            response = await client.generate(make_request(), provider="openai", fallback=False)
+
+        assert response.text == "primary"
+        assert policy.get_stats()["hedge_wins"] == 0
+
+    @pytest.mark.asyncio
+    async def test_exhausted_budget_waits_for_primary(self, monkeypatch):
+        """Test that no duplicate is sent once the budget is spent."""
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        policy = warmed_policy(budget_ratio=0.0)
+        generate, _ = scripted_generate((0.05, "primary"))
+        client = make_client(policy, generate)
+
+        response = await client.generate(make_request(), provider="openai", fallback=False)
+
+        assert response.text == "primary"
+        assert generate.call_count == 1
+        assert policy.get_stats()["budget_denied"] == 1
+
+    @pytest.mark.asyncio
+    async def test_hedging_off_by_default(self, monkeypatch):
+        """Test that generate() only hedges when enabled."""
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        policy = warmed_policy()
+        policy.enabled = False
+        generate, _ = scripted_generate((0.05, "primary"))
+        client = make_client(policy, generate)
+
+        await client.generate(make_request(), provider="openai", fallback=False)
+
+        assert generate.call_count == 1
+        assert policy.get_stats()["requests"] == 0
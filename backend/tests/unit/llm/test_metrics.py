@@ -0,0 +1,172 @@
+"""Unit tests for LLM call telemetry."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api.main import app
+from src.llm.client import LLMClient
+from src.llm.errors import ProviderError, RateLimitError
+from src.llm.metrics import (
+    LLMMetrics,
+    LLMUsageRollup,
+    bind_llm_usage,
+    get_current_stage,
+    llm_stage,
+    set_llm_metrics,
+    unbind_llm_usage,
+)
+from src.models.generation_job import GenerationJob
+
+from .conftest import make_request, make_response
+
+# Latency and token counts of the mocked provider calls
+JOB_CALL = {"latency_ms": 1200, "prompt_tokens": 300, "completion_tokens": 40}
+
+
+@pytest.fixture
+def metrics():
+    """Install a fresh metrics registry."""
+    registry = LLMMetrics()
+    set_llm_metrics(registry)
+    yield registry
+    set_llm_metrics(None)
+
+
+@pytest.fixture
+def client(metrics):
+    """LLMClient with both providers configured and no retry delay."""
+    with patch.dict("os.environ", {"OPENAI_API_KEY": "k", "ANTHROPIC_API_KEY": "k"}):
+        client = LLMClient(max_retries=1, metrics=metrics)
+        client._calculate_backoff = lambda attempt, error: 0
+        yield client
+
+
+def stats_by_key(metrics: LLMMetrics) -> dict:
+    """Index stats entries by (stage, provider)."""
+    return {(s["stage"], s["provider"]): s for s in metrics.get_stats()}
+
+
+class TestStageContext:
+    """Tests for the llm_stage context manager."""
+
+    @pytest.mark.asyncio
+    async def test_stage_is_scoped_and_inherited_by_tasks(self):
+        """Test that tasks created inside a stage report that stage."""
+        async def stage_in_task():
+            await asyncio.sleep(0)
+            return get_current_stage()
+
+        assert get_current_stage() == "unknown"
+        with llm_stage("chapter"):
+            task = asyncio.create_task(stage_in_task())
+        assert await task == "chapter"
+        assert get_current_stage() == "unknown"
+
+
+class TestClientMetrics:
+    """Tests for metrics recorded by LLMClient."""
+
+    @pytest.mark.asyncio
+    async def test_success_records_latency_and_tokens(self, client, metrics):
+        """Test that a successful call is recorded under its stage."""
+        client._providers["openai"].generate = AsyncMock(return_value=make_response(**JOB_CALL))
+
+        with llm_stage("planning"):
+            await client.generate(make_request())
+
+        entry = stats_by_key(metrics)[("planning", "openai")]
+        assert entry["calls"] == 1
+        assert entry["latency_ms"] == 1200
+        assert entry["prompt_tokens"] == 300
+        assert entry["completion_tokens"] == 40
+
+    @pytest.mark.asyncio
+    async def test_retries_fallbacks_and_errors(self, client, metrics):
+        """Test that retries, fallbacks and errors by type are counted."""
+        client._providers["openai"].generate = AsyncMock(
+            side_effect=[RateLimitError("slow down", provider="openai"), ProviderError("down", provider="openai")]
+        )
+        client._providers["anthropic"].generate = AsyncMock(return_value=make_response(provider="anthropic"))
+
+        with llm_stage("chapter"):
+            await client.generate(make_request())
+
+        stats = stats_by_key(metrics)
+        assert stats[("chapter", "openai")]["errors"] == 2
+        assert stats[("chapter", "openai")]["retries"] == 1
+        assert stats[("chapter", "openai")]["fallbacks"] == 1
+        assert stats[("chapter", "anthropic")]["calls"] == 1
+
+        text = metrics.render_prometheus()
+        assert 'llm_errors_total{stage="chapter",model="gpt-4o",provider="openai",error_type="RateLimitError"} 1' in text
+        assert 'llm_fallbacks_total{stage="chapter",model="gpt-4o",provider="openai"} 1' in text
+
+    @pytest.mark.asyncio
+    async def test_job_rollup_collects_bound_calls(self, client, metrics):
+        """Test that calls made while a rollup is bound are attributed to it."""
+        client._providers["openai"].generate = AsyncMock(return_value=make_response(**JOB_CALL))
+        rollup = LLMUsageRollup()
+
+        token = bind_llm_usage(rollup)
+        try:
+            with llm_stage("evidence"):
+                await asyncio.gather(client.generate(make_request()), client.generate(make_request()))
+        finally:
+            unbind_llm_usage(token)
+        await client.generate(make_request())  # outside the job
+
+        assert rollup.prompt_tokens == 600
+        assert rollup.completion_tokens == 80
+        assert rollup.to_list()[0]["stage"] == "evidence"
+        assert rollup.to_list()[0]["calls"] == 2
+
+
+class TestPrometheusExport:
+    """Tests for the Prometheus text format."""
+
+    def test_histogram_buckets_are_cumulative(self, metrics):
+        """Test bucket, sum and count lines for a histogram."""
+        with llm_stage("polish"):
+            metrics.record_response("openai", make_response(latency_ms=3000))
+
+        text = metrics.render_prometheus()
+
+        labels = 'stage="polish",model="gpt-4o",provider="openai"'
+        assert "# TYPE llm_request_latency_seconds histogram" in text
+        assert f'llm_request_latency_seconds_bucket{{{labels},le="2.5"}} 0' in text
+        assert f'llm_request_latency_seconds_bucket{{{labels},le="5"}} 1' in text
+        assert f'llm_request_latency_seconds_bucket{{{labels},le="+Inf"}} 1' in text
+        assert f"llm_request_latency_seconds_sum{{{labels}}} 3" in text
+        assert f"llm_requests_total{{{labels}}} 1" in text
+
+    def test_metrics_endpoint(self, metrics):
+        """Test that GET /metrics serves the registry as plain text."""
+        with llm_stage("qa_faithfulness"):
+            metrics.record_response("openai", make_response())
+
+        response = TestClient(app).get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert 'stage="qa_faithfulness"' in response.text
+
+
+class TestGenerationJobStats:
+    """Tests for the per-job rollup in GenerationJob.get_stats()."""
+
+    def test_get_stats_includes_llm_usage(self):
+        """Test that stored rollup entries are returned as LLMStageUsage."""
+        rollup = LLMUsageRollup()
+        entry = rollup.get("chapter", "gpt-4o", "openai")
+        entry.calls = 3
+        entry.prompt_tokens = 900
+
+        job = GenerationJob(job_id="job-1", llm_usage=rollup.to_list(), total_prompt_tokens=900)
+        stats = job.get_stats()
+
+        assert stats.tokens_used.prompt_tokens == 900
+        assert stats.llm_usage[0].stage == "chapter"
+        assert stats.llm_usage[0].calls == 3
@@ -24,6 +24,21 @@ from src.llm.models import ChatMessage, LLMRequest, ResponseFormat
 from src.llm.providers.openai import OpenAIProvider, _normalize_openai_json_schema
 
 
+class FakeStream:
+    """Fake SDK AsyncStream: async iteration plus an awaitable close()."""
+
+    def __init__(self, items):
+        self.items = list(items)
+        self.closed = False
+
+    async def __aiter__(self):
+        for item in self.items:
+            yield item
+
+    async def close(self):
+        self.closed = True
+
+
 class FakeAPIStatusError(Exception):
     """Fake API error for testing exception chaining."""
 
@@ -218,6 +233,28 @@ class TestOpenAIResponseParsing:
         assert response.usage.prompt_tokens == 10
         assert response.usage.completion_tokens == 5
 
+    def test_parse_cached_prompt_tokens(self):
+        """Test that automatic prompt-cache hits are reported in Usage."""
+        provider = OpenAIProvider(api_key="test-key")
+
+        mock_response = MagicMock()
+        mock_response.id = "req_123"
+        mock_response.model = "gpt-4o"
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = "Hi"
+        mock_response.choices[0].message.tool_calls = None
+        mock_response.choices[0].finish_reason = "stop"
+        mock_response.usage.prompt_tokens = 6000
+        mock_response.usage.completion_tokens = 50
+        mock_response.usage.total_tokens = 6050
+        mock_response.usage.prompt_tokens_details.cached_tokens = 5888
+        mock_response.model_dump = MagicMock(return_value={})
+
+        response = provider._parse_response(mock_response, latency_ms=100)
+
+        assert response.usage.prompt_tokens == 6000
+        assert response.usage.cached_tokens == 5888
+
     def test_parse_tool_call_response(self):
         """Test parsing a response with tool calls."""
         provider = OpenAIProvider(api_key="test-key")
@@ -481,6 +518,84 @@ class TestOpenAIProviderGenerate:
         assert "API key not configured" in str(exc_info.value)
 
 
+class TestOpenAIProviderStream:
+    """Tests for OpenAI provider streaming."""
+
+    @staticmethod
+    def _chunk(content=None, finish_reason=None, usage=None):
+        chunk = MagicMock()
+        chunk.model = "gpt-4o"
+        chunk.usage = usage
+        if content is None and finish_reason is None:
+            chunk.choices = []
+        else:
+            chunk.choices = [MagicMock()]
+            chunk.choices[0].delta.content = content
+            chunk.choices[0].finish_reason = finish_reason
+        return chunk
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_deltas_then_usage(self):
+        """Test that text deltas stream before a final usage chunk."""
+        provider = OpenAIProvider(api_key="test-key")
+        usage = MagicMock(prompt_tokens=5, completion_tokens=2, total_tokens=7)
+
+        stream = FakeStream([
+            self._chunk("Hel"),
+            self._chunk("lo"),
+            self._chunk("", finish_reason="stop"),
+            self._chunk(usage=usage),
+        ])
+
+        mock_client = AsyncMock()
+        mock_client.chat.completions.create = AsyncMock(return_value=stream)
+
+        with patch.object(provider, "_client", mock_client):
+            request = LLMRequest(messages=[ChatMessage(role="user", content="Hi")], model="gpt-4o")
+            chunks = [c async for c in provider.stream(request)]
+
+        call_kwargs = mock_client.chat.completions.create.call_args.kwargs
+        assert call_kwargs["stream"] is True
+        assert call_kwargs["stream_options"] == {"include_usage": True}
+        assert "".join(c.delta for c in chunks) == "Hello"
+        assert chunks[-1].finish_reason == "stop"
+        assert chunks[-1].usage.total_tokens == 7
+        assert stream.closed
+
+    @pytest.mark.asyncio
+    async def test_stream_closed_when_consumer_stops(self):
+        """Test that abandoning the stream aborts the HTTP response."""
+        provider = OpenAIProvider(api_key="test-key")
+        stream = FakeStream([self._chunk("Hel"), self._chunk("lo")])
+        mock_client = AsyncMock()
+        mock_client.chat.completions.create = AsyncMock(return_value=stream)
+
+        with patch.object(provider, "_client", mock_client):
+            request = LLMRequest(messages=[ChatMessage(role="user", content="Hi")], model="gpt-4o")
+            chunks = provider.stream(request)
+            assert (await anext(chunks)).delta == "Hel"
+            await chunks.aclose()
+
+        assert stream.closed
+
+    @pytest.mark.asyncio
+    async def test_stream_maps_timeout(self):
+        """Test that stream timeouts map to TimeoutError."""
+        from openai import APITimeoutError
+
+        provider = OpenAIProvider(api_key="test-key")
+        mock_client = AsyncMock()
+        mock_client.chat.completions.create = AsyncMock(
+            side_effect=APITimeoutError(request=MagicMock())
+        )
+
+        with patch.object(provider, "_client", mock_client):
+            request = LLMRequest(messages=[ChatMessage(role="user", content="Hi")], model="gpt-4o")
+            with pytest.raises(TimeoutError):
+                async for _ in provider.stream(request):
+                    pass
+
+
 class TestNormalizeOpenAIJsonSchema:
     """Tests for JSON schema normalization for OpenAI structured output."""
 
@@ -0,0 +1,91 @@
+"""Unit tests for the shared LLM HTTP connection pool."""
+
+import asyncio
+
+import anthropic as anthropic_sdk
+import httpx
+import openai
+import pytest
+
+from src.llm import pool
+from src.llm.pool import close_shared_http_clients, get_shared_http_client
+from src.llm.providers.anthropic import AnthropicProvider
+from src.llm.providers.openai import OpenAIProvider
+
+
+@pytest.fixture(autouse=True)
+def reset_pool():
+    """Start each test with an empty pool registry."""
+    pool._shared_clients.clear()
+    yield
+    pool._shared_clients.clear()
+
+
+class TestSharedHttpClient:
+    """Tests for get_shared_http_client."""
+
+    @pytest.mark.asyncio
+    async def test_same_client_within_event_loop(self):
+        """Test repeated calls on one loop return the same pooled client."""
+        first = get_shared_http_client()
+        second = get_shared_http_client()
+
+        assert isinstance(first, httpx.AsyncClient)
+        assert first is second
+        await close_shared_http_clients()
+
+    def test_no_client_outside_event_loop(self):
+        """Test that no shared client is created without a running loop."""
+        assert get_shared_http_client() is None
+
+    def test_separate_client_per_event_loop(self):
+        """Test that each event loop gets its own pool."""
+        async def grab():
+            return get_shared_http_client()
+
+        first = asyncio.run(grab())
+        second = asyncio.run(grab())
+
+        assert first is not second
+
+    @pytest.mark.asyncio
+    async def test_pool_limits_configured(self):
+        """Test that pool limits come from module configuration."""
+        client = get_shared_http_client()
+        pool_impl = client._transport._pool
+
+        assert pool_impl._max_connections == pool.LLM_HTTP_MAX_CONNECTIONS
+        assert pool_impl._max_keepalive_connections == pool.LLM_HTTP_MAX_KEEPALIVE
+        await close_shared_http_clients()
+
+    @pytest.mark.asyncio
+    async def test_closed_client_is_replaced(self):
+        """Test that a new client is created after the pool is closed."""
+        first = get_shared_http_client()
+        await close_shared_http_clients()
+
+        assert first.is_closed
+        assert get_shared_http_client() is not first
+        await close_shared_http_clients()
+
+    def test_http2_requires_h2_package(self, monkeypatch):
+        """Test that HTTP/2 is only enabled when h2 can be imported."""
+        monkeypatch.setattr(pool.importlib.util, "find_spec", lambda name: None)
+
+        assert pool.http2_available() is False
+
+
+class TestProvidersSharePool:
+    """Tests that providers reuse the shared transport."""
+
+    @pytest.mark.asyncio
+    async def test_providers_from_different_clients_share_transport(self):
+        """Test that separate provider instances use one connection pool."""
+        openai_a = OpenAIProvider(api_key="test-key")
+        openai_b = OpenAIProvider(api_key="test-key")
+        anthropic = AnthropicProvider(api_key="test-key")
+
+        assert openai_a.client._client is openai_b.client._client
+        assert openai_a.client._client is get_shared_http_client(openai.DefaultAsyncHttpxClient)
+        assert anthropic.client._client is get_shared_http_client(anthropic_sdk.DefaultAsyncHttpxClient)
+        await close_shared_http_clients()
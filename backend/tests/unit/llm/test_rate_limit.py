@@ -0,0 +1,159 @@
+"""Unit tests for the shared RPM/TPM rate limiter."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api.main import app
+from src.llm.client import LLMClient
+from src.llm.models import LLMResponse, Usage
+from src.llm.rate_limit import RateLimiter, estimate_prompt_tokens, set_rate_limiter
+
+from .conftest import make_request
+
+
+class TestEstimatePromptTokens:
+    """Tests for prompt token estimation."""
+
+    def test_four_chars_per_token(self):
+        """Test the chars/4 heuristic."""
+        assert estimate_prompt_tokens(make_request("x" * 400)) == 100
+
+    def test_minimum_one_token(self):
+        """Test that empty prompts still count as one token."""
+        assert estimate_prompt_tokens(make_request("")) == 1
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter buckets."""
+
+    @pytest.mark.asyncio
+    async def test_unconfigured_provider_is_unlimited(self):
+        """Test that providers without limits get no permit."""
+        limiter = RateLimiter(limits={})
+
+        assert await limiter.acquire("openai", make_request()) is None
+
+    @pytest.mark.asyncio
+    async def test_model_limit_overrides_provider_limit(self):
+        """Test that provider:model entries win over provider entries."""
+        limiter = RateLimiter(limits={
+            "openai": {"rpm": 10},
+            "openai:gpt-4o-mini": {"rpm": 1000},
+        })
+
+        mini = await limiter.acquire("openai", make_request(model="gpt-4o-mini"))
+        other = await limiter.acquire("openai", make_request(model="gpt-4o"))
+
+        assert mini.key == "openai:gpt-4o-mini"
+        assert other.key == "openai"
+
+    @pytest.mark.asyncio
+    async def test_rpm_exhaustion_waits_for_refill(self):
+        """Test that calls beyond the RPM budget wait instead of failing."""
+        limiter = RateLimiter(limits={"openai": {"rpm": 600}})  # 10 per second
+        bucket_key = "openai"
+
+        # Drain the bucket
+        for _ in range(600):
+            await limiter.acquire("openai", make_request())
+
+        start = time.monotonic()
+        permit = await limiter.acquire("openai", make_request())
+        waited = time.monotonic() - start
+
+        assert permit.wait_seconds > 0
+        assert 0.05 <= waited < 1.0
+        stats = limiter.get_stats()[bucket_key]
+        assert stats["requests"] == 601
+        assert stats["waited_requests"] >= 1
+        assert stats["max_wait_seconds"] > 0
+
+    @pytest.mark.asyncio
+    async def test_waiters_are_served_in_arrival_order(self):
+        """Test FIFO fairness for queued calls."""
+        limiter = RateLimiter(limits={"openai": {"rpm": 1200}})  # 20 per second
+        for _ in range(1200):
+            await limiter.acquire("openai", make_request())
+
+        order = []
+
+        async def call(i):
+            await limiter.acquire("openai", make_request())
+            order.append(i)
+
+        tasks = []
+        for i in range(4):
+            tasks.append(asyncio.create_task(call(i)))
+            await asyncio.sleep(0)  # Ensure arrival order
+        await asyncio.gather(*tasks)
+
+        assert order == [0, 1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_settle_refunds_overestimate_and_charges_debt(self):
+        """Test that actual usage corrects the token bucket."""
+        limiter = RateLimiter(limits={"openai": {"tpm": 1000}})
+        permit = await limiter.acquire("openai", make_request("x" * 400))  # 100 estimated
+        bucket = limiter._buckets["openai"]
+        after_acquire = bucket.tokens_available
+
+        limiter.settle(permit, 40)
+        assert bucket.tokens_available == pytest.approx(after_acquire + 60)
+
+        limiter.settle(permit, 500)
+        assert bucket.tokens_available == pytest.approx(after_acquire + 60 - 400)
+
+    @pytest.mark.asyncio
+    async def test_queue_wait_exported_on_metrics_endpoint(self):
+        """Test that queue waits are served on /metrics per provider/model."""
+        limiter = RateLimiter(limits={"openai": {"rpm": 600}, "openai:gpt-4o-mini": {"rpm": 600}})
+        for _ in range(601):
+            await limiter.acquire("openai", make_request())
+        await limiter.acquire("openai", make_request(model="gpt-4o-mini"))
+
+        set_rate_limiter(limiter)
+        try:
+            text = TestClient(app).get("/metrics").text
+        finally:
+            set_rate_limiter(None)
+
+        labels = 'provider="openai",model="*"'
+        assert f"llm_rate_limit_waited_requests_total{{{labels}}} 1" in text
+        assert f'llm_rate_limit_wait_seconds_bucket{{{labels},le="+Inf"}} 601' in text
+        assert f"llm_rate_limit_wait_seconds_count{{{labels}}} 601" in text
+        max_wait = next(
+            line for line in text.splitlines() if line.startswith(f"llm_rate_limit_max_wait_seconds{{{labels}}}")
+        )
+        assert float(max_wait.split()[-1]) > 0
+        assert 'llm_rate_limit_wait_seconds_count{provider="openai",model="gpt-4o-mini"} 1' in text
+
+
+class TestClientRateLimiting:
+    """Tests for rate limiter integration in LLMClient."""
+
+    @pytest.mark.asyncio
+    async def test_generate_acquires_and_settles_with_usage(self, monkeypatch):
+        """Test that generate() reserves budget and settles actual usage."""
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        limiter = RateLimiter(limits={"openai": {"rpm": 100, "tpm": 10000}})
+        client = LLMClient(rate_limiter=limiter)
+        client._providers["openai"].generate = AsyncMock(return_value=LLMResponse(
+            text="ok",
+            finish_reason="stop",
+            usage=Usage(prompt_tokens=90, completion_tokens=60, total_tokens=150),
+            model="gpt-4o",
+            provider="openai",
+            latency_ms=10,
+        ))
+
+        with patch.object(limiter, "settle", wraps=limiter.settle) as settle:
+            await client.generate(make_request(), provider="openai", fallback=False)
+
+        permit, actual = settle.call_args.args
+        assert permit.key == "openai"
+        assert actual == 150
+        assert limiter.get_stats()["openai"]["requests"] == 1
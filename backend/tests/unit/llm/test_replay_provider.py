@@ -0,0 +1,144 @@
+"""Unit tests for the record/replay provider."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.llm.client import LLMClient
+from src.llm.errors import InvalidRequestError
+from src.llm.models import LLMResponse
+from src.llm.providers.replay import ReplayProvider, SyntheticLatency, set_replay_latency
+
+from .conftest import make_request, make_response
+
+
+def make_upstream(response: LLMResponse | None = None) -> MagicMock:
+    """Create a mock live provider."""
+    upstream = MagicMock()
+    upstream.generate = AsyncMock(return_value=response or make_response("Recorded answer", latency_ms=1500))
+    upstream.supports = MagicMock(return_value=False)
+    return upstream
+
+
+class TestSyntheticLatency:
+    """Tests for latency spec parsing and sampling."""
+
+    def test_parse_kinds(self):
+        """Test that each spec kind parses with its parameters."""
+        assert SyntheticLatency.parse("none").sample_ms(900) == 0.0
+        assert SyntheticLatency.parse("recorded").sample_ms(900) == 900.0
+        assert SyntheticLatency.parse("fixed:250").sample_ms(900) == 250.0
+        assert 100 <= SyntheticLatency.parse("uniform:100:200").sample_ms(0) <= 200
+        assert SyntheticLatency.parse("lognormal:500:0.3").sample_ms(0) > 0
+
+    @pytest.mark.parametrize("spec", ["gaussian:1", "fixed", "uniform:1", "fixed:-5"])
+    def test_parse_rejects_malformed(self, spec):
+        """Test that malformed specs raise ValueError."""
+        with pytest.raises(ValueError):
+            SyntheticLatency.parse(spec)
+
+    def test_seeded_samples_are_reproducible(self):
+        """Test that the same seed gives the same latency sequence."""
+        a = SyntheticLatency.parse("lognormal:800:0.5", seed=7)
+        b = SyntheticLatency.parse("lognormal:800:0.5", seed=7)
+        assert [a.sample_ms(0) for _ in range(5)] == [b.sample_ms(0) for _ in range(5)]
+
+    def test_clients_share_the_seeded_sequence(self, monkeypatch):
+        """Test that clients built per call keep drawing from one latency sequence."""
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        set_replay_latency(SyntheticLatency.parse("uniform:100:900", seed=0))
+        try:
+            samples = [
+                LLMClient()._providers["replay"].latency.sample_ms(0) for _ in range(5)
+            ]
+        finally:
+            set_replay_latency(None)
+
+        expected = SyntheticLatency.parse("uniform:100:900", seed=0)
+        assert samples == [expected.sample_ms(0) for _ in range(5)]
+        assert len(set(samples)) == 5
+
+
+class TestReplayProvider:
+    """Tests for recording and replaying responses."""
+
+    @pytest.mark.asyncio
+    async def test_record_then_replay(self, tmp_path):
+        """Test that a recorded response is served back without the upstream."""
+        upstream = make_upstream()
+        recorder = ReplayProvider(upstream=upstream, fixture_dir=tmp_path, mode="record")
+
+        recorded = await recorder.generate(make_request())
+
+        assert recorded.text == "Recorded answer"
+        assert len(list(tmp_path.glob("*/*.json"))) == 1
+
+        replayer = ReplayProvider(fixture_dir=tmp_path, mode="replay")
+        replayed = await replayer.generate(make_request())
+
+        assert replayed.text == "Recorded answer"
+        assert replayed.usage.total_tokens == 15
+        assert replayed.latency_ms < 1500
+        upstream.generate.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_missing_fixture_is_non_retryable(self, tmp_path):
+        """Test that an unrecorded request raises InvalidRequestError."""
+        provider = ReplayProvider(fixture_dir=tmp_path, mode="replay")
+
+        with pytest.raises(InvalidRequestError, match="No recorded response"):
+            await provider.generate(make_request("never recorded"))
+
+    @pytest.mark.asyncio
+    async def test_replay_applies_synthetic_latency(self, tmp_path):
+        """Test that replayed calls sleep for the sampled latency."""
+        recorder = ReplayProvider(upstream=make_upstream(), fixture_dir=tmp_path, mode="record")
+        await recorder.generate(make_request())
+
+        provider = ReplayProvider(
+            fixture_dir=tmp_path, mode="replay", latency=SyntheticLatency.parse("fixed:30")
+        )
+        response = await provider.generate(make_request())
+
+        assert response.latency_ms >= 30
+
+    @pytest.mark.asyncio
+    async def test_stream_replays_text_in_chunks(self, tmp_path):
+        """Test that streaming yields the recorded text and a final chunk."""
+        text = "x" * 450
+        recorder = ReplayProvider(
+            upstream=make_upstream(make_response(text)), fixture_dir=tmp_path, mode="record"
+        )
+        await recorder.generate(make_request())
+
+        provider = ReplayProvider(fixture_dir=tmp_path, mode="replay")
+        chunks = [chunk async for chunk in provider.stream(make_request())]
+
+        assert "".join(c.delta for c in chunks) == text
+        assert chunks[-1].finish_reason == "stop"
+        assert chunks[-1].usage.total_tokens == 15
+
+    def test_supports_delegates_to_upstream(self, tmp_path):
+        """Test that capabilities follow the recorded provider."""
+        provider = ReplayProvider(upstream=make_upstream(), fixture_dir=tmp_path)
+        assert provider.supports("json_schema") is False
+
+
+class TestClientReplaySelection:
+    """Tests for selecting the replay provider via LLM_DEFAULT_PROVIDER."""
+
+    @pytest.mark.asyncio
+    async def test_replay_default_never_falls_back(self, tmp_path, monkeypatch):
+        """Test that replay mode routes every call to fixtures only."""
+        monkeypatch.setenv("LLM_DEFAULT_PROVIDER", "replay")
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        client = LLMClient(max_retries=0)
+        client._providers["replay"] = ReplayProvider(fixture_dir=tmp_path, mode="replay")
+        client._providers["openai"].generate = AsyncMock()
+
+        with pytest.raises(InvalidRequestError):
+            await client.generate(make_request())
+
+        assert client._providers_to_try(None, fallback=True) == ["replay"]
+        assert client.is_provider_available("replay")
+        client._providers["openai"].generate.assert_not_called()
@@ -133,6 +133,7 @@ class TestDraftGenRequest:
         assert api_req["transcript"] == "test transcript content"
         assert api_req["candidate_count"] == 2
         assert api_req["require_preflight_pass"] is True
+        assert api_req["priority"] == "batch"
         assert "transcript_id" not in api_req  # Not part of API
 
     def test_to_request_json(self):
@@ -246,6 +246,43 @@ class TestCorpusAggregation:
         assert report["content_mode"] == "essay"
         assert "generated_at" in report
 
+    def test_aggregates_timings(self):
+        """Timing profile averages stages and ranks passes over timed rows only."""
+        timed_a = make_pass_gate_row("T001")
+        timed_a.stage_wall_ms = {"planning": 1000.0, "post_process": 200.0}
+        timed_a.stage_cpu_ms = {"planning": 10.0, "post_process": 180.0}
+        timed_a.pass_cpu_ms = {"enforce_quote_whitelist": 60.0, "repair_whitespace": 2.0}
+        timed_a.max_chapter_wall_ms = 800.0
+        timed_b = make_pass_gate_row("T002")
+        timed_b.stage_wall_ms = {"planning": 3000.0, "post_process": 400.0}
+        timed_b.stage_cpu_ms = {"planning": 20.0, "post_process": 380.0}
+        timed_b.pass_cpu_ms = {"enforce_quote_whitelist": 100.0}
+        timed_b.max_chapter_wall_ms = 1200.0
+        # Cached drafts carry no timings and are left out
+        cached = make_pass_gate_row("T003")
+
+        report = aggregate_corpus(
+            gate_rows=[timed_a, timed_b, cached],
+            git_commit="abc1234",
+            config_hash="cfg123",
+            prompt_version="ideas_v3",
+            content_mode="essay",
+            require_preflight_pass=True,
+        )
+
+        timings = report["timings"]
+        assert timings["transcript_count"] == 2
+        assert timings["stages"]["planning"] == {
+            "mean_wall_ms": 2000.0, "max_wall_ms": 3000.0, "mean_cpu_ms": 15.0,
+        }
+        assert timings["max_chapter_wall_ms"] == 1200.0
+        assert list(timings["top_passes_cpu_ms"]) == ["enforce_quote_whitelist", "repair_whitespace"]
+        assert timings["top_passes_cpu_ms"]["enforce_quote_whitelist"] == 80.0
+
+        md = render_summary_md(report)
+        assert "## Timing Profile" in md
+        assert "| planning | 2000 | 3000 | 15 |" in md
+
 
 # =============================================================================
 # Summary Markdown Tests
@@ -470,6 +470,30 @@ class TestGateRow:
         assert d["verdict"] == "FAIL"
         assert "error" in d
 
+    def test_timings_summarized_onto_row(self):
+        """Stage entries are kept by name, passes summed, chapters reduced to the slowest."""
+        gate_row = make_gate_row(
+            run_id="test",
+            transcript_id="T001",
+            candidate_index=0,
+            content_mode="essay",
+            structure=StructureResult(verdict="PASS"),
+            groundedness=GroundednessResult(overall_verdict="PASS"),
+            yield_result=YieldResult(p10_prose_words=100.0),
+            timings=[
+                {"name": "planning", "kind": "stage", "chapter": None, "wall_ms": 1200.0, "cpu_ms": 15.0, "count": 1},
+                {"name": "chapter", "kind": "chapter", "chapter": 1, "wall_ms": 900.0, "cpu_ms": 40.0, "count": 1},
+                {"name": "chapter", "kind": "chapter", "chapter": 2, "wall_ms": 1500.0, "cpu_ms": 45.0, "count": 1},
+                {"name": "enforce_prose_quality", "kind": "pass", "chapter": 1, "wall_ms": 3.0, "cpu_ms": 2.5, "count": 1},
+                {"name": "enforce_prose_quality", "kind": "pass", "chapter": 2, "wall_ms": 4.0, "cpu_ms": 3.5, "count": 1},
+            ],
+        )
+
+        assert gate_row.stage_wall_ms == {"planning": 1200.0}
+        assert gate_row.stage_cpu_ms == {"planning": 15.0}
+        assert gate_row.pass_cpu_ms == {"enforce_prose_quality": 6.0}
+        assert gate_row.max_chapter_wall_ms == 1500.0
+
 
 # =============================================================================
 # Verdict Precedence Integration Test
@@ -3,6 +3,7 @@
 Tests cover:
 - POST /api/ai/draft/generate - start generation
 - GET /api/ai/draft/status/{job_id} - poll status
+- GET /api/ai/draft/stream/{job_id} - live SSE stream
 - POST /api/ai/draft/cancel/{job_id} - cancel generation
 - POST /api/ai/draft/regenerate - regenerate section
 
@@ -273,6 +274,60 @@ class TestStatusEndpoint:
 # Cancel Endpoint Tests
 # =============================================================================
 
+class TestStreamEndpoint:
+    """Tests for GET /api/ai/draft/stream/{job_id}."""
+
+    @staticmethod
+    def _parse_sse(body: str) -> list[tuple[str, dict]]:
+        import json
+
+        events = []
+        for frame in body.strip().split("\n\n"):
+            lines = dict(line.split(": ", 1) for line in frame.splitlines())
+            events.append((lines["event"], json.loads(lines["data"])))
+        return events
+
+    def test_stream_not_found(self):
+        """Test that unknown job returns 404."""
+        with patch("src.services.draft_service.get_job_status", new_callable=AsyncMock) as mock:
+            mock.return_value = None
+
+            response = client.get("/api/ai/draft/stream/unknown-job")
+
+        assert response.status_code == 404
+        assert response.json()["error"]["code"] == "JOB_NOT_FOUND"
+
+    def test_stream_pushes_tokens_until_terminal(self):
+        """Test that published events are relayed and the stream closes on completion."""
+        from src.services.draft_stream import DraftStreamHub
+
+        class PrefilledHub(DraftStreamHub):
+            def subscribe(self, job_id):
+                queue = super().subscribe(job_id)
+                self.publish(job_id, "token", {"chapter": 1, "delta": "Hello"})
+                self.publish(job_id, "chapter_complete", {"chapter": 1, "markdown": "## Chapter 1"})
+                return queue
+
+        hub = PrefilledHub()
+        generating = DraftStatusData(job_id="job-123", status=JobStatus.generating)
+        completed = DraftStatusData(job_id="job-123", status=JobStatus.completed)
+
+        with patch("src.services.draft_service.get_job_status", new_callable=AsyncMock) as mock, \
+             patch("src.api.routes.draft.get_draft_stream_hub", return_value=hub), \
+             patch("src.api.routes.draft.DRAFT_STREAM_STATUS_INTERVAL", 0.01):
+            mock.side_effect = [generating, completed]
+
+            response = client.get("/api/ai/draft/stream/job-123")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = self._parse_sse(response.text)
+        assert [name for name, _ in events] == ["status", "token", "chapter_complete", "status"]
+        assert events[1][1] == {"chapter": 1, "delta": "Hello"}
+        assert events[-1][1]["status"] == "completed"
+        assert not hub.has_subscribers("job-123")
+
+
 class TestCancelEndpoint:
     """Tests for POST /api/ai/draft/cancel/{job_id}."""
 
@@ -0,0 +1,151 @@
+"""Unit tests for the parsed draft document.
+
+Tests cover:
+- Lossless parsing and paragraph classification
+- Chapters, sentence offsets and chapter rewrites
+- Prose passes giving the same result on strings and documents
+"""
+
+import pytest
+
+from src.services.draft_document import BlockKind, DraftDocument
+from src.services.draft_service import (
+    cleanup_dangling_connectives,
+    enforce_dangling_attribution_gate,
+    enforce_no_names_in_prose,
+    normalize_prose_punctuation,
+    sanitize_meta_discourse,
+    sanitize_speaker_framing,
+)
+
+DRAFT = """# The Beginning of Infinity
+
+## Chapter 1: Explanations
+
+Good explanations are hard to vary. This chapter develops the theme of progress. It matters
+
+### Key Excerpts
+
+> "The quest for good explanations is the engine of progress."
+> — David Deutsch
+
+### Core Claims
+
+- **Progress is unbounded**: "There is no limit to understanding."
+
+## Chapter 2: Optimism
+
+According to Deutsch, problems are soluble. Deutsch notes, For ages people believed otherwise. Optimism offers a . Traits that once helped survival now hold us back.
+
+> A standalone blockquote.
+
+Every evil is due to insufficient knowledge.
+"""
+
+
+class TestDraftDocument:
+    def test_parse_is_lossless(self):
+        """Serializing a parsed draft gives back the exact text."""
+        for text in (DRAFT, "", "no breaks", "a\n\n\n\nb\n\n", DRAFT.replace("\n\n## Chapter 2", "\n\n\n## Chapter 2")):
+            assert DraftDocument.parse(text).to_markdown() == text
+
+    def test_classification_and_chapters(self):
+        """Paragraphs are classified by section and assigned to chapters."""
+        doc = DraftDocument.parse(DRAFT)
+        kinds = [(block.kind, block.chapter) for block in doc.blocks()]
+
+        # The passes only treat `## ` / `### ` lines as section headings
+        assert kinds[0] == (BlockKind.prose, None)
+        assert kinds[1] == (BlockKind.heading, 1)
+        assert kinds[2] == (BlockKind.prose, 1)
+        assert kinds[4] == (BlockKind.key_excerpts, 1)
+        assert kinds[6] == (BlockKind.core_claims, 1)
+        assert kinds[8] == (BlockKind.prose, 2)
+        assert kinds[9] == (BlockKind.blockquote, 2)
+        assert [c.number for c in doc.chapters()] == [1, 2]
+        assert doc.chapters()[1].start == DRAFT.index("## Chapter 2")
+
+    def test_sentence_offsets_point_into_markdown(self):
+        """Sentence offsets index the serialized draft."""
+        doc = DraftDocument.parse(DRAFT)
+        block = next(block for block in doc.prose() if block.chapter == 1)
+        markdown = doc.to_markdown()
+
+        sentences = block.sentences()
+        assert len(sentences) == 3
+        for sentence in sentences:
+            assert markdown[sentence.start:sentence.start + len(sentence.text)] == sentence.text
+
+    def test_chapter_text_matches_heading_slices(self):
+        """chapter_text() is the slice from one chapter heading to the next."""
+        doc = DraftDocument.parse(DRAFT)
+        first, second = doc.chapters()
+
+        assert doc.chapter_text(first) == DRAFT[DRAFT.index("## Chapter 1"):DRAFT.index("## Chapter 2")]
+        assert doc.chapter_text(second) == DRAFT[DRAFT.index("## Chapter 2"):]
+
+    def test_map_chapters_rebuilds_once_and_updates_boundaries(self):
+        """Chapter rewrites land in one rebuild; later lookups see the new layout."""
+        doc = DraftDocument.parse(DRAFT)
+        doc.map_chapters(lambda chapter, text: text.replace("Good explanations", "Good\n\nexplanations"))
+
+        assert doc.version == 1
+        assert "Good\n\nexplanations" in doc.to_markdown()
+        second = doc.chapters()[1]
+        assert doc.chapter_text(second).startswith("## Chapter 2")
+
+        # The identity rewrite is lossless
+        doc.map_chapters(lambda chapter, text: text)
+        assert doc.to_markdown() == DRAFT.replace("Good explanations", "Good\n\nexplanations")
+
+    def test_chapter_breaks_split_inline_headings(self):
+        """chapter_breaks starts a paragraph at every chapter heading."""
+        text = "Intro text.\n## Chapter 1: One\n\nBody."
+        assert DraftDocument.parse(text).chapters() == []
+        doc = DraftDocument.parse(text, chapter_breaks=True)
+        assert [c.number for c in doc.chapters()] == [1]
+
+    def test_rewrite_prose_is_atomic(self):
+        """A failing rewrite leaves the document untouched."""
+        doc = DraftDocument.parse(DRAFT)
+
+        def boom(paragraph: str) -> str:
+            if paragraph.startswith("According"):
+                raise ValueError("boom")
+            return paragraph.upper()
+
+        with pytest.raises(ValueError):
+            doc.rewrite_prose(boom)
+        assert doc.to_markdown() == DRAFT
+        assert doc.version == 0
+
+
+class TestPassesOnDocuments:
+    @pytest.mark.parametrize("pass_fn", [
+        enforce_dangling_attribution_gate,
+        sanitize_speaker_framing,
+        enforce_no_names_in_prose,
+        sanitize_meta_discourse,
+        cleanup_dangling_connectives,
+        normalize_prose_punctuation,
+    ])
+    def test_document_result_matches_string_result(self, pass_fn):
+        """A pass gives the same markdown and report for a string and a document."""
+        text_result, text_report = pass_fn(DRAFT)
+        doc = DraftDocument.parse(DRAFT)
+        doc_result, doc_report = pass_fn(doc)
+
+        assert doc_result is doc
+        assert doc.to_markdown() == text_result
+        assert doc_report == text_report
+
+    def test_chained_passes_match_string_chain(self):
+        """Threading one document through several passes matches the string chain."""
+        text = DRAFT
+        doc = DraftDocument.parse(DRAFT)
+        for pass_fn in (enforce_dangling_attribution_gate, sanitize_speaker_framing, cleanup_dangling_connectives):
+            text, _ = pass_fn(text)
+            doc, _ = pass_fn(doc)
+
+        assert doc.to_markdown() == text
+        assert text != DRAFT
@@ -168,6 +168,35 @@ def job_store():
     set_job_store(None)
 
 
+@pytest.fixture
+def evidence_map():
+    """Empty essay-mode Evidence Map for faked generation runs."""
+    from src.models.evidence_map import EvidenceMap
+    from src.models.style_config import ContentMode
+    return EvidenceMap(
+        project_id="p1",
+        content_mode=ContentMode.essay,
+        transcript_hash="abc",
+        generated_at=datetime.utcnow(),
+    )
+
+
+@pytest.fixture
+def scheduler():
+    """Job scheduler running one draft job at a time."""
+    from src.services.job_scheduler import JobKind, JobScheduler, set_job_scheduler
+    scheduler = JobScheduler(limits={JobKind.draft: 1})
+    set_job_scheduler(scheduler)
+    yield scheduler
+    set_job_scheduler(None)
+
+
+@pytest.fixture
+def serial_chapters(monkeypatch):
+    """Generate chapters after the full Evidence Map (no extraction pipelining)."""
+    monkeypatch.setattr(draft_service, "DRAFT_PIPELINE_ENABLED", False)
+
+
 # =============================================================================
 # DraftPlan Generation Tests
 # =============================================================================
@@ -238,8 +267,8 @@ class TestGenerateChapter:
         mock_response = MagicMock()
         mock_response.text = "## Chapter 1: Introduction\n\nThis is the content."
 
-        with patch("src.services.draft_service.LLMClient") as MockClient:
-            mock_client = MockClient.return_value
+        with patch("src.services.draft_service.get_llm_client") as mock_get_client:
+            mock_client = mock_get_client.return_value
             mock_client.generate = AsyncMock(return_value=mock_response)
 
             chapter_md = await draft_service.generate_chapter(
@@ -262,8 +291,8 @@ class TestGenerateChapter:
         mock_response = MagicMock()
         mock_response.text = "## Chapter 1: Introduction\n\nContent without placeholders."
 
-        with patch("src.services.draft_service.LLMClient") as MockClient:
-            mock_client = MockClient.return_value
+        with patch("src.services.draft_service.get_llm_client") as mock_get_client:
+            mock_client = mock_get_client.return_value
             mock_client.generate = AsyncMock(return_value=mock_response)
 
             chapter_md = await draft_service.generate_chapter(
@@ -295,8 +324,8 @@ class TestGenerateChapter:
             captured_request = request
             return mock_response
 
-        with patch("src.services.draft_service.LLMClient") as MockClient:
-            mock_client = MockClient.return_value
+        with patch("src.services.draft_service.get_llm_client") as mock_get_client:
+            mock_client = mock_get_client.return_value
             mock_client.generate = AsyncMock(side_effect=capture_request)
 
             await draft_service.generate_chapter(
@@ -467,6 +496,691 @@ class TestProgressAndPartials:
         assert len(job.chapters_completed) == 1
 
 
+# =============================================================================
+# Parallel Chapter Generation Tests
+# =============================================================================
+
+class TestParallelChapterGeneration:
+    """Tests for bounded-concurrency chapter generation."""
+
+    @pytest.mark.asyncio
+    async def test_chapters_reassembled_in_order(
+        self, sample_generate_request, sample_draft_plan, evidence_map, job_store
+    ):
+        """Chapters that finish out of order are returned in chapter order."""
+        from src.models.style_config import ContentMode
+
+        job_id = await job_store.create_job()
+        delays = {1: 0.03, 2: 0.0, 3: 0.01}
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_generate_chapter(chapter_plan, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(delays[chapter_plan.chapter_number])
+            in_flight -= 1
+            return f"## Chapter {chapter_plan.chapter_number}: {chapter_plan.title}"
+
+        with patch("src.services.draft_service.generate_chapter", side_effect=fake_generate_chapter):
+            chapters, cancelled = await draft_service._generate_chapters_parallel(
+                job_id=job_id,
+                request=sample_generate_request,
+                draft_plan=sample_draft_plan,
+                evidence_map=evidence_map,
+                words_per_chapter=500,
+                detail_level="balanced",
+                content_mode=ContentMode.essay,
+                strict_grounded=True,
+                constraint_warnings=[],
+                concurrency=2,
+            )
+
+        assert cancelled is False
+        assert [c.split(":")[0] for c in chapters] == ["## Chapter 1", "## Chapter 2", "## Chapter 3"]
+        assert max_in_flight == 2
+
+        job = await job_store.get_job(job_id)
+        assert len(job.chapters_completed) == 3
+
+    @pytest.mark.asyncio
+    async def test_continuity_comes_from_plan(
+        self, sample_generate_request, sample_draft_plan, evidence_map, job_store
+    ):
+        """Each chapter receives plan-based previous context, not finished text."""
+        from src.models.style_config import ContentMode
+
+        job_id = await job_store.create_job()
+        captured = {}
+
+        async def fake_generate_chapter(chapter_plan, **kwargs):
+            captured[chapter_plan.chapter_number] = kwargs
+            return f"## Chapter {chapter_plan.chapter_number}"
+
+        with patch("src.services.draft_service.generate_chapter", side_effect=fake_generate_chapter):
+            await draft_service._generate_chapters_parallel(
+                job_id=job_id,
+                request=sample_generate_request,
+                draft_plan=sample_draft_plan,
+                evidence_map=evidence_map,
+                words_per_chapter=500,
+                detail_level="balanced",
+                content_mode=ContentMode.essay,
+                strict_grounded=True,
+                constraint_warnings=[],
+                concurrency=3,
+            )
+
+        assert captured[1]["previous_chapter_ending"] is None
+        assert "Introduction to Scaling" in captured[2]["previous_chapter_ending"]
+        assert captured[2]["chapters_completed"] == []
+
+    @pytest.mark.asyncio
+    async def test_cancel_stops_pending_chapters(
+        self, sample_generate_request, sample_draft_plan, evidence_map, job_store
+    ):
+        """Chapters not yet started are skipped once cancellation is requested."""
+        from src.models.style_config import ContentMode
+
+        job_id = await job_store.create_job()
+
+        async def fake_generate_chapter(chapter_plan, **kwargs):
+            await job_store.update_job(job_id, cancel_requested=True)
+            return f"## Chapter {chapter_plan.chapter_number}"
+
+        with patch("src.services.draft_service.generate_chapter", side_effect=fake_generate_chapter):
+            chapters, cancelled = await draft_service._generate_chapters_parallel(
+                job_id=job_id,
+                request=sample_generate_request,
+                draft_plan=sample_draft_plan,
+                evidence_map=evidence_map,
+                words_per_chapter=500,
+                detail_level="balanced",
+                content_mode=ContentMode.essay,
+                strict_grounded=True,
+                constraint_warnings=[],
+                concurrency=1,
+            )
+
+        assert cancelled is True
+        assert chapters == ["## Chapter 1"]
+
+    @pytest.mark.asyncio
+    async def test_pipelined_chapter_starts_before_slow_evidence(
+        self, sample_generate_request, sample_draft_plan, job_store
+    ):
+        """A chapter is generated as soon as its own evidence is ready."""
+        from src.models.evidence_map import ChapterEvidence
+        from src.models.style_config import ContentMode
+
+        job_id = await job_store.create_job()
+        events = []
+        extract_delays = {1: 0.0, 2: 0.05, 3: 0.0}
+
+        async def fake_extract(chapter_index, chapter_title, transcript_segment, content_mode, outline_item_id, **kwargs):
+            await asyncio.sleep(extract_delays[chapter_index])
+            events.append(("evidence", chapter_index))
+            return ChapterEvidence(
+                chapter_index=chapter_index,
+                chapter_title=chapter_title,
+                outline_item_id=outline_item_id,
+            )
+
+        async def fake_generate_chapter(chapter_plan, **kwargs):
+            events.append(("chapter", chapter_plan.chapter_number))
+            assert kwargs["chapter_evidence"].chapter_index == chapter_plan.chapter_number
+            return f"## Chapter {chapter_plan.chapter_number}"
+
+        with patch("src.services.evidence_service.extract_claims_for_chapter", side_effect=fake_extract), \
+             patch("src.services.draft_service.generate_chapter", side_effect=fake_generate_chapter):
+            chapters, evidence_map, cancelled = await draft_service._generate_chapters_pipelined(
+                job_id=job_id,
+                request=sample_generate_request,
+                draft_plan=sample_draft_plan,
+                project_id="p1",
+                words_per_chapter=500,
+                detail_level="balanced",
+                content_mode=ContentMode.essay,
+                strict_grounded=True,
+                style_config={},
+                constraint_warnings=[],
+                concurrency=3,
+            )
+
+        assert cancelled is False
+        assert chapters == ["## Chapter 1", "## Chapter 2", "## Chapter 3"]
+        assert [c.chapter_index for c in evidence_map.chapters] == [1, 2, 3]
+        # Chapter 1 and 3 were generated before chapter 2's evidence arrived
+        assert events.index(("chapter", 1)) < events.index(("evidence", 2))
+        assert events.index(("chapter", 3)) < events.index(("evidence", 2))
+
+    @pytest.mark.asyncio
+    async def test_pipelined_failure_cancels_remaining_work(
+        self, sample_generate_request, sample_draft_plan, job_store
+    ):
+        """A failing chapter stops in-flight extraction and generation."""
+        from src.models.evidence_map import ChapterEvidence
+        from src.models.style_config import ContentMode
+
+        job_id = await job_store.create_job()
+        generated = []
+
+        async def fake_extract(chapter_index, chapter_title, transcript_segment, content_mode, outline_item_id, **kwargs):
+            await asyncio.sleep(0.0 if chapter_index == 1 else 0.05)
+            return ChapterEvidence(chapter_index=chapter_index, chapter_title=chapter_title)
+
+        async def fake_generate_chapter(chapter_plan, **kwargs):
+            if chapter_plan.chapter_number == 1:
+                raise RuntimeError("chapter 1 failed")
+            generated.append(chapter_plan.chapter_number)
+            return f"## Chapter {chapter_plan.chapter_number}"
+
+        with patch("src.services.evidence_service.extract_claims_for_chapter", side_effect=fake_extract), \
+             patch("src.services.draft_service.generate_chapter", side_effect=fake_generate_chapter):
+            with pytest.raises(RuntimeError, match="chapter 1 failed"):
+                await draft_service._generate_chapters_pipelined(
+                    job_id=job_id,
+                    request=sample_generate_request,
+                    draft_plan=sample_draft_plan,
+                    project_id="p1",
+                    words_per_chapter=500,
+                    detail_level="balanced",
+                    content_mode=ContentMode.essay,
+                    strict_grounded=True,
+                    style_config={},
+                    constraint_warnings=[],
+                    concurrency=3,
+                )
+
+        assert generated == []
+
+
+class TestResumableGeneration:
+    """Tests for checkpointed generation and the startup recovery sweep."""
+
+    async def _run(self, job_id, request, draft_plan, evidence_map, generated, fail_on=None):
+        """Run the generation task with LLM stages faked."""
+        async def fake_generate_chapter(chapter_plan, **kwargs):
+            if chapter_plan.chapter_number == fail_on:
+                raise RuntimeError("LLM outage")
+            generated.append(chapter_plan.chapter_number)
+            return f"## Chapter {chapter_plan.chapter_number}: {chapter_plan.title}\n\nText."
+
+        with patch("src.services.draft_service.generate_draft_plan", new_callable=AsyncMock, return_value=draft_plan) as plan, \
+             patch("src.services.draft_service.generate_evidence_map", new_callable=AsyncMock, return_value=evidence_map) as evidence, \
+             patch("src.services.draft_service.generate_chapter", side_effect=fake_generate_chapter):
+            await draft_service._generate_draft_task(job_id, request)
+        return plan, evidence
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("concurrency", [1, 3])
+    async def test_resume_skips_finished_work(
+        self, sample_generate_request, sample_draft_plan, evidence_map, job_store, monkeypatch, serial_chapters,
+        concurrency,
+    ):
+        """A job that failed mid-chapters resumes without redoing finished stages."""
+        from src.models import GenerationCheckpoint
+
+        monkeypatch.setattr(draft_service, "CHAPTER_GENERATION_CONCURRENCY", concurrency)
+        job_id = await job_store.create_job()
+        generated = []
+
+        await self._run(job_id, sample_generate_request, sample_draft_plan, evidence_map, generated, fail_on=2)
+        job = await job_store.get_job(job_id)
+        assert job.status == JobStatus.failed
+        assert job.checkpoint == GenerationCheckpoint.evidence_map
+        assert 1 in job.completed_chapter_numbers
+        assert 2 not in job.completed_chapter_numbers
+
+        done_before = list(generated)
+        await job_store.update_job(job_id, status=JobStatus.queued)
+        plan, evidence = await self._run(job_id, sample_generate_request, sample_draft_plan, evidence_map, generated)
+
+        plan.assert_not_awaited()
+        evidence.assert_not_awaited()
+        assert sorted(generated[len(done_before):]) == [n for n in (1, 2, 3) if n not in done_before]
+        job = await job_store.get_job(job_id)
+        assert job.status == JobStatus.completed
+        assert job.checkpoint == GenerationCheckpoint.chapters
+        assert job.completed_chapter_numbers == [1, 2, 3]
+        assert job.draft_markdown.index("Chapter 1") < job.draft_markdown.index("Chapter 3")
+
+    @pytest.mark.asyncio
+    async def test_resume_after_chapters_only_post_processes(
+        self, sample_generate_request, sample_draft_plan, evidence_map, job_store
+    ):
+        """With every chapter checkpointed, no LLM stage runs again."""
+        job_id = await job_store.create_job()
+        generated = []
+        await self._run(job_id, sample_generate_request, sample_draft_plan, evidence_map, generated)
+        first_draft = (await job_store.get_job(job_id)).draft_markdown
+
+        await job_store.update_job(job_id, status=JobStatus.generating)
+        generated.clear()
+        plan, evidence = await self._run(job_id, sample_generate_request, sample_draft_plan, evidence_map, generated)
+
+        plan.assert_not_awaited()
+        evidence.assert_not_awaited()
+        assert generated == []
+        assert (await job_store.get_job(job_id)).draft_markdown == first_draft
+
+    @pytest.mark.asyncio
+    async def test_resume_keeps_usage_and_timings_of_earlier_runs(
+        self, sample_generate_request, sample_draft_plan, evidence_map, job_store, monkeypatch, serial_chapters,
+    ):
+        """Token totals, per-stage usage and timings cover the interrupted run too."""
+        from src.llm.metrics import get_llm_metrics, llm_stage
+        from src.llm.models import Usage
+
+        monkeypatch.setattr(draft_service, "CHAPTER_GENERATION_CONCURRENCY", 1)
+        job_id = await job_store.create_job()
+        generated = []
+
+        async def fake_generate_chapter(chapter_plan, **kwargs):
+            with llm_stage("chapter"):
+                get_llm_metrics().record_call(
+                    "openai", "gpt-4o", 100, Usage(prompt_tokens=10, completion_tokens=5, total_tokens=15),
+                )
+            if chapter_plan.chapter_number == 2 and 2 not in generated:
+                generated.append(2)
+                raise RuntimeError("LLM outage")
+            generated.append(chapter_plan.chapter_number)
+            return f"## Chapter {chapter_plan.chapter_number}: {chapter_plan.title}\n\nText."
+
+        async def run():
+            with patch("src.services.draft_service.generate_draft_plan", new_callable=AsyncMock, return_value=sample_draft_plan), \
+                 patch("src.services.draft_service.generate_evidence_map", new_callable=AsyncMock, return_value=evidence_map), \
+                 patch("src.services.draft_service.generate_chapter", side_effect=fake_generate_chapter):
+                await draft_service._generate_draft_task(job_id, sample_generate_request)
+
+        await run()
+        first = await job_store.get_job(job_id)
+        assert first.status == JobStatus.failed
+        assert first.total_prompt_tokens == 20
+
+        await job_store.update_job(job_id, status=JobStatus.queued)
+        await run()
+
+        job = await job_store.get_job(job_id)
+        assert job.status == JobStatus.completed
+        # Chapters 1 and 2 (failed) in the first run, 2 and 3 in the second
+        assert job.total_prompt_tokens == 40
+        assert job.total_completion_tokens == 20
+        [usage] = job.llm_usage
+        assert usage["calls"] == 4
+        chapter_runs = {t["chapter"]: t["count"] for t in job.timings if t["kind"] == "chapter"}
+        assert chapter_runs == {1: 1, 2: 2, 3: 1}
+        planning = [t for t in job.timings if t["name"] == "planning"]
+        assert planning and planning[0]["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_sweep_resumes_interrupted_jobs(self, sample_generate_request, job_store, scheduler):
+        """The recovery sweep reschedules unfinished jobs that stored their request."""
+        job_id = await job_store.create_job()
+        await job_store.update_job(
+            job_id,
+            status=JobStatus.generating,
+            request=sample_generate_request.model_dump(mode="json"),
+        )
+        done_id = await job_store.create_job()
+        await job_store.update_job(done_id, status=JobStatus.completed)
+
+        with patch("src.services.draft_service._generate_draft_task", new_callable=AsyncMock) as task:
+            assert await draft_service.resume_interrupted_jobs() == 1
+            await asyncio.sleep(0.01)
+
+        task.assert_awaited_once()
+        assert task.await_args.args[0] == job_id
+        assert task.await_args.args[1].transcript == sample_generate_request.transcript
+        job = await job_store.get_job(job_id)
+        assert job.resume_count == 1
+        assert (await job_store.get_job(done_id)).status == JobStatus.completed
+
+    @pytest.mark.asyncio
+    async def test_concurrent_sweeps_resume_job_once(self, sample_generate_request, job_store, scheduler, monkeypatch):
+        """Two processes sweeping at once submit an interrupted job only once."""
+        job_id = await job_store.create_job()
+        await job_store.update_job(
+            job_id,
+            status=JobStatus.generating,
+            request=sample_generate_request.model_dump(mode="json"),
+        )
+        list_jobs = job_store.list_jobs
+
+        async def slow_list_jobs(**kwargs):
+            # Snapshot the jobs, then let the other sweep list them too (as
+            # a database round trip would)
+            jobs = [job.model_copy() for job in await list_jobs(**kwargs)]
+            await asyncio.sleep(0.01)
+            return jobs
+
+        monkeypatch.setattr(job_store, "list_jobs", slow_list_jobs)
+
+        with patch("src.services.draft_service._generate_draft_task", new_callable=AsyncMock) as task:
+            counts = await asyncio.gather(
+                draft_service.resume_interrupted_jobs(),
+                draft_service.resume_interrupted_jobs(),
+            )
+            await asyncio.sleep(0.01)
+
+        assert sorted(counts) == [0, 1]
+        task.assert_awaited_once()
+        job = await job_store.get_job(job_id)
+        assert job.status == JobStatus.queued
+        assert job.resume_count == 1
+
+    @pytest.mark.asyncio
+    async def test_sweep_fails_or_cancels_unresumable_jobs(
+        self, sample_generate_request, job_store, scheduler
+    ):
+        """Jobs without a request, over the resume limit, or cancelled are closed out."""
+        request_data = sample_generate_request.model_dump(mode="json")
+        no_request = await job_store.create_job()
+        await job_store.update_job(no_request, status=JobStatus.planning)
+        exhausted = await job_store.create_job()
+        await job_store.update_job(
+            exhausted,
+            status=JobStatus.generating,
+            request=request_data,
+            resume_count=draft_service.DRAFT_RESUME_MAX_ATTEMPTS,
+        )
+        cancelled = await job_store.create_job()
+        await job_store.update_job(
+            cancelled, status=JobStatus.generating, request=request_data, cancel_requested=True,
+        )
+
+        with patch("src.services.draft_service._generate_draft_task", new_callable=AsyncMock) as task:
+            assert await draft_service.resume_interrupted_jobs() == 0
+
+        task.assert_not_awaited()
+        assert (await job_store.get_job(no_request)).error_code == "JOB_INTERRUPTED"
+        assert (await job_store.get_job(exhausted)).error_code == "RESUME_LIMIT_EXCEEDED"
+        assert (await job_store.get_job(cancelled)).status == JobStatus.cancelled
+
+    @pytest.mark.asyncio
+    async def test_start_generation_stores_request(self, sample_generate_request, job_store, scheduler):
+        """The request is kept on the job so it can be resumed."""
+        with patch("src.services.draft_service._generate_draft_task", new_callable=AsyncMock):
+            job_id = await draft_service.start_generation(sample_generate_request)
+
+        job = await job_store.get_job(job_id)
+        assert DraftGenerateRequest.model_validate(job.request) == sample_generate_request
+
+
+class TestStageCacheReuse:
+    """Tests for reusing cached upstream stages across generations."""
+
+    @pytest.fixture
+    def stage_cache(self, serial_chapters):
+        from src.services.stage_cache import InMemoryStageCache, set_stage_cache
+        cache = InMemoryStageCache()
+        set_stage_cache(cache)
+        yield cache
+        set_stage_cache(None)
+
+    async def _run(self, job_store, request, draft_plan, evidence_map):
+        """Run a new job with LLM stages faked."""
+        async def fake_generate_chapter(chapter_plan, **kwargs):
+            return f"## Chapter {chapter_plan.chapter_number}: {chapter_plan.title}\n\nText."
+
+        job_id = await job_store.create_job()
+        with patch("src.services.draft_service.generate_draft_plan", new_callable=AsyncMock, return_value=draft_plan) as plan, \
+             patch("src.services.draft_service.generate_evidence_map", new_callable=AsyncMock, return_value=evidence_map) as evidence, \
+             patch("src.services.draft_service.generate_chapter", side_effect=fake_generate_chapter):
+            await draft_service._generate_draft_task(job_id, request)
+        return await job_store.get_job(job_id), plan, evidence
+
+    @pytest.mark.asyncio
+    async def test_downstream_change_reuses_upstream_stages(
+        self, sample_generate_request, sample_draft_plan, evidence_map, job_store, stage_cache
+    ):
+        """Changing only a downstream option skips planning and evidence extraction."""
+        first, plan, evidence = await self._run(job_store, sample_generate_request, sample_draft_plan, evidence_map)
+        plan.assert_awaited_once()
+        evidence.assert_awaited_once()
+
+        style_config = json.loads(json.dumps(sample_generate_request.style_config))
+        style_config["style"]["total_length_preset"] = "brief"
+        request = sample_generate_request.model_copy(update={"style_config": style_config})
+        second, plan, evidence = await self._run(job_store, request, sample_draft_plan, evidence_map)
+
+        plan.assert_not_awaited()
+        evidence.assert_not_awaited()
+        assert second.status == JobStatus.completed
+        assert second.draft_plan == first.draft_plan
+        assert stage_cache.stats.hits == 3  # plan, Evidence Map, whitelist
+
+    @pytest.mark.asyncio
+    async def test_upstream_change_recomputes(
+        self, sample_generate_request, sample_draft_plan, evidence_map, job_store, stage_cache
+    ):
+        """Changing the outline or transcript misses the cache."""
+        await self._run(job_store, sample_generate_request, sample_draft_plan, evidence_map)
+
+        outline = [dict(item) for item in sample_generate_request.outline]
+        outline[0]["title"] = "A Different Opening"
+        request = sample_generate_request.model_copy(update={"outline": outline})
+        _, plan, evidence = await self._run(job_store, request, sample_draft_plan, evidence_map)
+        plan.assert_awaited_once()
+        # Same chapters came back, so their evidence is still valid
+        evidence.assert_not_awaited()
+
+        request = sample_generate_request.model_copy(
+            update={"transcript": sample_generate_request.transcript + " One more sentence."}
+        )
+        _, plan, evidence = await self._run(job_store, request, sample_draft_plan, evidence_map)
+        plan.assert_awaited_once()
+        evidence.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_fallback_results_not_cached(
+        self, sample_generate_request, sample_draft_plan, evidence_map, job_store, stage_cache
+    ):
+        """Stages that fell back after an LLM failure are retried on the next run."""
+        from src.models.evidence_map import ChapterEvidence
+        from src.models.visuals import VisualPlan
+
+        draft_plan = sample_draft_plan.model_copy(update={"visual_plan": VisualPlan.fallback()})
+        evidence_map.chapters = [ChapterEvidence.failed_extraction(1, "Introduction to Scaling", "ch1")]
+        await self._run(job_store, sample_generate_request, draft_plan, evidence_map)
+
+        _, plan, evidence = await self._run(job_store, sample_generate_request, draft_plan, evidence_map)
+
+        plan.assert_awaited_once()
+        evidence.assert_awaited_once()
+        # Only the whitelist is stored; its key changes with the Evidence Map
+        assert stage_cache.stats.stores == 1
+
+
+class TestTimingProfile:
+    """Tests for the per-stage timing trace recorded on jobs."""
+
+    @pytest.mark.asyncio
+    async def test_job_records_stage_chapter_and_pass_timings(
+        self, sample_generate_request, sample_draft_plan, evidence_map, job_store, serial_chapters
+    ):
+        """A finished job stores timings and returns them in its stats."""
+
+        async def fake_generate_chapter(chapter_plan, **kwargs):
+            return f"## Chapter {chapter_plan.chapter_number}: {chapter_plan.title}\n\nText."
+
+        job_id = await job_store.create_job()
+        with patch("src.services.draft_service.generate_draft_plan", new_callable=AsyncMock, return_value=sample_draft_plan), \
+             patch("src.services.draft_service.generate_evidence_map", new_callable=AsyncMock, return_value=evidence_map), \
+             patch("src.services.draft_service.generate_chapter", side_effect=fake_generate_chapter):
+            await draft_service._generate_draft_task(job_id, sample_generate_request)
+
+        job = await job_store.get_job(job_id)
+        assert job.status == JobStatus.completed
+        stages = {t["name"] for t in job.timings if t["kind"] == "stage"}
+        assert {"planning", "evidence_map", "whitelist", "chapters", "post_process"} <= stages
+        chapters = sorted(t["chapter"] for t in job.timings if t["kind"] == "chapter")
+        assert chapters == [ch.chapter_number for ch in sample_draft_plan.chapters]
+        assert any(t["kind"] == "pass" for t in job.timings)
+
+        stats = job.get_stats()
+        assert [t.model_dump() for t in stats.timings] == job.timings
+
+
+class TestImmediateCancellation:
+    """Tests for cancelling jobs mid-chapter."""
+
+    @staticmethod
+    def _stalling_chapters(started: asyncio.Event, aborted: asyncio.Event):
+        """Fake generate_chapter: chapter 1 finishes, chapter 2 hangs until cancelled."""
+        async def fake_generate_chapter(chapter_plan, **kwargs):
+            if chapter_plan.chapter_number == 1:
+                return "## Chapter 1: Introduction to Scaling\n\nText."
+            started.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                aborted.set()
+                raise
+
+        return fake_generate_chapter
+
+    @pytest.mark.asyncio
+    async def test_cancel_aborts_running_chapter_and_keeps_partial(
+        self, sample_generate_request, sample_draft_plan, evidence_map, job_store, scheduler, serial_chapters
+    ):
+        """Cancelling stops the in-flight chapter at once and frees the slot."""
+        started, aborted = asyncio.Event(), asyncio.Event()
+        with patch("src.services.draft_service.generate_draft_plan", new_callable=AsyncMock, return_value=sample_draft_plan), \
+             patch("src.services.draft_service.generate_evidence_map", new_callable=AsyncMock, return_value=evidence_map), \
+             patch("src.services.draft_service.generate_chapter", side_effect=self._stalling_chapters(started, aborted)):
+            job_id = await draft_service.start_generation(sample_generate_request)
+            await asyncio.wait_for(started.wait(), timeout=1)
+
+            cancel_data = await draft_service.cancel_job(job_id)
+
+        assert aborted.is_set()
+        assert cancel_data.status == JobStatus.cancelled
+        assert "Chapter 1" in cancel_data.partial_draft_markdown
+        assert cancel_data.chapters_available == 1
+        assert (await job_store.get_job(job_id)).status == JobStatus.cancelled
+        stats = {s["kind"]: s for s in scheduler.get_stats()}["draft"]
+        assert stats["running"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cancel_waiting_job_never_starts(self, sample_generate_request, job_store, scheduler):
+        """A job waiting for a slot is cancelled without running."""
+        from src.services.job_scheduler import JobKind
+        release = asyncio.Event()
+        scheduler.submit(JobKind.draft, "busy", release.wait)
+        with patch("src.services.draft_service._generate_draft_task", new_callable=AsyncMock) as task:
+            job_id = await draft_service.start_generation(sample_generate_request)
+            await asyncio.sleep(0)
+            assert scheduler.queue_position(job_id) == 1
+
+            cancel_data = await draft_service.cancel_job(job_id)
+            release.set()
+            await asyncio.sleep(0)
+
+        task.assert_not_awaited()
+        assert cancel_data.status == JobStatus.cancelled
+        assert scheduler.queue_position(job_id) is None
+
+    @pytest.mark.asyncio
+    async def test_worker_job_stops_on_cancel_request(
+        self, sample_generate_request, sample_draft_plan, evidence_map, job_store, monkeypatch, serial_chapters
+    ):
+        """A queued job running on a worker notices the cancel request and stops."""
+        monkeypatch.setattr(draft_service, "DRAFT_CANCEL_POLL_SECONDS", 0.01)
+        job_id = await job_store.create_job()
+        started, aborted = asyncio.Event(), asyncio.Event()
+        with patch("src.services.draft_service.generate_draft_plan", new_callable=AsyncMock, return_value=sample_draft_plan), \
+             patch("src.services.draft_service.generate_evidence_map", new_callable=AsyncMock, return_value=evidence_map), \
+             patch("src.services.draft_service.generate_chapter", side_effect=self._stalling_chapters(started, aborted)):
+            run = asyncio.create_task(
+                draft_service.run_generation_job(job_id, sample_generate_request.model_dump(mode="json"))
+            )
+            await asyncio.wait_for(started.wait(), timeout=1)
+            # Set by cancel_job() in an API process
+            await job_store.update_job(job_id, cancel_requested=True)
+            await asyncio.wait_for(run, timeout=1)
+
+        assert aborted.is_set()
+        job = await job_store.get_job(job_id)
+        assert job.status == JobStatus.cancelled
+        assert len(job.chapters_completed) == 1
+
+    @pytest.mark.asyncio
+    async def test_shutdown_leaves_job_resumable(
+        self, sample_generate_request, sample_draft_plan, evidence_map, job_store, serial_chapters
+    ):
+        """Cancelling a worker's job without a cancel request keeps it resumable."""
+        job_id = await job_store.create_job()
+        started, aborted = asyncio.Event(), asyncio.Event()
+        with patch("src.services.draft_service.generate_draft_plan", new_callable=AsyncMock, return_value=sample_draft_plan), \
+             patch("src.services.draft_service.generate_evidence_map", new_callable=AsyncMock, return_value=evidence_map), \
+             patch("src.services.draft_service.generate_chapter", side_effect=self._stalling_chapters(started, aborted)):
+            run = asyncio.create_task(
+                draft_service.run_generation_job(job_id, sample_generate_request.model_dump(mode="json"))
+            )
+            await asyncio.wait_for(started.wait(), timeout=1)
+            run.cancel()
+            await asyncio.gather(run, return_exceptions=True)
+
+        assert aborted.is_set()
+        assert (await job_store.get_job(job_id)).status == JobStatus.generating
+
+
+class TestLiveChapterStreaming:
+    """Tests for streaming chapter tokens to live subscribers."""
+
+    @pytest.mark.asyncio
+    async def test_streams_and_publishes_when_subscribed(self):
+        """Tokens are published to the hub when someone is listening."""
+        from src.llm import StreamChunk
+        from src.services.draft_stream import DraftStreamHub
+
+        hub = DraftStreamHub()
+        queue = hub.subscribe("job-1")
+
+        async def fake_stream(request):
+            for delta in ["Chapter ", "text"]:
+                yield StreamChunk(delta=delta, provider="openai")
+            yield StreamChunk(finish_reason="stop", provider="openai")
+
+        client = MagicMock()
+        client.stream = fake_stream
+        client.generate = AsyncMock()
+
+        with patch("src.services.draft_service.get_draft_stream_hub", return_value=hub):
+            text = await draft_service._complete_with_live_stream(client, MagicMock(), "job-1", 3)
+
+        assert text == "Chapter text"
+        client.generate.assert_not_called()
+        assert queue.get_nowait() == ("token", {"chapter": 3, "delta": "Chapter "})
+        assert queue.get_nowait() == ("token", {"chapter": 3, "delta": "text"})
+
+    @pytest.mark.asyncio
+    async def test_plain_generate_without_subscribers(self):
+        """Without subscribers the request is a normal generate call."""
+        from src.services.draft_stream import DraftStreamHub
+
+        client = MagicMock()
+        client.generate = AsyncMock(return_value=MagicMock(text="Full chapter"))
+
+        with patch("src.services.draft_service.get_draft_stream_hub", return_value=DraftStreamHub()):
+            text = await draft_service._complete_with_live_stream(client, MagicMock(), "job-1", 1)
+
+        assert text == "Full chapter"
+
+    def test_slow_subscriber_drops_oldest(self):
+        """A full subscriber queue drops its oldest event instead of blocking."""
+        from src.services.draft_stream import DraftStreamHub
+
+        hub = DraftStreamHub(queue_size=2)
+        queue = hub.subscribe("job-1")
+        for i in range(3):
+            hub.publish("job-1", "token", {"delta": str(i)})
+
+        assert [queue.get_nowait()[1]["delta"] for _ in range(2)] == ["1", "2"]
+
+
 # =============================================================================
 # Visual Opportunities Tests
 # =============================================================================
@@ -0,0 +1,194 @@
+"""Unit tests for job admission control and priority scheduling.
+
+Tests cover:
+- Per-kind concurrency limits
+- Priority ordering and queue positions
+- Rejection when the waiting queue is full (429 with Retry-After)
+- Cancellation of waiting jobs
+- Prometheus rendering
+"""
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api.main import app
+from src.models import JobPriority
+from src.services.job_scheduler import (
+    JobKind,
+    JobScheduler,
+    SchedulerFullError,
+    set_job_scheduler,
+)
+from src.services.job_store import InMemoryJobStore, set_job_store
+
+
+def blocking_job(started: list, name: str, release: asyncio.Event):
+    """Factory for a job that records its start and waits for release."""
+    async def job():
+        started.append(name)
+        await release.wait()
+        return name
+
+    return job
+
+
+async def settle() -> None:
+    """Let scheduled tasks run until they block."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestJobScheduler:
+    async def test_limit_caps_running_jobs(self):
+        """Jobs beyond the limit wait for a free slot."""
+        scheduler = JobScheduler(limits={JobKind.draft: 2})
+        started, release = [], asyncio.Event()
+        tasks = [
+            scheduler.submit(JobKind.draft, f"job-{i}", blocking_job(started, f"job-{i}", release))
+            for i in range(3)
+        ]
+        await settle()
+
+        assert started == ["job-0", "job-1"]
+        stats = {s["kind"]: s for s in scheduler.get_stats()}["draft"]
+        assert stats["running"] == 2
+        assert stats["waiting"] == 1
+
+        release.set()
+        assert await asyncio.gather(*tasks) == ["job-0", "job-1", "job-2"]
+        assert started == ["job-0", "job-1", "job-2"]
+
+    async def test_limits_are_per_kind(self):
+        """A busy kind does not block other kinds."""
+        scheduler = JobScheduler(limits={JobKind.export: 1})
+        started, release = [], asyncio.Event()
+        scheduler.submit(JobKind.export, "export-1", blocking_job(started, "export-1", release))
+        scheduler.submit(JobKind.export, "export-2", blocking_job(started, "export-2", release))
+        scheduler.submit(JobKind.qa, "qa-1", blocking_job(started, "qa-1", release))
+        await settle()
+
+        assert started == ["export-1", "qa-1"]
+        release.set()
+        await settle()
+
+    async def test_priority_order_and_queue_position(self):
+        """Interactive jobs overtake batch jobs; FIFO within a priority."""
+        scheduler = JobScheduler(limits={JobKind.draft: 1})
+        started = []
+        gates = {name: asyncio.Event() for name in ("running", "batch", "normal", "interactive")}
+        scheduler.submit(JobKind.draft, "running", blocking_job(started, "running", gates["running"]))
+        scheduler.submit(
+            JobKind.draft, "batch", blocking_job(started, "batch", gates["batch"]),
+            priority=JobPriority.batch,
+        )
+        scheduler.submit(JobKind.draft, "normal", blocking_job(started, "normal", gates["normal"]))
+        scheduler.submit(
+            JobKind.draft, "interactive", blocking_job(started, "interactive", gates["interactive"]),
+            priority=JobPriority.interactive,
+        )
+        await settle()
+
+        assert scheduler.queue_position("running") is None
+        assert scheduler.queue_position("interactive") == 1
+        assert scheduler.queue_position("normal") == 2
+        assert scheduler.queue_position("batch") == 3
+
+        for name in ("running", "interactive", "normal"):
+            gates[name].set()
+            await settle()
+        gates["batch"].set()
+        await settle()
+        assert started == ["running", "interactive", "normal", "batch"]
+
+    async def test_full_queue_rejects_with_retry_after(self):
+        """Submissions beyond the waiting bound raise SchedulerFullError."""
+        scheduler = JobScheduler(limits={JobKind.qa: 1}, max_waiting=1)
+        started, release = [], asyncio.Event()
+        scheduler.submit(JobKind.qa, "job-1", blocking_job(started, "job-1", release))
+        scheduler.submit(JobKind.qa, "job-2", blocking_job(started, "job-2", release))
+
+        with pytest.raises(SchedulerFullError) as exc_info:
+            scheduler.submit(JobKind.qa, "job-3", blocking_job(started, "job-3", release))
+        assert exc_info.value.kind == JobKind.qa
+        assert exc_info.value.retry_after_seconds >= 1
+
+        stats = {s["kind"]: s for s in scheduler.get_stats()}["qa"]
+        assert stats["admitted"] == 2
+        assert stats["rejected"] == 1
+        release.set()
+        await settle()
+
+    async def test_cancelled_waiting_job_frees_its_place(self):
+        """Cancelling a waiting job removes it without taking a slot."""
+        scheduler = JobScheduler(limits={JobKind.themes: 1})
+        started, release = [], asyncio.Event()
+        scheduler.submit(JobKind.themes, "job-1", blocking_job(started, "job-1", release))
+        waiting = scheduler.submit(JobKind.themes, "job-2", blocking_job(started, "job-2", release))
+        last = scheduler.submit(JobKind.themes, "job-3", blocking_job(started, "job-3", release))
+        await settle()
+
+        waiting.cancel()
+        await settle()
+        assert scheduler.queue_position("job-3") == 1
+
+        release.set()
+        assert await last == "job-3"
+        assert started == ["job-1", "job-3"]
+        stats = {s["kind"]: s for s in scheduler.get_stats()}["themes"]
+        assert stats["running"] == 0
+        assert stats["waiting"] == 0
+
+    async def test_failed_job_releases_slot(self):
+        """A job that raises still frees its slot."""
+        scheduler = JobScheduler(limits={JobKind.rewrite: 1})
+
+        async def boom():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await scheduler.run(JobKind.rewrite, boom)
+        assert await scheduler.run(JobKind.rewrite, lambda: asyncio.sleep(0, result="ok")) == "ok"
+
+    async def test_render_prometheus(self):
+        """Scheduler metrics render in Prometheus text format."""
+        scheduler = JobScheduler(limits={JobKind.export: 1})
+        await scheduler.run(JobKind.export, lambda: asyncio.sleep(0))
+        text = scheduler.render_prometheus()
+
+        assert "# TYPE job_queue_depth gauge" in text
+        assert 'job_concurrency_limit{kind="export"} 1' in text
+        assert 'job_admitted_total{kind="export"} 1' in text
+        assert 'job_queue_wait_seconds_count{kind="export"} 1' in text
+        assert 'job_queue_wait_seconds_count{kind="draft"}' not in text
+
+
+class TestGenerateAdmission:
+    def test_generate_returns_429_when_queue_full(self):
+        """POST /generate returns 429 QUEUE_FULL with Retry-After and no job."""
+        store = InMemoryJobStore()
+        set_job_store(store)
+        scheduler = JobScheduler(limits={JobKind.draft: 1}, max_waiting=0)
+        # Occupy the only draft slot
+        scheduler._kinds[JobKind.draft].stats.running = 1
+        set_job_scheduler(scheduler)
+        try:
+            response = TestClient(app).post(
+                "/api/ai/draft/generate",
+                json={
+                    "transcript": "A" * 600,
+                    "outline": [
+                        {"id": str(i), "title": f"Chapter {i}", "level": 1} for i in range(3)
+                    ],
+                    "style_config": {},
+                },
+            )
+        finally:
+            set_job_scheduler(None)
+            set_job_store(None)
+
+        assert response.status_code == 429
+        assert int(response.headers["Retry-After"]) >= 1
+        assert response.json()["error"]["code"] == "QUEUE_FULL"
+        assert len(store) == 0
@@ -16,7 +16,7 @@ import pytest
 import pytest_asyncio
 from mongomock_motor import AsyncMongoMockClient
 
-from src.models import JobStatus, GenerationJob, DraftPlan, ChapterPlan, VisualPlan, GenerationMetadata
+from src.models import JobStatus, GenerationCheckpoint, GenerationJob, DraftPlan, ChapterPlan, VisualPlan, GenerationMetadata
 from src.services.job_store import (
     InMemoryJobStore,
     MongoJobStore,
@@ -274,6 +274,58 @@ class TestMongoJobStore:
         assert job.draft_plan.book_title == "Test Book"
         assert len(job.draft_plan.chapters) == 1
 
+    @pytest.mark.asyncio
+    async def test_update_job_persists_checkpoint(self, mongo_store):
+        """Test that resume checkpoint fields are persisted."""
+        job_id = await mongo_store.create_job()
+
+        await mongo_store.update_job(
+            job_id,
+            request={"transcript": "text"},
+            checkpoint=GenerationCheckpoint.evidence_map,
+            chapters_completed=["Chapter 2"],
+            completed_chapter_numbers=[2],
+            resume_count=1,
+        )
+
+        job = await mongo_store.get_job(job_id)
+        assert job.request == {"transcript": "text"}
+        assert job.checkpoint == GenerationCheckpoint.evidence_map
+        assert job.completed_chapter_numbers == [2]
+        assert job.resume_count == 1
+
+    @pytest.mark.asyncio
+    async def test_claim_job_matches_once(self, mongo_store):
+        """Test that a claim only matches the status and resume count it saw."""
+        job_id = await mongo_store.create_job()
+        await mongo_store.update_job(job_id, status=JobStatus.generating)
+
+        first = await mongo_store.claim_job(
+            job_id, JobStatus.generating, 0, status=JobStatus.queued, resume_count=1,
+        )
+        second = await mongo_store.claim_job(
+            job_id, JobStatus.generating, 0, status=JobStatus.queued, resume_count=1,
+        )
+
+        assert first is not None and first.resume_count == 1
+        assert second is None
+        job = await mongo_store.get_job(job_id)
+        assert job.status == JobStatus.queued
+        assert job.resume_count == 1
+
+    @pytest.mark.asyncio
+    async def test_update_job_persists_timings(self, mongo_store):
+        """Test that the timing trace is persisted."""
+        job_id = await mongo_store.create_job()
+        timings = [
+            {"name": "planning", "kind": "stage", "chapter": None, "wall_ms": 812.5, "cpu_ms": 4.2, "count": 1},
+        ]
+
+        await mongo_store.update_job(job_id, timings=timings)
+
+        job = await mongo_store.get_job(job_id)
+        assert job.timings == timings
+
     @pytest.mark.asyncio
     async def test_job_survives_reload(self, mongo_store):
         """Test that job state persists across get operations."""
@@ -0,0 +1,378 @@
+"""Unit tests for the post-processing pass engine.
+
+Tests cover:
+- Document, paragraph and chapter scopes
+- Fingerprint skips for repeated passes
+- Failures, report hooks, warnings and timing
+- Running passes in an executor, split per chapter
+- The registered draft post-processing passes
+"""
+
+import multiprocessing
+import os
+import signal
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+
+import pytest
+
+from src.models import DraftGenerateRequest
+from src.models.style_config import ContentMode
+from src.services import pass_pool
+from src.services.draft_document import DraftDocument
+from src.services.draft_service import (
+    build_post_processing_passes,
+    cleanup_dangling_connectives,
+    enforce_dangling_attribution_gate,
+    sanitize_speaker_framing,
+)
+from src.services.pass_engine import (
+    PassEngine,
+    PassReportSink,
+    PassScope,
+    PassSpec,
+    merge_reports,
+)
+from src.services.stage_timing import TimingTrace, bind_timing_trace, unbind_timing_trace
+
+DRAFT = """# Book
+
+## Chapter 1: One
+
+First chapter prose.
+
+## Chapter 2: Two
+
+Second chapter prose."""
+
+
+def upper_prose(doc: DraftDocument) -> tuple[DraftDocument, dict]:
+    count = 0
+
+    def rewrite(paragraph: str) -> str:
+        nonlocal count
+        count += 1
+        return paragraph.upper()
+
+    doc.rewrite_prose(rewrite)
+    return doc, {"paragraphs": count}
+
+
+class CountingPass:
+    """Document pass that records its calls."""
+
+    def __init__(self, fn=lambda text: text):
+        self.fn = fn
+        self.calls = 0
+
+    def __call__(self, text: str) -> tuple[str, dict]:
+        self.calls += 1
+        return self.fn(text), {"calls": self.calls}
+
+
+def tag_chapter_prose(text: str, chapter_index: int, seen: list) -> tuple[str, dict]:
+    seen.append(chapter_index)
+    return text.replace("prose.", f"prose ({chapter_index})."), {"tagged": 1}
+
+
+def burn_chapter_cpu(text: str, chapter_index: int) -> tuple[str, dict]:
+    """Spend about 20 ms of CPU time on a chapter."""
+    start = time.thread_time()
+    while time.thread_time() - start < 0.02:
+        pass
+    return text, {}
+
+
+def upper_unless_worker(text: str) -> tuple[str, dict]:
+    """Uppercase the draft; kills the process when run in a pool worker."""
+    if multiprocessing.parent_process() is not None:
+        os.kill(os.getpid(), signal.SIGKILL)
+    return text.upper(), {"upper": 1}
+
+
+class TestPassEngine:
+    async def test_scopes_compose(self):
+        """Document, paragraph and chapter passes run in order on the same draft."""
+        chapters = []
+
+        def tag_chapter(text: str, chapter_index: int) -> tuple[str, dict]:
+            chapters.append(chapter_index)
+            return text.replace("PROSE.", f"PROSE ({chapter_index})."), {"tagged": 1, "indices": [chapter_index]}
+
+        sink = PassReportSink()
+        engine = PassEngine([
+            PassSpec("upper", upper_prose, scope=PassScope.paragraph),
+            PassSpec("tag", tag_chapter, scope=PassScope.chapter),
+            PassSpec("title", lambda text: (text.replace("# BOOK", "# Title"), {})),
+        ], sink)
+
+        result = await engine.run(DRAFT)
+
+        assert "FIRST CHAPTER PROSE (0)." in result
+        assert "SECOND CHAPTER PROSE (1)." in result
+        assert result.startswith("# Title")
+        assert chapters == [0, 1]
+        assert sink.reports["tag"] == {"tagged": 2, "indices": [0, 1]}
+        assert [run.changed for run in sink.runs] == [True, True, True]
+
+    async def test_chapter_pass_without_chapters_gets_whole_draft(self):
+        """A draft without chapter headings is one chapter with index 0."""
+        seen = []
+        engine = PassEngine([
+            PassSpec("chapter", lambda text, chapter_index: (seen.append((text, chapter_index)) or text, {}), scope=PassScope.chapter),
+        ])
+
+        assert await engine.run("Just prose.") == "Just prose."
+        assert seen == [("Just prose.", 0)]
+
+    async def test_repeated_pass_skipped_when_draft_unchanged(self):
+        """A re-run is skipped when nothing changed the draft since the last run."""
+        normalize = CountingPass(lambda text: text.replace("chapter", "section"))
+        noop = CountingPass()
+        sink = PassReportSink()
+        engine = PassEngine([
+            PassSpec("normalize", normalize, idempotent=True),
+            PassSpec("noop", noop),
+            PassSpec("normalize", normalize, idempotent=True),
+        ], sink)
+
+        result = await engine.run(DRAFT)
+
+        assert "First section prose." in result
+        assert normalize.calls == 1
+        assert [(run.name, run.skipped) for run in sink.runs] == [
+            ("normalize", False), ("noop", False), ("normalize", True),
+        ]
+
+    async def test_non_idempotent_pass_reruns_on_its_own_output(self):
+        """Without `idempotent`, only an unchanged input is skipped."""
+        append = CountingPass(lambda text: text + "!")
+        engine = PassEngine([PassSpec("append", append), PassSpec("append", append)])
+
+        assert await engine.run("Hi") == "Hi!!"
+        assert append.calls == 2
+
+    async def test_unchanged_input_reuses_output_of_deterministic_pass(self):
+        """A pass whose input matches its last input is skipped."""
+        noop = CountingPass()
+        engine = PassEngine([PassSpec("noop", noop), PassSpec("noop", noop)])
+
+        assert await engine.run(DRAFT) == DRAFT
+        assert noop.calls == 1
+
+    async def test_failed_pass_keeps_previous_text(self):
+        """A failing pass is logged and the draft is left as it was."""
+        def boom(text: str) -> tuple[str, dict]:
+            raise ValueError("boom")
+
+        sink = PassReportSink("job-1")
+        engine = PassEngine([
+            PassSpec("boom", boom, label="Boom pass"),
+            PassSpec("upper", upper_prose, scope=PassScope.paragraph),
+        ], sink)
+
+        result = await engine.run(DRAFT)
+
+        assert "FIRST CHAPTER PROSE." in result
+        assert [run.failed for run in sink.runs] == [True, False]
+        assert sink.summary()["failed"] == 1
+
+    async def test_report_hooks_and_warnings(self):
+        """Report hooks add warnings, which are flushed once per pass."""
+        flushed = []
+
+        async def on_warnings(warnings):
+            flushed.append(list(warnings))
+
+        def report_paragraphs(report: dict, sink: PassReportSink) -> None:
+            sink.warn(f"Uppercased {report['paragraphs']} paragraphs")
+
+        warnings = ["earlier warning"]
+        engine = PassEngine(
+            [
+                PassSpec("upper", upper_prose, scope=PassScope.paragraph, on_report=report_paragraphs),
+                PassSpec("noop", CountingPass()),
+            ],
+            PassReportSink("job-1", warnings),
+            on_warnings=on_warnings,
+        )
+
+        await engine.run(DRAFT)
+
+        assert warnings == ["earlier warning", "Uppercased 3 paragraphs"]
+        assert flushed == [warnings]
+
+    async def test_passes_timed_under_their_names(self):
+        """Each pass that runs is recorded once in the bound timing trace."""
+        trace = TimingTrace()
+        token = bind_timing_trace(trace)
+        try:
+            noop = CountingPass()
+            await PassEngine([PassSpec("noop", noop), PassSpec("noop", noop)]).run(DRAFT)
+        finally:
+            unbind_timing_trace(token)
+
+        passes = [t for t in trace.to_list() if t["kind"] == "pass"]
+        assert [(t["name"], t["count"]) for t in passes] == [("noop", 1)]
+
+    def test_merge_reports(self):
+        """Per-chapter reports sum numbers and concatenate lists."""
+        merged = merge_reports([
+            {"kept": 1, "dropped": ["a"], "mode": "x", "ok": True},
+            {"kept": 2, "dropped": ["b"], "mode": "y", "ok": False},
+        ])
+        assert merged == {"kept": 3, "dropped": ["a", "b"], "mode": "y", "ok": False}
+
+
+class TestPassEngineExecutor:
+    async def test_chapter_pass_submitted_per_chapter(self):
+        """A chapter pass is run once per chapter in the executor."""
+        seen = []
+        sink = PassReportSink()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            engine = PassEngine(
+                [PassSpec("tag", partial(tag_chapter_prose, seen=seen), scope=PassScope.chapter)],
+                sink,
+                executor=executor,
+            )
+            result = await engine.run(DRAFT)
+
+        assert "First chapter prose (0)." in result
+        assert "Second chapter prose (1)." in result
+        assert sorted(seen) == [0, 1]
+        assert sink.reports["tag"] == {"tagged": 2}
+
+    async def test_paragraph_passes_match_serial_run(self):
+        """Splitting paragraph passes per chapter gives the serial result."""
+        draft = (
+            "# Book\n\n## Chapter 1: One\n\nDeutsch notes, For ages people believed otherwise. "
+            "He argues that progress is unbounded. Optimism offers a . Traits hold us back.\n\n"
+            "### Key Excerpts\n\n> \"Deutsch notes, keep this.\"\n> — Guest\n\n"
+            "## Chapter 2: Two\n\nAccording to Deutsch, problems are soluble. Knowledge grows."
+        )
+        passes = [
+            PassSpec("dangling", enforce_dangling_attribution_gate, scope=PassScope.paragraph),
+            PassSpec("framing", sanitize_speaker_framing, scope=PassScope.paragraph),
+            PassSpec("connectives", cleanup_dangling_connectives, scope=PassScope.paragraph),
+        ]
+        serial_sink, pooled_sink = PassReportSink(), PassReportSink()
+        serial = await PassEngine(passes, serial_sink).run(draft)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            pooled = await PassEngine(passes, pooled_sink, executor=executor).run(draft)
+
+        assert pooled == serial != draft
+        assert pooled_sink.reports == serial_sink.reports
+        assert [run.changed for run in pooled_sink.runs] == [run.changed for run in serial_sink.runs]
+
+    async def test_unpicklable_pass_runs_inline(self):
+        """A pass that cannot be sent to a worker process runs in the engine."""
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            engine = PassEngine([PassSpec("title", lambda text: (text.replace("# Book", "# Title"), {}))],
+                                executor=executor)
+            result = await engine.run(DRAFT)
+
+        assert result.startswith("# Title")
+
+    async def test_draft_passes_in_process_pool_match_serial_run(self):
+        """The registered passes give the same draft in worker processes."""
+        request = DraftGenerateRequest(
+            transcript="Host: Welcome. Guest: Problems are soluble.",
+            outline=[{"id": "ch1", "title": "One", "level": 1}],
+            style_config={"version": 1, "style": {"book_format": "guide"}},
+        )
+        draft = (
+            "# Book\n\n## Chapter 1: One\n\nOkay, so Deutsch notes, For ages people believed otherwise. "
+            "This chapter develops the theme. Problems are soluble...\n\n"
+            "### Key Excerpts\n\n> \"Problems are soluble.\"\n> — Guest\n\n"
+            "### Core Claims\n\n- **Soluble**: \"Problems are soluble.\"\n\n"
+            "## Chapter 2: Two\n\nAccording to Deutsch, knowledge grows. \"Invented quote here.\""
+        )
+        passes = build_post_processing_passes("job", request, ContentMode.essay, [], None)
+        serial = await PassEngine(passes).run(draft)
+        sink = PassReportSink("job")
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            pooled = await PassEngine(passes, sink, executor=executor).run(draft)
+
+        assert pooled == serial != draft
+        assert sink.summary()["failed"] == 0
+
+    async def test_broken_pool_reruns_passes_inline(self, monkeypatch):
+        """A killed worker does not skip enforcement, and the pool is replaced."""
+        executor = ProcessPoolExecutor(max_workers=1)
+        monkeypatch.setattr(pass_pool, "_executor", executor)
+        sink = PassReportSink("job")
+        engine = PassEngine(
+            [
+                PassSpec("upper", upper_unless_worker),
+                PassSpec("tag", partial(tag_chapter_prose, seen=[]), scope=PassScope.chapter),
+            ],
+            sink,
+            executor=executor,
+        )
+
+        result = await engine.run(DRAFT)
+
+        assert "FIRST CHAPTER PROSE." in result
+        assert sink.summary()["failed"] == 0
+        assert sink.reports["upper"] == {"upper": 1}
+        assert engine.executor is None
+        assert pass_pool._executor is None
+
+    async def test_worker_cpu_time_recorded_on_pass(self):
+        """CPU time spent in the workers is added to the pass's timing entry."""
+        trace = TimingTrace()
+        token = bind_timing_trace(trace)
+        try:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                await PassEngine(
+                    [PassSpec("burn", burn_chapter_cpu, scope=PassScope.chapter)], executor=executor,
+                ).run(DRAFT)
+        finally:
+            unbind_timing_trace(token)
+
+        [burn] = [t for t in trace.to_list() if t["kind"] == "pass"]
+        assert burn["name"] == "burn"
+        # Two chapters of ~20 ms each, none of it on the event loop thread
+        assert burn["cpu_ms"] >= 35
+
+    def test_pool_disabled_by_default(self, monkeypatch):
+        """Without DRAFT_POSTPROCESS_WORKERS the passes run on the event loop."""
+        monkeypatch.setattr(pass_pool, "DRAFT_POSTPROCESS_WORKERS", 0)
+        assert pass_pool.get_pass_executor() is None
+
+
+class TestDraftPostProcessingPasses:
+    @pytest.fixture
+    def request_obj(self):
+        return DraftGenerateRequest(
+            transcript="Host: Welcome. Guest: Problems are soluble.",
+            outline=[{"id": "ch1", "title": "One", "level": 1}],
+            style_config={"version": 1, "style": {"book_format": "guide"}},
+        )
+
+    def test_interview_drafts_skip_essay_gates(self, request_obj):
+        """Only the mode-independent passes apply outside the Ideas Edition."""
+        passes = build_post_processing_passes("job", request_obj, ContentMode.interview, [], None)
+        assert [spec.name for spec in passes] == [
+            "enforce_quote_grounding",
+            "enforce_ellipsis_ban",
+            "enforce_attributed_speech",
+            "fix_quote_artifacts",
+            "repair_whitespace",
+        ]
+
+    async def test_final_prose_gates_skipped_on_clean_draft(self, request_obj):
+        """The re-run prose gates are skipped when nothing changed in between."""
+        draft = (
+            "# Book\n\n## Chapter 1: One\n\nProblems are soluble. Knowledge grows without bound.\n\n"
+            "### Key Excerpts\n\n> \"Problems are soluble.\"\n> — Guest\n\n"
+            "### Core Claims\n\n- **Soluble**: \"Problems are soluble.\"\n"
+        )
+        passes = build_post_processing_passes("job", request_obj, ContentMode.essay, [], None)
+        sink = PassReportSink("job")
+
+        await PassEngine(passes, sink).run(draft)
+
+        skipped = {run.name for run in sink.runs if run.skipped}
+        assert {"sanitize_speaker_framing", "enforce_no_names_in_prose"} <= skipped
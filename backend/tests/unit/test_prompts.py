@@ -2,7 +2,14 @@
 
 import pytest
 
-from src.services.prompts import build_chapter_system_prompt
+from src.models import ChapterPlan
+from src.services.prompts import (
+    build_chapter_system_prompt,
+    build_chapter_user_prompt,
+    build_claim_extraction_prompt,
+    build_prefix_cached_messages,
+    get_previous_chapter_plan_ending,
+)
 
 
 class TestBuildChapterSystemPrompt:
@@ -65,3 +72,99 @@ class TestBuildChapterSystemPrompt:
         )
         assert "chapter 3" in prompt.lower()
         assert "My Book" in prompt
+
+
+    def test_chapter_agnostic_prompt_is_identical_across_chapters(self):
+        """Test that omitting chapter_number yields a cacheable, shared prompt."""
+        prompt = build_chapter_system_prompt(
+            book_title="My Book",
+            chapter_number=None,
+            style_config={},
+            words_per_chapter_target=500,
+            detail_level="balanced",
+        )
+        assert "My Book" in prompt
+        assert "chapter number and title are given in the instructions" in prompt
+        assert "## Chapter [Number]: [Title]" in prompt
+
+
+class TestPrefixCachedPrompts:
+    """Tests for prompt-cache friendly message layout."""
+
+    def _chapter(self):
+        return ChapterPlan(
+            chapter_number=2,
+            title="Applications",
+            outline_item_id="ch2",
+            estimated_words=500,
+        )
+
+    def test_message_layout(self):
+        """Test that stable messages come first and carry cache breakpoints."""
+        messages = build_prefix_cached_messages("system", "write chapter 2", shared_source="TRANSCRIPT")
+
+        assert [m.role for m in messages] == ["system", "user", "user"]
+        assert [m.cache_breakpoint for m in messages] == [True, True, False]
+        assert "TRANSCRIPT" in messages[1].content
+        assert messages[2].content == "write chapter 2"
+
+    def test_no_shared_source(self):
+        """Test that unique transcript text is not sent as a shared prefix."""
+        messages = build_prefix_cached_messages("system", "user")
+
+        assert len(messages) == 2
+        assert messages[0].cache_breakpoint
+
+    def test_source_in_context_omits_transcript(self):
+        """Test that user prompts refer to the shared transcript instead of repeating it."""
+        prompt = build_chapter_user_prompt(
+            chapter_plan=self._chapter(),
+            transcript_segment="TRANSCRIPT TEXT",
+            source_in_context=True,
+        )
+
+        assert "TRANSCRIPT TEXT" not in prompt
+        assert "source transcript provided above" in prompt
+        assert prompt.endswith("Write Chapter 2: Applications")
+
+    def test_claim_extraction_puts_chapter_after_transcript(self):
+        """Test that chapter-specific content follows the stable prefix."""
+        prompt = build_claim_extraction_prompt(
+            chapter_title="Applications",
+            transcript_segment="TRANSCRIPT TEXT",
+        )
+
+        assert prompt.index("TRANSCRIPT TEXT") < prompt.index("## Chapter: Applications")
+
+
+class TestGetPreviousChapterPlanEnding:
+    """Tests for plan-derived continuity context (parallel generation)."""
+
+    def _chapters(self):
+        return [
+            ChapterPlan(
+                chapter_number=1,
+                title="Foundations",
+                outline_item_id="ch1",
+                goals=["Set the stage"],
+                key_points=["Origins", "Definitions"],
+                estimated_words=500,
+            ),
+            ChapterPlan(
+                chapter_number=2,
+                title="Applications",
+                outline_item_id="ch2",
+                estimated_words=500,
+            ),
+        ]
+
+    def test_first_chapter_has_no_context(self):
+        """Test that the first chapter gets no previous context."""
+        assert get_previous_chapter_plan_ending(self._chapters(), 0) is None
+
+    def test_uses_previous_plan(self):
+        """Test that context is built from the previous chapter's plan."""
+        context = get_previous_chapter_plan_ending(self._chapters(), 1)
+        assert '"Foundations"' in context
+        assert "Origins, Definitions" in context
+        assert "Set the stage" in context
@@ -114,10 +114,10 @@ class TestAnalyzeFaithfulness:
             "summary": "Draft is largely faithful to the transcript."
         }
 
-        with patch("src.services.qa_semantic.LLMClient") as mock_client_class:
+        with patch("src.services.qa_semantic.get_llm_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.generate.return_value = create_mock_llm_response(mock_response_data)
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             result = await analyze_faithfulness(sample_draft, sample_transcript)
 
@@ -145,10 +145,10 @@ class TestAnalyzeFaithfulness:
             "summary": "Several claims lack source support."
         }
 
-        with patch("src.services.qa_semantic.LLMClient") as mock_client_class:
+        with patch("src.services.qa_semantic.get_llm_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.generate.return_value = create_mock_llm_response(mock_response_data)
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             result = await analyze_faithfulness(sample_draft, sample_transcript)
 
@@ -171,10 +171,10 @@ class TestAnalyzeFaithfulness:
             "summary": "Contains fabricated content."
         }
 
-        with patch("src.services.qa_semantic.LLMClient") as mock_client_class:
+        with patch("src.services.qa_semantic.get_llm_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.generate.return_value = create_mock_llm_response(mock_response_data)
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             result = await analyze_faithfulness(sample_draft, sample_transcript)
 
@@ -184,10 +184,10 @@ class TestAnalyzeFaithfulness:
     @pytest.mark.asyncio
     async def test_llm_error_returns_neutral_score(self, sample_draft, sample_transcript):
         """LLM error returns neutral score with error info."""
-        with patch("src.services.qa_semantic.LLMClient") as mock_client_class:
+        with patch("src.services.qa_semantic.get_llm_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.generate.side_effect = Exception("API Error")
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             result = await analyze_faithfulness(sample_draft, sample_transcript)
 
@@ -204,10 +204,10 @@ class TestAnalyzeFaithfulness:
             "summary": "Test"
         }
 
-        with patch("src.services.qa_semantic.LLMClient") as mock_client_class:
+        with patch("src.services.qa_semantic.get_llm_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.generate.return_value = create_mock_llm_response(mock_response_data)
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             result = await analyze_faithfulness(sample_draft, sample_transcript)
 
@@ -226,10 +226,10 @@ class TestAnalyzeFaithfulness:
             "summary": "Many issues"
         }
 
-        with patch("src.services.qa_semantic.LLMClient") as mock_client_class:
+        with patch("src.services.qa_semantic.get_llm_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.generate.return_value = create_mock_llm_response(mock_response_data)
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             result = await analyze_faithfulness(sample_draft, sample_transcript)
 
@@ -259,10 +259,10 @@ class TestAnalyzeClarity:
             "issues": []
         }
 
-        with patch("src.services.qa_semantic.LLMClient") as mock_client_class:
+        with patch("src.services.qa_semantic.get_llm_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.generate.return_value = create_mock_llm_response(mock_response_data)
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             result = await analyze_clarity_semantic(sample_draft)
 
@@ -288,10 +288,10 @@ class TestAnalyzeClarity:
             ]
         }
 
-        with patch("src.services.qa_semantic.LLMClient") as mock_client_class:
+        with patch("src.services.qa_semantic.get_llm_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.generate.return_value = create_mock_llm_response(mock_response_data)
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             result = await analyze_clarity_semantic(sample_draft)
 
@@ -303,10 +303,10 @@ class TestAnalyzeClarity:
     @pytest.mark.asyncio
     async def test_llm_error_returns_default_score(self, sample_draft):
         """LLM error returns neutral score with no issues."""
-        with patch("src.services.qa_semantic.LLMClient") as mock_client_class:
+        with patch("src.services.qa_semantic.get_llm_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.generate.side_effect = Exception("API Error")
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             result = await analyze_clarity_semantic(sample_draft)
 
@@ -344,10 +344,10 @@ class TestAnalyzeCompleteness:
             "issues": []
         }
 
-        with patch("src.services.qa_semantic.LLMClient") as mock_client_class:
+        with patch("src.services.qa_semantic.get_llm_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.generate.return_value = create_mock_llm_response(mock_response_data)
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             result = await analyze_completeness(sample_draft, sample_transcript)
 
@@ -377,10 +377,10 @@ class TestAnalyzeCompleteness:
             ]
         }
 
-        with patch("src.services.qa_semantic.LLMClient") as mock_client_class:
+        with patch("src.services.qa_semantic.get_llm_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.generate.return_value = create_mock_llm_response(mock_response_data)
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             result = await analyze_completeness(sample_draft, sample_transcript)
 
@@ -405,10 +405,10 @@ class TestAnalyzeCompleteness:
             ]
         }
 
-        with patch("src.services.qa_semantic.LLMClient") as mock_client_class:
+        with patch("src.services.qa_semantic.get_llm_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.generate.return_value = create_mock_llm_response(mock_response_data)
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             result = await analyze_completeness(sample_draft, sample_transcript)
 
@@ -418,10 +418,10 @@ class TestAnalyzeCompleteness:
     @pytest.mark.asyncio
     async def test_llm_error_returns_default(self, sample_draft, sample_transcript):
         """LLM error returns neutral score with empty lists."""
-        with patch("src.services.qa_semantic.LLMClient") as mock_client_class:
+        with patch("src.services.qa_semantic.get_llm_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.generate.side_effect = Exception("API Error")
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             result = await analyze_completeness(sample_draft, sample_transcript)
 
@@ -445,10 +445,10 @@ class TestAnalyzeSemantics:
             "issues": []
         }
 
-        with patch("src.services.qa_semantic.LLMClient") as mock_client_class:
+        with patch("src.services.qa_semantic.get_llm_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.generate.return_value = create_mock_llm_response(mock_clarity_response)
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             result = await analyze_semantics(sample_draft, transcript=None)
 
@@ -477,10 +477,10 @@ class TestAnalyzeSemantics:
             call_count += 1
             return response
 
-        with patch("src.services.qa_semantic.LLMClient") as mock_client_class:
+        with patch("src.services.qa_semantic.get_llm_client") as mock_get_client:
             mock_client = MagicMock()
             mock_client.generate = mock_generate
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             result = await analyze_semantics(sample_draft, sample_transcript)
 
@@ -519,10 +519,10 @@ class TestAnalyzeSemantics:
             call_count += 1
             return response
 
-        with patch("src.services.qa_semantic.LLMClient") as mock_client_class:
+        with patch("src.services.qa_semantic.get_llm_client") as mock_get_client:
             mock_client = MagicMock()
             mock_client.generate = mock_generate
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             result = await analyze_semantics(sample_draft, sample_transcript)
 
@@ -540,10 +540,10 @@ class TestAnalyzeSemantics:
 
         mock_clarity_response = {"score": 85, "issues": []}
 
-        with patch("src.services.qa_semantic.LLMClient") as mock_client_class:
+        with patch("src.services.qa_semantic.get_llm_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.generate.return_value = create_mock_llm_response(mock_clarity_response)
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             result = await analyze_semantics(sample_draft, short_transcript)
 
@@ -572,10 +572,10 @@ class TestSemanticEdgeCases:
         mock_response = MagicMock()
         mock_response.text = "not valid json {"
 
-        with patch("src.services.qa_semantic.LLMClient") as mock_client_class:
+        with patch("src.services.qa_semantic.get_llm_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.generate.return_value = mock_response
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             # Should not crash, returns neutral score
             result = await analyze_faithfulness(sample_draft, sample_transcript)
@@ -592,10 +592,10 @@ class TestSemanticEdgeCases:
             # Missing "score" field
         }
 
-        with patch("src.services.qa_semantic.LLMClient") as mock_client_class:
+        with patch("src.services.qa_semantic.get_llm_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.generate.return_value = create_mock_llm_response(mock_response_data)
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             result = await analyze_faithfulness(sample_draft, sample_transcript)
 
@@ -617,10 +617,10 @@ class TestSemanticEdgeCases:
             "summary": "Long text"
         }
 
-        with patch("src.services.qa_semantic.LLMClient") as mock_client_class:
+        with patch("src.services.qa_semantic.get_llm_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.generate.return_value = create_mock_llm_response(mock_response_data)
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             result = await analyze_faithfulness(sample_draft, sample_transcript)
 
@@ -551,10 +551,10 @@ class TestExecuteTargetedRewrite:
         mock_response = MagicMock()
         mock_response.content = "## Section 1\n\nImproved content here."
 
-        with patch("src.services.rewrite_service.LLMClient") as mock_client_class:
+        with patch("src.services.rewrite_service.get_llm_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.complete.return_value = mock_response
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             result = await execute_targeted_rewrite(draft, plan)
 
@@ -579,10 +579,10 @@ class TestExecuteTargetedRewrite:
             ],
         )
 
-        with patch("src.services.rewrite_service.LLMClient") as mock_client_class:
+        with patch("src.services.rewrite_service.get_llm_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.complete.side_effect = Exception("LLM error")
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             result = await execute_targeted_rewrite(draft, plan)
 
@@ -0,0 +1,106 @@
+"""Unit tests for the stage cache.
+
+Tests cover:
+- Stage keys and their sensitivity to inputs
+- Hits, misses and stage isolation (in-memory and MongoDB)
+- Per-project LRU cap, TTL expiry and explicit invalidation
+"""
+
+import pytest_asyncio
+from mongomock_motor import AsyncMongoMockClient
+
+from src.db import mongo
+from src.services.stage_cache import (
+    CachedStage,
+    InMemoryStageCache,
+    MongoStageCache,
+    compute_stage_key,
+    prompt_version,
+)
+
+
+@pytest_asyncio.fixture(params=["memory", "mongo"])
+async def cache_factory(request):
+    """Build caches of each backend with custom limits."""
+    if request.param == "mongo":
+        mongo.set_client(AsyncMongoMockClient())
+        yield MongoStageCache
+        mongo.set_client(None)
+    else:
+        yield InMemoryStageCache
+
+
+class TestStageKeys:
+    def test_key_is_stable_and_order_independent(self):
+        """Keyword order does not change the key."""
+        a = compute_stage_key(CachedStage.draft_plan, transcript="t", outline="o")
+        b = compute_stage_key(CachedStage.draft_plan, outline="o", transcript="t")
+        assert a == b
+
+    def test_key_changes_with_inputs_and_stage(self):
+        """Any input, or the stage itself, produces a different key."""
+        base = compute_stage_key(CachedStage.draft_plan, transcript="t", visual_density="medium")
+        assert base != compute_stage_key(CachedStage.draft_plan, transcript="t2", visual_density="medium")
+        assert base != compute_stage_key(CachedStage.draft_plan, transcript="t", visual_density="high")
+        assert base != compute_stage_key(CachedStage.evidence_map, transcript="t", visual_density="medium")
+
+    def test_prompt_version_tracks_prompt_text(self):
+        """Editing a prompt changes its version."""
+        assert prompt_version("You are an editor.", "gpt-4o-mini") == prompt_version("You are an editor.", "gpt-4o-mini")
+        assert prompt_version("You are an editor.", "gpt-4o-mini") != prompt_version("You are a writer.", "gpt-4o-mini")
+
+
+class TestStageCache:
+    async def test_round_trip_and_miss(self, cache_factory):
+        """Stored values come back; unknown keys miss."""
+        cache = cache_factory()
+        await cache.set("p1", CachedStage.draft_plan, "k1", {"book_title": "Scaling"})
+
+        assert await cache.get("p1", CachedStage.draft_plan, "k1") == {"book_title": "Scaling"}
+        assert await cache.get("p1", CachedStage.draft_plan, "k2") is None
+        assert await cache.get("p2", CachedStage.draft_plan, "k1") is None
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 2
+
+    async def test_stage_must_match(self, cache_factory):
+        """A key stored for one stage never answers another."""
+        cache = cache_factory()
+        await cache.set("p1", CachedStage.whitelist, "k1", [])
+        assert await cache.get("p1", CachedStage.evidence_map, "k1") is None
+
+    async def test_per_project_cap_evicts_least_recently_used(self, cache_factory):
+        """Past the cap, a project's least recently used entry goes first."""
+        cache = cache_factory(max_entries_per_project=2)
+        await cache.set("p1", CachedStage.draft_plan, "k1", 1)
+        await cache.set("p1", CachedStage.draft_plan, "k2", 2)
+        await cache.set("p2", CachedStage.draft_plan, "k1", 1)
+        # Touch k1 so k2 is the eviction candidate
+        assert await cache.get("p1", CachedStage.draft_plan, "k1") == 1
+        await cache.set("p1", CachedStage.draft_plan, "k3", 3)
+
+        assert await cache.get("p1", CachedStage.draft_plan, "k2") is None
+        assert await cache.get("p1", CachedStage.draft_plan, "k1") == 1
+        assert await cache.get("p1", CachedStage.draft_plan, "k3") == 3
+        # Other projects are capped separately
+        assert await cache.get("p2", CachedStage.draft_plan, "k1") == 1
+        assert cache.stats.evictions == 1
+
+    async def test_expired_entries_miss(self, cache_factory):
+        """Entries older than the TTL are not returned."""
+        cache = cache_factory(ttl_seconds=-1)
+        await cache.set("p1", CachedStage.evidence_map, "k1", {"chapters": []})
+        assert await cache.get("p1", CachedStage.evidence_map, "k1") is None
+
+    async def test_invalidate_project(self, cache_factory):
+        """Invalidation drops a project's entries, optionally by stage."""
+        cache = cache_factory()
+        await cache.set("p1", CachedStage.draft_plan, "k1", 1)
+        await cache.set("p1", CachedStage.evidence_map, "k2", 2)
+        await cache.set("p2", CachedStage.draft_plan, "k3", 3)
+
+        assert await cache.invalidate("p1", CachedStage.evidence_map) == 1
+        assert await cache.get("p1", CachedStage.draft_plan, "k1") == 1
+        assert await cache.invalidate("p1") == 1
+        assert await cache.get("p1", CachedStage.draft_plan, "k1") is None
+        assert await cache.get("p2", CachedStage.draft_plan, "k3") == 3
+        assert cache.stats.invalidations == 2
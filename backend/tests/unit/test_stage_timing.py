@@ -0,0 +1,108 @@
+"""Unit tests for the generation timing trace.
+
+Tests cover:
+- Stage and chapter blocks, and spans started outside a `with` block
+- Pass timing, chapter attribution and nested passes
+- Isolation between concurrent chapter tasks
+"""
+
+import asyncio
+
+from src.services.stage_timing import (
+    TimingKind,
+    TimingTrace,
+    bind_timing_trace,
+    start_timing,
+    timed,
+    timed_pass,
+    unbind_timing_trace,
+)
+
+
+@timed_pass
+def inner_pass(text: str) -> str:
+    return text.strip()
+
+
+@timed_pass
+def outer_pass(text: str) -> str:
+    return inner_pass(text).upper()
+
+
+def entries(trace: TimingTrace) -> dict:
+    """Index trace entries by (kind, name, chapter)."""
+    return {(t["kind"], t["name"], t["chapter"]): t for t in trace.to_list()}
+
+
+class TestTimingTrace:
+    def test_passes_untimed_without_trace(self):
+        """Decorated passes behave normally when no trace is bound."""
+        assert outer_pass(" ok ") == "OK"
+
+    def test_stage_and_pass_entries(self):
+        """Stages and passes accumulate wall time, CPU time and counts."""
+        trace = TimingTrace()
+        token = bind_timing_trace(trace)
+        try:
+            with timed("post_process"):
+                outer_pass(" a ")
+                outer_pass(" b ")
+        finally:
+            unbind_timing_trace(token)
+
+        timings = entries(trace)
+        stage = timings[("stage", "post_process", None)]
+        assert stage["count"] == 1
+        assert stage["wall_ms"] >= 0
+        assert timings[("pass", "outer_pass", None)]["count"] == 2
+        # Only the outermost pass is recorded
+        assert ("pass", "inner_pass", None) not in timings
+
+    def test_passes_attributed_to_enclosing_chapter(self):
+        """A pass inside a chapter block is recorded against that chapter."""
+        trace = TimingTrace()
+        token = bind_timing_trace(trace)
+        try:
+            with timed("chapter", kind=TimingKind.chapter, chapter=2):
+                inner_pass(" x ")
+            inner_pass(" y ")
+        finally:
+            unbind_timing_trace(token)
+
+        timings = entries(trace)
+        assert timings[("chapter", "chapter", 2)]["count"] == 1
+        assert timings[("pass", "inner_pass", 2)]["count"] == 1
+        assert timings[("pass", "inner_pass", None)]["count"] == 1
+
+    def test_span_records_once(self):
+        """stop() records the span the first time only."""
+        trace = TimingTrace()
+        token = bind_timing_trace(trace)
+        try:
+            span = start_timing("chapters")
+        finally:
+            unbind_timing_trace(token)
+        span.stop()
+        span.stop()
+
+        assert entries(trace)[("stage", "chapters", None)]["count"] == 1
+
+    async def test_concurrent_chapters_are_isolated(self):
+        """Chapter tasks running concurrently keep their own attribution."""
+        trace = TimingTrace()
+        token = bind_timing_trace(trace)
+
+        async def chapter(number: int) -> None:
+            with timed("chapter", kind=TimingKind.chapter, chapter=number):
+                await asyncio.sleep(0)
+                inner_pass(" text ")
+
+        try:
+            await asyncio.gather(chapter(1), chapter(2), chapter(3))
+        finally:
+            unbind_timing_trace(token)
+
+        timings = entries(trace)
+        for number in (1, 2, 3):
+            assert timings[("pass", "inner_pass", number)]["count"] == 1
+        assert [t["chapter"] for t in trace.to_list() if t["kind"] == "chapter"] == [1, 2, 3]
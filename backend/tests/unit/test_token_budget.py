@@ -0,0 +1,141 @@
+"""Tests for token budget estimation and prompt input fitting."""
+
+from src.models import ChapterPlan
+from src.services.token_budget import (
+    DEFAULT_INPUT_TOKEN_BUDGET,
+    OMISSION_MARKER,
+    PromptBudget,
+    estimate_tokens,
+    fit_claims,
+    fit_tail,
+    fit_text,
+    get_input_token_budget,
+)
+
+
+def filler(n_words: int, word: str = "lorem") -> str:
+    """Build a paragraph of n repeated words."""
+    return " ".join([word] * n_words) + "."
+
+
+class TestEstimateTokens:
+    def test_empty_text_is_zero(self):
+        """Empty text has no tokens."""
+        assert estimate_tokens("") == 0
+
+    def test_scales_with_length(self):
+        """Longer text estimates more tokens."""
+        assert estimate_tokens(filler(200)) > estimate_tokens(filler(20)) > 0
+
+    def test_results_are_cached(self):
+        """Repeated estimates of the same text hit the cache."""
+        text = filler(50, "cached")
+        estimate_tokens(text)
+        hits = estimate_tokens.cache_info().hits
+        estimate_tokens(text)
+        assert estimate_tokens.cache_info().hits == hits + 1
+
+
+class TestInputBudget:
+    def test_longest_prefix_wins(self):
+        """Model budgets match by prefix with an unknown-model default."""
+        assert get_input_token_budget("gpt-4o-mini") == get_input_token_budget("gpt-4o")
+        assert get_input_token_budget("some-new-model") == DEFAULT_INPUT_TOKEN_BUDGET
+
+    def test_prompt_budget_tracks_remaining(self):
+        """Reserved and spent tokens reduce the remaining budget."""
+        budget = PromptBudget(1000, reserved_tokens=100)
+        budget.spend(200)
+        budget.reserve(filler(10))
+        assert budget.remaining == 700 - estimate_tokens(filler(10))
+        budget.spend(5000)
+        assert budget.remaining == 0
+
+
+class TestFitText:
+    def test_text_within_budget_is_unchanged(self):
+        """Fitting text that already fits is a no-op."""
+        text = filler(10) + "\n\n" + filler(10)
+        assert fit_text(text, 1000) == text
+
+    def test_keeps_relevant_paragraphs_in_order(self):
+        """Paragraphs mentioning priority terms win over earlier ones."""
+        paragraphs = [
+            filler(40, "weather"),
+            filler(40, "pricing") + " Pricing strategy matters.",
+            filler(40, "weather"),
+            filler(40, "strategy") + " Pricing again.",
+        ]
+        text = "\n\n".join(paragraphs)
+        budget = estimate_tokens(paragraphs[1]) + estimate_tokens(paragraphs[3]) + 10
+
+        fitted = fit_text(text, budget, ["Pricing strategy"])
+
+        assert paragraphs[1] in fitted
+        assert paragraphs[3] in fitted
+        assert "weather" not in fitted
+        assert fitted.index(paragraphs[1]) < fitted.index(paragraphs[3])
+        assert OMISSION_MARKER in fitted
+        assert estimate_tokens(fitted) <= budget + estimate_tokens(OMISSION_MARKER)
+
+    def test_oversized_paragraph_is_split_into_sentences(self):
+        """A single huge paragraph still yields some content."""
+        text = " ".join(f"Sentence number {i} is here." for i in range(200))
+
+        fitted = fit_text(text, 50)
+
+        assert fitted.startswith("Sentence number 0 is here.")
+        assert 0 < estimate_tokens(fitted) <= 60
+
+
+class TestFitTailAndClaims:
+    def test_fit_tail_keeps_closing_paragraphs(self):
+        """Continuity context keeps the end of the previous chapter."""
+        text = "\n\n".join([filler(50, "opening"), filler(50, "middle"), filler(10, "closing")])
+
+        fitted = fit_tail(text, estimate_tokens(filler(10, "closing")) + 5)
+
+        assert fitted == filler(10, "closing")
+
+    def test_fit_claims_keeps_most_confident(self):
+        """Claims are dropped lowest-confidence first, order preserved."""
+        claims = [
+            {"claim": filler(30, "low"), "confidence": 0.2, "support": []},
+            {"claim": filler(30, "high"), "confidence": 0.9, "support": []},
+            {"claim": filler(30, "mid"), "confidence": 0.6, "support": []},
+        ]
+        budget = 2 * (estimate_tokens(filler(30, "high")) + 20)
+
+        fitted = fit_claims(claims, budget)
+
+        assert [c["confidence"] for c in fitted] == [0.9, 0.6]
+
+
+class TestChapterInputs:
+    def test_unmapped_chapter_gets_relevant_transcript(self):
+        """Chapters over budget keep transcript paragraphs about their topic."""
+        from src.services.draft_service import _fit_chapter_inputs
+
+        chapter = ChapterPlan(
+            chapter_number=1,
+            title="Pricing Strategy",
+            outline_item_id="item-1",
+            goals=["Explain pricing"],
+            key_points=["Value-based pricing"],
+            transcript_segments=[],
+            estimated_words=500,
+        )
+        relevant = filler(20, "pricing")
+        transcript = "\n\n".join([filler(70000, "rain"), relevant])
+
+        segment, claims, previous = _fit_chapter_inputs(
+            chapter_plan=chapter,
+            transcript_segment=transcript,
+            evidence_claims=[],
+            previous_ending="Previous chapter ended here.",
+            grounded=False,
+        )
+
+        assert relevant in segment
+        assert "rain rain" not in segment
+        assert previous == "Previous chapter ended here."
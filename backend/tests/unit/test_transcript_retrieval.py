@@ -0,0 +1,125 @@
+"""Tests for BM25 transcript retrieval and its use in segment extraction."""
+
+from itertools import pairwise
+
+import pytest
+
+from src.models import ChapterPlan, TranscriptSegment
+from src.services import transcript_retrieval
+from src.services.prompts import extract_transcript_segment
+from src.services.transcript_retrieval import (
+    TranscriptIndex,
+    clear_transcript_index_cache,
+    get_transcript_index,
+    retrieve_transcript_segments,
+)
+
+TOPICS = {
+    "pricing": "Host: Our pricing tiers changed. Subscription pricing now scales with seats and discounts.",
+    "hiring": "Guest: Hiring engineers is hard. We interview candidates with a take-home project.",
+    "onboarding": "Host: Customer onboarding matters. Onboarding checklists reduce churn in week one.",
+}
+
+
+def build_transcript(repeats: int = 120) -> str:
+    """Build a long transcript discussing distinct topics in turn."""
+    lines = []
+    for text in TOPICS.values():
+        for _ in range(repeats):
+            lines.append(text)
+            lines.append("Host: " + " ".join(["filler"] * 40))
+    return "\n".join(lines) + "\n"
+
+
+def chapter(title: str, **kwargs) -> ChapterPlan:
+    """Build a minimal chapter plan."""
+    return ChapterPlan(chapter_number=1, title=title, outline_item_id="ch1", **kwargs)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_transcript_index_cache()
+    yield
+    clear_transcript_index_cache()
+
+
+class TestTranscriptIndex:
+    def test_spans_cover_transcript_on_line_boundaries(self):
+        """Spans tile the transcript and start at line starts."""
+        transcript = build_transcript(5)
+        index = TranscriptIndex(transcript, span_chars=300)
+        assert index.spans[0][0] == 0
+        assert index.spans[-1][1] == len(transcript)
+        for (_, end), (start, _) in pairwise(index.spans):
+            assert end == start
+            assert transcript[start - 1] == "\n"
+
+    def test_search_ranks_matching_spans(self):
+        """Selected spans mention the query topic."""
+        transcript = build_transcript(5)
+        index = TranscriptIndex(transcript, span_chars=100)
+        segments = index.search(["Hiring engineers", "interview candidates"], top_k=3)
+        assert segments
+        for seg in segments:
+            assert "hiring" in transcript[seg.start_char:seg.end_char].lower()
+
+    def test_no_match_returns_nothing(self):
+        """A query with no indexed terms selects no spans."""
+        index = TranscriptIndex(build_transcript(2), span_chars=100)
+        assert index.search(["quantum chromodynamics"]) == []
+
+    def test_adjacent_spans_are_merged(self):
+        """Neighbouring selected spans become one segment."""
+        transcript = "alpha topic\n" * 10
+        index = TranscriptIndex(transcript, span_chars=10)
+        segments = index.search(["alpha"], top_k=10)
+        assert segments == [TranscriptSegment(start_char=0, end_char=len(transcript), relevance="supporting")]
+
+
+class TestIndexCache:
+    def test_index_is_built_once_per_transcript(self):
+        """The same transcript reuses its cached index."""
+        transcript = build_transcript(20)
+        assert get_transcript_index(transcript) is get_transcript_index(transcript)
+        assert get_transcript_index(transcript + "x") is not get_transcript_index(transcript)
+
+
+class TestExtractTranscriptSegment:
+    def test_unmapped_chapter_gets_relevant_spans(self):
+        """Long transcripts are narrowed to the chapter's topic."""
+        transcript = build_transcript()
+        assert len(transcript) > transcript_retrieval.TRANSCRIPT_RETRIEVAL_MIN_CHARS
+
+        segment = extract_transcript_segment(
+            transcript, chapter("Pricing", key_points=["Subscription pricing tiers"])
+        )
+
+        assert len(segment) < len(transcript) / 5
+        assert "pricing" in segment.lower()
+        assert "take-home" not in segment
+
+    def test_extra_query_is_used(self):
+        """Evidence claims steer retrieval for vague chapter titles."""
+        transcript = build_transcript()
+        segment = extract_transcript_segment(
+            transcript, chapter("Lessons learned"), extra_query=["Onboarding checklists reduce churn"]
+        )
+        assert "Onboarding checklists" in segment
+
+    def test_short_transcript_is_sent_whole(self):
+        """Transcripts below the threshold keep the full-text fallback."""
+        transcript = build_transcript(10)
+        assert extract_transcript_segment(transcript, chapter("Pricing")) == transcript
+
+    def test_mapped_segments_take_precedence(self):
+        """Chapters with mapped segments never use retrieval."""
+        transcript = build_transcript()
+        plan = chapter("Pricing", transcript_segments=[TranscriptSegment(start_char=0, end_char=50)])
+        assert extract_transcript_segment(transcript, plan) == transcript[:50]
+
+    def test_disabled_retrieval_falls_back(self, monkeypatch):
+        """With retrieval disabled, unmapped chapters get the full transcript."""
+        monkeypatch.setattr(transcript_retrieval, "TRANSCRIPT_RETRIEVAL_ENABLED", False)
+        transcript = build_transcript()
+        assert retrieve_transcript_segments(transcript, ["Pricing"]) == []
+        assert extract_transcript_segment(transcript, chapter("Pricing")) == transcript
@@ -0,0 +1,250 @@
+"""Unit tests for the durable work queue and job worker.
+
+Tests cover:
+- Atomic claims, heartbeats and lease expiry (in-memory and MongoDB)
+- Retry and dead-lettering after max attempts
+- Worker execution, lease loss and failure handling
+- API-side enqueueing when the job queue is enabled
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest_asyncio
+from mongomock_motor import AsyncMongoMockClient
+
+from src.db import mongo
+from src.services import draft_service, work_queue
+from src.services.job_store import InMemoryJobStore, set_job_store
+from src.services.job_worker import JobHandler, Worker
+from src.services.work_queue import (
+    InMemoryWorkQueue,
+    MongoWorkQueue,
+    TaskKind,
+    TaskStatus,
+    set_work_queue,
+)
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+@pytest_asyncio.fixture(params=["memory", "mongo"])
+async def queue_factory(request):
+    """Build queues of each backend with custom lease settings."""
+    if request.param == "mongo":
+        mongo.set_client(AsyncMongoMockClient())
+        yield MongoWorkQueue
+        mongo.set_client(None)
+    else:
+        yield InMemoryWorkQueue
+
+
+def recording_handler(calls: list, error: Exception | None = None) -> JobHandler:
+    """Handler that records runs and optionally raises."""
+    async def run(job_id: str, payload: dict) -> None:
+        calls.append((job_id, payload))
+        if error is not None:
+            raise error
+
+    return JobHandler(run=run, mark_failed=AsyncMock())
+
+
+# =============================================================================
+# Queue
+# =============================================================================
+
+class TestWorkQueue:
+    async def test_claim_leases_oldest_task_once(self, queue_factory):
+        """A task is claimed by exactly one worker, oldest first."""
+        queue = queue_factory()
+        first = await queue.enqueue(TaskKind.draft, "job-1", {"n": 1})
+        await queue.enqueue(TaskKind.draft, "job-2")
+
+        task = await queue.claim("worker-a")
+        assert task.task_id == first
+        assert task.payload == {"n": 1}
+        assert task.attempts == 1
+        assert (await queue.claim("worker-b")).job_id == "job-2"
+        assert await queue.claim("worker-c") is None
+
+    async def test_claim_filters_by_kind(self, queue_factory):
+        """Workers only claim the kinds they handle."""
+        queue = queue_factory()
+        await queue.enqueue(TaskKind.pdf_export, "job-1")
+        assert await queue.claim("worker-a", kinds=[TaskKind.draft]) is None
+        assert (await queue.claim("worker-a", kinds=[TaskKind.pdf_export])).job_id == "job-1"
+
+    async def test_expired_lease_is_reclaimed(self, queue_factory):
+        """A task whose lease expired is visible to other workers again."""
+        queue = queue_factory(lease_seconds=0)
+        task_id = await queue.enqueue(TaskKind.qa, "job-1")
+        await queue.claim("worker-a")
+
+        reclaimed = await queue.claim("worker-b")
+        assert reclaimed.task_id == task_id
+        assert reclaimed.attempts == 2
+        # The original worker lost its lease
+        assert not await queue.heartbeat(task_id, "worker-a")
+        assert not await queue.complete(task_id, "worker-a")
+
+    async def test_heartbeat_keeps_lease(self, queue_factory):
+        """A held lease can be extended and completed."""
+        queue = queue_factory()
+        task_id = await queue.enqueue(TaskKind.qa, "job-1")
+        await queue.claim("worker-a")
+        assert await queue.heartbeat(task_id, "worker-a")
+        assert await queue.complete(task_id, "worker-a")
+        assert await queue.get_status(task_id) == TaskStatus.done
+
+    async def test_fail_retries_then_dies(self, queue_factory):
+        """Failed tasks are retried until max attempts, then dead."""
+        queue = queue_factory(max_attempts=2, retry_delay_seconds=0)
+        task_id = await queue.enqueue(TaskKind.themes, "job-1")
+
+        task = await queue.claim("worker-a")
+        assert await queue.fail(task, "worker-a", "boom") == TaskStatus.pending
+        task = await queue.claim("worker-a")
+        assert task.attempts == 2
+        assert await queue.fail(task, "worker-a", "boom") == TaskStatus.dead
+        assert await queue.get_status(task_id) == TaskStatus.dead
+        assert await queue.claim("worker-a") is None
+
+    async def test_retry_delay_hides_task(self, queue_factory):
+        """A failed task is not visible until its retry delay passes."""
+        queue = queue_factory(retry_delay_seconds=3600)
+        await queue.enqueue(TaskKind.draft, "job-1")
+        task = await queue.claim("worker-a")
+        await queue.fail(task, "worker-a", "boom")
+        assert await queue.claim("worker-a") is None
+
+    async def test_reap_expired_marks_exhausted_tasks_dead(self, queue_factory):
+        """Expired leases with no attempts left are reaped once."""
+        queue = queue_factory(lease_seconds=0, max_attempts=1)
+        task_id = await queue.enqueue(TaskKind.draft, "job-1")
+        await queue.claim("worker-a")
+
+        assert await queue.claim("worker-b") is None
+        reaped = await queue.reap_expired()
+        assert [t.job_id for t in reaped] == ["job-1"]
+        assert await queue.get_status(task_id) == TaskStatus.dead
+        assert await queue.reap_expired() == []
+
+
+# =============================================================================
+# Worker
+# =============================================================================
+
+class TestWorker:
+    async def test_run_once_executes_and_completes(self):
+        """A claimed task runs its handler and is marked done."""
+        queue = InMemoryWorkQueue()
+        task_id = await queue.enqueue(TaskKind.qa, "job-1", {"project_id": "p1"})
+        calls = []
+        worker = Worker(queue=queue, handlers={TaskKind.qa: recording_handler(calls)})
+
+        assert await worker.run_once()
+        assert calls == [("job-1", {"project_id": "p1"})]
+        assert await queue.get_status(task_id) == TaskStatus.done
+        assert not await worker.run_once()
+
+    async def test_handler_error_is_retried_then_job_failed(self):
+        """Errors retry the task; the last attempt marks the job failed."""
+        queue = InMemoryWorkQueue(max_attempts=2, retry_delay_seconds=0)
+        await queue.enqueue(TaskKind.qa, "job-1")
+        calls = []
+        handler = recording_handler(calls, error=RuntimeError("boom"))
+        worker = Worker(queue=queue, handlers={TaskKind.qa: handler})
+
+        await worker.run_once()
+        handler.mark_failed.assert_not_awaited()
+        await worker.run_once()
+        handler.mark_failed.assert_awaited_once_with("job-1", "boom")
+        assert len(calls) == 2
+
+    async def test_lost_lease_cancels_job(self):
+        """A worker that loses its lease cancels its copy of the job."""
+        queue = InMemoryWorkQueue(lease_seconds=0)
+        task_id = await queue.enqueue(TaskKind.draft, "job-1")
+        cancelled = asyncio.Event()
+
+        async def run(job_id: str, payload: dict) -> None:
+            # Another worker reclaims the expired task while this one runs
+            await queue.claim("worker-b")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        worker = Worker(
+            queue=queue,
+            handlers={TaskKind.draft: JobHandler(run=run, mark_failed=AsyncMock())},
+            worker_id="worker-a",
+            heartbeat_seconds=0.01,
+        )
+        await worker.run_once()
+
+        assert cancelled.is_set()
+        assert await queue.get_status(task_id) == TaskStatus.leased
+
+    async def test_run_drains_on_stop(self):
+        """run() processes queued tasks and returns once stopped."""
+        queue = InMemoryWorkQueue()
+        for i in range(3):
+            await queue.enqueue(TaskKind.themes, f"job-{i}")
+        calls = []
+        worker = Worker(
+            queue=queue,
+            handlers={TaskKind.themes: recording_handler(calls)},
+            concurrency=2,
+            poll_seconds=0.01,
+        )
+        stop = asyncio.Event()
+        runner = asyncio.create_task(worker.run(stop))
+        for _ in range(100):
+            if len(calls) == 3:
+                break
+            await asyncio.sleep(0.01)
+        stop.set()
+        await asyncio.wait_for(runner, timeout=1)
+
+        assert sorted(job_id for job_id, _ in calls) == ["job-0", "job-1", "job-2"]
+
+
+# =============================================================================
+# API-side enqueueing
+# =============================================================================
+
+class TestStartGenerationEnqueues:
+    async def test_enqueues_instead_of_running(self, monkeypatch):
+        """With the job queue enabled, start_generation only enqueues."""
+        from src.models import DraftGenerateRequest
+
+        queue = InMemoryWorkQueue()
+        set_work_queue(queue)
+        set_job_store(InMemoryJobStore())
+        monkeypatch.setattr(work_queue, "JOB_QUEUE_ENABLED", True)
+        request = DraftGenerateRequest(
+            transcript="A" * 600,
+            outline=[
+                {"id": f"ch{i}", "title": f"Chapter {i}", "level": 1}
+                for i in range(1, 4)
+            ],
+            style_config={"style": {}},
+        )
+        try:
+            with patch.object(draft_service, "_generate_draft_task", new_callable=AsyncMock) as task:
+                job_id = await draft_service.start_generation(request)
+                await asyncio.sleep(0)
+                task.assert_not_awaited()
+
+                claimed = await queue.claim("worker-a")
+                assert claimed.kind == TaskKind.draft
+                assert claimed.job_id == job_id
+
+                await draft_service.run_generation_job(job_id, claimed.payload["request"])
+                assert task.await_args.args[1] == request
+        finally:
+            set_work_queue(None)
+            set_job_store(None)
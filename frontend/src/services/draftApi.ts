@@ -4,6 +4,7 @@
  * Provides functions for interacting with draft generation endpoints:
  * - Start generation (returns job ID for polling)
  * - Get status (poll for progress and results)
+ * - Stream live chapter tokens (server-sent events)
  * - Cancel generation
  * - Regenerate section
  */
@@ -191,3 +192,58 @@ export async function pollDraftGeneration(
     await new Promise(resolve => setTimeout(resolve, intervalMs))
   }
 }
+
+// ============================================================================
+// Live Streaming
+// ============================================================================
+
+/** Live draft stream events pushed by GET /stream/{job_id}. */
+export interface DraftStreamHandlers {
+  onToken?: (chapter: number, delta: string) => void
+  onChapterComplete?: (chapter: number, markdown: string) => void
+  onStatus?: (status: string, progress: DraftStatusData['progress']) => void
+  onClose?: () => void
+}
+
+/**
+ * Subscribe to live chapter tokens for a generation job (server-sent events).
+ *
+ * The stream closes itself after a terminal status; fetch getDraftStatus()
+ * afterwards for the final draft.
+ *
+ * @param jobId - Job ID from startDraftGeneration
+ * @param handlers - Callbacks for stream events
+ * @returns Function that closes the stream
+ */
+export function streamDraftGeneration(
+  jobId: string,
+  handlers: DraftStreamHandlers
+): () => void {
+  const source = new EventSource(`${API_BASE}/stream/${jobId}`)
+  const terminalStatuses = ['completed', 'cancelled', 'failed']
+
+  const close = () => {
+    source.close()
+    handlers.onClose?.()
+  }
+
+  source.addEventListener('token', (event) => {
+    const data = JSON.parse((event as MessageEvent).data)
+    handlers.onToken?.(data.chapter, data.delta)
+  })
+  source.addEventListener('chapter_complete', (event) => {
+    const data = JSON.parse((event as MessageEvent).data)
+    handlers.onChapterComplete?.(data.chapter, data.markdown)
+  })
+  source.addEventListener('status', (event) => {
+    const data = JSON.parse((event as MessageEvent).data)
+    handlers.onStatus?.(data.status, data.progress)
+    if (terminalStatuses.includes(data.status)) {
+      close()
+    }
+  })
+  // The server ends the stream after a terminal status; don't auto-reconnect
+  source.onerror = close
+
+  return close
+}
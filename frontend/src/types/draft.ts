@@ -15,6 +15,9 @@ import type { VisualPlan } from './visuals'
 // evidence_map phase added for Spec 009
 export type JobStatus = 'queued' | 'planning' | 'evidence_map' | 'generating' | 'completed' | 'cancelled' | 'failed'
 
+/** Scheduling priority for background jobs (interactive runs first) */
+export type JobPriority = 'interactive' | 'normal' | 'batch'
+
 // ============================================================================
 // Progress and Stats
 // ============================================================================
@@ -33,11 +36,36 @@ export interface TokenUsage {
   total_tokens: number
 }
 
+export interface LLMStageUsage {
+  stage: string
+  model: string
+  provider: string
+  calls: number
+  errors: number
+  retries: number
+  fallbacks: number
+  cache_hits: number
+  latency_ms: number
+  prompt_tokens: number
+  completion_tokens: number
+}
+
+export interface StageTiming {
+  name: string
+  kind: 'stage' | 'chapter' | 'pass'
+  chapter?: number | null
+  wall_ms: number
+  cpu_ms: number
+  count: number
+}
+
 export interface GenerationStats {
   chapters_generated: number
   total_words: number
   generation_time_ms: number
   tokens_used: TokenUsage
+  llm_usage?: LLMStageUsage[]
+  timings?: StageTiming[]
 }
 
 // ============================================================================
@@ -119,6 +147,10 @@ export interface DraftGenerateRequest {
   style_config: StyleConfigEnvelope | Record<string, unknown>
   /** Number of candidates for best-of-N selection (1=disabled, 2-3 recommended) */
   candidate_count?: number
+  /** Optional score at which best-of-N stops early and cancels remaining candidates */
+  candidate_score_threshold?: number
+  /** Scheduling priority while waiting for a generation slot */
+  priority?: JobPriority
 }
 
 export interface DraftRegenerateRequest {
@@ -140,6 +172,8 @@ export interface DraftGenerateData {
   draft_plan?: DraftPlan
   visual_plan?: VisualPlan
   generation_stats?: GenerationStats
+  /** 1-based position among waiting jobs (only when queued) */
+  queue_position?: number
 }
 
 export interface DraftStatusData {
@@ -150,6 +184,8 @@ export interface DraftStatusData {
   draft_plan?: DraftPlan
   visual_plan?: VisualPlan
   generation_stats?: GenerationStats
+  /** 1-based position among waiting jobs (only when queued) */
+  queue_position?: number
   partial_draft_markdown?: string
   chapters_available?: number
   error_code?: string
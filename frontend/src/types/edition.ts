@@ -53,6 +53,8 @@ export interface ThemeJob {
   status: ThemeJobStatus
   themes: Theme[]
   error: string | null
+  /** 1-based position among waiting jobs (only when queued) */
+  queue_position?: number | null
 }
 
 // UI Labels and Descriptions
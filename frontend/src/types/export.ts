@@ -39,6 +39,8 @@ export interface ExportStatusData {
   progress: number
   download_url: string | null
   error_message: string | null
+  /** 1-based position among waiting exports (only when pending) */
+  queue_position?: number | null
 }
 
 export interface ExportCancelData {
@@ -116,6 +116,8 @@ export interface QAJobStatusData {
   report?: QAReport
   /** Present when status is failed */
   error_message?: string
+  /** 1-based position among waiting jobs (only when queued) */
+  queue_position?: number | null
 }
 
 export interface QAReportData {
@@ -235,6 +237,7 @@ export interface RewriteStatusData {
   diffs: SectionDiff[] | null
   error: string | null
   warnings: string[] | null
+  queue_position?: number | null
 }
 
 export type RewritePhase = 'idle' | 'running' | 'completed' | 'failed'